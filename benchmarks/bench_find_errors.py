@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark for ComfyUILogDebugger.find_errors
+Compares the compiled ErrorMatcher against the original nested pattern loop
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from debugger_server import ComfyUILogDebugger
+
+NOISE_LINES = [
+    "got prompt",
+    "100%|##########| 20/20 [00:04<00:00,  4.51it/s]",
+    "Requested to load SDXLClipModel",
+    "Loading 1 new model",
+    "Prompt executed in 5.32 seconds",
+    "model_type EPS",
+    "Using pytorch attention in VAE",
+]
+
+ERROR_LINES = [
+    "torch.cuda.OutOfMemoryError: CUDA out of memory. Tried to allocate 2.00 GiB",
+    "Error occurred when executing KSampler:",
+    "ModuleNotFoundError: No module named 'insightface'",
+    "Traceback (most recent call last):",
+    "Invalid prompt: node 12 is missing",
+]
+
+
+def legacy_find_errors(error_patterns, log_path, context_lines=5):
+    """The original per-line, per-type, per-pattern re.search loop."""
+    found_errors = []
+    with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+        lines = f.readlines()
+
+    for i, line in enumerate(lines):
+        for error_type, patterns in error_patterns.items():
+            for pattern_str in patterns:
+                if re.search(pattern_str, line, re.IGNORECASE):
+                    start_index = max(0, i - context_lines)
+                    end_index = min(len(lines), i + context_lines + 1)
+                    context = "".join(lines[start_index:end_index]).strip()
+                    found_errors.append({
+                        "type": error_type,
+                        "line_number": i + 1,
+                        "error_line": line.strip(),
+                        "context": context,
+                        "log_file": log_path
+                    })
+                    break
+    return {"errors": found_errors}
+
+
+def write_log(path, num_lines, error_rate, seed=0):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(num_lines):
+            if rng.random() < error_rate:
+                f.write(rng.choice(ERROR_LINES) + "\n")
+            else:
+                f.write(f"{rng.choice(NOISE_LINES)} [{i}]\n")
+
+
+def extra_patterns(count):
+    """Synthetic pattern set padding error_patterns.json out to a realistic size."""
+    patterns = {}
+    for i in range(count):
+        patterns.setdefault(f"CustomNodeError{i // 10}", []).append(f"custom_node_{i} failed")
+    return patterns
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lines', type=int, default=200000)
+    parser.add_argument('--error-rate', type=float, default=0.001)
+    parser.add_argument('--extra-patterns', type=int, default=300)
+    parser.add_argument('--context-lines', type=int, default=5)
+    args = parser.parse_args()
+
+    debugger = ComfyUILogDebugger()
+    if args.extra_patterns:
+        patterns = dict(debugger.error_patterns)
+        patterns.update(extra_patterns(args.extra_patterns))
+        debugger.error_patterns = patterns
+        debugger.error_matcher = type(debugger.error_matcher)(patterns)
+
+    pattern_count = sum(len(p) for p in debugger.error_patterns.values())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep indexes and checkpoints for throwaway logs out of the real cache
+        os.environ['COMFYUI_CACHE_DIR'] = os.path.join(tmp, 'cache')
+        log_path = os.path.join(tmp, 'comfyui.log')
+        write_log(log_path, args.lines, args.error_rate)
+        size_mb = os.path.getsize(log_path) / (1024 * 1024)
+
+        print(f"Log: {args.lines} lines, {size_mb:.1f} MB, {pattern_count} patterns")
+
+        legacy_time, legacy = timed(legacy_find_errors, debugger.error_patterns, log_path, args.context_lines)
+        compiled_time, compiled = timed(debugger.find_errors, log_path, context_lines=args.context_lines,
+                                        cluster=False, max_bytes=0)
+
+    # The compiled scan merges overlapping matches into spans, so check that
+    # every match the nested loop found falls in a span reporting its type
+    spans = compiled["errors"]
+    for error in legacy["errors"]:
+        if not any(span["start_line"] <= error["line_number"] <= span["end_line"]
+                   and error["type"] in span["error_types"] for span in spans):
+            print(f"MISMATCH: {error['type']} on line {error['line_number']} is not in any span")
+            return 1
+
+    print(f"{'nested loop':<16} {legacy_time:8.2f}s  {size_mb / legacy_time:8.1f} MB/s")
+    print(f"{'compiled':<16} {compiled_time:8.2f}s  {size_mb / compiled_time:8.1f} MB/s")
+    print(f"Speedup: {legacy_time / compiled_time:.1f}x ({len(legacy['errors'])} errors in {len(spans)} spans)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for the standalone MCP server
+Times fresh server processes from spawn to the answered MCP handshake and tool list
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+SERVER = os.path.join(SRC_DIR, 'standalone_mcp_server.py')
+
+TARGET_MS = 200
+PROTOCOL_VERSION = "2024-11-05"
+
+
+def send(proc, message):
+    proc.stdin.write(json.dumps(dict(message, jsonrpc="2.0")) + "\n")
+    proc.stdin.flush()
+
+
+def read_response(proc, request_id):
+    """The server's response to request_id, skipping notifications and log lines."""
+    while True:
+        line = proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Server exited before answering request {request_id}")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if message.get("id") == request_id:
+            if "error" in message:
+                raise RuntimeError(f"Request {request_id} failed: {message['error']}")
+            return message["result"]
+
+
+def time_startup(env, timeout):
+    """(handshake seconds, tools/list seconds, tool count) for one cold start."""
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, SERVER], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, env=env, text=True)
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    try:
+        send(proc, {"id": 1, "method": "initialize", "params": {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "bench_startup", "version": "1.0"},
+        }})
+        read_response(proc, 1)
+        handshake = time.perf_counter() - start
+        send(proc, {"method": "notifications/initialized"})
+        send(proc, {"id": 2, "method": "tools/list"})
+        tools = read_response(proc, 2)["tools"]
+        listed = time.perf_counter() - start
+    finally:
+        watchdog.cancel()
+        proc.kill()
+        proc.wait()
+    return handshake, listed, len(tools)
+
+
+def import_seconds(statement, env, runs):
+    """Fastest wall time of a fresh interpreter running statement."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=60.0, help="seconds before a server start is abandoned")
+    parser.add_argument('--target-ms', type=float, default=TARGET_MS)
+    parser.add_argument('--check', action='store_true', help="exit with status 1 if the median misses the target")
+    args = parser.parse_args()
+
+    if importlib.util.find_spec('fastmcp') is None and not os.path.exists(os.path.join(SRC_DIR, 'lib', 'fastmcp')):
+        # The server would install its dependencies first, which is not what's being measured
+        print("fastmcp is not installed; pip install -r requirements.txt first")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the servers' caches out of the real one, so every start is cold
+        # The server finds its dependencies in src/lib when they were installed there
+        env = dict(os.environ, COMFYUI_CACHE_DIR=os.path.join(tmp, 'cache'),
+                   PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.path.join(SRC_DIR, 'lib'),
+                                                            os.environ.get('PYTHONPATH')])))
+
+        interpreter = import_seconds("pass", env, args.runs)
+        fastmcp = import_seconds("import fastmcp", env, args.runs) - interpreter
+        debugger = import_seconds("import fastmcp, debugger_server", env, args.runs) - interpreter - fastmcp
+        stubs = import_seconds("import fastmcp, tool_names; tool_names.tool_stubs(None)",
+                               env, args.runs) - interpreter - fastmcp
+        print(f"{'interpreter':<24} {interpreter * 1000:8.1f} ms")
+        print(f"{'import fastmcp':<24} {fastmcp * 1000:8.1f} ms")
+        print(f"{'import debugger_server':<24} {debugger * 1000:8.1f} ms  (deferred to the first tool call)")
+        print(f"{'tool stubs':<24} {stubs * 1000:8.1f} ms")
+
+        results = [time_startup(env, args.timeout) for _ in range(args.runs)]
+
+    for label, samples in (("initialize", [r[0] for r in results]), ("tools/list", [r[1] for r in results])):
+        samples = sorted(s * 1000 for s in samples)
+        print(f"{label:<24} {statistics.median(samples):8.1f} ms median  "
+              f"({samples[0]:.1f} min, {samples[-1]:.1f} max, {args.runs} runs)")
+    print(f"Tools listed: {results[0][2]}")
+
+    median = statistics.median(r[0] for r in results) * 1000
+    met = median < args.target_ms
+    print(f"Handshake target {args.target_ms:.0f} ms: {'met' if met else 'missed'} ({median:.1f} ms)")
+    return 1 if args.check and not met else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
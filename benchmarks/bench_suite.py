@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for ComfyUI Log Debugger
+Runs the tools and discovery over synthetic logs of several sizes and reports throughput, peak memory and latency
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCH_DIR, '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from synthetic_log import UNITS, format_size, parse_size, prompt_uuid, write_log
+
+MB = UNITS['MB']
+DEFAULT_SIZES = "10MB,100MB"
+DEFAULT_TOLERANCE = 0.25
+# Latency changes smaller than this are noise, whatever the ratio
+MIN_LATENCY_CHANGE_MS = 10.0
+
+
+def tool_calls(log_path, seed):
+    """The benchmarked calls: name -> (debugger method, arguments, whether a cold call reads the whole log)."""
+    return {
+        "find_errors": ("find_errors", {"log_path": log_path}, True),
+        # The first page only scans as far as it reaches, so it has no throughput
+        "find_errors_page": ("find_errors", {"log_path": log_path, "cluster": False}, False),
+        "query_log": ("query_log", {"log_path": log_path}, True),
+        "monitor_gpu_memory_warnings": ("monitor_gpu_memory_warnings", {"log_path": log_path}, True),
+        "analyze_execution_times": ("analyze_execution_times", {"log_path": log_path}, True),
+        "analyze_model_loads": ("analyze_model_loads", {"log_path": log_path}, True),
+        "find_workflow_by_id": ("find_workflow_by_id", {"workflow_id": prompt_uuid(seed, 1), "log_path": log_path},
+                                True),
+    }
+
+
+TOOL_NAMES = list(tool_calls('', 0)) + ["discovery"]
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process, or of the largest of its finished children (scan workers), in MB."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / MB
+        except (ImportError, AttributeError):
+            return None
+    # Bytes on macOS, KB elsewhere
+    unit = MB if sys.platform == 'darwin' else 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit
+    try:
+        # ru_maxrss carries over the benchmark runner's peak from before exec; VmHWM doesn't
+        with open('/proc/self/status') as f:
+            peak = next(int(line.split()[1]) for line in f if line.startswith('VmHWM:')) / 1024
+    except (OSError, StopIteration):
+        pass
+    return max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit)
+
+
+def timed_calls(func, runs):
+    """Seconds taken by a first (cold) call of func and by runs more (warm) ones."""
+    times = []
+    for _ in range(runs + 1):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(result["error"])
+    return times[0], times[1:]
+
+
+def make_installations(root, count):
+    """count fake ComfyUI installations, each with a few small live, rotated and archived logs."""
+    import gzip
+    installations = []
+    for i in range(count):
+        path = os.path.join(root, f"ComfyUI_{i}")
+        os.makedirs(os.path.join(path, 'logs'))
+        for name in ('main.py', 'nodes.py', 'execution.py'):
+            open(os.path.join(path, name), 'w').close()
+        for name in ('comfyui.log', 'logs/comfyui.log', 'logs/comfyui.log.1', 'logs/comfyui_8188.log'):
+            with open(os.path.join(path, name), 'w') as f:
+                f.write("[2024-06-01 00:00:00.000] got prompt\n")
+        with gzip.open(os.path.join(path, 'logs', 'comfyui.log.2.gz'), 'wt') as f:
+            f.write("[2024-06-01 00:00:00.000] got prompt\n")
+        installations.append(path)
+    return installations
+
+
+def run_child(tool, log_path, runs, seed, installs):
+    """Measure one tool in this (fresh) process and print the result as JSON."""
+    if tool == "discovery":
+        from simple_active_discovery import SimpleActiveDiscovery
+        with tempfile.TemporaryDirectory() as root:
+            installations = make_installations(root, installs)
+            discovery = SimpleActiveDiscovery()
+            discovery.known_paths = installations
+            # Cold: a full discovery; warm: listing the logs of every installation
+            cold, warm = timed_calls(discovery.discover, 0)[0], []
+            for _ in range(runs):
+                start = time.perf_counter()
+                for installation in installations:
+                    discovery.find_log_files(installation)
+                warm.append(time.perf_counter() - start)
+        size = None
+    else:
+        from debugger_server import ComfyUILogDebugger
+        debugger = ComfyUILogDebugger()
+        method, kwargs, whole_log = tool_calls(log_path, seed)[tool]
+        func = getattr(debugger, method)
+        cold, warm = timed_calls(lambda: func(**kwargs), runs)
+        size = os.path.getsize(log_path) if whole_log else None
+    print(json.dumps({"cold_s": cold, "warm_s": warm, "size": size, "peak_rss_mb": peak_rss_mb()}))
+    return 0
+
+
+def measure(tool, log_path, size_label, args):
+    """Run one tool in a child process with an empty cache; returns its result row."""
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, COMFYUI_CACHE_DIR=cache, COMFYUI_WATCH='false')
+        command = [sys.executable, os.path.abspath(__file__), '--child', tool, '--log', log_path or '',
+                   '--runs', str(args.runs), '--seed', str(args.seed), '--installs', str(args.installs)]
+        proc = subprocess.run(command, env=env, capture_output=True, text=True)
+    row = {"size": size_label, "tool": tool}
+    if proc.returncode != 0:
+        row["error"] = (proc.stderr.strip().splitlines() or [f"exit status {proc.returncode}"])[-1]
+        return row
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    row.update(cold_s=result["cold_s"], peak_rss_mb=result["peak_rss_mb"],
+               mb_per_s=result["size"] / MB / result["cold_s"] if result["size"] else None)
+    if result["warm_s"]:
+        row.update(warm_p50_ms=percentile(result["warm_s"], 0.5) * 1000,
+                   warm_p95_ms=percentile(result["warm_s"], 0.95) * 1000)
+    return row
+
+
+def synthetic_log(size, seed, data_dir):
+    """Path of the synthetic log of size bytes for seed, generated on first use and kept in data_dir."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"comfyui-{format_size(size)}-seed{seed}.log")
+    if not os.path.exists(path):
+        print(f"Generating {os.path.basename(path)}...", file=sys.stderr)
+        write_log(path, size, seed)
+    return path
+
+
+def print_rows(rows):
+    def value(row, key, fmt):
+        return format(row[key], fmt) if row.get(key) is not None else '-'
+
+    print(f"{'size':<7} {'tool':<28} {'cold s':>8} {'MB/s':>8} {'warm p50':>10} {'warm p95':>10} {'peak RSS':>9}")
+    for row in rows:
+        if "error" in row:
+            print(f"{row['size']:<7} {row['tool']:<28} failed: {row['error']}")
+            continue
+        print(f"{row['size']:<7} {row['tool']:<28} {value(row, 'cold_s', '8.3f')} {value(row, 'mb_per_s', '8.1f')} "
+              f"{value(row, 'warm_p50_ms', '7.1f')} ms {value(row, 'warm_p95_ms', '7.1f')} ms "
+              f"{value(row, 'peak_rss_mb', '6.0f')} MB")
+
+
+def regressions(rows, baseline, tolerance):
+    """Descriptions of the rows that are slower than baseline by more than tolerance."""
+    previous = {(row["size"], row["tool"]): row for row in baseline if "error" not in row}
+    found = []
+    for row in rows:
+        base = previous.get((row["size"], row["tool"]))
+        if base is None:
+            continue
+        if "error" in row:
+            found.append(f"{row['size']} {row['tool']}: failed ({row['error']})")
+            continue
+        if row.get("mb_per_s") and base.get("mb_per_s") and row["mb_per_s"] < base["mb_per_s"] * (1 - tolerance):
+            found.append(f"{row['size']} {row['tool']}: {row['mb_per_s']:.1f} MB/s, was {base['mb_per_s']:.1f}")
+        now, then = row.get("warm_p95_ms"), base.get("warm_p95_ms")
+        if now is not None and then is not None and now > then * (1 + tolerance) and now - then > MIN_LATENCY_CHANGE_MS:
+            found.append(f"{row['size']} {row['tool']}: warm p95 {now:.1f} ms, was {then:.1f}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="comma-separated log sizes, e.g. 10MB,1GB,10GB")
+    parser.add_argument('--tools', default=','.join(TOOL_NAMES), help="comma-separated subset of: "
+                        + ', '.join(TOOL_NAMES))
+    parser.add_argument('--runs', type=int, default=5, help="warm calls after the cold one")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--installs', type=int, default=20, help="fake installations for the discovery benchmark")
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'comfy-guru-bench'),
+                        help="where generated logs are kept between runs")
+    parser.add_argument('--json', help="write the results to this file")
+    parser.add_argument('--baseline', help="results of an earlier --json run to compare against")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="slowdown (0.25 = 25%%) reported as a regression")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--log', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args.child, args.log, args.runs, args.seed, args.installs)
+
+    tools = [tool.strip() for tool in args.tools.split(',') if tool.strip()]
+    unknown = [tool for tool in tools if tool not in TOOL_NAMES]
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(unknown)}")
+
+    rows = []
+    if "discovery" in tools:
+        rows.append(measure("discovery", None, '-', args))
+    for label in args.sizes.split(','):
+        size = parse_size(label)
+        log_path = synthetic_log(size, args.seed, args.data_dir)
+        for tool in tools:
+            if tool != "discovery":
+                rows.append(measure(tool, log_path, format_size(size), args))
+    print_rows(rows)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(rows, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(rows, json.load(f), args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}")
+        if found:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Synthetic ComfyUI log generator
+Writes deterministic, realistic comfyui.log output of any size for benchmarks
+"""
+import argparse
+import hashlib
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# 2024-06-01 00:00:00 local time; every log starts here so the same seed gives the same bytes
+BASE_TIME = time.mktime((2024, 6, 1, 0, 0, 0, 0, 0, -1))
+UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+# Stands for the prompt ID in pooled execution blocks
+PROMPT_ID = '\x00'
+# Logs are made of independent segments, so they can be generated in parallel.
+# Each starts with a server startup, SEGMENT_SECONDS after the one before
+SEGMENT_BYTES = 64 * 1024 * 1024
+SEGMENT_SECONDS = 21 * 86400
+
+CHECKPOINTS = ["sd_xl_base_1.0.safetensors", "juggernautXL_v9.safetensors", "v1-5-pruned-emaonly.ckpt",
+               "flux1-dev-fp8.safetensors", "realisticVisionV60B1.safetensors"]
+LORAS = ["add_detail.safetensors", "lcm-lora-sdxl.safetensors", "pixel-art-xl.safetensors"]
+MODELS = [("SDXLClipModel", 1560.8), ("SDXL", 4897.0), ("AutoencoderKL", 159.6), ("FluxClipModel_", 4777.6),
+          ("Flux", 11350.1), ("BaseModel", 1639.4), ("SD1ClipModel", 235.8)]
+NODES = ["CheckpointLoaderSimple", "CLIPTextEncode", "KSampler", "VAEDecode", "SaveImage", "LoraLoader",
+         "ControlNetApplyAdvanced", "IPAdapterAdvanced", "UltimateSDUpscale", "FaceDetailer"]
+CUSTOM_NODES = ["ComfyUI-Manager", "ComfyUI-Impact-Pack", "ComfyUI_IPAdapter_plus", "comfyui_controlnet_aux",
+                "rgthree-comfy", "ComfyUI-KJNodes", "was-node-suite-comfyui", "ComfyUI-VideoHelperSuite"]
+MISSING_MODULES = ["insightface", "onnxruntime", "mediapipe", "segment_anything", "ultralytics"]
+WARNINGS = [
+    "WARNING: [Errno 2] No such file or directory: 'custom_nodes/ComfyUI-Manager/channels.list'",
+    "WARNING: Ran out of memory when regular VAE decoding, retrying with tiled VAE decoding.",
+    "WARNING: unknown node type: ReActorFaceSwap",
+    "Warning: Could not load sageattention: No module named 'sageattention'",
+]
+
+
+def parse_size(text: str) -> int:
+    """Bytes in a size like 10MB, 1.5GB or 4096."""
+    m = re.fullmatch(r'\s*([\d.]+)\s*([KMG]?B?)\s*', text.upper())
+    if not m:
+        raise ValueError(f"Not a size: {text}")
+    return int(float(m.group(1)) * UNITS[m.group(2) if m.group(2) in UNITS else m.group(2) + 'B'])
+
+
+def format_size(size: int) -> str:
+    for unit in ('GB', 'MB', 'KB'):
+        if size >= UNITS[unit] and size % UNITS[unit] == 0:
+            return f"{size // UNITS[unit]}{unit}"
+    return f"{size}B"
+
+
+def prompt_uuid(seed: int, number: int, segment: int = 0) -> str:
+    """The prompt ID of the number'th execution (from 0) of a segment of the log made with seed."""
+    return str(uuid.UUID(bytes=hashlib.md5(f"{seed}:{segment}:{number}".encode('ascii')).digest(), version=4))
+
+
+class SyntheticLog:
+    """Generates ComfyUI log text, one server session or execution at a time.
+
+    The output follows what ComfyUI writes to comfyui.log: a startup banner
+    with the device, VRAM state and custom node import times (some failing
+    to import), then queued prompts, each with its prompt ID, model loads
+    and unloads, sampler progress bars, per-node timings and "Prompt
+    executed in". Some executions fail: CUDA out of memory, missing models
+    and node errors, each with a Python traceback. The server restarts now
+    and then. Everything comes from the seed, the segment number and
+    BASE_TIME, so they always produce the same bytes.
+
+    Executions are drawn from a pool of pool_size generated up front and
+    only get their timestamps and prompt ID when written, which is what
+    makes gigabyte logs quick to produce. A block is a list of (seconds
+    since the previous line, text) pairs, with None for the untimestamped
+    lines of a traceback.
+    """
+
+    def __init__(self, seed: int = 0, segment: int = 0, error_rate: float = 0.03, pool_size: int = 2000):
+        self.seed = seed
+        self.segment = segment
+        self.rng = random.Random(f"{seed}:{segment}")
+        self.error_rate = error_rate
+        self.now = BASE_TIME + segment * SEGMENT_SECONDS
+        # An hour short of the next segment's start, so timestamps only go forward
+        self.end_time = self.now + SEGMENT_SECONDS - 3600
+        self.prompts = 0
+        self._second = None
+        self._stamp = ''
+        self.pool = [self._execution() for _ in range(pool_size)]
+
+    def render(self, block, prompt_id: str = '') -> str:
+        lines = []
+        for step, text in block:
+            if step is None:
+                lines.append(text)
+                continue
+            self.now += step
+            second = int(self.now)
+            if second != self._second:
+                self._second = second
+                self._stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            if PROMPT_ID in text:
+                text = text.replace(PROMPT_ID, prompt_id)
+            lines.append(f"[{self._stamp}.{int((self.now - second) * 1000):03d}] {text}")
+        lines.append('')
+        return "\n".join(lines)
+
+    def startup(self):
+        rng = self.rng
+        vram = rng.choice([8192, 12288, 16376, 24564])
+        started = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.now + 30))
+        block = [
+            (30 + rng.uniform(0, 600), "Logging to ComfyUI/user/comfyui.log"),
+            (0.2, f"** ComfyUI startup time: {started}"),
+            (0.01, "** Platform: Linux"),
+            (0.01, "** Python version: 3.11.9 (main, Apr 19 2024, 16:48:06) [GCC 11.2.0]"),
+            (0.5, f"Total VRAM {vram} MB, total RAM 64203 MB"),
+            (0.01, "pytorch version: 2.3.1+cu121"),
+            (0.01, f"Set vram state to: {'LOW_VRAM' if vram <= 8192 else 'NORMAL_VRAM'}"),
+            (0.01, f"Device: cuda:0 NVIDIA GeForce RTX {rng.choice([3060, 3080, 4070, 4090])} : cudaMallocAsync"),
+            (0.3, "Using pytorch attention in VAE"),
+        ]
+        import_lines = []
+        for node in CUSTOM_NODES:
+            if rng.random() < 0.15:
+                module = rng.choice(MISSING_MODULES)
+                block += [
+                    (0.05, "Traceback (most recent call last):"),
+                    (None, '  File "/ComfyUI/nodes.py", line 1993, in load_custom_node'),
+                    (None, "    module_spec.loader.exec_module(module)"),
+                    (None, f'  File "/ComfyUI/custom_nodes/{node}/__init__.py", line 3, in <module>'),
+                    (None, f"    import {module}"),
+                    (None, f"ModuleNotFoundError: No module named '{module}'"),
+                    (None, ""),
+                    (0.01, f"Cannot import /ComfyUI/custom_nodes/{node} module for custom nodes: "
+                           f"No module named '{module}'"),
+                ]
+                import_lines.append((None, f"   0.0 seconds (IMPORT FAILED): /ComfyUI/custom_nodes/{node}"))
+            else:
+                import_lines.append((None, f"{rng.uniform(0, 2.5):6.1f} seconds: /ComfyUI/custom_nodes/{node}"))
+        return block + [(0.1, ""), (0.0, "Import times for custom nodes:")] + import_lines + [
+            (None, ""),
+            (0.2, "Starting server"),
+            (None, ""),
+            (0.0, "To see the GUI go to: http://127.0.0.1:8188"),
+        ]
+
+    def _load(self, name: str, size: float, block: list):
+        rng = self.rng
+        if rng.random() < 0.5:
+            # Still loaded from the previous execution
+            return 0.0
+        steps = [rng.uniform(0.01, 0.3), 0.0, rng.uniform(0.2, 3)]
+        block.append((steps[0], f"Requested to load {name}"))
+        block.append((steps[1], "Loading 1 new model"))
+        if rng.random() < 0.1:
+            block.append((steps[2], f"loaded partially {size * 0.7:.1f} {size:.1f} 0"))
+        else:
+            block.append((steps[2], f"loaded completely 0.0 {size:.1f} True"))
+        return sum(steps)
+
+    def _progress(self, steps: int, block: list):
+        rate = self.rng.uniform(1.2, 9.5)
+        seconds = steps / rate
+        for done in (0, steps // 4, steps // 2, 3 * steps // 4):
+            block.append((seconds / 4, f"{100 * done // steps:3d}%|{'#' * (10 * done // steps):<10}| {done}/{steps} "
+                                       f"[00:{int(seconds * done / steps):02d}<00:{int(seconds - seconds * done / steps):02d}, "
+                                       f"{rate:.2f}it/s]"))
+        block.append((0.0, f"100%|##########| {steps}/{steps} [00:{int(seconds):02d}<00:00, {rate:.2f}it/s]"))
+        return seconds
+
+    def _failure(self, node: str, block: list):
+        rng = self.rng
+        kind = rng.random()
+        if kind < 0.5:
+            tried = rng.choice([1.5, 2.0, 3.38, 5.06, 9.0])
+            message = (f"CUDA out of memory. Tried to allocate {tried:.2f} GiB. GPU 0 has a total capacity of "
+                       f"23.99 GiB of which {rng.uniform(0.1, 2):.2f} GiB is free. Of the allocated memory "
+                       f"{rng.uniform(15, 21):.2f} GiB is allocated by PyTorch, and {rng.uniform(0.1, 1):.2f} GiB "
+                       f"is reserved by PyTorch but unallocated.")
+            final = f"torch.OutOfMemoryError: {message}"
+            frames = [('/ComfyUI/comfy/ldm/modules/attention.py', 'attention_pytorch',
+                       'out = torch.nn.functional.scaled_dot_product_attention(q, k, v)')]
+        elif kind < 0.75:
+            missing = rng.choice(CHECKPOINTS + LORAS)
+            message = f"Value not in list: ckpt_name: '{missing}' not in []"
+            final = f"FileNotFoundError: Model in folder 'checkpoints' with filename '{missing}' not found."
+            frames = [('/ComfyUI/folder_paths.py', 'get_full_path_or_raise',
+                       'raise FileNotFoundError(f"Model in folder ...")')]
+        else:
+            message = f"mat1 and mat2 shapes cannot be multiplied (77x{rng.choice([768, 1024])} and 2048x320)"
+            final = f"RuntimeError: {message}"
+            frames = [('/ComfyUI/comfy/ops.py', 'forward_comfy_cast_weights',
+                       'return torch.nn.functional.linear(input, weight, bias)')]
+        step = rng.uniform(0.1, 2)
+        block += [
+            (step, f"!!! Exception during processing !!! {message}"),
+            (0.0, "Traceback (most recent call last):"),
+            (None, '  File "/ComfyUI/execution.py", line 151, in recursive_execute'),
+            (None, "    output_data, output_ui = get_output_data(obj, input_data_all)"),
+            (None, '  File "/ComfyUI/execution.py", line 81, in get_output_data'),
+            (None, "    return_values = map_node_over_list(obj, input_data_all, obj.FUNCTION, allow_interrupt=True)"),
+            (None, f'  File "/ComfyUI/nodes.py", line 1429, in {node.lower()}'),
+            (None, "    return common_ksampler(model, seed, steps, cfg, sampler_name, scheduler, positive, negative)"),
+        ]
+        for path, function, code in frames:
+            block += [(None, f'  File "{path}", line {rng.randint(50, 900)}, in {function}'), (None, f"    {code}")]
+        block += [(None, final), (None, "")]
+        return step
+
+    def _execution(self):
+        """A pooled execution block, from "got prompt" to "Prompt executed in"."""
+        rng = self.rng
+        block = [(rng.expovariate(1 / 5), "got prompt"), (0.001, f"[PromptServer] prompt_id: {PROMPT_ID}")]
+        elapsed = 0.001
+        if rng.random() < 0.3:
+            block += [(0.05, "model weight dtype torch.float16, manual cast: None"), (0.0, "model_type EPS")]
+            elapsed += 0.05
+        clip, model = rng.choice([(MODELS[0], MODELS[1]), (MODELS[3], MODELS[4]), (MODELS[6], MODELS[5])])
+        elapsed += self._load(*clip, block)
+        if rng.random() < 0.05:
+            block.append((0.1, rng.choice(WARNINGS)))
+            elapsed += 0.1
+        elapsed += self._load(*model, block)
+        if rng.random() < 0.1:
+            block.append((0.2, f"unloading models to make room: {rng.randint(1, 3)} models unloaded."))
+            elapsed += 0.2
+        if rng.random() < self.error_rate:
+            elapsed += self._failure(rng.choice(NODES[2:]), block)
+        else:
+            elapsed += self._progress(rng.choice([20, 25, 30, 40]), block)
+            elapsed += self._load(*MODELS[2], block)
+            if rng.random() < 0.05:
+                block.append((0.5, WARNINGS[1]))
+                elapsed += 0.5
+            for number, node in enumerate(rng.sample(NODES, 4), 3):
+                if rng.random() < 0.5:
+                    block.append((0.01, f"#{number} [{node}]: {rng.uniform(0.01, 6):.2f}s"))
+                    elapsed += 0.01
+        step = rng.uniform(0.1, 1)
+        block.append((step, f"Prompt executed in {elapsed + step:.2f} seconds"))
+        return block
+
+    def chunks(self):
+        """Endless log text, a session or execution at a time."""
+        rng = self.rng
+        pool = self.pool
+        yield self.render(self.startup())
+        while True:
+            if rng.random() < 0.002:
+                yield self.render(self.startup())
+            yield self.render(pool[rng.randrange(len(pool))], prompt_uuid(self.seed, self.prompts, self.segment))
+            self.prompts += 1
+
+
+def segment_text(seed: int, segment: int, size: int, error_rate: float):
+    """(text, prompt count) of one segment: about size bytes, ending after the execution that reaches it."""
+    log = SyntheticLog(seed, segment, error_rate)
+    chunks = []
+    written = 0
+    for chunk in log.chunks():
+        chunks.append(chunk)
+        written += len(chunk)
+        if written >= size or log.now >= log.end_time:
+            break
+    return "".join(chunks).encode('ascii'), log.prompts
+
+
+def write_log(path: str, size: int, seed: int = 0, error_rate: float = 0.03, workers: int = None) -> int:
+    """Write a log of about size bytes, in SEGMENT_BYTES segments made by workers processes; returns the prompt count."""
+    sizes = [min(SEGMENT_BYTES, size - start) for start in range(0, size, SEGMENT_BYTES)]
+    workers = min(workers or os.cpu_count() or 1, len(sizes))
+    prompts = 0
+    partial = f"{path}.partial"
+    with open(partial, 'wb') as f:
+        if workers == 1:
+            for segment, segment_size in enumerate(sizes):
+                text, count = segment_text(seed, segment, segment_size, error_rate)
+                f.write(text)
+                prompts += count
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # A few segments ahead of the writer, so finished ones don't pile up in memory
+                pending = deque()
+                for segment, segment_size in enumerate(sizes):
+                    pending.append(pool.submit(segment_text, seed, segment, segment_size, error_rate))
+                    if len(pending) >= 2 * workers:
+                        text, count = pending.popleft().result()
+                        f.write(text)
+                        prompts += count
+                while pending:
+                    text, count = pending.popleft().result()
+                    f.write(text)
+                    prompts += count
+    # Renamed into place once complete, so an interrupted run never leaves a short log behind
+    os.replace(partial, path)
+    return prompts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('path')
+    parser.add_argument('--size', default='10MB', help="approximate size, e.g. 10MB, 1GB")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.03, help="share of executions that fail")
+    parser.add_argument('--workers', type=int, default=None, help="generator processes (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    prompts = write_log(args.path, parse_size(args.size), args.seed, args.error_rate, args.workers)
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(args.path) / UNITS['MB']
+    print(f"Wrote {size_mb:.1f} MB, {prompts} prompts, in {elapsed:.1f}s ({size_mb / elapsed:.1f} MB/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
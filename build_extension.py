@@ -45,6 +45,30 @@ def create_extension():
         ("src/standalone_mcp_server.py", "server/standalone_mcp_server.py"),
         ("src/debugger_server.py", "server/debugger_server.py"),
         ("src/simple_active_discovery.py", "server/simple_active_discovery.py"),
+        ("src/log_scanner.py", "server/log_scanner.py"),
+        ("src/log_index.py", "server/log_index.py"),
+        ("src/cache_store.py", "server/cache_store.py"),
+        ("src/scan_checkpoints.py", "server/scan_checkpoints.py"),
+        ("src/parallel_scan.py", "server/parallel_scan.py"),
+        ("src/log_follower.py", "server/log_follower.py"),
+        ("src/fs_events.py", "server/fs_events.py"),
+        ("src/inventory_watcher.py", "server/inventory_watcher.py"),
+        ("src/vram_events.py", "server/vram_events.py"),
+        ("src/log_blocks.py", "server/log_blocks.py"),
+        ("src/prompt_index.py", "server/prompt_index.py"),
+        ("src/execution_stats.py", "server/execution_stats.py"),
+        ("src/model_loads.py", "server/model_loads.py"),
+        ("src/log_store.py", "server/log_store.py"),
+        ("src/log_tables.py", "server/log_tables.py"),
+        ("src/error_clusters.py", "server/error_clusters.py"),
+        ("src/pagination.py", "server/pagination.py"),
+        ("src/log_rotation.py", "server/log_rotation.py"),
+        ("src/cancellation.py", "server/cancellation.py"),
+        ("src/tool_names.py", "server/tool_names.py"),
+        ("src/tool_runner.py", "server/tool_runner.py"),
+        ("src/progress.py", "server/progress.py"),
+        ("src/log_daemon.py", "server/log_daemon.py"),
+        ("src/metrics.py", "server/metrics.py"),
         ("src/error_patterns.json", "server/error_patterns.json"),
         ("src/server_launcher.py", "server/server_launcher.py"),
         ("src/windows_launcher.bat", "server/windows_launcher.bat"),
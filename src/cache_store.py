@@ -0,0 +1,128 @@
+"""
+On-disk cache helpers for ComfyUI Log Debugger
+Resolves settings and the cache directory, and identifies log files across calls
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from log_rotation import is_compressed
+
+HEAD_HASH_BYTES = 4096
+
+_env_settings = None
+
+
+def get_setting(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read a setting from the environment, falling back to the project .env file."""
+    global _env_settings
+    if name in os.environ:
+        return os.environ[name]
+
+    if _env_settings is None:
+        _env_settings = {}
+        env_file = Path(__file__).parent.parent / '.env'
+        if env_file.exists():
+            try:
+                with open(env_file, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line and not line.startswith('#') and '=' in line:
+                            key, value = line.split('=', 1)
+                            _env_settings[key.strip()] = value.strip()
+            except OSError:
+                pass
+
+    value = _env_settings.get(name)
+    return value if value else default
+
+
+def cache_dir(subdir: str = '') -> str:
+    """Directory for persisted indexes and caches (COMFYUI_CACHE_DIR)."""
+    base = get_setting('COMFYUI_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'comfy-guru')
+    return os.path.join(base, subdir) if subdir else base
+
+
+def cache_file(subdir: str, log_path: str) -> str:
+    """Cache file for one log, named by a hash of its absolute path."""
+    key = hashlib.sha1(os.path.abspath(log_path).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir(subdir), f"{key}.json")
+
+
+def load_json(path: str) -> Optional[Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(path: str, data: Dict) -> bool:
+    """Atomically write a cache file; caching is best effort, so errors are only logged."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # A temp file of its own, so threads writing the same cache file can't interleave
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except OSError as e:
+        print(f"Could not write cache file {path}: {e}", file=sys.stderr)
+        return False
+
+
+def _head_hash(path: str, length: int) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read(length)).hexdigest()
+
+
+def file_identity(path: str) -> Dict:
+    """Identify a log by path, inode, size and a hash of its first bytes."""
+    stat = os.stat(path)
+    head_len = min(stat.st_size, HEAD_HASH_BYTES)
+    return {
+        "path": os.path.abspath(path),
+        "inode": stat.st_ino,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "head_len": head_len,
+        "head_hash": _head_hash(path, head_len),
+    }
+
+
+def read_identity(identity: Dict, offset: int) -> Dict:
+    """The identity to save once a log has been read up to offset.
+
+    A log that grew while it was read is saved at the size actually read.
+    Offsets into a compressed log count decompressed bytes, so archives keep
+    their own size.
+    """
+    if is_compressed(identity["path"]):
+        return identity
+    return dict(identity, size=max(identity["size"], offset))
+
+
+def is_continuation(identity: Optional[Dict], path: str) -> bool:
+    """True if the file at path is the same log as identity, unchanged or appended to.
+
+    A different inode, a smaller size or different leading bytes mean the log
+    was rotated, truncated or rewritten and anything derived from it is stale.
+    """
+    if not identity:
+        return False
+    try:
+        stat = os.stat(path)
+        return (stat.st_ino == identity["inode"]
+                and stat.st_size >= identity["size"]
+                and _head_hash(path, identity["head_len"]) == identity["head_hash"])
+    except (OSError, KeyError):
+        return False
@@ -0,0 +1,30 @@
+"""
+Cooperative cancellation for ComfyUI Log Debugger
+Lets a scan running in a worker thread stop once its tool call is cancelled or times out
+"""
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
+# Set for the duration of one tool call; carried into threads with contextvars.copy_context()
+_cancelled: ContextVar[Optional[threading.Event]] = ContextVar('cancelled', default=None)
+
+
+class CallCancelled(Exception):
+    """The tool call this work is for was cancelled or ran out of time."""
+
+
+def run_cancellable(cancelled: threading.Event, func, *args, **kwargs):
+    """Call func with check_cancelled() watching cancelled; run it in a copied context."""
+    _cancelled.set(cancelled)
+    return func(*args, **kwargs)
+
+
+def check_cancelled():
+    """Raise CallCancelled if the tool call running this code has been abandoned.
+
+    Long loops call this every so often; outside a tool call it does nothing.
+    """
+    cancelled = _cancelled.get()
+    if cancelled is not None and cancelled.is_set():
+        raise CallCancelled("Tool call was cancelled")
@@ -1,37 +1,134 @@
+import contextvars
 import json
 import os
-import subprocess
-import platform
-import re
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 
-try:
-    from simple_active_discovery import simple_discover_all
-    USE_SIMPLE_DISCOVERY = True
-    USE_ENHANCED_DISCOVERY = False
-    USE_SMART_DISCOVERY = False
-except ImportError:
-    USE_SIMPLE_DISCOVERY = False
+from cache_store import file_identity, is_continuation
+from error_clusters import cluster_errors
+from execution_stats import ExecutionTimings, find_regression, summarize
+from log_follower import LogFollower
+from log_index import TimestampIndex
+from log_rotation import READ_ERRORS, is_compressed, open_log, rotated_segments
+from log_scanner import ErrorMatcher, ErrorScan, lines_before
+from log_store import GROUP_COLUMNS, LogStore
+from log_tables import LogTables
+from metrics import count, prometheus_text, snapshot as metrics_snapshot
+from model_loads import ModelLoadTracker, summarize_model
+from pagination import (MAX_RESPONSE_BYTES, PAGE_FIELDS_BYTES, CursorError, decode_cursor, encode_cursor,
+                        json_size, paginate, query_key, shrink)
+from parallel_scan import parallel_cut, scan_errors_parallel
+from progress import (CallProgress, current_progress, cut_short, cut_short_within, expect_bytes, scanned,
+                      time_budget, time_is_up, track)
+from prompt_index import PromptIndex
+from scan_checkpoints import CheckpointStore
+from vram_events import VramEventExtractor
+
+# Higher is worse; used to rank results across logs. Unknown types rank between.
+ERROR_SEVERITY = {
+    "CUDA_OUT_OF_MEMORY": 5,
+    "NodeExecutionFailure": 4,
+    "PromptExecutionError": 3,
+    "DependencyNotFound": 3,
+    "GeneralError": 1,
+}
+DEFAULT_SEVERITY = 2
+
+SEARCH_WORKERS = 8
+# How long find_errors_all waits past its budget for scans to stop and hand in what they found
+SEARCH_GRACE_SECONDS = 1.0
+
+
+def _page(result, key, query, cursor, max_bytes):
+    """paginate() for a tool result, with a bad cursor reported as the tool's error."""
+    try:
+        return paginate(result, key, query, cursor, max_bytes)
+    except CursorError as e:
+        return {"error": str(e)}
+
+
+def _note_partial(result):
+    """Mark a result partial if this call's time ran out before its indexes read every log to the end."""
+    if cut_short():
+        result.update(partial=True, note="Time ran out before every log was read; the results cover "
+                                         "what was read, and calling again carries on from there")
+    return result
+
+
+@lru_cache(maxsize=None)
+def discovery_backend():
+    """(method, discover) for the most capable discovery module available.
+
+    Resolved on first use rather than when this module is imported, so
+    starting the server costs nothing until a tool needs the log inventory.
+    method is "simple", "enhanced", "smart" or "basic".
+    """
+    try:
+        from simple_active_discovery import simple_discover_all
+        return "simple", simple_discover_all
+    except ImportError:
+        pass
     try:
         from enhanced_discovery import enhanced_discover_all
-        USE_ENHANCED_DISCOVERY = True
-        USE_SMART_DISCOVERY = False
+        return "enhanced", enhanced_discover_all
+    except ImportError:
+        pass
+    try:
+        from smart_log_discovery import discover_all_comfyui_logs
+        return "smart", discover_all_comfyui_logs
+    except ImportError:
+        pass
+    try:
+        from advanced_log_discovery import discover_all_comfyui_logs
+        return "smart", discover_all_comfyui_logs
     except ImportError:
-        USE_ENHANCED_DISCOVERY = False
+        from log_discovery import discover_comfyui_logs
+        return "basic", discover_comfyui_logs
+
+
+def _window_logs(log_files, since):
+    """The logs that may hold lines from since on; one last written before since holds none."""
+    if since is None:
+        return log_files
+    recent = []
+    for path in log_files:
         try:
-            from smart_log_discovery import discover_all_comfyui_logs
-            USE_SMART_DISCOVERY = True
-        except ImportError:
-            try:
-                from advanced_log_discovery import discover_all_comfyui_logs
-                USE_SMART_DISCOVERY = True
-            except ImportError:
-                from log_discovery import discover_comfyui_logs
-                USE_SMART_DISCOVERY = False
+            if os.path.getmtime(path) < since:
+                continue
+        except OSError:
+            pass
+        recent.append(path)
+    return recent
+
+
+def _expect_scan(log_path, start_offset):
+    """Count the rest of a log from start_offset towards the call's progress; archives' sizes aren't known."""
+    expect_bytes(None if is_compressed(log_path) else max(0, os.path.getsize(log_path) - start_offset))
+
 
 class ComfyUILogDebugger:
-    def __init__(self):
+    def __init__(self, watch_inventory: bool = False):
         self.error_patterns = self._load_error_patterns()
+        self.error_matcher = ErrorMatcher(self.error_patterns)
+        self.timestamp_index = TimestampIndex()
+        # Append-only rows of the incremental indexes, shared by them all
+        self.log_tables = LogTables()
+        self.checkpoints = CheckpointStore(self.log_tables)
+        self.follower = LogFollower()
+        self.vram_events = VramEventExtractor(self.log_tables)
+        self.prompt_index = PromptIndex(self.log_tables)
+        self.execution_timings = ExecutionTimings(self.log_tables)
+        self.model_loads = ModelLoadTracker(self.log_tables)
+        self.log_store = LogStore(self.log_tables, self.error_matcher)
+        # Shared by every find_errors_all call, so scans outliving one can't pile up
+        self.search_pool = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="comfy-guru-search")
+        # Started by the first tool call that needs the log inventory, not at startup
+        self.watch_inventory = watch_inventory
+        self.inventory_watcher = None
+        self._watcher_lock = threading.Lock()
 
     def _load_error_patterns(self):
         """Loads error patterns from error_patterns.json."""
@@ -42,20 +139,66 @@ class ComfyUILogDebugger:
                 return json.load(f)
         return {}
 
-    def get_logs(self):
-        """Discovers and returns a list of ComfyUI log files."""
-        if USE_SIMPLE_DISCOVERY:
-            result = simple_discover_all()
+    def start_inventory_watcher(self):
+        """Starts keeping the installation and log inventory up to date in the background."""
+        with self._watcher_lock:
+            if self.inventory_watcher is None and discovery_backend()[0] == "simple":
+                from inventory_watcher import InventoryWatcher
+                self.inventory_watcher = InventoryWatcher()
+                self.inventory_watcher.start()
+
+    def get_logs(self, refresh: bool = False, cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES):
+        """Discovers and returns a list of ComfyUI log files.
+        Results are cached until installations, their logs or the running ComfyUI
+        processes change; pass refresh=True to force a full rediscovery.
+        Log files are listed in pages of at most max_bytes (0 for no limit); pass
+        next_cursor back as cursor to get the next page.
+        """
+        result = _page(self._discover_logs(refresh and not cursor), "log_files",
+                       query_key("get_logs"), cursor, max_bytes)
+        if "log_details" in result:
+            result["log_details"] = {path: result["log_details"][path] for path in result["log_files"]
+                                     if path in result["log_details"]}
+        return result
+
+    def _discover_logs(self, refresh: bool = False):
+        """Every discovered log file and installation, unpaged."""
+        method, discover = discovery_backend()
+        if method == "simple":
+            watcher = self.inventory_watcher
+            if watcher is not None and not refresh:
+                snapshot = watcher.snapshot()
+                if snapshot is not None:
+                    count("cache_hits", cache="inventory")
+                    return {
+                        "log_files": snapshot['log_files'],
+                        "installations": snapshot['installations'],
+                        "discovery_method": snapshot.get('discovery_method', 'simple'),
+                        "discovery_time": snapshot.get('discovery_time', 0),
+                        "known_count": snapshot.get('known_count', 0),
+                        "active_count": snapshot.get('active_count', 0),
+                        "cached": True,
+                        "log_details": snapshot['log_details']
+                    }
+                count("cache_misses", cache="inventory")
+
+            result = discover(refresh)
+            if watcher is not None and refresh:
+                watcher.apply_discovery(result)
+            elif watcher is None and self.watch_inventory:
+                # Its first discovery finds this one in the discovery cache
+                self.start_inventory_watcher()
             return {
                 "log_files": result['log_files'],
                 "installations": result['installations'],
                 "discovery_method": result.get('discovery_method', 'simple'),
                 "discovery_time": result.get('discovery_time', 0),
                 "known_count": result.get('known_count', 0),
-                "active_count": result.get('active_count', 0)
+                "active_count": result.get('active_count', 0),
+                "cached": result.get('cached', False)
             }
-        elif USE_ENHANCED_DISCOVERY:
-            result = enhanced_discover_all()
+        elif method == "enhanced":
+            result = discover()
             return {
                 "log_files": result['log_files'],
                 "installations": result['installations'],
@@ -65,8 +208,8 @@ class ComfyUILogDebugger:
                 "active_count": result.get('active_count', 0),
                 "discovered_count": result.get('discovered_count', 0)
             }
-        elif USE_SMART_DISCOVERY:
-            result = discover_all_comfyui_logs()
+        elif method == "smart":
+            result = discover()
             return {
                 "log_files": result['log_files'],
                 "installations": result['installations'],
@@ -75,86 +218,680 @@ class ComfyUILogDebugger:
                 "system_info": result.get('system_info', {})
             }
         else:
-            logs = discover_comfyui_logs()
+            logs = discover()
             return {
                 "log_files": logs,
                 "discovery_method": "basic"
             }
 
-    def tail_log(self, path: str):
-        """Tails a specified log file in real-time."""
+    async def tail_log(self, path: str, cursor: str = None, max_lines: int = 100, wait_seconds: float = 0):
+        """Returns new lines from a log file since the given cursor, without blocking.
+        Call without a cursor to get the last max_lines lines, then pass the returned
+        cursor back to get only what was appended since. If nothing new has been
+        written, waits up to wait_seconds (max 30) for the file to change.
+        Rotated or truncated logs are followed from their start.
+        """
         if not os.path.exists(path):
             return {"error": f"Log file not found: {path}"}
-
-        system = platform.system()
-        command = []
-        if system == "Linux" or system == "Darwin":
-            command = ["tail", "-f", path]
-        elif system == "Windows":
-            # PowerShell command to tail a file
-            command = ["powershell.exe", "Get-Content", "-Path", path, "-Wait", "-Encoding", "UTF8"]
-        else:
-            return {"error": f"Unsupported operating system for tailing: {system}"}
+        if is_compressed(path):
+            return {"error": f"Compressed logs are not written to and can't be tailed: {path}"}
 
         try:
-            # Start the subprocess in a non-blocking way
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
-            print(f"Tailing log file: {path}. Press Ctrl+C to stop.")
-            for line in iter(process.stdout.readline, ''):
-                print(line, end='')
-            process.wait()
-            return {"message": f"Stopped tailing {path}"}
-        except Exception as e:
+            return await self.follower.follow(path, cursor, max_lines, wait_seconds)
+        except OSError as e:
             return {"error": f"Failed to tail log: {e}"}
 
-    def find_errors(self, log_path: str, last_minutes: int = None, context_lines: int = 5):
+    def find_errors(self, log_path: str, last_minutes: int = None, context_lines: int = 5,
+                    cluster: bool = True, cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES,
+                    time_budget_seconds: float = None):
         """Finds errors in a log file based on defined patterns, with contextual lines.
-        If last_minutes is provided, only searches within that timeframe.
-        context_lines specifies how many lines before and after the error to include.
+        If last_minutes is provided, only searches within that timeframe, using the
+        timestamps in the log (or the file modification time if it has none).
+        context_lines specifies how many lines before and after the error to include;
+        an error inside a Python traceback gets the whole exception chain instead.
+        Errors whose context overlaps are merged and reported once, with all the
+        error_types found and their start_line and end_line.
+        With cluster (the default), repeats of the same error - equal once numbers,
+        paths and hex IDs are masked - are grouped into one entry with a count, the
+        first and last occurrence, and the context of the latest one. Set cluster
+        to False to list every occurrence.
+        Responses hold at most max_bytes of results (0 for no limit); when has_more
+        is set, pass next_cursor back as cursor, with the same other arguments, for
+        the next page. Unclustered pages scan the log only as far as the page
+        reaches, and the next page carries on from there. Anything too large for
+        a page is cut down, and the fields cut are listed in truncated (an
+        unclustered error cut down has truncated set instead).
+        Compressed logs (.gz, .zst) are decompressed as they are read, and paged
+        from one scan of the whole archive. With last_minutes, the rotated
+        segments of the log (comfyui.log.1, comfyui.log.2.gz, ...) written to
+        within the timeframe are searched too, oldest first; older segments are
+        not read at all.
+        Progress (bytes scanned, errors so far, time left) is reported while the
+        log is read. If time_budget_seconds (or most of the server's tool
+        timeout) runs out, the scan stops and what it found is returned with
+        partial set; pages then end early with a cursor to carry on from, and
+        a whole-log scan resumes from where it stopped when called again.
         """
         if not os.path.exists(log_path):
             return {"error": f"Log file not found: {log_path}"}
 
+        query = query_key("find_errors", os.path.abspath(log_path), last_minutes, context_lines, cluster)
+        try:
+            with time_budget(time_budget_seconds):
+                if not cluster and max_bytes:
+                    return self._find_errors_page(log_path, last_minutes, context_lines, query, cursor, max_bytes)
+
+                if last_minutes:
+                    since = time.time() - last_minutes * 60
+                    errors = []
+                    for path in self._window_segments(log_path, since):
+                        errors.extend(self._find_recent_errors(path, since, context_lines))
+                        if cut_short():
+                            break
+                else:
+                    errors = self._file_errors(log_path, None, context_lines)
+                partial = cut_short()
+
+            if not cluster:
+                result = {"errors": errors}
+            else:
+                clusters = cluster_errors(errors)
+                result = paginate({"clusters": clusters, "total_errors": len(errors),
+                                   "distinct_errors": len(clusters)}, "clusters", query, cursor, max_bytes)
+            if partial:
+                if last_minutes or is_compressed(log_path):
+                    note = "Time ran out before the end of the log; narrow last_minutes or raise time_budget_seconds"
+                else:
+                    note = "Time ran out before the end of the log; call again to carry on from where the scan stopped"
+                result.update(partial=True, note=note)
+            return result
+        except CursorError as e:
+            return {"error": str(e)}
+        except READ_ERRORS as e:
+            return {"error": f"Failed to read log: {e}"}
+
+    def _file_errors(self, log_path: str, since: float, context_lines: int):
+        """The errors of one log file, without its rotated segments: from since (epoch seconds) on, or all."""
+        if since is not None:
+            return self._find_recent_errors(log_path, since, context_lines)
+        if is_compressed(log_path):
+            return self._find_errors_archive(log_path, context_lines)
+        return self._find_errors_incremental(log_path, context_lines)
+
+    def _file_errors_in_time(self, scans: CallProgress, log_path: str, since: float, context_lines: int):
+        """(errors, cut short) of one log for find_errors_all, within the scans' deadline."""
+        track(scans)
+        if time_is_up():
+            # Queued behind other scans until the time was up
+            return [], True
+        return cut_short_within(self._file_errors, log_path, since, context_lines)
+
+    @staticmethod
+    def _window_segments(log_path: str, since: float):
+        """The rotated segments of a log last written to from since on, oldest first, then the log."""
+        segments = []
+        for path in rotated_segments(log_path):
+            try:
+                if os.path.getmtime(path) < since:
+                    # Segments are newest first, so the rest end before the window too
+                    break
+            except OSError:
+                continue
+            segments.append(path)
+        return segments[::-1] + [log_path]
+
+    def _recent_start(self, log_path: str, since: float):
+        """(offset, line, since) to scan the part of a log written from since on, or None if nothing is that recent."""
+        if os.path.getmtime(log_path) < since:
+            return None
+        if is_compressed(log_path):
+            # Archives are read as a stream, skipping older lines as they go
+            return 0, 1, since
+        position = self.timestamp_index.seek(log_path, since)
+        if position is None:
+            # No timestamps in this log; the file modification time puts all of it in the window
+            return 0, 1, None
+        return position[0], position[1], since
+
+    def _find_recent_errors(self, log_path: str, since: float, context_lines: int):
+        """Scans only the part of the log written from since on."""
+        start = self._recent_start(log_path, since)
+        if start is None:
+            return []
+        start_offset, start_line, since = start
+
+        found_errors = []
+        _expect_scan(log_path, start_offset)
+        with open_log(log_path) as f:
+            f.seek(start_offset)
+            scan = ErrorScan(f, self.error_matcher, context_lines, start_offset, start_line, since=since)
+            for error in scan:
+                error["log_file"] = log_path
+                found_errors.append(error)
+        return found_errors
+
+    def _find_errors_page(self, log_path: str, last_minutes: int, context_lines: int, query: str,
+                          cursor: str, max_bytes: int):
+        """Scans from the cursor (or the start of the log or window) until max_bytes of errors are found.
+
+        With last_minutes the scan runs through the rotated segments in the
+        window, then the log. The next cursor holds the segment, the byte
+        offset and number of the first line of the first span left out, and
+        the segment's identity, so the next page resumes the scan there, and a
+        cursor for a rotated or rewritten log is refused. Archives can't seek,
+        so instead of decompressing one up to the cursor for every page, it is
+        scanned whole once (its checkpoint) and pages are cut from the errors
+        found, by line.
+        """
+        if cursor:
+            position = decode_cursor(cursor, query)
+            since = position["since"]
+            segments = self._window_segments(log_path, since) if since is not None else [log_path]
+            if position["path"] not in segments or not is_continuation(position["identity"], position["path"]):
+                raise CursorError("Log was rotated or rewritten since the cursor was issued; call again without a cursor")
+            segments = segments[segments.index(position["path"]):]
+        else:
+            position = None
+            since = time.time() - last_minutes * 60 if last_minutes else None
+            segments = self._window_segments(log_path, since) if since is not None else [log_path]
+
+        errors = []
+        budget = max_bytes - PAGE_FIELDS_BYTES
+
+        def add(error):
+            """Add an error to the page; False if the page is full without it."""
+            nonlocal budget
+            size = json_size(error) + 2
+            if size > budget and errors:
+                return False
+            if size > budget:
+                # Too large for a page of its own
+                error = dict(shrink(error, budget - 2), truncated=True)
+            budget -= size
+            errors.append(error)
+            return True
+
+        for path in segments:
+            if position is not None:
+                # The first page found where the window starts; errors past it are all inside
+                identity = position["identity"]
+                start_offset, start_line, scan_since = position["offset"], position["line"], None
+            else:
+                identity = {key: value for key, value in file_identity(path).items()
+                            if key in ("inode", "size", "head_len", "head_hash")}
+                start_offset, start_line, scan_since = 0, 1, None
+                if since is not None:
+                    start = self._recent_start(path, since)
+                    if start is None:
+                        continue
+                    start_offset, start_line, scan_since = start
+
+            if is_compressed(path) and scan_since is None:
+                position = None
+                archive_errors, resume_line = self._archive_errors(path, context_lines)
+                for error in archive_errors:
+                    if error["start_line"] < start_line or (resume_line is not None
+                                                            and error["end_line"] >= resume_line):
+                        continue
+                    if not add(error):
+                        next_cursor = encode_cursor(query, path=path, identity=identity, since=since,
+                                                    line=error["start_line"], offset=None)
+                        return {"errors": errors, "has_more": True, "next_cursor": next_cursor}
+                if resume_line is not None:
+                    # Out of time before the end of the archive: the next page scans it again
+                    next_cursor = encode_cursor(query, path=path, identity=identity, since=since,
+                                                line=resume_line, offset=None)
+                    return {"errors": errors, "has_more": True, "next_cursor": next_cursor, "partial": True}
+                continue
+
+            _expect_scan(path, start_offset)
+            with open_log(path) as f:
+                before = None
+                if position is not None:
+                    before = lines_before(f, start_offset, context_lines)
+                position = None
+                f.seek(start_offset)
+                scan = ErrorScan(f, self.error_matcher, context_lines, start_offset, start_line,
+                                 since=scan_since, before=before)
+                for error in scan:
+                    error["log_file"] = path
+                    if not add(error):
+                        next_cursor = encode_cursor(query, path=path, identity=identity, since=since,
+                                                    line=error["start_line"],
+                                                    offset=scan.line_offset(error["start_line"]))
+                        return {"errors": errors, "has_more": True, "next_cursor": next_cursor}
+                if scan.cut_short:
+                    # Out of time: the next page starts where this scan stopped, and
+                    # re-reads the spans it couldn't finish
+                    errors = [e for e in errors if e["log_file"] != path or e["end_line"] < scan.resume_line]
+                    next_cursor = encode_cursor(query, path=path, identity=identity, since=since,
+                                                line=scan.resume_line, offset=scan.resume_offset)
+                    return {"errors": errors, "has_more": True, "next_cursor": next_cursor, "partial": True}
+        return {"errors": errors, "has_more": False, "next_cursor": None}
+
+    def _find_errors_archive(self, log_path: str, context_lines: int):
+        """Scans a compressed log in one pass; archives don't grow, so the result is kept as its checkpoint."""
+        return self._archive_errors(log_path, context_lines)[0]
+
+    def _archive_errors(self, log_path: str, context_lines: int):
+        """(errors, resume_line) of a compressed log, scanned whole once and kept as its checkpoint.
+
+        resume_line is None once every error was found; if time ran out first,
+        it is the line to scan again from, and spans ending there or after may
+        be unfinished.
+        """
+        patterns_key = self.error_matcher.fingerprint
+        checkpoint = self.checkpoints.load(log_path, context_lines, patterns_key)
+        if checkpoint:
+            return list(checkpoint["errors"]), None
+
+        identity = file_identity(log_path)
+        _expect_scan(log_path, 0)
+        with open_log(log_path) as f:
+            scan = ErrorScan(f, self.error_matcher, context_lines)
+            found_errors = [dict(error, log_file=log_path) for error in scan]
+        if scan.cut_short:
+            return found_errors, scan.resume_line
+        self.checkpoints.save(log_path, None, context_lines, patterns_key, identity,
+                              scan.resume_offset, scan.resume_line, scan.resume_context, found_errors)
+        return found_errors, None
+
+    def _find_errors_incremental(self, log_path: str, context_lines: int):
+        """Scans the log from its last checkpoint and merges with the errors found before it."""
+        patterns_key = self.error_matcher.fingerprint
+        identity = file_identity(log_path)
+        checkpoint = self.checkpoints.load(log_path, context_lines, patterns_key)
+        if checkpoint:
+            start_offset, start_line = checkpoint["offset"], checkpoint["line_number"]
+            before, found_errors = checkpoint["context"], list(checkpoint["errors"])
+        else:
+            start_offset, start_line, before, found_errors = 0, 1, [], []
+        known = len(found_errors)
+        _expect_scan(log_path, start_offset)
+
+        # Large unscanned regions are split across worker processes, leaving the
+        # tail of the file to the streaming scan so it can set the checkpoint
+        cut = parallel_cut(log_path, start_offset, identity["size"])
+        if cut is not None:
+            result = scan_errors_parallel(log_path, self.error_patterns, context_lines,
+                                          start_offset, cut, start_line)
+            if result is not None:
+                scanned(result[1] - start_offset, len(result[0]))
+                # The worker processes keep their own metrics; only the bytes are known here
+                count("bytes_read", result[1] - start_offset, scan="errors")
+                errors, start_offset, start_line, before = result
+                for error in errors:
+                    error["log_file"] = log_path
+                found_errors.extend(errors)
+
+        with open(log_path, 'rb') as f:
+            f.seek(start_offset)
+            scan = ErrorScan(f, self.error_matcher, context_lines, start_offset, start_line, before=before)
+            for error in scan:
+                error["log_file"] = log_path
+                found_errors.append(error)
+
+        # The errors before the checkpoint are stored already
+        final_errors = [e for e in found_errors[known:] if e["end_line"] < scan.resume_line]
+        self.checkpoints.save(log_path, checkpoint, context_lines, patterns_key, identity,
+                              scan.resume_offset, scan.resume_line, scan.resume_context, final_errors)
+        return found_errors
+
+    def find_errors_all(self, last_minutes: int = None, context_lines: int = 5,
+                        time_budget_seconds: float = 30, max_results: int = 200,
+                        cluster: bool = True, cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES):
+        """Finds errors across every discovered ComfyUI log file at once.
+        Logs are scanned concurrently and the results ranked by severity, then by
+        recency (newest log and latest line first). If time_budget_seconds runs out,
+        the scans stop and what they found is returned, listing the logs they didn't
+        finish; whole logs carry on from where they stopped when asked again.
+        With cluster (the default), repeats of the same error across all logs are
+        grouped as in find_errors and ranked by severity, then by count; max_results
+        then limits the number of clusters. Results come in pages of at most
+        max_bytes (0 for no limit); pass next_cursor back as cursor for the next one.
+        Rotated and compressed logs are scanned like any other; with last_minutes,
+        logs last written before the timeframe are skipped without being read.
+        Progress (bytes scanned, errors so far, time left) is reported as they are.
+        """
+        query = query_key("find_errors_all", last_minutes, context_lines, max_results, cluster)
+        start_time = time.time()
+        log_files = self._discover_logs().get("log_files", [])
+        mtimes = {}
+        for log_path in log_files:
+            try:
+                mtimes[log_path] = os.path.getmtime(log_path)
+            except OSError:
+                pass
+
+        since = time.time() - last_minutes * 60 if last_minutes else None
+        # The scans' own deadline, which (unlike time_budget()) stays put for any that outlive this call
+        call = current_progress()
+        deadline = time.monotonic() + time_budget_seconds if time_budget_seconds else None
+        if call is not None and call.deadline is not None:
+            deadline = call.deadline if deadline is None else min(deadline, call.deadline)
+        scans = CallProgress(call.forward if call is not None else None, deadline)
+        # Rotated segments are discovered as logs of their own, so each file is scanned alone.
+        # Each scan runs in a copy of this call's context, so cancelling the call stops them too
+        futures = {self.search_pool.submit(contextvars.copy_context().run, self._file_errors_in_time, scans,
+                                           log_path, since, context_lines): log_path
+                   for log_path in mtimes}
+        timeout = max(0.0, deadline - time.monotonic()) + SEARCH_GRACE_SECONDS if deadline is not None else None
+        done, not_done = wait(futures, timeout=timeout)
+        # Scans that haven't started never will; running ones stop at their next check
+        # and whole logs leave a checkpoint, so asking again picks up where they got to
+        for future in not_done:
+            future.cancel()
+
         found_errors = []
-        current_time = time.time()
-
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-
-        for i, line in enumerate(lines):
-            if last_minutes:
-                # This is a very basic timestamp check. Real-world logs might need more robust parsing.
-                # Assuming log lines might start with a timestamp that can be parsed.
-                # For now, we'll just check if the file modification time is within the last_minutes.
-                # A more accurate approach would involve parsing timestamps from each log line.
-                log_mtime = os.path.getmtime(log_path)
-                if (current_time - log_mtime) > (last_minutes * 60):
-                    continue # Skip lines older than the specified timeframe
-
-            for error_type, patterns in self.error_patterns.items():
-                for pattern_str in patterns:
-                    if re.search(pattern_str, line, re.IGNORECASE):
-                        start_index = max(0, i - context_lines)
-                        end_index = min(len(lines), i + context_lines + 1)
-                        context = "".join(lines[start_index:end_index]).strip()
-
-                        found_errors.append({
-                            "type": error_type,
-                            "line_number": i + 1,
-                            "error_line": line.strip(),
-                            "context": context,
-                            "log_file": log_path
-                        })
-                        break # Found a match for this line, move to next line
-        return {"errors": found_errors}
-
-    # Placeholder for future features
-    def monitor_gpu_memory_warnings(self, log_path: str):
-        """Monitors a log for GPU memory warnings."""
-        return {"message": "GPU memory warning monitoring not yet implemented."}
-
-    def find_workflow_by_id(self, workflow_id: str, log_path: str):
-        """Finds workflow execution details by ID."""
-        return {"message": "Workflow ID search not yet implemented."}
+        failed_files = {}
+        incomplete_files = [futures[future] for future in not_done]
+        for future in done:
+            log_path = futures[future]
+            try:
+                errors, was_cut_short = future.result()
+            except Exception as e:
+                failed_files[log_path] = str(e)
+                continue
+            if was_cut_short:
+                incomplete_files.append(log_path)
+            for error in errors:
+                severity = max(ERROR_SEVERITY.get(error_type, DEFAULT_SEVERITY) for error_type in error["error_types"])
+                found_errors.append(dict(error, severity=severity))
+
+        found_errors.sort(key=lambda e: (-e["severity"], -mtimes[e["log_file"]], -e["line_number"]))
+        if cluster:
+            # Occurrence order within each log, so first/last come out right
+            clusters = cluster_errors(sorted(found_errors, key=lambda e: (mtimes[e["log_file"]], e["line_number"])))
+            clusters.sort(key=lambda c: (-c["severity"], -c["count"]))
+            key, listing = "clusters", {"clusters": clusters[:max_results], "distinct_errors": len(clusters)}
+        else:
+            key, listing = "errors", {"errors": found_errors[:max_results]}
+        return _page({
+            **listing,
+            "total_errors": len(found_errors),
+            "files_scanned": len(done) - len(failed_files),
+            "files_total": len(mtimes),
+            "incomplete_files": sorted(incomplete_files),
+            "failed_files": failed_files,
+            "search_time": time.time() - start_time
+        }, key, query, cursor, max_bytes)
 
+    def monitor_gpu_memory_warnings(self, log_path: str, last_minutes: int = None, max_events: int = 100,
+                                    cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES):
+        """Extracts GPU memory events from a log: CUDA out of memory errors, models
+        "loaded partially", lowvram mode and offloading, and reported free VRAM.
+        Each event has its type, line number, timestamp (the last one logged before
+        it), byte amounts where the line gives them, and the prompt it happened in.
+        Also returns, per ComfyUI run, event counts, a memory pressure series
+        (0 none, 1 offload, 2 lowvram/partial load, 3 OOM) and the prompts that
+        hit memory pressure with their execution time. "loaded completely" lines
+        carry no pressure and are only counted per run. Only the newest max_events
+        events are listed, series are downsampled to at most 100 points (keeping
+        each stretch's peak) and only the newest 10 pressured prompts of a run are
+        listed; last_minutes limits events and series to that timeframe. If time
+        runs out first, returns what was read so far with partial set.
+        Events come in pages of at most max_bytes (0 for no limit); pass next_cursor
+        back as cursor for the next one.
+        """
+        if not os.path.exists(log_path):
+            return {"error": f"Log file not found: {log_path}"}
+
+        try:
+            log_id, state = self.vram_events.update(log_path)
+            since = time.time() - last_minutes * 60 if last_minutes else None
+            listed = True
+            if since is not None and state["last_time"] is None:
+                # No timestamps in this log, so fall back to the file modification time
+                listed = os.path.getmtime(log_path) >= since
+                since = None
+            events, event_counts = self.vram_events.events(log_id, state, since, max_events) if listed else ([], {})
+            runs = self.vram_events.runs(log_id, state, since)
+        except READ_ERRORS + (sqlite3.Error,) as e:
+            return {"error": f"Failed to read log: {e}"}
+
+        query = query_key("monitor_gpu_memory_warnings", os.path.abspath(log_path), last_minutes, max_events)
+        return _page(_note_partial({
+            "log_file": log_path,
+            "events": events,
+            "total_events": sum(event_counts.values()),
+            "event_counts": event_counts,
+            "runs": runs,
+        }), "events", query, cursor, max_bytes)
+
+    def query_log(self, log_path: str = None, error_type: str = None, level: str = None,
+                  last_minutes: int = None, group_by: str = None, limit: int = 100,
+                  cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES):
+        """Queries the structured records of a log: every line matching an error
+        pattern or logged at WARNING/ERROR/CRITICAL level, with its timestamp, level,
+        source (logger or [prefix]) and error type. Logs are parsed once into an
+        indexed store and only appended lines are parsed later, so filtering by
+        error_type, level and last_minutes is a lookup. With group_by ("error_type",
+        "level" or "source") returns counts instead of records; otherwise the newest
+        limit records, in pages of at most max_bytes (0 for no limit); pass next_cursor
+        back as cursor for the next page. Covers every discovered log if log_path is
+        not given. If time runs out first, returns what was parsed so far with
+        partial set.
+        """
+        if group_by and group_by not in GROUP_COLUMNS:
+            return {"error": f"group_by must be one of {', '.join(GROUP_COLUMNS)}"}
+        query = query_key("query_log", log_path and os.path.abspath(log_path), error_type, level,
+                          last_minutes, limit)
+        if log_path:
+            if not os.path.exists(log_path):
+                return {"error": f"Log file not found: {log_path}"}
+            log_files = [log_path]
+        else:
+            log_files = self._discover_logs().get("log_files", [])
 
+        since = time.time() - last_minutes * 60 if last_minutes else None
+        log_files = _window_logs(log_files, since)
+        records, counts = [], {}
+        failed_files = {}
+        for path in log_files:
+            try:
+                log_id, state = self.log_store.update(path)
+                file_since = since
+                if since is not None and state["last_time"] is None:
+                    # No timestamps in this log, so fall back to the file modification time
+                    if os.path.getmtime(path) < since:
+                        continue
+                    file_since = None
+                if group_by:
+                    for key, number in self.log_store.counts(log_id, group_by, error_type, level, file_since).items():
+                        counts[key] = counts.get(key, 0) + number
+                else:
+                    for record in self.log_store.records(path, log_id, error_type, level, file_since, limit):
+                        record["log_file"] = path
+                        records.append(record)
+            except READ_ERRORS + (sqlite3.Error,) as e:
+                failed_files[path] = str(e)
+
+        if group_by:
+            result = {"group_by": group_by, "counts": counts, "failed_files": failed_files}
+        else:
+            records.sort(key=lambda r: (r["timestamp"] or 0, r["line_number"]), reverse=True)
+            result = {"records": records[:limit], "failed_files": failed_files}
+        if group_by:
+            return _note_partial(result)
+        return _page(_note_partial(result), "records", query, cursor, max_bytes)
+
+    def analyze_execution_times(self, log_path: str = None, last_minutes: int = None, top_n: int = 20,
+                                cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES):
+        """Summarizes how long prompts and nodes take to execute, to find what makes
+        generation slow. Reads "Prompt executed in" lines, per-node timings printed by
+        profiling custom nodes ("#3 [KSampler]: 5.1s", "VAEDecode took 0.5s") and
+        completed progress bars (how samplers appear in a default log). Returns
+        count, p50/p95/p99, max and total seconds for prompts and for the top_n nodes
+        by total time, the slowest prompts, and regressions: names whose median got
+        at least 25% slower in the last last_minutes (or, without a window, in their
+        most recent runs) than before. Covers every discovered log if log_path is not given.
+        If time runs out first, returns what was read so far with partial set.
+        Nodes come in pages of at most max_bytes (0 for no limit); pass next_cursor
+        back as cursor for the next one.
+        """
+        query = query_key("analyze_execution_times", log_path and os.path.abspath(log_path), last_minutes, top_n)
+        if log_path:
+            if not os.path.exists(log_path):
+                return {"error": f"Log file not found: {log_path}"}
+            log_files = [log_path]
+        else:
+            log_files = self._discover_logs().get("log_files", [])
+
+        since = time.time() - last_minutes * 60 if last_minutes else None
+        log_files = _window_logs(log_files, since)
+        prompts, nodes, regressions = [], {}, []
+        failed_files = {}
+        for path in log_files:
+            try:
+                state = self.execution_timings.extract(path)
+            except READ_ERRORS as e:
+                failed_files[path] = str(e)
+                continue
+
+            # Prompts and nodes apart, since a node may well be called "prompt"
+            samples = [("prompt", "prompt", state["prompts"])]
+            samples += [("node", name, entries) for name, entries in state["nodes"].items()]
+            for kind, name, entries in samples:
+                regression = find_regression(kind, name, entries, since if state["last_time"] else None)
+                if regression:
+                    regression["log_file"] = path
+                    regressions.append(regression)
+
+            if since is not None:
+                if state["last_time"] is None:
+                    # No timestamps in this log, so fall back to the file modification time
+                    if os.path.getmtime(path) < since:
+                        continue
+                else:
+                    samples = [(kind, name, [s for s in entries if s[1] is not None and s[1] >= since])
+                               for kind, name, entries in samples]
+            for kind, name, entries in samples:
+                if kind == "prompt":
+                    prompts.extend([path] + sample for sample in entries)
+                else:
+                    nodes.setdefault(name, []).extend(s[2] for s in entries)
+
+        node_stats = [dict(name=name, **summarize(durations)) for name, durations in nodes.items() if durations]
+        node_stats.sort(key=lambda stats: -stats["total_seconds"])
+        slowest = sorted(prompts, key=lambda p: -p[3])[:5]
+        regressions.sort(key=lambda r: -r["ratio"])
+        return _page(_note_partial({
+            "prompts": summarize([p[3] for p in prompts]),
+            "slowest_prompts": [{"log_file": p[0], "line_number": p[1], "timestamp": p[2], "seconds": p[3]}
+                                for p in slowest],
+            "nodes": node_stats[:top_n],
+            "regressions": regressions,
+            "files_scanned": len(log_files) - len(failed_files),
+            "failed_files": failed_files,
+        }), "nodes", query, cursor, max_bytes)
+
+    def analyze_model_loads(self, log_path: str = None, last_minutes: int = None, top_n: int = 20,
+                            cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES):
+        """Reports model loading churn: how often each model (checkpoint, LoRA, VAE,
+        text encoder, ...) is loaded onto the GPU, how often it is reloaded after being
+        evicted within the same ComfyUI run, how long loads take and the estimated
+        time lost to reloading (measured where the log has load times or timestamps,
+        otherwise the model's median load time). Models are listed by time lost, then
+        by reloads. Only loads in the last last_minutes are counted if given. Covers
+        every discovered log if log_path is not given. If time runs out first,
+        returns what was read so far with partial set. Models come in pages of at
+        most max_bytes (0 for no limit); pass next_cursor back as cursor for the next one.
+        """
+        query = query_key("analyze_model_loads", log_path and os.path.abspath(log_path), last_minutes, top_n)
+        if log_path:
+            if not os.path.exists(log_path):
+                return {"error": f"Log file not found: {log_path}"}
+            log_files = [log_path]
+        else:
+            log_files = self._discover_logs().get("log_files", [])
+
+        since = time.time() - last_minutes * 60 if last_minutes else None
+        log_files = _window_logs(log_files, since)
+        models = {}
+        models_unloaded = 0
+        failed_files = {}
+        for path in log_files:
+            try:
+                state = self.model_loads.extract(path)
+            except READ_ERRORS as e:
+                failed_files[path] = str(e)
+                continue
+            if since is not None and state["last_time"] is None and os.path.getmtime(path) < since:
+                # No timestamps in this log, so fall back to the file modification time
+                continue
+            windowed = since is not None and state["last_time"] is not None
+            models_unloaded += sum(unload[2] for unload in state["unloads"]
+                                   if not windowed or (unload[1] is not None and unload[1] >= since))
+            for name, model in state["models"].items():
+                loads = model["loads"]
+                if windowed:
+                    loads = [load for load in loads if load[1] is not None and load[1] >= since]
+                if loads:
+                    entry = models.setdefault(name, {"kind": model["kind"], "loads": []})
+                    entry["loads"].extend(loads)
+
+        summaries = [summarize_model(name, model["kind"], model["loads"]) for name, model in models.items()]
+        summaries.sort(key=lambda m: (-m["estimated_lost_seconds"], -m["reloads"], -m["loads"]))
+        return _page(_note_partial({
+            "models": summaries[:top_n],
+            "total_loads": sum(m["loads"] for m in summaries),
+            "total_reloads": sum(m["reloads"] for m in summaries),
+            "estimated_lost_seconds": sum(m["estimated_lost_seconds"] for m in summaries),
+            "models_unloaded": models_unloaded,
+            "files_scanned": len(log_files) - len(failed_files),
+            "failed_files": failed_files,
+        }), "models", query, cursor, max_bytes)
+
+    def find_workflow_by_id(self, workflow_id: str, log_path: str = None, max_lines: int = 200,
+                            cursor: str = None, max_bytes: int = MAX_RESPONSE_BYTES):
+        """Finds the executions of a prompt or workflow ID and returns their timeline.
+        Looks the ID up in an index of the log (built on first use and extended as
+        the log grows) and reads only the matching executions, from "got prompt" to
+        "Prompt executed". Each execution has its status (finished, error, running),
+        execution time and a timeline of queue, model load, node, progress, error and
+        finish lines. Searches every discovered log if log_path is not given. If
+        time runs out first, returns what was indexed so far with partial set.
+        Executions come in pages of at most max_bytes (0 for no limit); pass
+        next_cursor back as cursor for the next one.
+        """
+        query = query_key("find_workflow_by_id", workflow_id, log_path and os.path.abspath(log_path), max_lines)
+        if log_path:
+            if not os.path.exists(log_path):
+                return {"error": f"Log file not found: {log_path}"}
+            log_files = [log_path]
+        else:
+            log_files = self._discover_logs().get("log_files", [])
+
+        executions = []
+        failed_files = {}
+        for path in log_files:
+            try:
+                for execution in self.prompt_index.timeline(path, workflow_id, max_lines, self.error_matcher):
+                    execution["log_file"] = path
+                    executions.append(execution)
+            except READ_ERRORS as e:
+                failed_files[path] = str(e)
+
+        if not executions:
+            return _note_partial({
+                "workflow_id": workflow_id, "executions": [], "failed_files": failed_files,
+                "message": f"No executions mentioning {workflow_id} found in {len(log_files)} log file(s)."})
+        return _page(_note_partial({"workflow_id": workflow_id, "executions": executions,
+                                    "failed_files": failed_files}), "executions", query, cursor, max_bytes)
+
+    def get_metrics(self, output: str = "json", reset: bool = False):
+        """Returns this server's own metrics, to see where the time of slow calls goes.
+        Counters: bytes_read, lines_scanned and patterns_evaluated per kind of scan,
+        cache_hits/cache_misses per cache, tool_errors per tool and response_bytes of
+        paged responses. Spans (count, wall seconds, CPU seconds, longest run): tool
+        calls, the JSON sizing of paged responses, discovery and its steps,
+        subprocesses, block reads and scans. CPU seconds well below wall seconds mean waiting on the disk
+        or a subprocess. output is "json" or "prometheus" (text exposition format);
+        reset=True starts the metrics over after returning them.
+        """
+        if output not in ("json", "prometheus"):
+            return {"error": f"output must be json or prometheus, not {output!r}"}
+        metrics = metrics_snapshot(reset)
+        if output == "prometheus":
+            return {"output": "prometheus", "text": prometheus_text(metrics)}
+        return metrics
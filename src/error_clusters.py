@@ -0,0 +1,72 @@
+"""
+Error fingerprinting for ComfyUI Log Debugger
+Groups repeated errors into clusters so responses scale with distinct problems, not occurrences
+"""
+import hashlib
+import re
+from typing import Dict, List
+
+from log_scanner import TIMESTAMP_RE, parse_timestamp
+
+# Absolute or relative paths with at least two components, Windows or POSIX
+PATH_RE = re.compile(r'(?:[A-Za-z]:)?(?:[\\/]?[\w.~-]+)?(?:[\\/][^\\/\s"\'<>:,()\[\]]+){2,}[\\/]?')
+HEX_RE = re.compile(r'\b0x[0-9a-fA-F]+\b|\b(?=[0-9a-fA-F-]*[a-fA-F])[0-9a-fA-F]{8,}(?:-[0-9a-fA-F]{4,})*\b')
+NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+SPACE_RE = re.compile(r'\s+')
+
+
+def normalize_message(line: str) -> str:
+    """An error line with timestamps, paths, hex IDs and numbers replaced by placeholders."""
+    m = TIMESTAMP_RE.match(line)
+    if m:
+        line = line[m.end():].lstrip('] ')
+    line = PATH_RE.sub('<path>', line)
+    line = HEX_RE.sub('<hex>', line)
+    line = NUMBER_RE.sub('<n>', line)
+    return SPACE_RE.sub(' ', line).strip()
+
+
+def fingerprint(error_type: str, message: str) -> str:
+    return hashlib.sha1(f"{error_type}\0{message}".encode('utf-8')).hexdigest()[:16]
+
+
+def _occurrence(error: Dict) -> Dict:
+    return {
+        "log_file": error.get("log_file"),
+        "line_number": error["line_number"],
+        "timestamp": parse_timestamp(error["error_line"]),
+    }
+
+
+def cluster_errors(errors: List[Dict]) -> List[Dict]:
+    """Group errors by type and normalized error line.
+
+    errors must be in occurrence order (per log). Each cluster has the
+    count, the first and last occurrence, and the error line and context of
+    its most recent occurrence as a representative. Clusters are ordered by
+    count, most frequent first.
+    """
+    clusters: Dict[str, Dict] = {}
+    messages: Dict[str, str] = {}
+    for error in errors:
+        line = error["error_line"]
+        message = messages.get(line)
+        if message is None:
+            message = messages[line] = normalize_message(line)
+        key = fingerprint(error["type"], message)
+        cluster = clusters.get(key)
+        if cluster is None:
+            cluster = clusters[key] = {
+                "fingerprint": key,
+                "type": error["type"],
+                "message": message,
+                "count": 0,
+                "first": _occurrence(error),
+            }
+            if "severity" in error:
+                cluster["severity"] = error["severity"]
+        cluster["count"] += 1
+        cluster["last"] = _occurrence(error)
+        cluster["error_line"] = error["error_line"]
+        cluster["context"] = error["context"]
+    return sorted(clusters.values(), key=lambda c: -c["count"])
@@ -0,0 +1,154 @@
+"""
+Execution-time analytics for ComfyUI logs
+Collects prompt and node durations incrementally and summarizes them as percentiles and regressions
+"""
+import re
+from typing import Dict, List, Optional
+
+from log_scanner import trie_regex
+from log_tables import Row, TableIndex
+
+EXECUTION_STATS_VERSION = 2
+
+# A name regresses when its recent median is this much slower than before
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_SAMPLES = 3
+# Without a time window, the newest share of samples is compared to the rest
+RECENT_SHARE = 0.2
+
+KEYWORDS = ['executed in', 'took', 'finished in', '100%|', ']:']
+KEYWORD_RE = re.compile(trie_regex(KEYWORDS).encode('ascii'))
+
+DURATION = r'(?P<seconds>[\d.]+)\s*(?P<unit>ms|s|secs?|seconds?)\b'
+# "Prompt executed in 5.32 seconds", "Prompt executed in 1 minute, 5.32 seconds"
+PROMPT_DONE_RE = re.compile(r'Prompt executed in (?:(?P<minutes>\d+) minutes?,?\s*)?(?P<seconds>[\d.]+) seconds')
+# "#3 [KSampler]: 5.12s" (profiler style)
+NODE_BRACKET_RE = re.compile(r'#(?P<node>\d+)\s*\[(?P<name>[^\]]+)\]:\s*' + DURATION, re.IGNORECASE)
+# "KSampler (#3) executed in 5.1 seconds", "VAEDecode took 0.52s", "UpscaleModel finished in 850ms"
+NODE_TOOK_RE = re.compile(r'(?P<name>[A-Za-z_][\w.-]*)(?:\s*\(#?(?P<node>\d+)\))?\s+'
+                          r'(?:executed in|took|finished in)\s+' + DURATION, re.IGNORECASE)
+# Final state of a tqdm bar: "100%|##########| 20/20 [00:04<00:00,  4.51it/s]"
+PROGRESS_DONE_RE = re.compile(r'100%\|[^|]*\|\s*(?P<total>\d+)/(?P=total)\s*\[(?:(?P<h>\d+):)?(?P<m>\d+):(?P<s>\d+)<')
+
+
+def _seconds(m) -> Optional[float]:
+    try:
+        value = float(m.group('seconds'))
+    except ValueError:
+        return None
+    return value / 1000 if m.group('unit').lower() == 'ms' else value
+
+
+def parse_timing(line: str) -> Optional[Dict]:
+    """The prompt or node duration a log line reports, or None.
+
+    Returns {"kind": "prompt" | "node", "name", "seconds"}. Completed
+    progress bars count as a node named after their step count, which is
+    how samplers show up in a default ComfyUI log.
+    """
+    m = PROMPT_DONE_RE.search(line)
+    if m:
+        return {"kind": "prompt", "name": "prompt",
+                "seconds": int(m.group('minutes') or 0) * 60 + float(m.group('seconds'))}
+
+    m = NODE_BRACKET_RE.search(line) or NODE_TOOK_RE.search(line)
+    if m:
+        seconds = _seconds(m)
+        if seconds is None:
+            return None
+        name = m.group('name').strip()
+        return {"kind": "node", "name": name, "node": m.group('node'), "seconds": seconds}
+
+    m = PROGRESS_DONE_RE.search(line)
+    if m:
+        seconds = int(m.group('h') or 0) * 3600 + int(m.group('m')) * 60 + int(m.group('s'))
+        return {"kind": "node", "name": f"progress bar ({m.group('total')} steps)", "node": None,
+                "seconds": float(seconds)}
+    return None
+
+
+def percentile(sorted_values: List[float], p: float) -> Optional[float]:
+    """Linearly interpolated percentile (0-100) of already sorted values."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(durations: List[float]) -> Dict:
+    values = sorted(durations)
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else None,
+        "total_seconds": sum(values),
+    }
+
+
+class ExecutionTimings(TableIndex):
+    """Prompt and node durations per log, extracted incrementally.
+
+    Samples are [line_number, timestamp, seconds], keyed by "prompt" or the
+    node name. Only lines containing one of KEYWORDS are decoded, and each
+    sample is a row in the LogTables, so later calls only read and store
+    what was appended; a rotated or rewritten log is read again from the
+    start.
+    """
+
+    KIND = 'execution_stats'
+    VERSION = EXECUTION_STATS_VERSION
+    KEYWORD_RE = KEYWORD_RE
+
+    def process_line(self, state: Dict, rows: List[Row], line: str, start: int, end: int, number: int):
+        timing = parse_timing(line)
+        if timing is not None:
+            rows.append((timing["kind"], timing["name"], number, state["last_time"], timing["seconds"]))
+
+    def extract(self, log_path: str) -> Dict:
+        """Bring the samples for a log up to date and return them with the log's last timestamp (read-only)."""
+        log_id, state = self.update(log_path)
+
+        def samples():
+            nodes: Dict[str, List[List]] = {}
+            for name, line_number, timestamp, seconds in self.tables.rows(log_id, "node"):
+                nodes.setdefault(name, []).append([line_number, timestamp, seconds])
+            return {
+                "last_time": state["last_time"],
+                "prompts": [[line_number, timestamp, seconds]
+                            for _, line_number, timestamp, seconds in self.tables.rows(log_id, "prompt")],
+                "nodes": nodes,
+            }
+        return self.remember(log_id, state, samples)
+
+
+def split_recent(samples: List[List], since: Optional[float]):
+    """Split samples into (baseline, recent): before and inside the window, or older and newest."""
+    if since is not None:
+        recent = [s for s in samples if s[1] is not None and s[1] >= since]
+        baseline = [s for s in samples if s[1] is not None and s[1] < since]
+        return baseline, recent
+    cut = len(samples) - max(REGRESSION_MIN_SAMPLES, int(len(samples) * RECENT_SHARE))
+    return samples[:max(cut, 0)], samples[max(cut, 0):]
+
+
+def find_regression(kind: str, name: str, samples: List[List], since: Optional[float]) -> Optional[Dict]:
+    baseline, recent = split_recent(samples, since)
+    if len(baseline) < REGRESSION_MIN_SAMPLES or len(recent) < REGRESSION_MIN_SAMPLES:
+        return None
+    baseline_p50 = percentile(sorted(s[2] for s in baseline), 50)
+    recent_p50 = percentile(sorted(s[2] for s in recent), 50)
+    if not baseline_p50 or recent_p50 < baseline_p50 * REGRESSION_RATIO:
+        return None
+    return {
+        "kind": kind,
+        "name": name,
+        "baseline_p50": baseline_p50,
+        "recent_p50": recent_p50,
+        "ratio": recent_p50 / baseline_p50,
+        "baseline_count": len(baseline),
+        "recent_count": len(recent),
+    }
@@ -0,0 +1,107 @@
+"""
+Filesystem change notifications for ComfyUI Log Debugger
+Thin ctypes wrapper around Linux inotify; callers fall back to polling elsewhere
+"""
+import ctypes
+import os
+import struct
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Everything that changes a log file or the set of files in a directory
+DIRECTORY_EVENTS = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+@lru_cache(maxsize=None)
+def _libc():
+    """libc with inotify, or None; looked up on first use, since finding it can run ldconfig."""
+    if not sys.platform.startswith('linux'):
+        return None
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+def inotify_available() -> bool:
+    return _libc() is not None
+
+
+class Inotify:
+    """A non-blocking inotify instance watching any number of directories.
+
+    fileno() can be handed to select() or loop.add_reader(); read_events()
+    drains whatever is pending as (directory, mask, name) tuples.
+    """
+
+    def __init__(self):
+        if _libc() is None:
+            raise OSError("inotify is not available on this system")
+        self.fd = _libc().inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories: Dict[int, str] = {}
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def add_watch(self, directory: str, mask: int = DIRECTORY_EVENTS) -> int:
+        wd = _libc().inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {directory}: {os.strerror(errno)}")
+        self.directories[wd] = directory
+        return wd
+
+    def remove_watch(self, directory: str):
+        for wd, watched in list(self.directories.items()):
+            if watched == directory:
+                _libc().inotify_rm_watch(self.fd, wd)
+                del self.directories[wd]
+
+    def watched(self) -> List[str]:
+        return list(self.directories.values())
+
+    def read_events(self) -> List[Tuple[Optional[str], int, str]]:
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                start = offset + _EVENT_HEADER.size
+                name = os.fsdecode(data[start:start + length].rstrip(b'\0'))
+                directory = self.directories.get(wd)
+                if mask & IN_IGNORED:
+                    self.directories.pop(wd, None)
+                events.append((directory, mask, name))
+                offset = start + length
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
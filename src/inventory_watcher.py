@@ -0,0 +1,172 @@
+"""
+Live inventory of ComfyUI installations and their log files
+A background watcher keeps get_logs a lookup instead of a rediscovery
+"""
+import fnmatch
+import os
+import select
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from fs_events import IN_DELETE_SELF, IN_ISDIR, IN_MOVE_SELF, Inotify, inotify_available
+from simple_active_discovery import LOG_PATTERNS, SimpleActiveDiscovery, simple_discover_all
+
+REDISCOVER_INTERVAL = 60
+POLL_INTERVAL = 2.0
+
+
+def is_log_name(name: str) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in LOG_PATTERNS)
+
+
+class InventoryWatcher:
+    """Keeps the installations and log files (with sizes and mtimes) up to date.
+
+    Runs in a daemon thread started with the MCP server. On Linux each
+    installation and its logs/ folder are watched with inotify, so a log
+    that is created, written, renamed or deleted shows up in the inventory
+    right away. Elsewhere the known folders are re-listed every
+    POLL_INTERVAL seconds. Discovery itself (which finds new installations
+    from .env and running processes) is re-run every REDISCOVER_INTERVAL
+    seconds through the discovery cache.
+    """
+
+    def __init__(self, rediscover_interval: float = REDISCOVER_INTERVAL, poll_interval: float = POLL_INTERVAL):
+        self.rediscover_interval = rediscover_interval
+        self.poll_interval = poll_interval
+        self.lock = threading.RLock()
+        self.ready = threading.Event()
+        self.stopping = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.inotify: Optional[Inotify] = None
+
+        self.discovery: Dict = {}
+        self.installations: List[str] = []
+        self.logs: Dict[str, Dict] = {}
+        self.last_discovery = 0.0
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="comfy-guru-inventory", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+
+    def snapshot(self) -> Optional[Dict]:
+        """The current inventory in get_logs form, or None before the first discovery."""
+        if not self.ready.is_set():
+            return None
+        with self.lock:
+            log_files = sorted(self.logs, key=lambda path: self.logs[path]["mtime"], reverse=True)
+            return dict(self.discovery,
+                        installations=list(self.installations),
+                        log_files=log_files,
+                        log_details={path: dict(self.logs[path]) for path in log_files},
+                        live=True)
+
+    def apply_discovery(self, result: Dict):
+        """Adopt a discovery result: track its installations and re-list their logs."""
+        with self.lock:
+            self.discovery = {key: value for key, value in result.items()
+                              if key not in ("installations", "log_files", "cached")}
+            self.installations = sorted(result.get("installations", []))
+            self.logs = {}
+            for installation in self.installations:
+                self._rescan_installation(installation)
+            if self.inotify is not None:
+                self._sync_watches()
+            self.last_discovery = time.time()
+        self.ready.set()
+
+    def _run(self):
+        try:
+            if inotify_available():
+                try:
+                    self.inotify = Inotify()
+                except OSError as e:
+                    print(f"Inventory watcher: inotify unavailable ({e}), polling instead", file=sys.stderr)
+            self.apply_discovery(simple_discover_all())
+
+            while not self.stopping.is_set():
+                if time.time() - self.last_discovery > self.rediscover_interval:
+                    self.apply_discovery(simple_discover_all())
+                if self.inotify is not None:
+                    self._wait_for_events()
+                else:
+                    self.stopping.wait(self.poll_interval)
+                    with self.lock:
+                        for installation in self.installations:
+                            self._rescan_installation(installation)
+        except Exception as e:
+            print(f"Inventory watcher stopped: {e}", file=sys.stderr)
+        finally:
+            if self.inotify is not None:
+                self.inotify.close()
+                self.inotify = None
+
+    def _wait_for_events(self):
+        readable, _, _ = select.select([self.inotify], [], [], min(self.poll_interval, 1.0))
+        if not readable:
+            return
+        with self.lock:
+            for directory, mask, name in self.inotify.read_events():
+                if directory is None:
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    # An installation or logs/ folder went away; let discovery decide
+                    self.last_discovery = 0.0
+                elif mask & IN_ISDIR:
+                    if name == 'logs' and directory in self.installations:
+                        self._sync_watches()
+                        self._rescan_installation(directory)
+                elif is_log_name(name):
+                    self._update_log(os.path.join(directory, name), self._installation_for(directory))
+
+    def _installation_for(self, directory: str) -> str:
+        return os.path.dirname(directory) if os.path.basename(directory) == 'logs' else directory
+
+    def _watched_directories(self) -> List[str]:
+        directories = []
+        for installation in self.installations:
+            directories.append(installation)
+            logs_dir = os.path.join(installation, 'logs')
+            if os.path.isdir(logs_dir):
+                directories.append(logs_dir)
+        return directories
+
+    def _sync_watches(self):
+        wanted = set(self._watched_directories())
+        watched = set(self.inotify.watched())
+        for directory in watched - wanted:
+            self.inotify.remove_watch(directory)
+        for directory in wanted - watched:
+            try:
+                self.inotify.add_watch(directory)
+            except OSError as e:
+                print(f"Inventory watcher: cannot watch {directory}: {e}", file=sys.stderr)
+
+    def _rescan_installation(self, installation: str):
+        found = SimpleActiveDiscovery.find_log_files(installation)
+        with self.lock:
+            for path in [p for p, info in self.logs.items() if info["installation"] == installation]:
+                if path not in found:
+                    del self.logs[path]
+        for path in found:
+            self._update_log(path, installation)
+
+    def _update_log(self, path: str, installation: str):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self.lock:
+                self.logs.pop(path, None)
+            return
+        with self.lock:
+            if installation in self.installations:
+                self.logs[path] = {"size": stat.st_size, "mtime": stat.st_mtime, "installation": installation}
@@ -0,0 +1,11 @@
+name = "Authlib"
+version = "1.9.1"
+author = "Hsiaoming Yang <me@lepture.com>"
+homepage = "https://authlib.org"
+default_user_agent = f"{name}/{version} (+{homepage})"
+
+default_json_headers = [
+    ("Content-Type", "application/json"),
+    ("Cache-Control", "no-store"),
+    ("Pragma", "no-cache"),
+]
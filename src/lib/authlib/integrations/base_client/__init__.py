@@ -0,0 +1,29 @@
+from .errors import InvalidTokenError
+from .errors import MismatchingStateError
+from .errors import MissingRequestTokenError
+from .errors import MissingTokenError
+from .errors import OAuthError
+from .errors import TokenExpiredError
+from .errors import UnsupportedTokenTypeError
+from .framework_integration import FrameworkIntegration
+from .registry import BaseOAuth
+from .sync_app import BaseApp
+from .sync_app import OAuth1Mixin
+from .sync_app import OAuth2Mixin
+from .sync_openid import OpenIDMixin
+
+__all__ = [
+    "BaseOAuth",
+    "BaseApp",
+    "OAuth1Mixin",
+    "OAuth2Mixin",
+    "OpenIDMixin",
+    "FrameworkIntegration",
+    "OAuthError",
+    "MissingRequestTokenError",
+    "MissingTokenError",
+    "TokenExpiredError",
+    "InvalidTokenError",
+    "UnsupportedTokenTypeError",
+    "MismatchingStateError",
+]
@@ -0,0 +1,5 @@
+from .authorization_server import BaseServer
+from .authorization_server import CacheAuthorizationServer
+from .resource_protector import ResourceProtector
+
+__all__ = ["BaseServer", "CacheAuthorizationServer", "ResourceProtector"]
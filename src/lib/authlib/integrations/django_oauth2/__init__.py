@@ -0,0 +1,9 @@
+# flake8: noqa
+
+from .authorization_server import AuthorizationServer
+from .endpoints import RevocationEndpoint
+from .resource_protector import BearerTokenValidator
+from .resource_protector import ResourceProtector
+from .signals import client_authenticated
+from .signals import token_authenticated
+from .signals import token_revoked
@@ -0,0 +1,8 @@
+# flake8: noqa
+
+from .authorization_server import AuthorizationServer
+from .cache import create_exists_nonce_func
+from .cache import register_nonce_hooks
+from .cache import register_temporary_credential_hooks
+from .resource_protector import ResourceProtector
+from .resource_protector import current_credential
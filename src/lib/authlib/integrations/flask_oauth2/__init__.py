@@ -0,0 +1,8 @@
+# flake8: noqa
+
+from .authorization_server import AuthorizationServer
+from .resource_protector import ResourceProtector
+from .resource_protector import current_token
+from .signals import client_authenticated
+from .signals import token_authenticated
+from .signals import token_revoked
@@ -0,0 +1,36 @@
+from authlib.oauth1 import SIGNATURE_HMAC_SHA1
+from authlib.oauth1 import SIGNATURE_PLAINTEXT
+from authlib.oauth1 import SIGNATURE_RSA_SHA1
+from authlib.oauth1 import SIGNATURE_TYPE_BODY
+from authlib.oauth1 import SIGNATURE_TYPE_HEADER
+from authlib.oauth1 import SIGNATURE_TYPE_QUERY
+
+from ..base_client import OAuthError
+from .assertion_client import AssertionClient
+from .assertion_client import AsyncAssertionClient
+from .oauth1_client import AsyncOAuth1Client
+from .oauth1_client import OAuth1Auth
+from .oauth1_client import OAuth1Client
+from .oauth2_client import AsyncOAuth2Client
+from .oauth2_client import OAuth2Auth
+from .oauth2_client import OAuth2Client
+from .oauth2_client import OAuth2ClientAuth
+
+__all__ = [
+    "OAuthError",
+    "OAuth1Auth",
+    "AsyncOAuth1Client",
+    "OAuth1Client",
+    "SIGNATURE_HMAC_SHA1",
+    "SIGNATURE_RSA_SHA1",
+    "SIGNATURE_PLAINTEXT",
+    "SIGNATURE_TYPE_HEADER",
+    "SIGNATURE_TYPE_QUERY",
+    "SIGNATURE_TYPE_BODY",
+    "OAuth2Auth",
+    "OAuth2ClientAuth",
+    "OAuth2Client",
+    "AsyncOAuth2Client",
+    "AssertionClient",
+    "AsyncAssertionClient",
+]
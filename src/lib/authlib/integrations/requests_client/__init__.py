@@ -0,0 +1,28 @@
+from authlib.oauth1 import SIGNATURE_HMAC_SHA1
+from authlib.oauth1 import SIGNATURE_PLAINTEXT
+from authlib.oauth1 import SIGNATURE_RSA_SHA1
+from authlib.oauth1 import SIGNATURE_TYPE_BODY
+from authlib.oauth1 import SIGNATURE_TYPE_HEADER
+from authlib.oauth1 import SIGNATURE_TYPE_QUERY
+
+from ..base_client import OAuthError
+from .assertion_session import AssertionSession
+from .oauth1_session import OAuth1Auth
+from .oauth1_session import OAuth1Session
+from .oauth2_session import OAuth2Auth
+from .oauth2_session import OAuth2Session
+
+__all__ = [
+    "OAuthError",
+    "OAuth1Session",
+    "OAuth1Auth",
+    "SIGNATURE_HMAC_SHA1",
+    "SIGNATURE_RSA_SHA1",
+    "SIGNATURE_PLAINTEXT",
+    "SIGNATURE_TYPE_HEADER",
+    "SIGNATURE_TYPE_QUERY",
+    "SIGNATURE_TYPE_BODY",
+    "OAuth2Session",
+    "OAuth2Auth",
+    "AssertionSession",
+]
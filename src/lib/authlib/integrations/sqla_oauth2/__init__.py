@@ -0,0 +1,19 @@
+from .client_mixin import OAuth2ClientMixin
+from .functions import create_bearer_token_validator
+from .functions import create_query_client_func
+from .functions import create_query_token_func
+from .functions import create_revocation_endpoint
+from .functions import create_save_token_func
+from .tokens_mixins import OAuth2AuthorizationCodeMixin
+from .tokens_mixins import OAuth2TokenMixin
+
+__all__ = [
+    "OAuth2ClientMixin",
+    "OAuth2AuthorizationCodeMixin",
+    "OAuth2TokenMixin",
+    "create_query_client_func",
+    "create_save_token_func",
+    "create_query_token_func",
+    "create_revocation_endpoint",
+    "create_bearer_token_validator",
+]
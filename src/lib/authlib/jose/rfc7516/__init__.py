@@ -0,0 +1,22 @@
+"""authlib.jose.rfc7516.
+~~~~~~~~~~~~~~~~~~~~~
+
+This module represents a direct implementation of
+JSON Web Encryption (JWE).
+
+:rfc:`7516`
+"""
+
+from .jwe import JsonWebEncryption
+from .models import JWEAlgorithm
+from .models import JWEAlgorithmWithTagAwareKeyAgreement
+from .models import JWEEncAlgorithm
+from .models import JWEZipAlgorithm
+
+__all__ = [
+    "JsonWebEncryption",
+    "JWEAlgorithm",
+    "JWEAlgorithmWithTagAwareKeyAgreement",
+    "JWEEncAlgorithm",
+    "JWEZipAlgorithm",
+]
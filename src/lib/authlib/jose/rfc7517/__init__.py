@@ -0,0 +1,16 @@
+"""authlib.jose.rfc7517.
+~~~~~~~~~~~~~~~~~~~~~
+
+This module represents a direct implementation of
+JSON Web Key (JWK).
+
+:rfc:`7517`
+"""
+
+from ._cryptography_key import load_pem_key
+from .asymmetric_key import AsymmetricKey
+from .base_key import Key
+from .jwk import JsonWebKey
+from .key_set import KeySet
+
+__all__ = ["Key", "AsymmetricKey", "KeySet", "JsonWebKey", "load_pem_key"]
@@ -0,0 +1,31 @@
+from .rfc5849 import SIGNATURE_HMAC_SHA1
+from .rfc5849 import SIGNATURE_PLAINTEXT
+from .rfc5849 import SIGNATURE_RSA_SHA1
+from .rfc5849 import SIGNATURE_TYPE_BODY
+from .rfc5849 import SIGNATURE_TYPE_HEADER
+from .rfc5849 import SIGNATURE_TYPE_QUERY
+from .rfc5849 import AuthorizationServer
+from .rfc5849 import ClientAuth
+from .rfc5849 import ClientMixin
+from .rfc5849 import OAuth1Request
+from .rfc5849 import ResourceProtector
+from .rfc5849 import TemporaryCredential
+from .rfc5849 import TemporaryCredentialMixin
+from .rfc5849 import TokenCredentialMixin
+
+__all__ = [
+    "OAuth1Request",
+    "ClientAuth",
+    "SIGNATURE_HMAC_SHA1",
+    "SIGNATURE_RSA_SHA1",
+    "SIGNATURE_PLAINTEXT",
+    "SIGNATURE_TYPE_HEADER",
+    "SIGNATURE_TYPE_QUERY",
+    "SIGNATURE_TYPE_BODY",
+    "ClientMixin",
+    "TemporaryCredentialMixin",
+    "TokenCredentialMixin",
+    "TemporaryCredential",
+    "AuthorizationServer",
+    "ResourceProtector",
+]
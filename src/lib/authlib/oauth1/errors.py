@@ -0,0 +1,3 @@
+# flake8: noqa
+
+from .rfc5849.errors import *
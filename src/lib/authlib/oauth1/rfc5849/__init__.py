@@ -0,0 +1,39 @@
+"""authlib.oauth1.rfc5849.
+~~~~~~~~~~~~~~~~~~~~~~
+
+This module represents a direct implementation of The OAuth 1.0 Protocol.
+
+:rfc:`5849`
+"""
+
+from .authorization_server import AuthorizationServer
+from .client_auth import ClientAuth
+from .models import ClientMixin
+from .models import TemporaryCredential
+from .models import TemporaryCredentialMixin
+from .models import TokenCredentialMixin
+from .resource_protector import ResourceProtector
+from .signature import SIGNATURE_HMAC_SHA1
+from .signature import SIGNATURE_PLAINTEXT
+from .signature import SIGNATURE_RSA_SHA1
+from .signature import SIGNATURE_TYPE_BODY
+from .signature import SIGNATURE_TYPE_HEADER
+from .signature import SIGNATURE_TYPE_QUERY
+from .wrapper import OAuth1Request
+
+__all__ = [
+    "OAuth1Request",
+    "ClientAuth",
+    "SIGNATURE_HMAC_SHA1",
+    "SIGNATURE_RSA_SHA1",
+    "SIGNATURE_PLAINTEXT",
+    "SIGNATURE_TYPE_HEADER",
+    "SIGNATURE_TYPE_QUERY",
+    "SIGNATURE_TYPE_BODY",
+    "ClientMixin",
+    "TemporaryCredentialMixin",
+    "TokenCredentialMixin",
+    "TemporaryCredential",
+    "AuthorizationServer",
+    "ResourceProtector",
+]
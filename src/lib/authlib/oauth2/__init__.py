@@ -0,0 +1,21 @@
+from .auth import ClientAuth
+from .auth import TokenAuth
+from .base import OAuth2Error
+from .client import OAuth2Client
+from .rfc6749 import AuthorizationServer
+from .rfc6749 import ClientAuthentication
+from .rfc6749 import JsonRequest
+from .rfc6749 import OAuth2Request
+from .rfc6749 import ResourceProtector
+
+__all__ = [
+    "OAuth2Error",
+    "ClientAuth",
+    "TokenAuth",
+    "OAuth2Client",
+    "OAuth2Request",
+    "JsonRequest",
+    "AuthorizationServer",
+    "ClientAuthentication",
+    "ResourceProtector",
+]
@@ -0,0 +1,13 @@
+"""authlib.oauth2.rfc7009.
+~~~~~~~~~~~~~~~~~~~~~~
+
+This module represents a direct implementation of
+OAuth 2.0 Token Revocation.
+
+:rfc:`7009`
+"""
+
+from .parameters import prepare_revoke_token_request
+from .revocation import RevocationEndpoint
+
+__all__ = ["prepare_revoke_token_request", "RevocationEndpoint"]
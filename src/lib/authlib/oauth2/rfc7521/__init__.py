@@ -0,0 +1,3 @@
+from .client import AssertionClient
+
+__all__ = ["AssertionClient"]
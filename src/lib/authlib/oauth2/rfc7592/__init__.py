@@ -0,0 +1,12 @@
+"""authlib.oauth2.rfc7592.
+~~~~~~~~~~~~~~~~~~~~~~
+
+This module represents a direct implementation of
+OAuth 2.0 Dynamic Client Registration Management Protocol.
+
+:rfc:`7592`
+"""
+
+from .endpoint import ClientConfigurationEndpoint
+
+__all__ = ["ClientConfigurationEndpoint"]
@@ -0,0 +1,14 @@
+"""authlib.oauth2.rfc7662.
+~~~~~~~~~~~~~~~~~~~~~~
+
+This module represents a direct implementation of
+OAuth 2.0 Token Introspection.
+
+:rfc:`7662`
+"""
+
+from .introspection import IntrospectionEndpoint
+from .models import IntrospectionToken
+from .token_validator import IntrospectTokenValidator
+
+__all__ = ["IntrospectionEndpoint", "IntrospectionToken", "IntrospectTokenValidator"]
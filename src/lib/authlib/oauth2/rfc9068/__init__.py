@@ -0,0 +1,11 @@
+from .introspection import JWTIntrospectionEndpoint
+from .revocation import JWTRevocationEndpoint
+from .token import JWTBearerTokenGenerator
+from .token_validator import JWTBearerTokenValidator
+
+__all__ = [
+    "JWTBearerTokenGenerator",
+    "JWTBearerTokenValidator",
+    "JWTIntrospectionEndpoint",
+    "JWTRevocationEndpoint",
+]
@@ -0,0 +1,37 @@
+"""authlib.oidc.core.
+~~~~~~~~~~~~~~~~~
+
+OpenID Connect Core 1.0 Implementation.
+
+http://openid.net/specs/openid-connect-core-1_0.html
+"""
+
+from .authorization_request import OpenIDJWTAuthenticationRequest
+from .claims import CodeIDToken
+from .claims import HybridIDToken
+from .claims import IDToken
+from .claims import ImplicitIDToken
+from .claims import UserInfo
+from .claims import get_claim_cls_by_response_type
+from .grants import OpenIDCode
+from .grants import OpenIDHybridGrant
+from .grants import OpenIDImplicitGrant
+from .grants import OpenIDToken
+from .models import AuthorizationCodeMixin
+from .userinfo import UserInfoEndpoint
+
+__all__ = [
+    "OpenIDJWTAuthenticationRequest",
+    "AuthorizationCodeMixin",
+    "IDToken",
+    "CodeIDToken",
+    "ImplicitIDToken",
+    "HybridIDToken",
+    "UserInfo",
+    "UserInfoEndpoint",
+    "get_claim_cls_by_response_type",
+    "OpenIDToken",
+    "OpenIDCode",
+    "OpenIDHybridGrant",
+    "OpenIDImplicitGrant",
+]
@@ -0,0 +1,11 @@
+from .code import OpenIDCode
+from .code import OpenIDToken
+from .hybrid import OpenIDHybridGrant
+from .implicit import OpenIDImplicitGrant
+
+__all__ = [
+    "OpenIDToken",
+    "OpenIDCode",
+    "OpenIDImplicitGrant",
+    "OpenIDHybridGrant",
+]
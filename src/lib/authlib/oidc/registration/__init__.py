@@ -0,0 +1,3 @@
+from .claims import ClientMetadataClaims
+
+__all__ = ["ClientMetadataClaims"]
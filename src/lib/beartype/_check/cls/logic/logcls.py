@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type hint logic class hierarchy** (i.e., dataclasses encapsulating
+all low-level Python code snippets and associated metadata required to
+dynamically generate high-level Python code snippets fully type-checking various
+kinds of type hints uniquely identified by common signs).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from abc import abstractmethod
+from beartype._check.code.codescope import add_hints_meta_scope_type_or_types
+from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._check.cls.hint.tree.hinttreeerror import HintTreeError
+from beartype._check.cls.hint.hintsane import HintSane
+from beartype._conf.confenum import BeartypeStrategy
+from beartype._data.cls.dataclsslot import BeartypeSlottedABCMeta
+from beartype._data.check.code.pep.datacodepep484585 import (
+    CODE_PEP484585_SEQUENCE_NONRANDOM_PITH_CHILD_EXPR,
+    CODE_PEP484585_SEQUENCE_RANDOM_PITH_CHILD_EXPR,
+    CODE_PEP484585_QUASIITERABLE_format,
+    CODE_PEP484585_REITERABLE_OR_SEQUENCE_format,
+    CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR_format,
+)
+from beartype._data.typing.datatyping import (
+    EnumeratorItem,
+    Enumerator,
+)
+from collections.abc import (
+    Callable,
+    Collection,
+    Sequence,
+)
+from typing import TYPE_CHECKING
+
+# ....................{ PRIVATE ~ hints                    }....................
+_GetCauseEnumeratorItem = Callable[[HintTreeError], EnumeratorItem]
+'''
+PEP-compliant type hint matching an **enumerator item violation cause getter**
+(i.e., callable accepting a :class:`.HintTreeError` object and returning a
+2-tuple ``(item_index, item)`` describing an arbitrary item efficiently accessed
+from the container encapsulated by this violation cause.
+
+This hint matches callables with signatures resembling:
+
+.. code-block:: python
+
+   def _get_cause_enumerator_item(cause: HintTreeError) -> EnumeratorItem:
+
+Callables matched by this hint return 2-tuples of the standard form
+``(item_index, item)`` returned by the :func:`enumerate` builtin, where:
+
+* ``item_index`` is the 0-based index of an arbitrary item efficiently accessed
+  from this container.
+* ``item`` is that item.
+'''
+
+# ....................{ SUPERCLASSES                       }....................
+class HintLogicABC(object, metaclass=BeartypeSlottedABCMeta):
+    '''
+    Abstract base class (ABC) of all **hint logic** (i.e., dataclasses
+    encapsulating all low-level Python code snippets and associated metadata
+    required to dynamically generate high-level Python code snippets fully
+    type-checking some kind of type hint uniquely identified by a common sign).
+
+    Caveats
+    -------
+    **Python code snippets should not contain ternary conditionals.** For
+    unknown reasons suggesting a critical defect in the current implementation
+    of Python 3.8's assignment expressions, snippets containing one or more
+    ternary conditionals raise :exc:`UnboundLocalError` exceptions resembling:
+
+        UnboundLocalError: local variable '__beartype_pith_1' referenced before
+        assignment
+
+    In particular, the initial draft of these snippets guarded against empty
+    sequences with a seemingly reasonable ternary conditional:
+
+    .. code-block:: python
+
+       CODE_PEP484585_SEQUENCE = \'\'\'(
+       {indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+       {indent_curr}    {hint_child_placeholder} if {pith_curr_var_name} else True
+       {indent_curr})\'\'\'
+
+    That should behave as expected, but doesn't, presumably due to obscure
+    scoping rules and a non-intuitive implementation of ternary conditionals in
+    CPython. Ergo, the current version of this snippet guards against empty
+    sequences with disjunctions and conjunctions (i.e., ``or`` and ``and``
+    operators) instead. Happily, the current version is more efficient than the
+    equivalent approach based on ternary conditionals (albeit less intuitive).
+
+    Attributes
+    ----------
+    _get_cause_enumerator_item : _GetCauseEnumeratorItem
+        **Enumerator item violation cause getter** (i.e., callable accepting a
+        :class:`.HintTreeError` object and returning a 2-tuple ``(item_index,
+        item)`` describing an arbitrary item efficiently accessed from the
+        container encapsulated by this violation cause.
+    _is_var_random_int_needed_if_conf_is_random : bool
+        :data:`True` only if the Python expression dynamically generated by the
+        subclass-specific :attr:`_make_code` factory method requires a
+        pseudo-random integer by accessing the local variable named
+        :data:`beartype._data.check.code.datacodename.VAR_NAME_RANDOM_INT` when
+        the :attr:`beartype.BeartypeConf.is_random` option is enabled. If
+        :data:`True`, the public :attr:`.make_code` factory method prefixes the
+        body of the current wrapper function by a Python statement assigning
+        such an integer to that local variable.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently called
+    # cache dunder methods. Slotting has been shown to reduce read and write
+    # costs by approximately ~10%, which is non-trivial.
+    __slots__ = (
+        '_get_cause_enumerator_item',
+        '_is_var_random_int_needed_if_conf_is_random',
+    )
+
+    # Squelch false negatives from mypy. This is absurd. This is mypy. See:
+    #     https://github.com/python/mypy/issues/5941
+    if TYPE_CHECKING:
+        _get_cause_enumerator_item: _GetCauseEnumeratorItem
+        _is_var_random_int_needed_if_conf_is_random: bool
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        get_cause_enumerator_item: _GetCauseEnumeratorItem,
+
+        # Optional parameters.
+        is_var_random_int_needed_if_conf_is_random: bool = False,
+    ) -> None:
+        '''
+        Initialize this hint logic.
+
+        Parameters
+        ----------
+        See the class docstring for further details.
+        '''
+        assert callable(get_cause_enumerator_item), (
+            f'{repr(get_cause_enumerator_item)} uncallable.')
+        assert isinstance(is_var_random_int_needed_if_conf_is_random, bool), (
+            f'{repr(is_var_random_int_needed_if_conf_is_random)} not boolean.')
+
+        # Classify all passed parameters.
+        self._get_cause_enumerator_item = get_cause_enumerator_item
+        self._is_var_random_int_needed_if_conf_is_random = (
+            is_var_random_int_needed_if_conf_is_random)
+
+    # ..................{ ITERATORS                          }..................
+    def enumerate_cause_items(self, cause: HintTreeError) -> Enumerator:
+        '''
+        Arbitrary iterator satisfying the :func:`enumerate` protocol over a
+        subset or possibly all items contained in the current pith as configured
+        by the beartype configuration of the passed violation cause.
+
+        That configuration configures how many items this iterator enumerates
+        over. In particular, if that configuration enables:
+
+        * The default :math:`O1` constant-time type-checking strategy (i.e., if
+          ``conf.strategy is beartype.BeartypeStrategy.O1``), this iterator
+          efficiently enumerates over only a fixed number of (typically only one
+          or two) items of this pith.
+        * The :math:`On` linear-time type-checking strategy (i.e., if
+          ``conf.strategy is beartype.BeartypeStrategy.On``), this iterator
+          inefficiently enumerates over *all* items of this pith.
+
+        Parameters
+        ----------
+        cause: HintTreeError
+            Type-checking violation cause finder to be inspected.
+
+        Returns
+        -------
+        Enumerator
+            Iterator yielding zero or more 2-tuples of the standard form
+            ``(item_index, item)``, where:
+
+            * ``item_index`` is the 0-based index of the currently enumerated
+              item.
+            * ``item`` is an arbitrary item of this pith.
+        '''
+
+        # Iterator to be returned.
+        container_enumerator: Enumerator = None  # type: ignore[assignment]
+
+        # If the only a single item of this container was type-checked by the
+        # parent @beartype-generated wrapper function in O(1) time, type-check
+        # only the same single item of this container in O(1) time as well.
+        if cause.conf.strategy is BeartypeStrategy.O1:
+            # 2-tuple of the index and value of an arbitrary item in the same
+            # order as the 2-tuples returned by the enumerate() builtin.
+            container_enumerator_item = self._get_cause_enumerator_item(cause)
+
+            # Iterator yielding only this 2-tuple.
+            container_enumerator = iter((container_enumerator_item,))
+        # Else, *ALL* items of this container were type-checked by the parent
+        # @beartype-generated wrapper function in O(n) time. In this case,
+        # type-check *ALL* items of this container in O(n) time as well.
+        else:
+            # Iterator yielding all indices and items of this container.
+            container_enumerator = enumerate(cause.pith)
+
+        # Return this iterator.
+        return container_enumerator
+
+    # ..................{ FACTORIES                          }..................
+    def make_code(
+        self, hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+        '''
+        Python expression deeply type-checking the current pith against the
+        currently visited container hint described by the passed parameters.
+
+        Parameters
+        ----------
+        hint_tree : HintTreeCode
+            Stack of metadata describing all visitable hints currently
+            discovered by this breadth-first search (BFS).
+        hint_child_sane : HintSane
+            **Sanified child hint metadata** (i.e., :data:`.HintSane` object)
+            encapsulating the sanification of this child hint to be
+            type-checked.
+        '''
+
+        # Increase the indentation level of code type-checking this pith
+        # *BEFORE* generating that code below..
+        hint_tree.indent_level_child += 1
+
+        # Python expression deeply type-checking this pith against this hint.
+        self._make_code(hint_tree=hint_tree, hint_child_sane=hint_child_sane)
+
+        # This expression requires a pseudo-random integer if and only if...
+        hint_tree.is_var_random_int_needed |= (
+            # The beartype configuration under which this expression was
+            # generated above allows randomized type-checking *AND*...
+            hint_tree.conf.is_random and
+            # Our subclass insists this expression requires a pseudo-random
+            # integer in that case.
+            self._is_var_random_int_needed_if_conf_is_random
+        )
+
+    # ..................{ PRIVATE ~ factories                }..................
+    @abstractmethod
+    def _make_code(
+        self, hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+        '''
+        Python expression deeply type-checking the current pith against the
+        currently visited container hint described by the passed parameters.
+
+        Subclasses are required to define this lower-level abstract factory
+        internally called by the higher-level concrete :meth:`make_code`
+        factory.
+
+        Parameters
+        ----------
+        hint_tree : HintTreeCode
+            Stack of metadata describing all visitable hints currently
+            discovered by this breadth-first search (BFS).
+        hint_child_sane : HintSane
+            **Sanified child hint metadata** (i.e., :data:`.HintSane` object)
+            encapsulating the sanification of this child hint to be
+            type-checked.
+        '''
+
+        pass
+
+# ....................{ SUBCLASSES ~ quasiiterable         }....................
+class HintLogicQuasiiterable(HintLogicABC):
+    '''
+    **Single-argument quasi-iterable hint logic** (i.e., dataclass encapsulating
+    all low-level Python code snippets and associated metadata required to
+    dynamically generate high-level Python code snippets fully type-checking
+    some kind of :pep:`484`- or :pep:`585`-compliant quasi-iterable type hint
+    uniquely identified by a common sign, satisfying at least the
+    :class:`collections.abc.Iterable` protocol subscripted by exactly one child
+    type hint constraining *all* items contained in that container) subclass.
+
+    This logic generates type-checking code for potentially "unsafe" containers
+    that are *not* necessarily guaranteed to be safely reiterable. Canonical
+    examples would be exhaustible one-time-only containers like generators and
+    iterators (even if those iterators iterate over "safe" containers that *are*
+    safely reiterable).
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self) -> None:
+        '''
+        Initialize this hint logic.
+        '''
+
+        # Initialize our superclass.
+        super().__init__(
+            get_cause_enumerator_item=_get_cause_enumerator_item_collection,
+            # Code snippets dynamically generated by this logic require
+            # pseudo-random integers to type-check random sequence items for the
+            # proper subset of quasi-iterables that are actually sequences.
+            is_var_random_int_needed_if_conf_is_random=True,
+        )
+
+    # ..................{ PRIVATE ~ factories                }..................
+    def _make_code(
+        self, hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+        assert isinstance(hint_tree, HintTreeCode), (
+            f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+        # ..................{ SUBEXPRESSIONS                 }..................
+        # Python expression evaluating to the "collections.abc.Collection" ABC
+        # as a hidden parameter passed to the current wrapper function.
+        collection_abc_expr = add_hints_meta_scope_type_or_types(
+            hint_tree=hint_tree, type_or_types=Collection)
+
+        # Python expression evaluating to the "collections.abc.Sequence" ABC as
+        # a hidden parameter passed to the current wrapper function.
+        sequence_abc_expr = add_hints_meta_scope_type_or_types(
+            hint_tree=hint_tree, type_or_types=Sequence)
+
+        # Python expression efficiently yielding the value of a (typically)
+        # pseudo-randomly selected item of the current sequence pith *BEFORE*
+        # modifying the "hint_tree.hint_curr.pith_var_name_index" and thus the
+        # "hint_tree.hint_curr.pith_var_name" property internally accessed by
+        # this getter below.
+        sequence_pith_child_expr = _get_sequence_pith_child_expr(hint_tree)
+
+        # ..................{ EXPRESSION                     }..................
+        # Name of a unique local variable storing the value of this parent pith
+        # *BEFORE* modifying the "hint_tree.hint_curr.pith_var_name_index" and
+        # thus this name as well below.
+        pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+        # Increment the integer suffixing the name of a unique local variable
+        # storing the value of this child pith *BEFORE* localizing this name.
+        hint_tree.hint_curr.pith_var_name_index += 1
+
+        # Name of a unique local variable storing the value of this child pith.
+        pith_child_var_name = hint_tree.hint_curr.pith_var_name
+
+        # Python expression deeply type-checking this pith against this hint.
+        hint_tree.func_curr_code = CODE_PEP484585_QUASIITERABLE_format(
+            collection_abc_expr=collection_abc_expr,
+            hint_curr_expr=hint_tree.hint_curr_expr,
+            indent_curr=hint_tree.indent_curr,
+            pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+            pith_curr_var_name=pith_curr_var_name,
+            pith_child_var_name=pith_child_var_name,
+            sequence_abc_expr=sequence_abc_expr,
+            sequence_pith_child_expr=sequence_pith_child_expr,
+            hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                hint_sane=hint_child_sane, pith_expr=pith_child_var_name),
+        )
+
+# ....................{ SUBCLASSES ~ (reiterable|sequence) }....................
+class HintLogicReiterable(HintLogicABC):
+    '''
+    **Single-argument reiterable hint logic** (i.e., dataclass
+    encapsulating all low-level Python code snippets and associated metadata
+    required to dynamically generate high-level Python code snippets fully
+    type-checking some kind of :pep:`484`- or :pep:`585`-compliant reiterable
+    type hint uniquely identified by a common sign, satisfying at least the
+    :class:`collections.abc.Collection` protocol subscripted by exactly one
+    child type hint constraining *all* items contained in that reiterable)
+    subclass.
+
+    Reiterables constitute all pure-Python collections *except* sequences.
+    Whereas sequences grant efficient random access to *all* sequence items,
+    reiterables grant efficient non-random access to *only* the first reiterable
+    item. Whereas quasiiterables are *not* necessarily (but *might* be) safely
+    reiterable, reiterables are collections and thus guaranteed to be safely
+    reiterable.
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self) -> None:
+        '''
+        Initialize this hint logic.
+        '''
+
+        # Initialize our superclass.
+        super().__init__(
+            get_cause_enumerator_item=_get_cause_enumerator_item_reiterable)
+
+    # ..................{ PRIVATE ~ factories                }..................
+    def _make_code(
+        self, hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+        assert isinstance(hint_tree, HintTreeCode), (
+            f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+        # Python snippet accessing the desired reiterable pith item.
+        pith_expr = CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR_format(
+            pith_curr_var_name=hint_tree.hint_curr.pith_var_name)
+
+        # Python expression deeply type-checking this pith against this hint.
+        hint_tree.func_curr_code = (
+            CODE_PEP484585_REITERABLE_OR_SEQUENCE_format(
+                hint_curr_expr=hint_tree.hint_curr_expr,
+                indent_curr=hint_tree.indent_curr,
+                pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+                pith_curr_var_name=hint_tree.hint_curr.pith_var_name,
+                hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                    hint_sane=hint_child_sane, pith_expr=pith_expr),
+            )
+        )
+
+
+class HintLogicSequence(HintLogicABC):
+    '''
+    **Single-argument sequence hint logic** (i.e., dataclass encapsulating
+    all low-level Python code snippets and associated metadata required to
+    dynamically generate high-level Python code snippets fully type-checking
+    some kind of :pep:`484`- or :pep:`585`-compliant sequence type hint
+    uniquely identified by a common sign, satisfying at least the
+    :class:`collections.abc.Sequence` protocol subscripted by exactly one child
+    type hint constraining *all* items contained in that sequence) subclass.
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self) -> None:
+        '''
+        Initialize this hint logic.
+        '''
+
+        # Initialize our superclass.
+        super().__init__(
+            get_cause_enumerator_item=_get_cause_enumerator_item_sequence,
+            # Code snippets dynamically generated by this logic require
+            # pseudo-random integers to type-check random sequence items.
+            is_var_random_int_needed_if_conf_is_random=True,
+        )
+
+    # ..................{ PRIVATE ~ factories                }..................
+    def _make_code(
+        self, hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+        assert isinstance(hint_tree, HintTreeCode), (
+            f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+        # Python expression deeply type-checking this pith against this hint.
+        hint_tree.func_curr_code = (
+            CODE_PEP484585_REITERABLE_OR_SEQUENCE_format(
+                hint_curr_expr=hint_tree.hint_curr_expr,
+                indent_curr=hint_tree.indent_curr,
+                pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+                pith_curr_var_name=hint_tree.hint_curr.pith_var_name,
+                hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                    hint_sane=hint_child_sane,
+                    pith_expr=_get_sequence_pith_child_expr(hint_tree),
+                ),
+            )
+        )
+
+# ..................{ PRIVATE ~ getters                      }..................
+def _get_sequence_pith_child_expr(hint_tree: HintTreeCode) -> str:
+    '''
+    :pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding
+    the value of some item of the current sequence pith conditionally depending
+    on the passed :attr:`beartype.BeartypeConf.is_random` option.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+    # Python expression efficiently yielding the index of either...
+    sequence_pith_child_index_expr = (
+        # If this beartype configuration allows randomized type-checking, a
+        # randomly indexed item of the current sequence pith;
+        CODE_PEP484585_SEQUENCE_RANDOM_PITH_CHILD_EXPR
+        if hint_tree.conf.is_random else
+        # Else, the first item of the current sequence pith.
+        CODE_PEP484585_SEQUENCE_NONRANDOM_PITH_CHILD_EXPR
+    )
+
+    # Return the Python expression yielding the corresponding value of the item
+    # at that index of the current sequence pith.
+    return sequence_pith_child_index_expr.format(
+        pith_curr_var_name=hint_tree.hint_curr.pith_var_name)
+
+# ..................{ PRIVATE ~ getters : cause              }..................
+def _get_cause_enumerator_item_collection(
+    cause: HintTreeError) -> EnumeratorItem:
+    '''
+    2-tuple ``(item_index, item)`` describing the first item of the passed
+    collection satisfying the format of the :func:`enumerate` iterator.
+
+    Parameters
+    ----------
+    cause: HintTreeError
+        Type-checking violation cause finder to be inspected.
+
+    Returns
+    -------
+    EnumeratorItem
+        2-tuple of the standard form ``(item_index, item)`` returned by the
+        :func:`enumerate` builtin, where:
+
+        * ``item_index`` is the 0-based index of the first item of this
+          collection.
+        * ``item`` is that item.
+    '''
+    assert isinstance(cause.pith, Collection), (
+        f'Violation cause {repr(cause)} pith not collection.')
+
+    # Return either...
+    return (
+        # If this cause describes a sequence, a pseudo-random item of this
+        # sequence;
+        _get_cause_enumerator_item_sequence(cause)
+        if isinstance(cause.pith, Sequence) else
+        # Else, this cause does *NOT* describe a sequence. Since this cause
+        # describes a collection, this cause *MUST* necessarily describe a
+        # reiterable by elimination. In this case, the first item of this
+        # reiterable.
+        _get_cause_enumerator_item_reiterable(cause)
+    )
+
+
+def _get_cause_enumerator_item_reiterable(
+    cause: HintTreeError) -> EnumeratorItem:
+    '''
+    2-tuple ``(item_index, item)`` describing the first item of the passed
+    reiterable satisfying the format of the :func:`enumerate` iterator.
+
+    Parameters
+    ----------
+    cause: HintTreeError
+        Type-checking violation cause finder to be inspected.
+
+    Returns
+    -------
+    EnumeratorItem
+        2-tuple of the standard form ``(item_index, item)`` returned by the
+        :func:`enumerate` builtin, where:
+
+        * ``item_index`` is the 0-based index of the first item of this
+          reiterable.
+        * ``item`` is that item.
+    '''
+
+    # First item of this container.
+    item = next(iter(cause.pith))
+
+    # 0-based index of this item for readability purposes.
+    item_index = 0
+
+    # Return a 2-tuple "(item_index, item)" describing this item.
+    return (item_index, item)
+
+
+def _get_cause_enumerator_item_sequence(
+    cause: HintTreeError) -> EnumeratorItem:
+    '''
+    2-tuple ``(item_index, item)`` describing a pseudo-random item of the passed
+    sequence satisfying the format of the :func:`enumerate` iterator.
+
+    Parameters
+    ----------
+    cause: HintTreeError
+        Type-checking violation cause finder to be inspected.
+
+    Returns
+    -------
+    EnumeratorItem
+        2-tuple of the standard form ``(item_index, item)`` returned by the
+        :func:`enumerate` builtin, where:
+
+        * ``item_index`` is the 0-based index of a pseudo-random item of this
+          sequence.
+        * ``item`` is that item.
+    '''
+
+    # 0-based index of the *SAME EXACT ITEM* of this sequence as type-checked in
+    # the body of the parent @beartype-generated wrapper, defaulting to merely
+    # the first item of this sequence.
+    item_index = 0
+
+    # If this beartype configuration prefers non-deterministic type-checking...
+    if cause.conf.is_random:
+        assert cause.random_int is not None, (
+            f'Violation cause {repr(cause)} pseudo-random integer is "None".')
+
+        # Prefer the same pseudo-random item derived from the random integer
+        # associated with this cause.
+        item_index = cause.random_int % len(cause.pith)
+    # Else, this beartype configuration prefers deterministic type-checking. In
+    # this case, preserve the default of the first item. *LOL* <-- killmenowfam
+
+    # Pseudo-random item with this index in this sequence.
+    item = cause.pith[item_index]
+
+    # Return a 2-tuple "(item_index, item)" describing this item.
+    return (item_index, item)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **abstract syntax tree (AST) functionality** (i.e., low-level callables
+and classes instrumenting well-typed third-party modules with runtime
+type-checking dynamically generated by the :func:`beartype.beartype` decorator).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ TODO                               }....................
+#FIXME: [PEP 484] Additionally define generator transformers. The idea here is
+#that @beartype *CAN* actually automatically type-check generator yields, sends,
+#and returns at runtime. How? By automatically injecting appropriate
+#die_if_unbearable() calls type-checking the values to be yielded, sent, and
+#returned against the appropriate type hints of the current generator factory
+#*BEFORE* yielding, sending, and returning those values. Shockingly, typeguard
+#already does this -- which is all manner of impressive. See the
+#TypeguardTransformer._use_memo() context manager for working code. Wow!
+#    https://github.com/agronholm/typeguard/blob/master/src/typeguard/_transformer.py
+#
+#Note, however, that doing so is extremely complicated in the modern Python era.
+#Why? PEP 649. Unquoted forward references in type hints are now resolved
+#dynamically at runtime via non-trivial machinery that, ultimately, calls
+#__annotate__() dunder methods declared on callables. This means that type hints
+#are no longer safely copyable at early AST transformation time, which in turn
+#means that AST transformers *CANNOT* safely copy type hints annotating
+#callables into parameters passed to die_if_unbearable() calls. Is there no hope
+#then? There is hope, actually -- and fairly trivial, too. How? Just reference
+#rather than copy nested generator type hints. Since the @beartype decorator
+#guarantees nested generator type hints to be resolved by the time these
+#die_if_unbearable() calls are actually performed, referencing these type hints
+#suffices to preserve sanity: e.g.,
+#    from collections.abc import Iterable
+#    def muh_generator_func(muh_arg: str) -> Iterable[str]:
+#        die_in_unbearable(
+#            muh_arg, muh_generator_func.__annotations__['muh_arg])
+#        yield muh_arg
+#
+#Of course, even the convoluted pseudocode above still fails to suffice. Why?
+#Because the "__annotations__" dunder dictionary is no longer safely accessible.
+#Doing so raises "NameError" exceptions for type hints subscripted by one or
+#more unquoted forward references. Instead, we'll need to call some sort of PEP
+#649-compliant private beartype utility function (which doesn't even exist,
+#currently) to efficiently retrieve specific type hints.
+#
+#Super-annoying, but also super-feasible. Still, nobody cares at the moment.
+#Let's let this one slip onto the back burner for the moment, eh?
+
+#FIXME: [SPEED] Consider generalizing the BeartypeNodeTransformer.__new__()
+#class method to internally cache and return "BeartypeNodeTransformer" instances
+#depending on the passed "conf" parameter. In general, most codebases
+#will only leverage a single @beartype configuration (if any @beartype
+#configuration at all); ergo, caching improves everything by enabling us to
+#reuse the same "BeartypeNodeTransformer" instance for every hooked module.
+#Score @beartype! See the BeartypeConf.__new__() method for relevant logic. \o/
+#FIXME: Oh, wait. We probably do *NOT* want to cache -- at least, not without
+#defining a comparable reinit() method as we do for "BeartypeCallDecorFuncData". After
+#retrieving a cached "BeartypeNodeTransformer" instance, we'll need to
+#immediately call BeartypeNodeTransformer.reinit() to reinitialize that
+#instance.
+#
+#This is all feasible, of course -- but let's just roll with the naive
+#implementation for now, please.
+
+#FIXME: [PEP 675] *OMG.* See also the third-party "executing" Python package:
+#    https://github.com/alexmojaki/executing
+#
+#IPython itself internally leverages "executing" via "stack_data" (i.e., a
+#slightly higher-level third-party Python package that internally leverages
+#"executing") to syntax-highlight the currently executing AST node. Indeed,
+#"executing" sports an intense test suite (much like ours) effectively
+#guaranteeing a one-to-one mapping between stack frames and AST nodes.
+#
+#So, what's the Big Idea here? The Big Idea here is that @beartype can
+#internally (...possibly only optionally, but possibly mandatorily) leverage
+#"executing" to begin performing full-blown static type-checking at runtime --
+#especially of mission critical type hints like "typing.LiteralString" which can
+#*ONLY* be type-checked via static analysis. :o
+#
+#So, what's the Little Idea here? The Little Idea here is that @beartype can
+#generate type-checking wrappers that type-check parameters or returns annotated
+#by "typing.LiteralString" by calling an internal private utility function --
+#say, "_die_unless_literalstring(func: Callable, arg_name: str) -> None" -- with
+#"func" as the current type-checking wrapper and "arg_name" as either the name
+#of that parameter or "return". The _die_unless_literalstring() raiser then:
+#* Dynamically searches up the call stack for the stack frame encapsulating an
+#  external call to the passed "func" callable.
+#* Passes that stack frame to the "executing" package.
+#* "executing" then returns the AST node corresponding to that stack frame.
+#* Introspects that node for the passed parameter whose name is "arg_name".
+#* Raises an exception unless the value of that parameter is an AST node
+#  corresponding to a string literal.
+#
+#Of course, that won't necessarily be fast -- but it will be accurate. Since
+#security trumps speed, speed is significantly less of a concern insofar as
+#"typing.LiteralString" is concerned. Of course, we should also employ
+#significant caching... if we even can.
+#FIXME: Actually, while demonstrably awesome, even the above fails to suffice to
+#to statically type-check "typing.LiteralString". We failed to fully read PEP
+#675, which contains a section on inference. In the worst case, nothing less
+#than a complete graph of the entire app and all transitive dependencies thereof
+#suffices to decide whether a parameter satisfies "typing.LiteralString".
+#
+#Thankfully, the above idea generalizes from "typing.LiteralString" to other
+#fascinating topics as well. Indeed, given sufficient caching, one could begin
+#to internally generate and cache a mypy-like graph network whose nodes are
+#typed attributes and whose edges are relations between those typed attributes.
@@ -0,0 +1,21 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import annotations
+
+from cryptography.hazmat.bindings._rust import (
+    cobblestone as _cobblestone,
+)
+
+Cobblestone128Decryptor = _cobblestone.Cobblestone128Decryptor
+Cobblestone128Encryptor = _cobblestone.Cobblestone128Encryptor
+Cobblestone256Decryptor = _cobblestone.Cobblestone256Decryptor
+Cobblestone256Encryptor = _cobblestone.Cobblestone256Encryptor
+
+__all__ = [
+    "Cobblestone128Decryptor",
+    "Cobblestone128Encryptor",
+    "Cobblestone256Decryptor",
+    "Cobblestone256Encryptor",
+]
@@ -0,0 +1,39 @@
+from cyclopts import config as config
+from cyclopts import types as types
+from cyclopts import validators as validators
+from cyclopts._convert import convert as convert
+from cyclopts._edit import EditorDidNotChangeError as EditorDidNotChangeError
+from cyclopts._edit import EditorDidNotSaveError as EditorDidNotSaveError
+from cyclopts._edit import EditorError as EditorError
+from cyclopts._edit import EditorNotFoundError as EditorNotFoundError
+from cyclopts._edit import edit as edit
+from cyclopts._env_var import env_var_split as env_var_split
+from cyclopts._result_action import ResultAction as ResultAction
+from cyclopts._run import run as run
+from cyclopts.argument import Argument as Argument
+from cyclopts.argument import ArgumentCollection as ArgumentCollection
+from cyclopts.core import App as App
+from cyclopts.exceptions import ArgumentOrderError as ArgumentOrderError
+from cyclopts.exceptions import CoercionError as CoercionError
+from cyclopts.exceptions import CombinedShortOptionError as CombinedShortOptionError
+from cyclopts.exceptions import CommandCollisionError as CommandCollisionError
+from cyclopts.exceptions import CycloptsError as CycloptsError
+from cyclopts.exceptions import DocstringError as DocstringError
+from cyclopts.exceptions import MissingArgumentError as MissingArgumentError
+from cyclopts.exceptions import MixedArgumentError as MixedArgumentError
+from cyclopts.exceptions import RepeatArgumentError as RepeatArgumentError
+from cyclopts.exceptions import RequiresEqualsError as RequiresEqualsError
+from cyclopts.exceptions import TokenizationError as TokenizationError
+from cyclopts.exceptions import UnknownCommandError as UnknownCommandError
+from cyclopts.exceptions import UnknownOptionError as UnknownOptionError
+from cyclopts.exceptions import UnusedCliTokensError as UnusedCliTokensError
+from cyclopts.exceptions import ValidationError as ValidationError
+from cyclopts.group import Group as Group
+from cyclopts.panel import CycloptsPanel as CycloptsPanel
+from cyclopts.parameter import Parameter as Parameter
+from cyclopts.protocols import Dispatcher as Dispatcher
+from cyclopts.token import Token as Token
+from cyclopts.utils import UNSET as UNSET
+from cyclopts.utils import default_name_transform as default_name_transform
+
+__version__: str
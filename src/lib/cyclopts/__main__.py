@@ -0,0 +1,6 @@
+"""Cyclopts CLI entry point."""
+
+from cyclopts.cli import app
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,22 @@
+"""Argument and ArgumentCollection classes for CLI parsing."""
+
+from cyclopts.annotations import get_choices_from_hint
+from cyclopts.token import Token
+
+from ._argument import Argument
+from ._collection import (
+    ArgumentCollection,
+    _resolve_groups_from_callable,
+    update_argument_collection,
+)
+from .utils import resolve_parameter_name
+
+__all__ = [
+    "Argument",
+    "ArgumentCollection",
+    "Token",
+    "_resolve_groups_from_callable",
+    "get_choices_from_hint",
+    "resolve_parameter_name",
+    "update_argument_collection",
+]
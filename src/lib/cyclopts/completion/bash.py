@@ -0,0 +1,688 @@
+"""Bash completion script generator.
+
+Generates static bash completion scripts using COMPREPLY and compgen.
+Targets bash 3.2+ with no external dependencies.
+"""
+
+import re
+from typing import TYPE_CHECKING
+
+from cyclopts.annotations import is_iterable_type
+from cyclopts.completion._base import (
+    CompletionAction,
+    CompletionData,
+    clean_choice_text,
+    escape_for_shell_pattern,
+    extract_completion_data,
+    get_completion_action,
+)
+
+if TYPE_CHECKING:
+    from cyclopts import App
+
+
+def generate_completion_script(app: "App", prog_name: str) -> str:
+    """Generate bash completion script.
+
+    Parameters
+    ----------
+    app : App
+        The Cyclopts application to generate completion for.
+    prog_name : str
+        Program name (alphanumeric with hyphens/underscores).
+
+    Returns
+    -------
+    str
+        Complete bash completion script.
+
+    Raises
+    ------
+    ValueError
+        If prog_name contains invalid characters.
+    """
+    if not prog_name or not re.match(r"^[a-zA-Z0-9_-]+$", prog_name):
+        raise ValueError(f"Invalid prog_name: {prog_name!r}. Must be alphanumeric with hyphens/underscores.")
+
+    func_name = prog_name.replace("-", "_")
+    completion_data = extract_completion_data(app)
+
+    lines = [
+        f"# Bash completion for {prog_name}",
+        "# Generated by Cyclopts",
+        "",
+        f"_{func_name}() {{",
+        "  local cur prev",
+        "",
+    ]
+
+    lines.extend(_generate_completion_function_body(completion_data, prog_name, app))
+
+    lines.extend(["}"])
+    lines.append("")
+    lines.append(f"complete -F _{func_name} {prog_name}")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def _escape_bash_choice(choice: str) -> str:
+    r"""Escape a choice for embedding inside a bash double-quoted string.
+
+    Choices live inside ``local -a _c=("..." "...")`` arrays in the generated
+    script (not as ``compgen -W`` whitespace-split tokens), so the only
+    characters the shell still interprets are ``\``, ``"``, ``$`` and
+    backtick.
+    """
+    choice = choice.replace("\\", "\\\\")
+    choice = choice.replace('"', '\\"')
+    choice = choice.replace("$", "\\$")
+    choice = choice.replace("`", "\\`")
+    return choice
+
+
+def _emit_completer_completion(indent: str, prog_name: str) -> list[str]:
+    """Emit bash that fetches ``__complete`` candidates at TAB time.
+
+    Candidates are read line-by-line and prefix-matched against ``$cur`` — never
+    fed to ``compgen -W``, which word-splits and shell-expands each value
+    (``$(...)``/backticks in completer output would execute on TAB). Descriptions
+    are dropped (``COMPREPLY`` shows values only); errors are swallowed.
+    """
+    return [
+        f"{indent}local -a _c=()",
+        f"{indent}local _line",
+        f"{indent}local _q",
+        # ``COMP_WORDS[0]`` is how the user typed the command, which isn't always
+        # directly executable (a shell function/alias, or completion registered
+        # under a different name). ``command -v`` accepts aliases, which don't
+        # expand from a variable, so use a PATH-only lookup plus a path-form check
+        # (``./prog``) -- mirrors the zsh helper's ``$+commands`` guard.
+        f'{indent}local _cmd="${{COMP_WORDS[0]}}"',
+        f'{indent}type -P "$_cmd" >/dev/null 2>&1 || [[ -x "$_cmd" ]] || _cmd="{prog_name}"',
+        f"{indent}while IFS= read -r _line; do",
+        # ``\x1fbegin`` opens the record stream: drop anything printed before it
+        # (import-time output from the program). Other \x1f lines are reserved
+        # global control directives, not candidates; skip them (forward-compat).
+        f"{indent}  [[ \"$_line\" == $'\\x1f'begin ]] && {{ _c=(); continue; }}",
+        f"{indent}  [[ \"$_line\" == $'\\x1f'* ]] && continue",
+        # Each line is a tab-delimited record (value<TAB>description<TAB>reserved...);
+        # take only the value field. Trailing fields are reserved for future
+        # per-candidate metadata and ignored here. (bash shows values only.)
+        f"{indent}  _line=\"${{_line%%$'\\t'*}}\"",
+        f'{indent}  [[ -n "$_line" ]] && _c+=("$_line")',
+        # Words after the cursor (mid-line TAB) must not be forwarded — the final
+        # word the engine sees is the one being completed. The slice sends
+        # indices 1..COMP_CWORD inclusive.
+        f'{indent}done < <("$_cmd" __complete "${{COMP_WORDS[@]:1:COMP_CWORD}}" 2>/dev/null)',
+        f"{indent}COMPREPLY=()",
+        f'{indent}for _x in "${{_c[@]}}"; do',
+        f'{indent}  [[ "$_x" == "${{cur}}"* ]] && {{ printf -v _q \'%q\' "$_x"; COMPREPLY+=("$_q"); }}',
+        f"{indent}done",
+    ]
+
+
+def _emit_choice_completion(choices: list[str], indent: str) -> list[str]:
+    """Emit bash that prefix-matches ``$cur`` against an array of choices.
+
+    Avoids ``compgen -W`` whitespace tokenization, which mangles choices
+    containing spaces, single quotes, or characters re-parsed by the
+    surrounding ``$(...)`` (e.g. backticks). Matches are ``%q``-escaped on the
+    way into ``COMPREPLY``: readline inserts entries verbatim (no ``-o
+    filenames``), so an unescaped ``release 2.0`` would land on the line as
+    two words. ``$cur`` is compared raw, so a partially-inserted escaped
+    prefix (a backslash-escaped space) does not narrow further -- acceptable for now.
+
+    Parameters
+    ----------
+    choices : list[str]
+        Raw choice strings (already cleaned via ``clean_choice_text``).
+    indent : str
+        Indentation prefix.
+
+    Returns
+    -------
+    list[str]
+        Bash code lines.
+    """
+    escaped = [_escape_bash_choice(c) for c in choices]
+    array_body = " ".join(f'"{c}"' for c in escaped)
+    return [
+        f"{indent}local -a _c=({array_body})",
+        f"{indent}local _q",
+        f"{indent}COMPREPLY=()",
+        f'{indent}for _x in "${{_c[@]}}"; do',
+        f'{indent}  [[ "$_x" == "${{cur}}"* ]] && {{ printf -v _q \'%q\' "$_x"; COMPREPLY+=("$_q"); }}',
+        f"{indent}done",
+    ]
+
+
+def _escape_bash_description(text: str) -> str:
+    r"""Escape description text for bash comments."""
+    text = text.replace("\n", " ")
+    text = text.replace("\r", " ")
+    return text
+
+
+def _map_completion_action_to_bash(action: CompletionAction) -> str:
+    """Map completion action to bash compgen flags.
+
+    Parameters
+    ----------
+    action : CompletionAction
+        Completion action type.
+
+    Returns
+    -------
+    str
+        Compgen flags ("-f", "-d", or "").
+    """
+    if action == CompletionAction.FILES:
+        return "-f"
+    elif action == CompletionAction.DIRECTORIES:
+        return "-d"
+    return ""
+
+
+def _generate_completion_function_body(
+    completion_data: dict[tuple[str, ...], CompletionData],
+    prog_name: str,
+    app: "App",
+) -> list[str]:
+    """Generate the body of the bash completion function.
+
+    Parameters
+    ----------
+    completion_data : dict
+        All extracted completion data.
+    prog_name : str
+        Program name.
+    app : App
+        Application instance.
+
+    Returns
+    -------
+    list[str]
+        Lines of bash code for the completion function body.
+    """
+    lines = []
+    lines.append('  cur="${COMP_WORDS[COMP_CWORD]}"')
+    # ``=`` is a COMP_WORDBREAK, so ``--opt=<TAB>`` puts a literal ``=`` under the
+    # cursor; the value being completed is empty (bash-completion's ``-s`` fix).
+    lines.append('  [[ "$cur" == "=" ]] && cur=""')
+    lines.append('  prev="${COMP_WORDS[COMP_CWORD-1]}"')
+    lines.append("")
+
+    lines.extend(_generate_command_path_detection(completion_data))
+    lines.append("")
+
+    lines.extend(_generate_completion_logic(completion_data, prog_name, app))
+
+    return lines
+
+
+def _generate_command_path_detection(completion_data: dict[tuple[str, ...], CompletionData]) -> list[str]:
+    """Generate bash code to detect the current command path.
+
+    This function generates two passes through COMP_WORDS:
+    1. First pass builds cmd_path by identifying valid command names
+    2. Second pass counts positionals (non-option words after the command path)
+
+    The two-pass approach is necessary because we need to know the full command
+    path length before we can correctly identify which words are positionals.
+
+    Note: all_commands is built globally across all command levels. If a positional
+    argument value happens to match a command name from a different level, it could
+    be incorrectly classified (though this represents poor CLI design).
+
+    Parameters
+    ----------
+    completion_data : dict
+        All extracted completion data.
+
+    Returns
+    -------
+    list[str]
+        Lines of bash code for command path detection.
+    """
+    options_with_values = set()
+    all_commands = set()
+
+    for data in completion_data.values():
+        for argument in data.arguments:
+            if not argument.is_flag() and argument.parameter.name:
+                for name in argument.parameter.name:
+                    if name.startswith("-"):
+                        options_with_values.add(name)
+
+        for registered_command in data.commands:
+            for cmd_name in registered_command.names:
+                if not cmd_name.startswith("-"):
+                    all_commands.add(cmd_name)
+
+    lines = []
+    lines.append("  # Build list of options that take values (to skip their arguments)")
+    if options_with_values:
+        # Option/command names are constrained to ``-``, ``_``, and alphanumerics,
+        # so they cannot contain characters that need shell escaping.
+        opts_str = " ".join(sorted(options_with_values))
+        lines.append(f"  local options_with_values='{opts_str}'")
+    else:
+        lines.append("  local options_with_values=''")
+
+    lines.append("")
+    lines.append("  # Build list of all valid command names (to distinguish from positionals)")
+    if all_commands:
+        cmds_str = " ".join(sorted(all_commands))
+        lines.append(f"  local all_commands='{cmds_str}'")
+    else:
+        lines.append("  local all_commands=''")
+
+    lines.append("")
+    lines.append("  # Detect command path by collecting valid command words only")
+    lines.append("  local -a cmd_path=()")
+    lines.append("  local i skip_next=0")
+    lines.append("  for ((i=1; i<COMP_CWORD; i++)); do")
+    lines.append('    local word="${COMP_WORDS[i]}"')
+    lines.append("    if [[ $skip_next -eq 1 ]]; then")
+    lines.append("      skip_next=0")
+    lines.append("      continue")
+    lines.append("    fi")
+    lines.append("    if [[ $word =~ ^- ]]; then")
+    lines.append("      # Check if this option takes a value")
+    lines.append('      if [[ " $options_with_values " =~ " $word " ]]; then')
+    lines.append("        skip_next=1")
+    lines.append("      fi")
+    lines.append("    else")
+    lines.append("      # Non-option word - only add to cmd_path if it's a valid command")
+    lines.append('      if [[ " $all_commands " =~ " $word " ]]; then')
+    lines.append('        cmd_path+=("$word")')
+    lines.append("      fi")
+    lines.append("    fi")
+    lines.append("  done")
+    lines.append("")
+    lines.append("  # Count positionals (non-option words after command path)")
+    lines.append("  local positional_count=0")
+    lines.append("  local cmd_path_len=${#cmd_path[@]}")
+    lines.append("  skip_next=0")
+    lines.append("  local cmd_depth=0")
+    lines.append("  for ((i=1; i<COMP_CWORD; i++)); do")
+    lines.append('    local word="${COMP_WORDS[i]}"')
+    lines.append("    if [[ $skip_next -eq 1 ]]; then")
+    lines.append("      skip_next=0")
+    lines.append("      continue")
+    lines.append("    fi")
+    lines.append("    if [[ $word =~ ^- ]]; then")
+    lines.append('      if [[ " $options_with_values " =~ " $word " ]]; then')
+    lines.append("        skip_next=1")
+    lines.append("      fi")
+    lines.append("    else")
+    lines.append("      # Non-option word")
+    lines.append("      if [[ $cmd_depth -lt $cmd_path_len ]]; then")
+    lines.append("        # Still in command path")
+    lines.append("        ((cmd_depth++))")
+    lines.append("      else")
+    lines.append("        # Past command path, this is a positional")
+    lines.append("        ((positional_count++))")
+    lines.append("      fi")
+    lines.append("    fi")
+    lines.append("  done")
+    return lines
+
+
+def _generate_completion_logic(
+    completion_data: dict[tuple[str, ...], CompletionData],
+    prog_name: str,
+    app: "App",
+) -> list[str]:
+    """Generate the main completion logic using case statements.
+
+    Parameters
+    ----------
+    completion_data : dict
+        All extracted completion data.
+    prog_name : str
+        Program name.
+    app : App
+        Application instance.
+
+    Returns
+    -------
+    list[str]
+        Lines of bash code for completion logic.
+    """
+    lines = []
+
+    help_flags = tuple(app.help_flags) if app.help_flags else ()
+    version_flags = tuple(app.version_flags) if app.version_flags else ()
+
+    lines.append("  # Determine command level and generate completions")
+    lines.append('  case "${#cmd_path[@]}" in')
+
+    max_depth = max(len(path) for path in completion_data.keys())
+    for depth in range(max_depth + 1):
+        relevant_paths = [path for path in completion_data.keys() if len(path) == depth]
+        if not relevant_paths:
+            continue
+
+        lines.append(f"    {depth})")
+
+        if depth == 0:
+            lines.extend(
+                _generate_completions_for_path(completion_data, (), "      ", help_flags, version_flags, prog_name)
+            )
+        else:
+            lines.append('      case "${cmd_path[@]}" in')
+            for path in sorted(relevant_paths):
+                # Escape glob characters in command names for case pattern matching
+                escaped_path = [escape_for_shell_pattern(cmd) for cmd in path]
+                path_str = " ".join(escaped_path)
+                lines.append(f'        "{path_str}")')
+                lines.extend(
+                    _generate_completions_for_path(
+                        completion_data, path, "          ", help_flags, version_flags, prog_name
+                    )
+                )
+                lines.append("          ;;")
+            lines.append("        *)")
+            lines.append("          ;;")
+            lines.append("      esac")
+
+        lines.append("      ;;")
+
+    lines.append("    *)")
+    lines.append("      ;;")
+    lines.append("  esac")
+
+    return lines
+
+
+def _generate_completions_for_path(
+    completion_data: dict[tuple[str, ...], CompletionData],
+    command_path: tuple[str, ...],
+    indent: str,
+    help_flags: tuple[str, ...],
+    version_flags: tuple[str, ...],
+    prog_name: str,
+) -> list[str]:
+    """Generate completions for a specific command path.
+
+    Parameters
+    ----------
+    completion_data : dict
+        All extracted completion data.
+    command_path : tuple[str, ...]
+        Current command path.
+    indent : str
+        Indentation string.
+    help_flags : tuple[str, ...]
+        Help flag names.
+    version_flags : tuple[str, ...]
+        Version flag names.
+    prog_name : str
+        Program name (fallback command for dynamic completer callbacks).
+
+    Returns
+    -------
+    list[str]
+        Lines of bash code for completions at this command path.
+    """
+    if command_path not in completion_data:
+        return [f"{indent}COMPREPLY=()"]
+
+    data = completion_data[command_path]
+    lines = []
+
+    options = []
+    keyword_args = [arg for arg in data.arguments if not arg.is_positional_only() and arg.show]
+
+    for argument in keyword_args:
+        for name in argument.parameter.name or []:
+            if name.startswith("-"):
+                options.append(name)
+
+        for name in argument.negatives:
+            if name.startswith("-"):
+                options.append(name)
+
+    flag_commands = []
+    for registered_command in data.commands:
+        for name in registered_command.names:
+            if name.startswith("-"):
+                flag_commands.append(name)
+
+    for flag in help_flags:
+        if flag.startswith("-") and flag not in options and flag not in flag_commands:
+            options.append(flag)
+
+    for flag in version_flags:
+        if flag.startswith("-") and flag not in options and flag not in flag_commands:
+            options.append(flag)
+
+    options.extend(flag_commands)
+
+    commands = []
+    for registered_command in data.commands:
+        for cmd_name in registered_command.names:
+            if not cmd_name.startswith("-"):
+                commands.append(cmd_name)
+
+    # Exclude inherited (ancestor-meta) positionals: they were consumed before
+    # this path's command name, so they must not claim a slot here. (This PR
+    # does not attempt the full #759-style subcommand shifting for bash.)
+    local_arguments = data.launcher_arguments + data.own_arguments
+    positional_args = [arg for arg in local_arguments if arg.index is not None and arg.show]
+    positional_args.sort(key=lambda a: a.index if a.index is not None else 0)
+
+    lines.append(f"{indent}if [[ ${{cur}} == -* ]]; then")
+
+    if options:
+        lines.extend(_emit_choice_completion(options, f"{indent}  "))
+    else:
+        lines.append(f"{indent}  COMPREPLY=()")
+
+    lines.append(f"{indent}else")
+
+    needs_value_completion = _check_if_prev_needs_value(data.arguments)
+
+    if needs_value_completion:
+        value_completion_lines = _generate_value_completion_for_prev(
+            data.arguments, commands, positional_args, f"{indent}  ", prog_name
+        )
+        lines.extend(value_completion_lines)
+    elif commands:
+        lines.extend(_emit_choice_completion(commands, f"{indent}  "))
+    elif positional_args:
+        lines.extend(_generate_positional_completion(positional_args, f"{indent}  ", prog_name))
+    else:
+        lines.append(f"{indent}  COMPREPLY=()")
+
+    lines.append(f"{indent}fi")
+
+    return lines
+
+
+def _generate_positional_completion(positional_args, indent: str, prog_name: str) -> list[str]:
+    """Generate position-aware positional argument completion.
+
+    Parameters
+    ----------
+    positional_args : list
+        List of positional arguments sorted by index.
+    indent : str
+        Indentation string.
+    prog_name : str
+        Program name (fallback command for dynamic completer callbacks).
+
+    Returns
+    -------
+    list[str]
+        Lines of bash code for position-aware positional completion.
+    """
+    lines = []
+
+    def _emit_one(argument, body_indent: str) -> list[str]:
+        if argument.parameter.completer is not None:
+            return _emit_completer_completion(body_indent, prog_name)
+        choices = argument.get_choices(force=True)
+        if choices:
+            cleaned = [clean_choice_text(c) for c in choices]
+            return _emit_choice_completion(cleaned, body_indent)
+        compgen_flag = _map_completion_action_to_bash(get_completion_action(argument.hint))
+        if compgen_flag:
+            return [f'{body_indent}COMPREPLY=( $(compgen {compgen_flag} -- "${{cur}}") )']
+        return [f"{body_indent}COMPREPLY=()"]
+
+    # An iterable positional (``list[X]``, ``set[X]``, or ``*args``) greedily
+    # consumes all remaining positions starting at its index. The args that
+    # follow it in ``positional_args`` are positional-or-keyword-with-default
+    # entries that can still be filled via their ``--name`` keyword forms but
+    # never end up at a later positional slot. Picking the rest-owner here:
+    # prefer the actual var-positional, otherwise the first iterable.
+    rest_idx = None
+    for i, arg in enumerate(positional_args):
+        if arg.is_var_positional():
+            rest_idx = i
+            break
+    if rest_idx is None:
+        for i, arg in enumerate(positional_args):
+            if is_iterable_type(arg.hint):
+                rest_idx = i
+                break
+
+    # Numbered cases only for positions strictly before the rest-owner.
+    head = positional_args if rest_idx is None else positional_args[:rest_idx]
+    rest_owner = None if rest_idx is None else positional_args[rest_idx]
+
+    if not head and rest_owner is not None:
+        # Rest-owner at index 0 — no case statement needed; the iterable
+        # answers every position.
+        lines.extend(_emit_one(rest_owner, indent))
+    elif len(head) == 1 and rest_owner is None and head[0].parameter.completer is None:
+        # Single non-iterable positional — simple case. Completer-backed args
+        # take the case statement below so an already-filled slot doesn't spawn
+        # a useless ``__complete`` subprocess on every TAB.
+        lines.extend(_emit_one(head[0], indent))
+    else:
+        lines.append(f"{indent}case ${{positional_count}} in")
+        for idx, argument in enumerate(head):
+            lines.append(f"{indent}  {idx})")
+            lines.extend(_emit_one(argument, f"{indent}    "))
+            lines.append(f"{indent}    ;;")
+        lines.append(f"{indent}  *)")
+        if rest_owner is not None:
+            lines.extend(_emit_one(rest_owner, f"{indent}    "))
+        else:
+            lines.append(f"{indent}    COMPREPLY=()")
+        lines.append(f"{indent}    ;;")
+        lines.append(f"{indent}esac")
+
+    return lines
+
+
+def _check_if_prev_needs_value(arguments) -> bool:
+    """Check if any options take values, requiring prev-word completion logic.
+
+    Parameters
+    ----------
+    arguments : ArgumentCollection
+        Arguments to check.
+
+    Returns
+    -------
+    bool
+        True if any option (starts with -) takes a value (is not a flag).
+    """
+    for argument in arguments:
+        if not argument.is_flag():
+            for name in argument.parameter.name or []:
+                if name.startswith("-"):
+                    return True
+    return False
+
+
+def _generate_value_completion_for_prev(
+    arguments, commands: list[str], positional_args, indent: str, prog_name: str
+) -> list[str]:
+    """Generate value completion based on previous word.
+
+    Parameters
+    ----------
+    arguments : ArgumentCollection
+        Arguments with potential values.
+    commands : list[str]
+        Available commands at this level.
+    positional_args : list
+        List of positional arguments sorted by index.
+    indent : str
+        Indentation string.
+    prog_name : str
+        Program name (fallback command for dynamic completer callbacks).
+
+    Returns
+    -------
+    list[str]
+        Lines of bash code for value completion.
+    """
+    lines = []
+    # Real interactive bash treats ``=`` as a COMP_WORDBREAK, so
+    # ``--opt=value`` tokenizes to ``--opt`` ``=`` ``value`` and ``$prev``
+    # ends up as ``=``. Resolve through the equals sign to the actual option
+    # name two slots back so the dispatch case below works for both forms.
+    lines.append(f'{indent}local _value_prev="${{prev}}"')
+    lines.append(f'{indent}if [[ "$_value_prev" == "=" && $COMP_CWORD -ge 2 ]]; then')
+    lines.append(f'{indent}  _value_prev="${{COMP_WORDS[COMP_CWORD-2]}}"')
+    lines.append(f"{indent}fi")
+    lines.append(f'{indent}case "$_value_prev" in')
+
+    has_cases = False
+    for argument in arguments:
+        if argument.is_flag():
+            continue
+
+        names = [name for name in (argument.parameter.name or []) if name.startswith("-")]
+        if not names:
+            continue
+
+        has_cases = True
+        has_completer = argument.parameter.completer is not None
+        choices = argument.get_choices(force=True)
+        action = get_completion_action(argument.hint)
+
+        for name in names:
+            lines.append(f"{indent}  {name})")
+
+            if has_completer:
+                lines.extend(_emit_completer_completion(f"{indent}    ", prog_name))
+            elif choices:
+                cleaned = [clean_choice_text(c) for c in choices]
+                lines.extend(_emit_choice_completion(cleaned, f"{indent}    "))
+            else:
+                compgen_flag = _map_completion_action_to_bash(action)
+                if compgen_flag:
+                    lines.append(f'{indent}    COMPREPLY=( $(compgen {compgen_flag} -- "${{cur}}") )')
+                else:
+                    lines.append(f"{indent}    COMPREPLY=()")
+
+            lines.append(f"{indent}    ;;")
+
+    if has_cases:
+        lines.append(f"{indent}  *)")
+        if commands:
+            lines.extend(_emit_choice_completion(commands, f"{indent}    "))
+        elif positional_args:
+            lines.extend(_generate_positional_completion(positional_args, f"{indent}    ", prog_name))
+        else:
+            lines.append(f"{indent}    COMPREPLY=()")
+        lines.append(f"{indent}    ;;")
+        lines.append(f"{indent}esac")
+    else:
+        lines = []
+        if commands:
+            lines.extend(_emit_choice_completion(commands, indent))
+        elif positional_args:
+            lines.extend(_generate_positional_completion(positional_args, indent, prog_name))
+        else:
+            lines.append(f"{indent}COMPREPLY=()")
+
+    return lines
@@ -0,0 +1,14 @@
+__all__ = [
+    "ConfigFromFile",
+    "Dict",
+    "Env",
+    "Json",
+    "Toml",
+    "Yaml",
+]
+
+from cyclopts.config._common import ConfigFromFile, Dict
+from cyclopts.config._env import Env
+from cyclopts.config._json import Json
+from cyclopts.config._toml import Toml
+from cyclopts.config._yaml import Yaml
@@ -0,0 +1,39 @@
+__all__ = [
+    "Renderer",
+    "HelpEntry",
+    "TableSpec",
+    "PanelSpec",
+    "ColumnSpec",
+    "HelpPanel",
+    "create_parameter_help_panel",
+    "format_command_entries",
+    "format_doc",
+    "format_usage",
+    "InlineText",
+    "DefaultFormatter",
+    "MarkdownFormatter",
+    "PlainFormatter",
+    "NameRenderer",
+    "DescriptionRenderer",
+    "AsteriskRenderer",
+]
+
+from .formatters import DefaultFormatter, MarkdownFormatter, PlainFormatter
+from .help import (
+    HelpEntry,
+    HelpPanel,
+    create_parameter_help_panel,
+    format_command_entries,
+    format_doc,
+    format_usage,
+)
+from .inline_text import InlineText
+from .protocols import Renderer
+from .specs import (
+    AsteriskRenderer,
+    ColumnSpec,
+    DescriptionRenderer,
+    NameRenderer,
+    PanelSpec,
+    TableSpec,
+)
@@ -0,0 +1,13 @@
+"""Help formatters for Cyclopts."""
+
+from .default import DefaultFormatter
+from .html import HtmlFormatter
+from .markdown import MarkdownFormatter
+from .plain import PlainFormatter
+
+__all__ = [
+    "DefaultFormatter",
+    "HtmlFormatter",
+    "MarkdownFormatter",
+    "PlainFormatter",
+]
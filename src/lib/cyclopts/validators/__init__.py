@@ -0,0 +1,14 @@
+__all__ = [
+    "all_or_none",
+    "LimitedChoice",
+    "MutuallyExclusive",
+    "mutually_exclusive",
+    "Number",
+    "Path",
+    "Slice",
+]
+
+from cyclopts.validators._group import LimitedChoice, MutuallyExclusive, all_or_none, mutually_exclusive
+from cyclopts.validators._number import Number
+from cyclopts.validators._path import Path
+from cyclopts.validators._slice import Slice
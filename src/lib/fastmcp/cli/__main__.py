@@ -0,0 +1,5 @@
+"""FastMCP CLI as a runnable package"""
+
+from . import app
+
+app()
@@ -0,0 +1 @@
+"""Horizon deployment support for the FastMCP CLI."""
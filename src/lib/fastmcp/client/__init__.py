@@ -0,0 +1,42 @@
+from fastmcp import _install_hints
+
+try:
+    from .auth import (
+        BearerAuth,
+        ClientCredentialsOAuthProvider,
+        OAuth,
+        PrivateKeyJWTOAuthProvider,
+    )
+    from .client import Client
+    from .transports import (
+        ClientTransport,
+        FastMCPTransport,
+        NodeStdioTransport,
+        NpxStdioTransport,
+        PythonStdioTransport,
+        SSETransport,
+        StdioTransport,
+        StreamableHttpTransport,
+        UvStdioTransport,
+        UvxStdioTransport,
+    )
+except ImportError as exc:
+    raise ImportError(_install_hints.CLIENT_SUPPORT) from exc
+
+__all__ = [
+    "BearerAuth",
+    "Client",
+    "ClientCredentialsOAuthProvider",
+    "ClientTransport",
+    "FastMCPTransport",
+    "NodeStdioTransport",
+    "NpxStdioTransport",
+    "OAuth",
+    "PrivateKeyJWTOAuthProvider",
+    "PythonStdioTransport",
+    "SSETransport",
+    "StdioTransport",
+    "StreamableHttpTransport",
+    "UvStdioTransport",
+    "UvxStdioTransport",
+]
@@ -0,0 +1,17 @@
+from .bearer import BearerAuth
+from .client_credentials import (
+    ClientCredentialsOAuthProvider,
+    PrivateKeyJWTOAuthProvider,
+    SignedJWTParameters,
+    static_assertion_provider,
+)
+from .oauth import OAuth
+
+__all__ = [
+    "BearerAuth",
+    "ClientCredentialsOAuthProvider",
+    "OAuth",
+    "PrivateKeyJWTOAuthProvider",
+    "SignedJWTParameters",
+    "static_assertion_provider",
+]
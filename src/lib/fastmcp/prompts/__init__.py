@@ -0,0 +1,12 @@
+from .function_prompt import FunctionPrompt, prompt
+from .base import Message, Prompt, PromptArgument, PromptMessage, PromptResult
+
+__all__ = [
+    "FunctionPrompt",
+    "Message",
+    "Prompt",
+    "PromptArgument",
+    "PromptMessage",
+    "PromptResult",
+    "prompt",
+]
@@ -0,0 +1,26 @@
+from .function_resource import FunctionResource, resource
+from .base import Resource, ResourceContent, ResourceResult
+from .security import ResourceSecurity
+from .template import ResourceTemplate
+from .types import (
+    BinaryResource,
+    DirectoryResource,
+    FileResource,
+    HttpResource,
+    TextResource,
+)
+
+__all__ = [
+    "BinaryResource",
+    "DirectoryResource",
+    "FileResource",
+    "FunctionResource",
+    "HttpResource",
+    "Resource",
+    "ResourceContent",
+    "ResourceResult",
+    "ResourceSecurity",
+    "ResourceTemplate",
+    "TextResource",
+    "resource",
+]
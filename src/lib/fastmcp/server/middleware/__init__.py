@@ -0,0 +1,15 @@
+from .authorization import AuthMiddleware
+from .middleware import (
+    CallNext,
+    Middleware,
+    MiddlewareContext,
+)
+from .ping import PingMiddleware
+
+__all__ = [
+    "AuthMiddleware",
+    "CallNext",
+    "Middleware",
+    "MiddlewareContext",
+    "PingMiddleware",
+]
@@ -0,0 +1,7 @@
+"""Server mixins for FastMCP."""
+
+from fastmcp.server.mixins.lifespan import LifespanMixin
+from fastmcp.server.mixins.mcp_operations import MCPOperationsMixin
+from fastmcp.server.mixins.transport import TransportMixin
+
+__all__ = ["LifespanMixin", "MCPOperationsMixin", "TransportMixin"]
@@ -0,0 +1,13 @@
+from .function_tool import FunctionTool, tool
+from .base import InputRequiredToolResult, Tool, ToolResult
+from .tool_transform import forward, forward_raw
+
+__all__ = [
+    "FunctionTool",
+    "InputRequiredToolResult",
+    "Tool",
+    "ToolResult",
+    "forward",
+    "forward_raw",
+    "tool",
+]
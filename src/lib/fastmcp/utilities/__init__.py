@@ -0,0 +1 @@
+"""FastMCP utility modules."""
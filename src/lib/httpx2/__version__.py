@@ -0,0 +1,5 @@
+from importlib.metadata import version
+
+__title__ = "httpx2"
+__description__ = "A next generation HTTP client, for Python 3."
+__version__ = version("httpx2")
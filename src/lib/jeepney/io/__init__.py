@@ -0,0 +1 @@
+from .common import RouterClosed
@@ -0,0 +1,3 @@
+"""Constants used across key-value store implementations."""
+
+DEFAULT_COLLECTION_NAME = "default_collection"
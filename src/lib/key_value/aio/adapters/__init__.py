@@ -0,0 +1,6 @@
+from key_value.aio.adapters.base_model import BaseModelAdapter
+from key_value.aio.adapters.dataclass import DataclassAdapter
+from key_value.aio.adapters.pydantic import PydanticAdapter
+from key_value.aio.adapters.raise_on_missing import RaiseOnMissingAdapter
+
+__all__ = ["BaseModelAdapter", "DataclassAdapter", "PydanticAdapter", "RaiseOnMissingAdapter"]
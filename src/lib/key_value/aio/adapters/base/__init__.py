@@ -0,0 +1,3 @@
+from key_value.aio.adapters.pydantic.base import BasePydanticAdapter
+
+__all__ = ["BasePydanticAdapter"]
@@ -0,0 +1,3 @@
+from key_value.aio.adapters.base_model.adapter import BaseModelAdapter
+
+__all__ = ["BaseModelAdapter"]
@@ -0,0 +1,3 @@
+from key_value.aio.adapters.dataclass.adapter import DataclassAdapter
+
+__all__ = ["DataclassAdapter"]
@@ -0,0 +1 @@
+from key_value.aio.protocols.key_value import AsyncKeyValue as AsyncKeyValue
@@ -0,0 +1,3 @@
+from key_value.aio.stores.aerospike.store import AerospikeStore
+
+__all__ = ["AerospikeStore"]
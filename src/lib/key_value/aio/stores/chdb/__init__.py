@@ -0,0 +1,3 @@
+from key_value.aio.stores.chdb.store import ChDBStore
+
+__all__ = ["ChDBStore"]
@@ -0,0 +1,4 @@
+from key_value.aio.stores.disk.multi_store import MultiDiskStore
+from key_value.aio.stores.disk.store import DiskStore
+
+__all__ = ["DiskStore", "MultiDiskStore"]
@@ -0,0 +1,3 @@
+from key_value.aio.stores.duckdb.store import DuckDBStore
+
+__all__ = ["DuckDBStore"]
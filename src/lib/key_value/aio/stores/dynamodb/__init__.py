@@ -0,0 +1,5 @@
+"""DynamoDB key-value store."""
+
+from key_value.aio.stores.dynamodb.store import DynamoDBStore
+
+__all__ = ["DynamoDBStore"]
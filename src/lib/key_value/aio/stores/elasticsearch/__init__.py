@@ -0,0 +1,3 @@
+from key_value.aio.stores.elasticsearch.store import ElasticsearchStore
+
+__all__ = ["ElasticsearchStore"]
@@ -0,0 +1,13 @@
+"""File-tree based store for visual inspection and testing."""
+
+from key_value.aio.stores.filetree.store import (
+    FileTreeStore,
+    FileTreeV1CollectionSanitizationStrategy,
+    FileTreeV1KeySanitizationStrategy,
+)
+
+__all__ = [
+    "FileTreeStore",
+    "FileTreeV1CollectionSanitizationStrategy",
+    "FileTreeV1KeySanitizationStrategy",
+]
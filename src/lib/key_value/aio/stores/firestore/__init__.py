@@ -0,0 +1,13 @@
+"""Firestore key-value store."""
+
+from key_value.aio.stores.firestore.store import (
+    FirestoreStore,
+    FirestoreV1CollectionSanitizationStrategy,
+    FirestoreV1KeySanitizationStrategy,
+)
+
+__all__ = [
+    "FirestoreStore",
+    "FirestoreV1CollectionSanitizationStrategy",
+    "FirestoreV1KeySanitizationStrategy",
+]
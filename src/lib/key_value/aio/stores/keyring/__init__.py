@@ -0,0 +1,3 @@
+from key_value.aio.stores.keyring.store import KeyringStore
+
+__all__ = ["KeyringStore"]
@@ -0,0 +1,3 @@
+from key_value.aio.stores.memcached.store import MemcachedStore, MemcachedV1KeySanitizationStrategy
+
+__all__ = ["MemcachedStore", "MemcachedV1KeySanitizationStrategy"]
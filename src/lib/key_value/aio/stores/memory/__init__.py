@@ -0,0 +1,3 @@
+from key_value.aio.stores.memory.store import MemoryStore
+
+__all__ = ["MemoryStore"]
@@ -0,0 +1,3 @@
+from key_value.aio.stores.mongodb.store import MongoDBStore
+
+__all__ = ["MongoDBStore"]
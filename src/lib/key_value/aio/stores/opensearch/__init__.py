@@ -0,0 +1,3 @@
+from key_value.aio.stores.opensearch.store import OpenSearchStore
+
+__all__ = ["OpenSearchStore"]
@@ -0,0 +1,5 @@
+"""PostgreSQL store for py-key-value-aio."""
+
+from key_value.aio.stores.postgresql.store import PostgreSQLStore
+
+__all__ = ["PostgreSQLStore"]
@@ -0,0 +1,3 @@
+from key_value.aio.stores.redis.store import RedisStore
+
+__all__ = ["RedisStore"]
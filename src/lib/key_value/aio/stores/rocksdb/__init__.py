@@ -0,0 +1,3 @@
+from key_value.aio.stores.rocksdb.store import RocksDBStore
+
+__all__ = ["RocksDBStore"]
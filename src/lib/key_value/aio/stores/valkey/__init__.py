@@ -0,0 +1,3 @@
+from key_value.aio.stores.valkey.store import ValkeyStore
+
+__all__ = ["ValkeyStore"]
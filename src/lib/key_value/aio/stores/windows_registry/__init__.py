@@ -0,0 +1,3 @@
+from key_value.aio.stores.windows_registry.store import WindowsRegistryStore
+
+__all__ = ["WindowsRegistryStore"]
@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.compression.wrapper import CompressionWrapper
+
+__all__ = ["CompressionWrapper"]
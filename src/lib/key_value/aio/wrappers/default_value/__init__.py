@@ -0,0 +1,5 @@
+"""Default value wrapper for returning fallback values when keys are not found."""
+
+from key_value.aio.wrappers.default_value.wrapper import DefaultValueWrapper
+
+__all__ = ["DefaultValueWrapper"]
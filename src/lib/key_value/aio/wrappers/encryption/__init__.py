@@ -0,0 +1,4 @@
+from key_value.aio.wrappers.encryption.base import BaseEncryptionWrapper
+from key_value.aio.wrappers.encryption.fernet import FernetEncryptionWrapper
+
+__all__ = ["BaseEncryptionWrapper", "FernetEncryptionWrapper"]
@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.limit_size.wrapper import LimitSizeWrapper
+
+__all__ = ["LimitSizeWrapper"]
@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.logging.wrapper import LoggingWrapper
+
+__all__ = ["LoggingWrapper"]
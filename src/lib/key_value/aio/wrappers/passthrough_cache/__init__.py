@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.passthrough_cache.wrapper import PassthroughCacheWrapper
+
+__all__ = ["PassthroughCacheWrapper"]
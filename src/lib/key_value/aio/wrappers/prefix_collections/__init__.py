@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.prefix_collections.wrapper import PrefixCollectionsWrapper
+
+__all__ = ["PrefixCollectionsWrapper"]
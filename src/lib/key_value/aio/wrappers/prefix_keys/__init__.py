@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.prefix_keys.wrapper import PrefixKeysWrapper
+
+__all__ = ["PrefixKeysWrapper"]
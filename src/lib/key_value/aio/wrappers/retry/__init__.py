@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.retry.wrapper import RetryWrapper
+
+__all__ = ["RetryWrapper"]
@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.timeout.wrapper import TimeoutWrapper
+
+__all__ = ["TimeoutWrapper"]
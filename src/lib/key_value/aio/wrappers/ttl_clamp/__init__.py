@@ -0,0 +1,3 @@
+from key_value.aio.wrappers.ttl_clamp.wrapper import TTLClampWrapper
+
+__all__ = ["TTLClampWrapper"]
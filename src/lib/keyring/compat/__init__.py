@@ -0,0 +1,7 @@
+__all__ = ['properties']
+
+
+try:
+    from jaraco.classes import properties
+except ImportError:  # pragma: no cover
+    from . import properties  # type: ignore[no-redef]
@@ -0,0 +1,6 @@
+"""MCP CLI package."""
+
+from .cli import app
+
+if __name__ == "__main__":  # pragma: no cover
+    app()
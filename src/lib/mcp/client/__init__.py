@@ -0,0 +1,44 @@
+"""MCP Client module."""
+
+from mcp.client._input_required import InputRequiredRoundsExceededError
+from mcp.client._transport import Transport
+from mcp.client.caching import (
+    CacheConfig,
+    CacheEntry,
+    CacheKey,
+    CacheMode,
+    InMemoryResponseCacheStore,
+    ResponseCacheStore,
+)
+from mcp.client.client import Client
+from mcp.client.context import ClientRequestContext
+from mcp.client.extension import (
+    ClaimContext,
+    ClientExtension,
+    NotificationBinding,
+    ResultClaim,
+    UnexpectedClaimedResult,
+    advertise,
+)
+from mcp.client.session import ClientSession, IncomingMessage
+
+__all__ = [
+    "CacheConfig",
+    "CacheEntry",
+    "CacheKey",
+    "CacheMode",
+    "ClaimContext",
+    "Client",
+    "ClientExtension",
+    "ClientRequestContext",
+    "ClientSession",
+    "IncomingMessage",
+    "InMemoryResponseCacheStore",
+    "InputRequiredRoundsExceededError",
+    "NotificationBinding",
+    "ResponseCacheStore",
+    "ResultClaim",
+    "Transport",
+    "UnexpectedClaimedResult",
+    "advertise",
+]
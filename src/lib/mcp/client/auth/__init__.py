@@ -0,0 +1,22 @@
+"""OAuth2 Authentication implementation for httpx2.
+
+Implements authorization code flow with PKCE and automatic token refresh.
+"""
+
+from mcp.client.auth.exceptions import OAuthFlowError, OAuthRegistrationError, OAuthTokenError
+from mcp.client.auth.oauth2 import (
+    OAuthClientProvider,
+    PKCEParameters,
+    TokenStorage,
+)
+from mcp.shared.auth import AuthorizationCodeResult
+
+__all__ = [
+    "AuthorizationCodeResult",
+    "OAuthClientProvider",
+    "OAuthFlowError",
+    "OAuthRegistrationError",
+    "OAuthTokenError",
+    "PKCEParameters",
+    "TokenStorage",
+]
@@ -0,0 +1,5 @@
+"""Request context for MCP client handlers."""
+
+from mcp.client.session import ClientRequestContext
+
+__all__ = ["ClientRequestContext"]
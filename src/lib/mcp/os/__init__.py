@@ -0,0 +1 @@
+"""Platform-specific utilities for MCP."""
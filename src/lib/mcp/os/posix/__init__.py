@@ -0,0 +1 @@
+"""POSIX-specific utilities for MCP."""
@@ -0,0 +1 @@
+"""Windows-specific utilities for MCP."""
@@ -0,0 +1,7 @@
+from .caching import CacheHint
+from .context import ServerRequestContext
+from .lowlevel import NotificationOptions, Server
+from .mcpserver import MCPServer
+from .models import InitializationOptions
+
+__all__ = ["CacheHint", "Server", "ServerRequestContext", "MCPServer", "NotificationOptions", "InitializationOptions"]
@@ -0,0 +1 @@
+"""MCP OAuth server authorization components."""
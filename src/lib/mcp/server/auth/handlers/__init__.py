@@ -0,0 +1 @@
+"""Request handlers for MCP authorization endpoints."""
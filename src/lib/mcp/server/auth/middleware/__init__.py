@@ -0,0 +1 @@
+"""Middleware for MCP authorization."""
@@ -0,0 +1,3 @@
+from .server import NotificationOptions, Server
+
+__all__ = ["NotificationOptions", "Server"]
@@ -0,0 +1 @@
+"""MCPServer utility modules."""
@@ -0,0 +1 @@
+from python_multipart.decoders import *
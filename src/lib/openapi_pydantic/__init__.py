@@ -0,0 +1,40 @@
+"""OpenAPI schema interface utilizing Pydantic."""
+
+import logging
+
+from .v3 import XML as XML
+from .v3 import Callback as Callback
+from .v3 import Components as Components
+from .v3 import Contact as Contact
+from .v3 import DataType as DataType
+from .v3 import Discriminator as Discriminator
+from .v3 import Encoding as Encoding
+from .v3 import Example as Example
+from .v3 import ExternalDocumentation as ExternalDocumentation
+from .v3 import Header as Header
+from .v3 import Info as Info
+from .v3 import License as License
+from .v3 import Link as Link
+from .v3 import MediaType as MediaType
+from .v3 import OAuthFlow as OAuthFlow
+from .v3 import OAuthFlows as OAuthFlows
+from .v3 import OpenAPI as OpenAPI
+from .v3 import Operation as Operation
+from .v3 import Parameter as Parameter
+from .v3 import ParameterLocation as ParameterLocation
+from .v3 import PathItem as PathItem
+from .v3 import Paths as Paths
+from .v3 import Reference as Reference
+from .v3 import RequestBody as RequestBody
+from .v3 import Response as Response
+from .v3 import Responses as Responses
+from .v3 import Schema as Schema
+from .v3 import SecurityRequirement as SecurityRequirement
+from .v3 import SecurityScheme as SecurityScheme
+from .v3 import Server as Server
+from .v3 import ServerVariable as ServerVariable
+from .v3 import Tag as Tag
+from .v3 import parse_obj as parse_obj
+from .v3 import schema_validate as schema_validate
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
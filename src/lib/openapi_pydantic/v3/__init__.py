@@ -0,0 +1,36 @@
+"""OpenAPI V3 schema interface utilizing Pydantic."""
+
+from .parser import parse_obj as parse_obj
+from .v3_1 import XML as XML
+from .v3_1 import Callback as Callback
+from .v3_1 import Components as Components
+from .v3_1 import Contact as Contact
+from .v3_1 import DataType as DataType
+from .v3_1 import Discriminator as Discriminator
+from .v3_1 import Encoding as Encoding
+from .v3_1 import Example as Example
+from .v3_1 import ExternalDocumentation as ExternalDocumentation
+from .v3_1 import Header as Header
+from .v3_1 import Info as Info
+from .v3_1 import License as License
+from .v3_1 import Link as Link
+from .v3_1 import MediaType as MediaType
+from .v3_1 import OAuthFlow as OAuthFlow
+from .v3_1 import OAuthFlows as OAuthFlows
+from .v3_1 import OpenAPI as OpenAPI
+from .v3_1 import Operation as Operation
+from .v3_1 import Parameter as Parameter
+from .v3_1 import ParameterLocation as ParameterLocation
+from .v3_1 import PathItem as PathItem
+from .v3_1 import Paths as Paths
+from .v3_1 import Reference as Reference
+from .v3_1 import RequestBody as RequestBody
+from .v3_1 import Response as Response
+from .v3_1 import Responses as Responses
+from .v3_1 import Schema as Schema
+from .v3_1 import SecurityRequirement as SecurityRequirement
+from .v3_1 import SecurityScheme as SecurityScheme
+from .v3_1 import Server as Server
+from .v3_1 import ServerVariable as ServerVariable
+from .v3_1 import Tag as Tag
+from .v3_1 import schema_validate as schema_validate
@@ -0,0 +1 @@
+VERSION = '2.16.0'
@@ -0,0 +1,3852 @@
+"""
+    pygments.lexers._vim_builtins
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This file is autogenerated by scripts/get_vimkw.py
+
+    :copyright: Copyright 2006-present by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+# Split up in multiple functions so it's importable by jython, which has a
+# per-method size limit.
+
+def _getcommand():
+    var = (
+        ('a','a'),
+        ('ab','abbreviate'),
+        ('abc','abclear'),
+        ('abs','abs'),
+        ('acos','acos'),
+        ('add','add'),
+        ('al','all'),
+        ('am','amenu'),
+        ('an','anoremenu'),
+        ('and','and'),
+        ('append','append'),
+        ('appendbufline','appendbufline'),
+        ('ar','args'),
+        ('arga','argadd'),
+        ('argc','argc'),
+        ('argd','argdelete'),
+        ('argded','argdedupe'),
+        ('arge','argedit'),
+        ('argg','argglobal'),
+        ('argidx','argidx'),
+        ('argl','arglocal'),
+        ('arglistid','arglistid'),
+        ('argu','argument'),
+        ('argv','argv'),
+        ('argv','argv'),
+        ('as','ascii'),
+        ('asin','asin'),
+        ('assert_beeps','assert_beeps'),
+        ('assert_equal','assert_equal'),
+        ('assert_equalfile','assert_equalfile'),
+        ('assert_exception','assert_exception'),
+        ('assert_fails','assert_fails'),
+        ('assert_false','assert_false'),
+        ('assert_inrange','assert_inrange'),
+        ('assert_match','assert_match'),
+        ('assert_nobeep','assert_nobeep'),
+        ('assert_notequal','assert_notequal'),
+        ('assert_notmatch','assert_notmatch'),
+        ('assert_report','assert_report'),
+        ('assert_true','assert_true'),
+        ('atan','atan'),
+        ('atan2','atan2'),
+        ('aun','aunmenu'),
+        ('autocmd_add','autocmd_add'),
+        ('autocmd_delete','autocmd_delete'),
+        ('autocmd_get','autocmd_get'),
+        ('b','buffer'),
+        ('bN','bNext'),
+        ('ba','ball'),
+        ('bad','badd'),
+        ('balloon_gettext','balloon_gettext'),
+        ('balloon_show','balloon_show'),
+        ('balloon_split','balloon_split'),
+        ('balt','balt'),
+        ('base64_decode','base64_decode'),
+        ('base64_encode','base64_encode'),
+        ('bd','bdelete'),
+        ('beval_bufnr','beval_bufnr'),
+        ('beval_col','beval_col'),
+        ('beval_lnum','beval_lnum'),
+        ('beval_text','beval_text'),
+        ('beval_winid','beval_winid'),
+        ('beval_winnr','beval_winnr'),
+        ('bf','bfirst'),
+        ('bindtextdomain','bindtextdomain'),
+        ('bl','blast'),
+        ('blob2list','blob2list'),
+        ('blob2str','blob2str'),
+        ('bm','bmodified'),
+        ('bn','bnext'),
+        ('bp','bprevious'),
+        ('br','brewind'),
+        ('brea','break'),
+        ('browse','browse'),
+        ('browsedir','browsedir'),
+        ('bufadd','bufadd'),
+        ('bufexists','bufexists'),
+        ('buffers','buffers'),
+        ('buflisted','buflisted'),
+        ('bufload','bufload'),
+        ('bufloaded','bufloaded'),
+        ('bufname','bufname'),
+        ('bufnr','bufnr'),
+        ('bufwinid','bufwinid'),
+        ('bufwinnr','bufwinnr'),
+        ('bun','bunload'),
+        ('bw','bwipeout'),
+        ('byte2line','byte2line'),
+        ('byteidx','byteidx'),
+        ('byteidxcomp','byteidxcomp'),
+        ('cN','cNext'),
+        ('cNf','cNfile'),
+        ('ca','cabbrev'),
+        ('cabc','cabclear'),
+        ('cabo','cabove'),
+        ('cad','caddbuffer'),
+        ('cadde','caddexpr'),
+        ('caddf','caddfile'),
+        ('caf','cafter'),
+        ('call','call'),
+        ('cb','cbuffer'),
+        ('cbe','cbefore'),
+        ('cbel','cbelow'),
+        ('cbo','cbottom'),
+        ('cc','cc'),
+        ('ccl','cclose'),
+        ('ce','center'),
+        ('ceil','ceil'),
+        ('cex','cexpr'),
+        ('cf','cfile'),
+        ('cfir','cfirst'),
+        ('cg','cgetfile'),
+        ('cgetb','cgetbuffer'),
+        ('cgete','cgetexpr'),
+        ('ch_canread','ch_canread'),
+        ('ch_close','ch_close'),
+        ('ch_close_in','ch_close_in'),
+        ('ch_evalexpr','ch_evalexpr'),
+        ('ch_evalraw','ch_evalraw'),
+        ('ch_getbufnr','ch_getbufnr'),
+        ('ch_getjob','ch_getjob'),
+        ('ch_info','ch_info'),
+        ('ch_listen','ch_listen'),
+        ('ch_log','ch_log'),
+        ('ch_logfile','ch_logfile'),
+        ('ch_open','ch_open'),
+        ('ch_read','ch_read'),
+        ('ch_readblob','ch_readblob'),
+        ('ch_readraw','ch_readraw'),
+        ('ch_sendexpr','ch_sendexpr'),
+        ('ch_sendraw','ch_sendraw'),
+        ('ch_setoptions','ch_setoptions'),
+        ('ch_status','ch_status'),
+        ('changenr','changenr'),
+        ('changes','changes'),
+        ('char','char'),
+        ('char2nr','char2nr'),
+        ('charclass','charclass'),
+        ('charcol','charcol'),
+        ('charconvert_from','charconvert_from'),
+        ('charconvert_to','charconvert_to'),
+        ('charidx','charidx'),
+        ('chdir','chdir'),
+        ('che','checkpath'),
+        ('checkt','checktime'),
+        ('chi','chistory'),
+        ('cindent','cindent'),
+        ('cl','clist'),
+        ('cla','clast'),
+        ('cle','clearjumps'),
+        ('clearmatches','clearmatches'),
+        ('clip','clipreset'),
+        ('clipmethod','clipmethod'),
+        ('clipproviders','clipproviders'),
+        ('clo','close'),
+        ('cm','cmap'),
+        ('cmapc','cmapclear'),
+        ('cmdarg','cmdarg'),
+        ('cmdbang','cmdbang'),
+        ('cmdcomplete_info','cmdcomplete_info'),
+        ('cme','cmenu'),
+        ('cn','cnext'),
+        ('cnew','cnewer'),
+        ('cnf','cnfile'),
+        ('cno','cnoremap'),
+        ('cnorea','cnoreabbrev'),
+        ('cnoreme','cnoremenu'),
+        ('col','col'),
+        ('col','colder'),
+        ('collate','collate'),
+        ('colo','colorscheme'),
+        ('colornames','colornames'),
+        ('comc','comclear'),
+        ('comp','compiler'),
+        ('complete','complete'),
+        ('complete_add','complete_add'),
+        ('complete_check','complete_check'),
+        ('complete_info','complete_info'),
+        ('completed_item','completed_item'),
+        ('con','continue'),
+        ('confirm','confirm'),
+        ('cope','copen'),
+        ('copy','copy'),
+        ('cos','cos'),
+        ('cosh','cosh'),
+        ('count','count'),
+        ('count','count'),
+        ('count1','count1'),
+        ('cp','cprevious'),
+        ('cpf','cpfile'),
+        ('cq','cquit'),
+        ('cr','crewind'),
+        ('cs','cscope'),
+        ('cscope_connection','cscope_connection'),
+        ('cst','cstag'),
+        ('ctype','ctype'),
+        ('cuna','cunabbrev'),
+        ('cunme','cunmenu'),
+        ('cursor','cursor'),
+        ('cw','cwindow'),
+        ('debugbreak','debugbreak'),
+        ('deepcopy','deepcopy'),
+        ('defc','defcompile'),
+        ('delel','delel'),
+        ('delep','delep'),
+        ('delete','delete'),
+        ('deletebufline','deletebufline'),
+        ('deletel','deletel'),
+        ('deletep','deletep'),
+        ('deletl','deletl'),
+        ('deletp','deletp'),
+        ('dell','dell'),
+        ('delm','delmarks'),
+        ('delp','delp'),
+        ('dep','dep'),
+        ('di','display'),
+        ('did_filetype','did_filetype'),
+        ('dif','diffupdate'),
+        ('diff','diff'),
+        ('diff_filler','diff_filler'),
+        ('diff_hlID','diff_hlID'),
+        ('diffg','diffget'),
+        ('diffo','diffoff'),
+        ('diffp','diffpatch'),
+        ('diffpu','diffput'),
+        ('diffs','diffsplit'),
+        ('difft','diffthis'),
+        ('dig','digraphs'),
+        ('digraph_get','digraph_get'),
+        ('digraph_getlist','digraph_getlist'),
+        ('digraph_set','digraph_set'),
+        ('digraph_setlist','digraph_setlist'),
+        ('disa','disassemble'),
+        ('dj','djump'),
+        ('dl','dl'),
+        ('dli','dlist'),
+        ('dp','dp'),
+        ('dr','drop'),
+        ('ds','dsearch'),
+        ('dsp','dsplit'),
+        ('dying','dying'),
+        ('e','edit'),
+        ('ea','earlier'),
+        ('echoraw','echoraw'),
+        ('echospace','echospace'),
+        ('em','emenu'),
+        ('empty','empty'),
+        ('endfo','endfor'),
+        ('endt','endtry'),
+        ('endw','endwhile'),
+        ('ene','enew'),
+        ('environ','environ'),
+        ('err_teapot','err_teapot'),
+        ('errmsg','errmsg'),
+        ('errors','errors'),
+        ('escape','escape'),
+        ('eval','eval'),
+        ('event','event'),
+        ('eventhandler','eventhandler'),
+        ('ex','ex'),
+        ('exception','exception'),
+        ('executable','executable'),
+        ('execute','execute'),
+        ('exepath','exepath'),
+        ('exi','exit'),
+        ('exists','exists'),
+        ('exists_compiled','exists_compiled'),
+        ('exiting','exiting'),
+        ('exp','exp'),
+        ('expand','expand'),
+        ('expandcmd','expandcmd'),
+        ('extend','extend'),
+        ('extendnew','extendnew'),
+        ('exu','exusage'),
+        ('f','file'),
+        ('false','false'),
+        ('fcs_choice','fcs_choice'),
+        ('fcs_reason','fcs_reason'),
+        ('feedkeys','feedkeys'),
+        ('filecopy','filecopy'),
+        ('filereadable','filereadable'),
+        ('files','files'),
+        ('filewritable','filewritable'),
+        ('filter','filter'),
+        ('fin','find'),
+        ('fina','finally'),
+        ('finddir','finddir'),
+        ('findfile','findfile'),
+        ('fini','finish'),
+        ('fir','first'),
+        ('fix','fixdel'),
+        ('flatten','flatten'),
+        ('flattennew','flattennew'),
+        ('float2nr','float2nr'),
+        ('floor','floor'),
+        ('fmod','fmod'),
+        ('fname','fname'),
+        ('fname_diff','fname_diff'),
+        ('fname_in','fname_in'),
+        ('fname_new','fname_new'),
+        ('fname_out','fname_out'),
+        ('fnameescape','fnameescape'),
+        ('fnamemodify','fnamemodify'),
+        ('fo','fold'),
+        ('foldc','foldclose'),
+        ('foldclosed','foldclosed'),
+        ('foldclosedend','foldclosedend'),
+        ('folddashes','folddashes'),
+        ('foldend','foldend'),
+        ('foldlevel','foldlevel'),
+        ('foldlevel','foldlevel'),
+        ('foldo','foldopen'),
+        ('foldstart','foldstart'),
+        ('foldtext','foldtext'),
+        ('foldtextresult','foldtextresult'),
+        ('foreach','foreach'),
+        ('foreground','foreground'),
+        ('fullcommand','fullcommand'),
+        ('funcref','funcref'),
+        ('function','function'),
+        ('g','global'),
+        ('garbagecollect','garbagecollect'),
+        ('get','get'),
+        ('getbgcolor','getbgcolor'),
+        ('getbufinfo','getbufinfo'),
+        ('getbufline','getbufline'),
+        ('getbufoneline','getbufoneline'),
+        ('getbufvar','getbufvar'),
+        ('getcellpixels','getcellpixels'),
+        ('getcellwidths','getcellwidths'),
+        ('getchangelist','getchangelist'),
+        ('getchar','getchar'),
+        ('getcharmod','getcharmod'),
+        ('getcharpos','getcharpos'),
+        ('getcharsearch','getcharsearch'),
+        ('getcharstr','getcharstr'),
+        ('getcmdcomplpat','getcmdcomplpat'),
+        ('getcmdcompltype','getcmdcompltype'),
+        ('getcmdline','getcmdline'),
+        ('getcmdpos','getcmdpos'),
+        ('getcmdprompt','getcmdprompt'),
+        ('getcmdscreenpos','getcmdscreenpos'),
+        ('getcmdtype','getcmdtype'),
+        ('getcmdwintype','getcmdwintype'),
+        ('getcompletion','getcompletion'),
+        ('getcompletiontype','getcompletiontype'),
+        ('getcurpos','getcurpos'),
+        ('getcursorcharpos','getcursorcharpos'),
+        ('getcwd','getcwd'),
+        ('getenv','getenv'),
+        ('getfontname','getfontname'),
+        ('getfperm','getfperm'),
+        ('getfsize','getfsize'),
+        ('getftime','getftime'),
+        ('getftype','getftype'),
+        ('getimstatus','getimstatus'),
+        ('getjumplist','getjumplist'),
+        ('getline','getline'),
+        ('getloclist','getloclist'),
+        ('getmarklist','getmarklist'),
+        ('getmatches','getmatches'),
+        ('getmousepos','getmousepos'),
+        ('getmouseshape','getmouseshape'),
+        ('getpid','getpid'),
+        ('getpos','getpos'),
+        ('getqflist','getqflist'),
+        ('getreg','getreg'),
+        ('getreginfo','getreginfo'),
+        ('getregion','getregion'),
+        ('getregionpos','getregionpos'),
+        ('getregtype','getregtype'),
+        ('getscriptinfo','getscriptinfo'),
+        ('getstacktrace','getstacktrace'),
+        ('gettabinfo','gettabinfo'),
+        ('gettabvar','gettabvar'),
+        ('gettabwinvar','gettabwinvar'),
+        ('gettagstack','gettagstack'),
+        ('gettext','gettext'),
+        ('getwininfo','getwininfo'),
+        ('getwinpos','getwinpos'),
+        ('getwinposx','getwinposx'),
+        ('getwinposy','getwinposy'),
+        ('getwinvar','getwinvar'),
+        ('glob','glob'),
+        ('glob2regpat','glob2regpat'),
+        ('globpath','globpath'),
+        ('go','goto'),
+        ('gu','gui'),
+        ('gv','gvim'),
+        ('ha','hardcopy'),
+        ('has','has'),
+        ('has_key','has_key'),
+        ('haslocaldir','haslocaldir'),
+        ('hasmapto','hasmapto'),
+        ('helpc','helpclose'),
+        ('helpf','helpfind'),
+        ('helpt','helptags'),
+        ('histadd','histadd'),
+        ('histdel','histdel'),
+        ('histget','histget'),
+        ('histnr','histnr'),
+        ('hlID','hlID'),
+        ('hlexists','hlexists'),
+        ('hlget','hlget'),
+        ('hlsearch','hlsearch'),
+        ('hlset','hlset'),
+        ('hostname','hostname'),
+        ('i','i'),
+        ('ia','iabbrev'),
+        ('iabc','iabclear'),
+        ('iconv','iconv'),
+        ('id','id'),
+        ('ij','ijump'),
+        ('il','ilist'),
+        ('im','imap'),
+        ('imapc','imapclear'),
+        ('ime','imenu'),
+        ('indent','indent'),
+        ('index','index'),
+        ('indexof','indexof'),
+        ('ino','inoremap'),
+        ('inorea','inoreabbrev'),
+        ('inoreme','inoremenu'),
+        ('input','input'),
+        ('inputdialog','inputdialog'),
+        ('inputlist','inputlist'),
+        ('inputrestore','inputrestore'),
+        ('inputsave','inputsave'),
+        ('inputsecret','inputsecret'),
+        ('insert','insert'),
+        ('insertmode','insertmode'),
+        ('instanceof','instanceof'),
+        ('int','intro'),
+        ('interrupt','interrupt'),
+        ('invert','invert'),
+        ('ip','iput'),
+        ('is','isearch'),
+        ('isabsolutepath','isabsolutepath'),
+        ('isdirectory','isdirectory'),
+        ('isinf','isinf'),
+        ('islocked','islocked'),
+        ('isnan','isnan'),
+        ('isp','isplit'),
+        ('items','items'),
+        ('iuna','iunabbrev'),
+        ('iunme','iunmenu'),
+        ('job_getchannel','job_getchannel'),
+        ('job_info','job_info'),
+        ('job_setoptions','job_setoptions'),
+        ('job_start','job_start'),
+        ('job_status','job_status'),
+        ('job_stop','job_stop'),
+        ('join','join'),
+        ('js_decode','js_decode'),
+        ('js_encode','js_encode'),
+        ('json_decode','json_decode'),
+        ('json_encode','json_encode'),
+        ('ju','jumps'),
+        ('key','key'),
+        ('keys','keys'),
+        ('keytrans','keytrans'),
+        ('l','list'),
+        ('lN','lNext'),
+        ('lNf','lNfile'),
+        ('la','last'),
+        ('lab','labove'),
+        ('lad','laddexpr'),
+        ('laddb','laddbuffer'),
+        ('laddf','laddfile'),
+        ('laf','lafter'),
+        ('lang','lang'),
+        ('lat','later'),
+        ('lb','lbuffer'),
+        ('lbe','lbefore'),
+        ('lbel','lbelow'),
+        ('lbo','lbottom'),
+        ('lc_time','lc_time'),
+        ('lcl','lclose'),
+        ('lcs','lcscope'),
+        ('le','left'),
+        ('len','len'),
+        ('lex','lexpr'),
+        ('lf','lfile'),
+        ('lfir','lfirst'),
+        ('lg','lgetfile'),
+        ('lgetb','lgetbuffer'),
+        ('lgete','lgetexpr'),
+        ('lhi','lhistory'),
+        ('libcall','libcall'),
+        ('libcallnr','libcallnr'),
+        ('line','line'),
+        ('line2byte','line2byte'),
+        ('lispindent','lispindent'),
+        ('list2blob','list2blob'),
+        ('list2str','list2str'),
+        ('list2tuple','list2tuple'),
+        ('listener_add','listener_add'),
+        ('listener_flush','listener_flush'),
+        ('listener_remove','listener_remove'),
+        ('ll','ll'),
+        ('lla','llast'),
+        ('lli','llist'),
+        ('lm','lmap'),
+        ('lmak','lmake'),
+        ('lmapc','lmapclear'),
+        ('ln','lnoremap'),
+        ('lne','lnext'),
+        ('lnew','lnewer'),
+        ('lnf','lnfile'),
+        ('lnum','lnum'),
+        ('lo','loadview'),
+        ('localtime','localtime'),
+        ('lockv','lockvar'),
+        ('log','log'),
+        ('log10','log10'),
+        ('lol','lolder'),
+        ('lop','lopen'),
+        ('lp','lprevious'),
+        ('lpf','lpfile'),
+        ('lr','lrewind'),
+        ('ls','ls'),
+        ('lt','ltag'),
+        ('luaeval','luaeval'),
+        ('lw','lwindow'),
+        ('m','move'),
+        ('map','map'),
+        ('maparg','maparg'),
+        ('mapcheck','mapcheck'),
+        ('maplist','maplist'),
+        ('mapnew','mapnew'),
+        ('mapset','mapset'),
+        ('marks','marks'),
+        ('match','match'),
+        ('matchadd','matchadd'),
+        ('matchaddpos','matchaddpos'),
+        ('matcharg','matcharg'),
+        ('matchbufline','matchbufline'),
+        ('matchdelete','matchdelete'),
+        ('matchend','matchend'),
+        ('matchfuzzy','matchfuzzy'),
+        ('matchfuzzypos','matchfuzzypos'),
+        ('matchlist','matchlist'),
+        ('matchstr','matchstr'),
+        ('matchstrlist','matchstrlist'),
+        ('matchstrpos','matchstrpos'),
+        ('max','max'),
+        ('maxcol','maxcol'),
+        ('me','menu'),
+        ('menu_info','menu_info'),
+        ('mes','messages'),
+        ('min','min'),
+        ('mk','mkexrc'),
+        ('mkdir','mkdir'),
+        ('mks','mksession'),
+        ('mksp','mkspell'),
+        ('mkv','mkvimrc'),
+        ('mkvie','mkview'),
+        ('mod','mode'),
+        ('mode','mode'),
+        ('mouse_col','mouse_col'),
+        ('mouse_lnum','mouse_lnum'),
+        ('mouse_win','mouse_win'),
+        ('mouse_winid','mouse_winid'),
+        ('mzeval','mzeval'),
+        ('n','next'),
+        ('nb','nbkey'),
+        ('nbc','nbclose'),
+        ('nbs','nbstart'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextnonblank','nextnonblank'),
+        ('ngettext','ngettext'),
+        ('nm','nmap'),
+        ('nmapc','nmapclear'),
+        ('nme','nmenu'),
+        ('nn','nnoremap'),
+        ('nnoreme','nnoremenu'),
+        ('noh','nohlsearch'),
+        ('none','none'),
+        ('norea','noreabbrev'),
+        ('noreme','noremenu'),
+        ('nr2char','nr2char'),
+        ('nu','number'),
+        ('null','null'),
+        ('numbermax','numbermax'),
+        ('numbermin','numbermin'),
+        ('numbersize','numbersize'),
+        ('nunme','nunmenu'),
+        ('o','open'),
+        ('ol','oldfiles'),
+        ('oldfiles','oldfiles'),
+        ('om','omap'),
+        ('omapc','omapclear'),
+        ('ome','omenu'),
+        ('on','only'),
+        ('ono','onoremap'),
+        ('onoreme','onoremenu'),
+        ('operator','operator'),
+        ('opt','options'),
+        ('option_command','option_command'),
+        ('option_new','option_new'),
+        ('option_old','option_old'),
+        ('option_oldglobal','option_oldglobal'),
+        ('option_oldlocal','option_oldlocal'),
+        ('option_type','option_type'),
+        ('or','or'),
+        ('ounme','ounmenu'),
+        ('ow','ownsyntax'),
+        ('p','print'),
+        ('pa','packadd'),
+        ('packl','packloadall'),
+        ('pathshorten','pathshorten'),
+        ('pb','pbuffer'),
+        ('pc','pclose'),
+        ('ped','pedit'),
+        ('perleval','perleval'),
+        ('po','pop'),
+        ('popu','popup'),
+        ('popup_atcursor','popup_atcursor'),
+        ('popup_beval','popup_beval'),
+        ('popup_clear','popup_clear'),
+        ('popup_close','popup_close'),
+        ('popup_create','popup_create'),
+        ('popup_dialog','popup_dialog'),
+        ('popup_filter_menu','popup_filter_menu'),
+        ('popup_filter_yesno','popup_filter_yesno'),
+        ('popup_findecho','popup_findecho'),
+        ('popup_findinfo','popup_findinfo'),
+        ('popup_findpreview','popup_findpreview'),
+        ('popup_getoptions','popup_getoptions'),
+        ('popup_getpos','popup_getpos'),
+        ('popup_hide','popup_hide'),
+        ('popup_list','popup_list'),
+        ('popup_locate','popup_locate'),
+        ('popup_menu','popup_menu'),
+        ('popup_move','popup_move'),
+        ('popup_notification','popup_notification'),
+        ('popup_setbuf','popup_setbuf'),
+        ('popup_setoptions','popup_setoptions'),
+        ('popup_settext','popup_settext'),
+        ('popup_show','popup_show'),
+        ('pow','pow'),
+        ('pp','ppop'),
+        ('pre','preserve'),
+        ('preinserted','preinserted'),
+        ('prev','previous'),
+        ('prevcount','prevcount'),
+        ('prevnonblank','prevnonblank'),
+        ('printf','printf'),
+        ('profiling','profiling'),
+        ('progname','progname'),
+        ('progpath','progpath'),
+        ('prompt_getprompt','prompt_getprompt'),
+        ('prompt_setcallback','prompt_setcallback'),
+        ('prompt_setinterrupt','prompt_setinterrupt'),
+        ('prompt_setprompt','prompt_setprompt'),
+        ('prop_add','prop_add'),
+        ('prop_add_list','prop_add_list'),
+        ('prop_clear','prop_clear'),
+        ('prop_find','prop_find'),
+        ('prop_list','prop_list'),
+        ('prop_remove','prop_remove'),
+        ('prop_type_add','prop_type_add'),
+        ('prop_type_change','prop_type_change'),
+        ('prop_type_delete','prop_type_delete'),
+        ('prop_type_get','prop_type_get'),
+        ('prop_type_list','prop_type_list'),
+        ('ps','psearch'),
+        ('pt','ptag'),
+        ('ptN','ptNext'),
+        ('ptf','ptfirst'),
+        ('ptj','ptjump'),
+        ('ptl','ptlast'),
+        ('ptn','ptnext'),
+        ('ptp','ptprevious'),
+        ('ptr','ptrewind'),
+        ('pts','ptselect'),
+        ('pu','put'),
+        ('pum_getpos','pum_getpos'),
+        ('pumvisible','pumvisible'),
+        ('pw','pwd'),
+        ('py3eval','py3eval'),
+        ('pyeval','pyeval'),
+        ('python3_version','python3_version'),
+        ('pyxeval','pyxeval'),
+        ('q','quit'),
+        ('qa','qall'),
+        ('quita','quitall'),
+        ('r','read'),
+        ('rand','rand'),
+        ('range','range'),
+        ('readblob','readblob'),
+        ('readdir','readdir'),
+        ('readdirex','readdirex'),
+        ('readfile','readfile'),
+        ('rec','recover'),
+        ('red','redo'),
+        ('redr','redraw'),
+        ('redraw_listener_add','redraw_listener_add'),
+        ('redraw_listener_remove','redraw_listener_remove'),
+        ('redraws','redrawstatus'),
+        ('redrawt','redrawtabline'),
+        ('redrawtabp','redrawtabpanel'),
+        ('reduce','reduce'),
+        ('reg','registers'),
+        ('reg_executing','reg_executing'),
+        ('reg_recording','reg_recording'),
+        ('register','register'),
+        ('reltime','reltime'),
+        ('reltimefloat','reltimefloat'),
+        ('reltimestr','reltimestr'),
+        ('remote_expr','remote_expr'),
+        ('remote_foreground','remote_foreground'),
+        ('remote_peek','remote_peek'),
+        ('remote_read','remote_read'),
+        ('remote_send','remote_send'),
+        ('remote_startserver','remote_startserver'),
+        ('remove','remove'),
+        ('rename','rename'),
+        ('repeat','repeat'),
+        ('res','resize'),
+        ('resolve','resolve'),
+        ('ret','retab'),
+        ('reverse','reverse'),
+        ('rew','rewind'),
+        ('ri','right'),
+        ('round','round'),
+        ('ru','runtime'),
+        ('rubyeval','rubyeval'),
+        ('rund','rundo'),
+        ('rv','rviminfo'),
+        ('sN','sNext'),
+        ('sa','sargument'),
+        ('sal','sall'),
+        ('sav','saveas'),
+        ('sb','sbuffer'),
+        ('sbN','sbNext'),
+        ('sba','sball'),
+        ('sbf','sbfirst'),
+        ('sbl','sblast'),
+        ('sbm','sbmodified'),
+        ('sbn','sbnext'),
+        ('sbp','sbprevious'),
+        ('sbr','sbrewind'),
+        ('scr','scriptnames'),
+        ('screenattr','screenattr'),
+        ('screenchar','screenchar'),
+        ('screenchars','screenchars'),
+        ('screencol','screencol'),
+        ('screenpos','screenpos'),
+        ('screenrow','screenrow'),
+        ('screenstring','screenstring'),
+        ('scripte','scriptencoding'),
+        ('scriptv','scriptversion'),
+        ('scrollstart','scrollstart'),
+        ('scs','scscope'),
+        ('search','search'),
+        ('searchcount','searchcount'),
+        ('searchdecl','searchdecl'),
+        ('searchforward','searchforward'),
+        ('searchpair','searchpair'),
+        ('searchpairpos','searchpairpos'),
+        ('searchpos','searchpos'),
+        ('server2client','server2client'),
+        ('serverlist','serverlist'),
+        ('servername','servername'),
+        ('setbufline','setbufline'),
+        ('setbufvar','setbufvar'),
+        ('setcellwidths','setcellwidths'),
+        ('setcharpos','setcharpos'),
+        ('setcharsearch','setcharsearch'),
+        ('setcmdline','setcmdline'),
+        ('setcmdpos','setcmdpos'),
+        ('setcursorcharpos','setcursorcharpos'),
+        ('setenv','setenv'),
+        ('setf','setfiletype'),
+        ('setfperm','setfperm'),
+        ('setline','setline'),
+        ('setloclist','setloclist'),
+        ('setmatches','setmatches'),
+        ('setpos','setpos'),
+        ('setqflist','setqflist'),
+        ('setreg','setreg'),
+        ('settabvar','settabvar'),
+        ('settabwinvar','settabwinvar'),
+        ('settagstack','settagstack'),
+        ('setwinvar','setwinvar'),
+        ('sf','sfind'),
+        ('sfir','sfirst'),
+        ('sh','shell'),
+        ('sha256','sha256'),
+        ('shell_error','shell_error'),
+        ('shellescape','shellescape'),
+        ('shiftwidth','shiftwidth'),
+        ('sig','sign'),
+        ('sign_define','sign_define'),
+        ('sign_getdefined','sign_getdefined'),
+        ('sign_getplaced','sign_getplaced'),
+        ('sign_jump','sign_jump'),
+        ('sign_place','sign_place'),
+        ('sign_placelist','sign_placelist'),
+        ('sign_undefine','sign_undefine'),
+        ('sign_unplace','sign_unplace'),
+        ('sign_unplacelist','sign_unplacelist'),
+        ('sim','simalt'),
+        ('simplify','simplify'),
+        ('sin','sin'),
+        ('sinh','sinh'),
+        ('sizeofint','sizeofint'),
+        ('sizeoflong','sizeoflong'),
+        ('sizeofpointer','sizeofpointer'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('sla','slast'),
+        ('slice','slice'),
+        ('smap','smap'),
+        ('smapc','smapclear'),
+        ('sme','smenu'),
+        ('smi','smile'),
+        ('sn','snext'),
+        ('snor','snoremap'),
+        ('snoreme','snoremenu'),
+        ('so','source'),
+        ('sort','sort'),
+        ('sound_clear','sound_clear'),
+        ('sound_playevent','sound_playevent'),
+        ('sound_playfile','sound_playfile'),
+        ('sound_stop','sound_stop'),
+        ('soundfold','soundfold'),
+        ('spe','spellgood'),
+        ('spellbadword','spellbadword'),
+        ('spelld','spelldump'),
+        ('spelli','spellinfo'),
+        ('spellr','spellrepall'),
+        ('spellra','spellrare'),
+        ('spellsuggest','spellsuggest'),
+        ('spellu','spellundo'),
+        ('spellw','spellwrong'),
+        ('split','split'),
+        ('spr','sprevious'),
+        ('sqrt','sqrt'),
+        ('srand','srand'),
+        ('sre','srewind'),
+        ('st','stop'),
+        ('sta','stag'),
+        ('stacktrace','stacktrace'),
+        ('star','startinsert'),
+        ('startg','startgreplace'),
+        ('startr','startreplace'),
+        ('state','state'),
+        ('statusmsg','statusmsg'),
+        ('stj','stjump'),
+        ('stopi','stopinsert'),
+        ('str2blob','str2blob'),
+        ('str2float','str2float'),
+        ('str2list','str2list'),
+        ('str2nr','str2nr'),
+        ('strcharlen','strcharlen'),
+        ('strcharpart','strcharpart'),
+        ('strchars','strchars'),
+        ('strdisplaywidth','strdisplaywidth'),
+        ('strftime','strftime'),
+        ('strgetchar','strgetchar'),
+        ('stridx','stridx'),
+        ('string','string'),
+        ('strlen','strlen'),
+        ('strpart','strpart'),
+        ('strptime','strptime'),
+        ('strridx','strridx'),
+        ('strtrans','strtrans'),
+        ('strutf16len','strutf16len'),
+        ('strwidth','strwidth'),
+        ('sts','stselect'),
+        ('submatch','submatch'),
+        ('substitute','substitute'),
+        ('sun','sunhide'),
+        ('sunme','sunmenu'),
+        ('sus','suspend'),
+        ('sv','sview'),
+        ('swapchoice','swapchoice'),
+        ('swapcommand','swapcommand'),
+        ('swapfilelist','swapfilelist'),
+        ('swapinfo','swapinfo'),
+        ('swapname','swapname'),
+        ('swapname','swapname'),
+        ('synID','synID'),
+        ('synIDattr','synIDattr'),
+        ('synIDtrans','synIDtrans'),
+        ('sync','syncbind'),
+        ('synconcealed','synconcealed'),
+        ('synstack','synstack'),
+        ('system','system'),
+        ('systemlist','systemlist'),
+        ('t','t'),
+        ('tN','tNext'),
+        ('t_blob','t_blob'),
+        ('t_bool','t_bool'),
+        ('t_channel','t_channel'),
+        ('t_class','t_class'),
+        ('t_dict','t_dict'),
+        ('t_enum','t_enum'),
+        ('t_enumvalue','t_enumvalue'),
+        ('t_float','t_float'),
+        ('t_func','t_func'),
+        ('t_job','t_job'),
+        ('t_list','t_list'),
+        ('t_none','t_none'),
+        ('t_number','t_number'),
+        ('t_object','t_object'),
+        ('t_string','t_string'),
+        ('t_tuple','t_tuple'),
+        ('t_typealias','t_typealias'),
+        ('ta','tag'),
+        ('tabN','tabNext'),
+        ('tabc','tabclose'),
+        ('tabe','tabedit'),
+        ('tabf','tabfind'),
+        ('tabfir','tabfirst'),
+        ('tabl','tablast'),
+        ('tabm','tabmove'),
+        ('tabn','tabnext'),
+        ('tabnew','tabnew'),
+        ('tabo','tabonly'),
+        ('tabp','tabprevious'),
+        ('tabpagebuflist','tabpagebuflist'),
+        ('tabpagenr','tabpagenr'),
+        ('tabpagewinnr','tabpagewinnr'),
+        ('tabpanel_getinfo','tabpanel_getinfo'),
+        ('tabpanel_scroll','tabpanel_scroll'),
+        ('tabr','tabrewind'),
+        ('tabs','tabs'),
+        ('tagfiles','tagfiles'),
+        ('taglist','taglist'),
+        ('tags','tags'),
+        ('tan','tan'),
+        ('tanh','tanh'),
+        ('te','tearoff'),
+        ('tempname','tempname'),
+        ('term_dumpdiff','term_dumpdiff'),
+        ('term_dumpload','term_dumpload'),
+        ('term_dumpwrite','term_dumpwrite'),
+        ('term_getaltscreen','term_getaltscreen'),
+        ('term_getansicolors','term_getansicolors'),
+        ('term_getattr','term_getattr'),
+        ('term_getcursor','term_getcursor'),
+        ('term_getjob','term_getjob'),
+        ('term_getline','term_getline'),
+        ('term_getscrolled','term_getscrolled'),
+        ('term_getsize','term_getsize'),
+        ('term_getstatus','term_getstatus'),
+        ('term_gettitle','term_gettitle'),
+        ('term_gettty','term_gettty'),
+        ('term_list','term_list'),
+        ('term_scrape','term_scrape'),
+        ('term_sendkeys','term_sendkeys'),
+        ('term_setansicolors','term_setansicolors'),
+        ('term_setapi','term_setapi'),
+        ('term_setkill','term_setkill'),
+        ('term_setrestore','term_setrestore'),
+        ('term_setsize','term_setsize'),
+        ('term_start','term_start'),
+        ('term_wait','term_wait'),
+        ('termblinkresp','termblinkresp'),
+        ('termda1','termda1'),
+        ('terminalprops','terminalprops'),
+        ('termosc','termosc'),
+        ('termrbgresp','termrbgresp'),
+        ('termresponse','termresponse'),
+        ('termrfgresp','termrfgresp'),
+        ('termstyleresp','termstyleresp'),
+        ('termu7resp','termu7resp'),
+        ('test_alloc_fail','test_alloc_fail'),
+        ('test_autochdir','test_autochdir'),
+        ('test_feedinput','test_feedinput'),
+        ('test_garbagecollect_now','test_garbagecollect_now'),
+        ('test_garbagecollect_soon','test_garbagecollect_soon'),
+        ('test_getvalue','test_getvalue'),
+        ('test_gui_event','test_gui_event'),
+        ('test_ignore_error','test_ignore_error'),
+        ('test_mswin_event','test_mswin_event'),
+        ('test_null_blob','test_null_blob'),
+        ('test_null_channel','test_null_channel'),
+        ('test_null_dict','test_null_dict'),
+        ('test_null_function','test_null_function'),
+        ('test_null_job','test_null_job'),
+        ('test_null_list','test_null_list'),
+        ('test_null_partial','test_null_partial'),
+        ('test_null_string','test_null_string'),
+        ('test_null_tuple','test_null_tuple'),
+        ('test_option_not_set','test_option_not_set'),
+        ('test_override','test_override'),
+        ('test_refcount','test_refcount'),
+        ('test_setmouse','test_setmouse'),
+        ('test_settime','test_settime'),
+        ('test_srand_seed','test_srand_seed'),
+        ('test_unknown','test_unknown'),
+        ('test_void','test_void'),
+        ('testing','testing'),
+        ('tf','tfirst'),
+        ('this_session','this_session'),
+        ('throwpoint','throwpoint'),
+        ('timer_info','timer_info'),
+        ('timer_pause','timer_pause'),
+        ('timer_start','timer_start'),
+        ('timer_stop','timer_stop'),
+        ('timer_stopall','timer_stopall'),
+        ('tj','tjump'),
+        ('tl','tlast'),
+        ('tlm','tlmenu'),
+        ('tln','tlnoremenu'),
+        ('tlu','tlunmenu'),
+        ('tm','tmenu'),
+        ('tma','tmap'),
+        ('tmapc','tmapclear'),
+        ('tn','tnext'),
+        ('tno','tnoremap'),
+        ('tolower','tolower'),
+        ('toupper','toupper'),
+        ('tp','tprevious'),
+        ('tr','tr'),
+        ('tr','trewind'),
+        ('trim','trim'),
+        ('true','true'),
+        ('trunc','trunc'),
+        ('try','try'),
+        ('ts','tselect'),
+        ('tu','tunmenu'),
+        ('tuple2list','tuple2list'),
+        ('type','type'),
+        ('typename','typename'),
+        ('u','undo'),
+        ('una','unabbreviate'),
+        ('undofile','undofile'),
+        ('undoj','undojoin'),
+        ('undol','undolist'),
+        ('undotree','undotree'),
+        ('unh','unhide'),
+        ('uniq','uniq'),
+        ('unme','unmenu'),
+        ('up','update'),
+        ('uri_decode','uri_decode'),
+        ('uri_encode','uri_encode'),
+        ('utf16idx','utf16idx'),
+        ('v','vglobal'),
+        ('val','val'),
+        ('values','values'),
+        ('ve','version'),
+        ('version','version'),
+        ('versionlong','versionlong'),
+        ('vi','visual'),
+        ('vie','view'),
+        ('vimBang','vimBang'),
+        ('vimBang','vimBang'),
+        ('vimBang','vimBang'),
+        ('vimBang','vimBang'),
+        ('vimBang','vimBang'),
+        ('vimMapLhs','vimMapLhs'),
+        ('vimMapLhs','vimMapLhs'),
+        ('vimMapMod','vimMapMod'),
+        ('vimMapMod','vimMapMod'),
+        ('vimMapMod','vimMapMod'),
+        ('vimMapMod','vimMapMod'),
+        ('vimMenuBang','vimMenuBang'),
+        ('vimMenuBang','vimMenuBang'),
+        ('vimMenuMod','vimMenuMod'),
+        ('vimMenuName','vimMenuName'),
+        ('vimMenuName','vimMenuName'),
+        ('vimMenuPriority','vimMenuPriority'),
+        ('vimMenuStatus','vimMenuStatus'),
+        ('vim_did_enter','vim_did_enter'),
+        ('vim_did_init','vim_did_init'),
+        ('virtcol','virtcol'),
+        ('virtcol2col','virtcol2col'),
+        ('visualmode','visualmode'),
+        ('viu','viusage'),
+        ('vm','vmap'),
+        ('vmapc','vmapclear'),
+        ('vme','vmenu'),
+        ('vn','vnoremap'),
+        ('vne','vnew'),
+        ('vnoreme','vnoremenu'),
+        ('vs','vsplit'),
+        ('vunme','vunmenu'),
+        ('w','write'),
+        ('wN','wNext'),
+        ('wa','wall'),
+        ('warningmsg','warningmsg'),
+        ('wayland_display','wayland_display'),
+        ('wi','winsize'),
+        ('wildmenumode','wildmenumode'),
+        ('wildtrigger','wildtrigger'),
+        ('win_execute','win_execute'),
+        ('win_findbuf','win_findbuf'),
+        ('win_getid','win_getid'),
+        ('win_gettype','win_gettype'),
+        ('win_gotoid','win_gotoid'),
+        ('win_id2tabwin','win_id2tabwin'),
+        ('win_id2win','win_id2win'),
+        ('win_move_separator','win_move_separator'),
+        ('win_move_statusline','win_move_statusline'),
+        ('win_screenpos','win_screenpos'),
+        ('win_splitmove','win_splitmove'),
+        ('winbufnr','winbufnr'),
+        ('wincol','wincol'),
+        ('windowid','windowid'),
+        ('windowsversion','windowsversion'),
+        ('winheight','winheight'),
+        ('winlayout','winlayout'),
+        ('winline','winline'),
+        ('winnr','winnr'),
+        ('winp','winpos'),
+        ('winrestcmd','winrestcmd'),
+        ('winrestview','winrestview'),
+        ('winsaveview','winsaveview'),
+        ('winwidth','winwidth'),
+        ('wl','wlrestore'),
+        ('wn','wnext'),
+        ('wordcount','wordcount'),
+        ('wp','wprevious'),
+        ('wq','wq'),
+        ('wqa','wqall'),
+        ('writefile','writefile'),
+        ('wu','wundo'),
+        ('wv','wviminfo'),
+        ('x','xit'),
+        ('xa','xall'),
+        ('xm','xmap'),
+        ('xmapc','xmapclear'),
+        ('xme','xmenu'),
+        ('xn','xnoremap'),
+        ('xnoreme','xnoremenu'),
+        ('xor','xor'),
+        ('xr','xrestore'),
+        ('xunme','xunmenu'),
+        ('y','yank'),
+        ('z','z'),
+    )
+    return var
+command = _getcommand()
+
+def _getoption():
+    var = (
+        ('ac','ac'),
+        ('ac','ac'),
+        ('acd','acd'),
+        ('acd','acd'),
+        ('acl','acl'),
+        ('acl','acl'),
+        ('act','act'),
+        ('act','act'),
+        ('ai','ai'),
+        ('ai','ai'),
+        ('al','al'),
+        ('al','al'),
+        ('aleph','aleph'),
+        ('aleph','aleph'),
+        ('allowrevins','allowrevins'),
+        ('allowrevins','allowrevins'),
+        ('ambiwidth','ambiwidth'),
+        ('ambiwidth','ambiwidth'),
+        ('ambw','ambw'),
+        ('ambw','ambw'),
+        ('ar','ar'),
+        ('ar','ar'),
+        ('arab','arab'),
+        ('arab','arab'),
+        ('arabic','arabic'),
+        ('arabic','arabic'),
+        ('arabicshape','arabicshape'),
+        ('arabicshape','arabicshape'),
+        ('ari','ari'),
+        ('ari','ari'),
+        ('arshape','arshape'),
+        ('arshape','arshape'),
+        ('asd','asd'),
+        ('asd','asd'),
+        ('autochdir','autochdir'),
+        ('autochdir','autochdir'),
+        ('autocomplete','autocomplete'),
+        ('autocomplete','autocomplete'),
+        ('autocompletedelay','autocompletedelay'),
+        ('autocompletedelay','autocompletedelay'),
+        ('autocompletetimeout','autocompletetimeout'),
+        ('autocompletetimeout','autocompletetimeout'),
+        ('autoindent','autoindent'),
+        ('autoindent','autoindent'),
+        ('autoread','autoread'),
+        ('autoread','autoread'),
+        ('autoshelldir','autoshelldir'),
+        ('autoshelldir','autoshelldir'),
+        ('autowrite','autowrite'),
+        ('autowrite','autowrite'),
+        ('autowriteall','autowriteall'),
+        ('autowriteall','autowriteall'),
+        ('aw','aw'),
+        ('aw','aw'),
+        ('awa','awa'),
+        ('awa','awa'),
+        ('background','background'),
+        ('background','background'),
+        ('backspace','backspace'),
+        ('backspace','backspace'),
+        ('backup','backup'),
+        ('backup','backup'),
+        ('backupcopy','backupcopy'),
+        ('backupcopy','backupcopy'),
+        ('backupdir','backupdir'),
+        ('backupdir','backupdir'),
+        ('backupext','backupext'),
+        ('backupext','backupext'),
+        ('backupskip','backupskip'),
+        ('backupskip','backupskip'),
+        ('balloondelay','balloondelay'),
+        ('balloondelay','balloondelay'),
+        ('ballooneval','ballooneval'),
+        ('ballooneval','ballooneval'),
+        ('balloonevalterm','balloonevalterm'),
+        ('balloonevalterm','balloonevalterm'),
+        ('balloonexpr','balloonexpr'),
+        ('balloonexpr','balloonexpr'),
+        ('bdir','bdir'),
+        ('bdir','bdir'),
+        ('bdlay','bdlay'),
+        ('bdlay','bdlay'),
+        ('belloff','belloff'),
+        ('belloff','belloff'),
+        ('beval','beval'),
+        ('beval','beval'),
+        ('bevalterm','bevalterm'),
+        ('bevalterm','bevalterm'),
+        ('bex','bex'),
+        ('bex','bex'),
+        ('bexpr','bexpr'),
+        ('bexpr','bexpr'),
+        ('bg','bg'),
+        ('bg','bg'),
+        ('bh','bh'),
+        ('bh','bh'),
+        ('bin','bin'),
+        ('bin','bin'),
+        ('binary','binary'),
+        ('binary','binary'),
+        ('bk','bk'),
+        ('bk','bk'),
+        ('bkc','bkc'),
+        ('bkc','bkc'),
+        ('bl','bl'),
+        ('bl','bl'),
+        ('bo','bo'),
+        ('bo','bo'),
+        ('bomb','bomb'),
+        ('bomb','bomb'),
+        ('breakat','breakat'),
+        ('breakat','breakat'),
+        ('breakindent','breakindent'),
+        ('breakindent','breakindent'),
+        ('breakindentopt','breakindentopt'),
+        ('breakindentopt','breakindentopt'),
+        ('bri','bri'),
+        ('bri','bri'),
+        ('briopt','briopt'),
+        ('briopt','briopt'),
+        ('brk','brk'),
+        ('brk','brk'),
+        ('browsedir','browsedir'),
+        ('browsedir','browsedir'),
+        ('bs','bs'),
+        ('bs','bs'),
+        ('bsdir','bsdir'),
+        ('bsdir','bsdir'),
+        ('bsk','bsk'),
+        ('bsk','bsk'),
+        ('bt','bt'),
+        ('bt','bt'),
+        ('bufhidden','bufhidden'),
+        ('bufhidden','bufhidden'),
+        ('buflisted','buflisted'),
+        ('buflisted','buflisted'),
+        ('buftype','buftype'),
+        ('buftype','buftype'),
+        ('casemap','casemap'),
+        ('casemap','casemap'),
+        ('cb','cb'),
+        ('cb','cb'),
+        ('cc','cc'),
+        ('cc','cc'),
+        ('ccv','ccv'),
+        ('ccv','ccv'),
+        ('cd','cd'),
+        ('cd','cd'),
+        ('cdh','cdh'),
+        ('cdh','cdh'),
+        ('cdhome','cdhome'),
+        ('cdhome','cdhome'),
+        ('cdpath','cdpath'),
+        ('cdpath','cdpath'),
+        ('cedit','cedit'),
+        ('cedit','cedit'),
+        ('cf','cf'),
+        ('cf','cf'),
+        ('cfu','cfu'),
+        ('cfu','cfu'),
+        ('ch','ch'),
+        ('ch','ch'),
+        ('charconvert','charconvert'),
+        ('charconvert','charconvert'),
+        ('chi','chi'),
+        ('chi','chi'),
+        ('chistory','chistory'),
+        ('chistory','chistory'),
+        ('ci','ci'),
+        ('ci','ci'),
+        ('cia','cia'),
+        ('cia','cia'),
+        ('cin','cin'),
+        ('cin','cin'),
+        ('cindent','cindent'),
+        ('cindent','cindent'),
+        ('cink','cink'),
+        ('cink','cink'),
+        ('cinkeys','cinkeys'),
+        ('cinkeys','cinkeys'),
+        ('cino','cino'),
+        ('cino','cino'),
+        ('cinoptions','cinoptions'),
+        ('cinoptions','cinoptions'),
+        ('cinscopedecls','cinscopedecls'),
+        ('cinscopedecls','cinscopedecls'),
+        ('cinsd','cinsd'),
+        ('cinsd','cinsd'),
+        ('cinw','cinw'),
+        ('cinw','cinw'),
+        ('cinwords','cinwords'),
+        ('cinwords','cinwords'),
+        ('clipboard','clipboard'),
+        ('clipboard','clipboard'),
+        ('clipmethod','clipmethod'),
+        ('clipmethod','clipmethod'),
+        ('cm','cm'),
+        ('cm','cm'),
+        ('cmdheight','cmdheight'),
+        ('cmdheight','cmdheight'),
+        ('cmdwinheight','cmdwinheight'),
+        ('cmdwinheight','cmdwinheight'),
+        ('cmp','cmp'),
+        ('cmp','cmp'),
+        ('cms','cms'),
+        ('cms','cms'),
+        ('co','co'),
+        ('co','co'),
+        ('cocu','cocu'),
+        ('cocu','cocu'),
+        ('cole','cole'),
+        ('cole','cole'),
+        ('colorcolumn','colorcolumn'),
+        ('colorcolumn','colorcolumn'),
+        ('columns','columns'),
+        ('columns','columns'),
+        ('com','com'),
+        ('com','com'),
+        ('comments','comments'),
+        ('comments','comments'),
+        ('commentstring','commentstring'),
+        ('commentstring','commentstring'),
+        ('compatible','compatible'),
+        ('compatible','compatible'),
+        ('complete','complete'),
+        ('complete','complete'),
+        ('completefunc','completefunc'),
+        ('completefunc','completefunc'),
+        ('completeitemalign','completeitemalign'),
+        ('completeitemalign','completeitemalign'),
+        ('completeopt','completeopt'),
+        ('completeopt','completeopt'),
+        ('completepopup','completepopup'),
+        ('completepopup','completepopup'),
+        ('completeslash','completeslash'),
+        ('completeslash','completeslash'),
+        ('completetimeout','completetimeout'),
+        ('completetimeout','completetimeout'),
+        ('concealcursor','concealcursor'),
+        ('concealcursor','concealcursor'),
+        ('conceallevel','conceallevel'),
+        ('conceallevel','conceallevel'),
+        ('confirm','confirm'),
+        ('confirm','confirm'),
+        ('copyindent','copyindent'),
+        ('copyindent','copyindent'),
+        ('cot','cot'),
+        ('cot','cot'),
+        ('cp','cp'),
+        ('cp','cp'),
+        ('cpm','cpm'),
+        ('cpm','cpm'),
+        ('cpo','cpo'),
+        ('cpo','cpo'),
+        ('cpoptions','cpoptions'),
+        ('cpoptions','cpoptions'),
+        ('cpp','cpp'),
+        ('cpp','cpp'),
+        ('cpt','cpt'),
+        ('cpt','cpt'),
+        ('crb','crb'),
+        ('crb','crb'),
+        ('cryptmethod','cryptmethod'),
+        ('cryptmethod','cryptmethod'),
+        ('cscopepathcomp','cscopepathcomp'),
+        ('cscopepathcomp','cscopepathcomp'),
+        ('cscopeprg','cscopeprg'),
+        ('cscopeprg','cscopeprg'),
+        ('cscopequickfix','cscopequickfix'),
+        ('cscopequickfix','cscopequickfix'),
+        ('cscoperelative','cscoperelative'),
+        ('cscoperelative','cscoperelative'),
+        ('cscopetag','cscopetag'),
+        ('cscopetag','cscopetag'),
+        ('cscopetagorder','cscopetagorder'),
+        ('cscopetagorder','cscopetagorder'),
+        ('cscopeverbose','cscopeverbose'),
+        ('cscopeverbose','cscopeverbose'),
+        ('csl','csl'),
+        ('csl','csl'),
+        ('cspc','cspc'),
+        ('cspc','cspc'),
+        ('csprg','csprg'),
+        ('csprg','csprg'),
+        ('csqf','csqf'),
+        ('csqf','csqf'),
+        ('csre','csre'),
+        ('csre','csre'),
+        ('cst','cst'),
+        ('cst','cst'),
+        ('csto','csto'),
+        ('csto','csto'),
+        ('csverb','csverb'),
+        ('csverb','csverb'),
+        ('cto','cto'),
+        ('cto','cto'),
+        ('cuc','cuc'),
+        ('cuc','cuc'),
+        ('cul','cul'),
+        ('cul','cul'),
+        ('culopt','culopt'),
+        ('culopt','culopt'),
+        ('cursorbind','cursorbind'),
+        ('cursorbind','cursorbind'),
+        ('cursorcolumn','cursorcolumn'),
+        ('cursorcolumn','cursorcolumn'),
+        ('cursorline','cursorline'),
+        ('cursorline','cursorline'),
+        ('cursorlineopt','cursorlineopt'),
+        ('cursorlineopt','cursorlineopt'),
+        ('cwh','cwh'),
+        ('cwh','cwh'),
+        ('debug','debug'),
+        ('debug','debug'),
+        ('deco','deco'),
+        ('deco','deco'),
+        ('def','def'),
+        ('def','def'),
+        ('define','define'),
+        ('define','define'),
+        ('delcombine','delcombine'),
+        ('delcombine','delcombine'),
+        ('dex','dex'),
+        ('dex','dex'),
+        ('dg','dg'),
+        ('dg','dg'),
+        ('dia','dia'),
+        ('dia','dia'),
+        ('dict','dict'),
+        ('dict','dict'),
+        ('dictionary','dictionary'),
+        ('dictionary','dictionary'),
+        ('diff','diff'),
+        ('diff','diff'),
+        ('diffanchors','diffanchors'),
+        ('diffanchors','diffanchors'),
+        ('diffexpr','diffexpr'),
+        ('diffexpr','diffexpr'),
+        ('diffopt','diffopt'),
+        ('diffopt','diffopt'),
+        ('digraph','digraph'),
+        ('digraph','digraph'),
+        ('dip','dip'),
+        ('dip','dip'),
+        ('dir','dir'),
+        ('dir','dir'),
+        ('directory','directory'),
+        ('directory','directory'),
+        ('display','display'),
+        ('display','display'),
+        ('dy','dy'),
+        ('dy','dy'),
+        ('ea','ea'),
+        ('ea','ea'),
+        ('ead','ead'),
+        ('ead','ead'),
+        ('eadirection','eadirection'),
+        ('eadirection','eadirection'),
+        ('eb','eb'),
+        ('eb','eb'),
+        ('ed','ed'),
+        ('ed','ed'),
+        ('edcompatible','edcompatible'),
+        ('edcompatible','edcompatible'),
+        ('ef','ef'),
+        ('ef','ef'),
+        ('efm','efm'),
+        ('efm','efm'),
+        ('ei','ei'),
+        ('ei','ei'),
+        ('eiw','eiw'),
+        ('eiw','eiw'),
+        ('ek','ek'),
+        ('ek','ek'),
+        ('emo','emo'),
+        ('emo','emo'),
+        ('emoji','emoji'),
+        ('emoji','emoji'),
+        ('enc','enc'),
+        ('enc','enc'),
+        ('encoding','encoding'),
+        ('encoding','encoding'),
+        ('endoffile','endoffile'),
+        ('endoffile','endoffile'),
+        ('endofline','endofline'),
+        ('endofline','endofline'),
+        ('eof','eof'),
+        ('eof','eof'),
+        ('eol','eol'),
+        ('eol','eol'),
+        ('ep','ep'),
+        ('ep','ep'),
+        ('equalalways','equalalways'),
+        ('equalalways','equalalways'),
+        ('equalprg','equalprg'),
+        ('equalprg','equalprg'),
+        ('errorbells','errorbells'),
+        ('errorbells','errorbells'),
+        ('errorfile','errorfile'),
+        ('errorfile','errorfile'),
+        ('errorformat','errorformat'),
+        ('errorformat','errorformat'),
+        ('esckeys','esckeys'),
+        ('esckeys','esckeys'),
+        ('et','et'),
+        ('et','et'),
+        ('eventignore','eventignore'),
+        ('eventignore','eventignore'),
+        ('eventignorewin','eventignorewin'),
+        ('eventignorewin','eventignorewin'),
+        ('ex','ex'),
+        ('ex','ex'),
+        ('expandtab','expandtab'),
+        ('expandtab','expandtab'),
+        ('exrc','exrc'),
+        ('exrc','exrc'),
+        ('fcl','fcl'),
+        ('fcl','fcl'),
+        ('fcs','fcs'),
+        ('fcs','fcs'),
+        ('fdc','fdc'),
+        ('fdc','fdc'),
+        ('fde','fde'),
+        ('fde','fde'),
+        ('fdi','fdi'),
+        ('fdi','fdi'),
+        ('fdl','fdl'),
+        ('fdl','fdl'),
+        ('fdls','fdls'),
+        ('fdls','fdls'),
+        ('fdm','fdm'),
+        ('fdm','fdm'),
+        ('fdn','fdn'),
+        ('fdn','fdn'),
+        ('fdo','fdo'),
+        ('fdo','fdo'),
+        ('fdt','fdt'),
+        ('fdt','fdt'),
+        ('fen','fen'),
+        ('fen','fen'),
+        ('fenc','fenc'),
+        ('fenc','fenc'),
+        ('fencs','fencs'),
+        ('fencs','fencs'),
+        ('fex','fex'),
+        ('fex','fex'),
+        ('ff','ff'),
+        ('ff','ff'),
+        ('ffs','ffs'),
+        ('ffs','ffs'),
+        ('ffu','ffu'),
+        ('ffu','ffu'),
+        ('fic','fic'),
+        ('fic','fic'),
+        ('fileencoding','fileencoding'),
+        ('fileencoding','fileencoding'),
+        ('fileencodings','fileencodings'),
+        ('fileencodings','fileencodings'),
+        ('fileformat','fileformat'),
+        ('fileformat','fileformat'),
+        ('fileformats','fileformats'),
+        ('fileformats','fileformats'),
+        ('fileignorecase','fileignorecase'),
+        ('fileignorecase','fileignorecase'),
+        ('filetype','filetype'),
+        ('filetype','filetype'),
+        ('fillchars','fillchars'),
+        ('fillchars','fillchars'),
+        ('findfunc','findfunc'),
+        ('findfunc','findfunc'),
+        ('fixendofline','fixendofline'),
+        ('fixendofline','fixendofline'),
+        ('fixeol','fixeol'),
+        ('fixeol','fixeol'),
+        ('flp','flp'),
+        ('flp','flp'),
+        ('fml','fml'),
+        ('fml','fml'),
+        ('fmr','fmr'),
+        ('fmr','fmr'),
+        ('fo','fo'),
+        ('fo','fo'),
+        ('foldclose','foldclose'),
+        ('foldclose','foldclose'),
+        ('foldcolumn','foldcolumn'),
+        ('foldcolumn','foldcolumn'),
+        ('foldenable','foldenable'),
+        ('foldenable','foldenable'),
+        ('foldexpr','foldexpr'),
+        ('foldexpr','foldexpr'),
+        ('foldignore','foldignore'),
+        ('foldignore','foldignore'),
+        ('foldlevel','foldlevel'),
+        ('foldlevel','foldlevel'),
+        ('foldlevelstart','foldlevelstart'),
+        ('foldlevelstart','foldlevelstart'),
+        ('foldmarker','foldmarker'),
+        ('foldmarker','foldmarker'),
+        ('foldmethod','foldmethod'),
+        ('foldmethod','foldmethod'),
+        ('foldminlines','foldminlines'),
+        ('foldminlines','foldminlines'),
+        ('foldnestmax','foldnestmax'),
+        ('foldnestmax','foldnestmax'),
+        ('foldopen','foldopen'),
+        ('foldopen','foldopen'),
+        ('foldtext','foldtext'),
+        ('foldtext','foldtext'),
+        ('formatexpr','formatexpr'),
+        ('formatexpr','formatexpr'),
+        ('formatlistpat','formatlistpat'),
+        ('formatlistpat','formatlistpat'),
+        ('formatoptions','formatoptions'),
+        ('formatoptions','formatoptions'),
+        ('formatprg','formatprg'),
+        ('formatprg','formatprg'),
+        ('fp','fp'),
+        ('fp','fp'),
+        ('fs','fs'),
+        ('fs','fs'),
+        ('fsync','fsync'),
+        ('fsync','fsync'),
+        ('ft','ft'),
+        ('ft','ft'),
+        ('gcr','gcr'),
+        ('gcr','gcr'),
+        ('gd','gd'),
+        ('gd','gd'),
+        ('gdefault','gdefault'),
+        ('gdefault','gdefault'),
+        ('gfm','gfm'),
+        ('gfm','gfm'),
+        ('gfn','gfn'),
+        ('gfn','gfn'),
+        ('gfs','gfs'),
+        ('gfs','gfs'),
+        ('gfw','gfw'),
+        ('gfw','gfw'),
+        ('ghr','ghr'),
+        ('ghr','ghr'),
+        ('gli','gli'),
+        ('gli','gli'),
+        ('go','go'),
+        ('go','go'),
+        ('gp','gp'),
+        ('gp','gp'),
+        ('grepformat','grepformat'),
+        ('grepformat','grepformat'),
+        ('grepprg','grepprg'),
+        ('grepprg','grepprg'),
+        ('gtl','gtl'),
+        ('gtl','gtl'),
+        ('gtt','gtt'),
+        ('gtt','gtt'),
+        ('guicursor','guicursor'),
+        ('guicursor','guicursor'),
+        ('guifont','guifont'),
+        ('guifont','guifont'),
+        ('guifontset','guifontset'),
+        ('guifontset','guifontset'),
+        ('guifontwide','guifontwide'),
+        ('guifontwide','guifontwide'),
+        ('guiheadroom','guiheadroom'),
+        ('guiheadroom','guiheadroom'),
+        ('guiligatures','guiligatures'),
+        ('guiligatures','guiligatures'),
+        ('guioptions','guioptions'),
+        ('guioptions','guioptions'),
+        ('guipty','guipty'),
+        ('guipty','guipty'),
+        ('guitablabel','guitablabel'),
+        ('guitablabel','guitablabel'),
+        ('guitabtooltip','guitabtooltip'),
+        ('guitabtooltip','guitabtooltip'),
+        ('helpfile','helpfile'),
+        ('helpfile','helpfile'),
+        ('helpheight','helpheight'),
+        ('helpheight','helpheight'),
+        ('helplang','helplang'),
+        ('helplang','helplang'),
+        ('hf','hf'),
+        ('hf','hf'),
+        ('hh','hh'),
+        ('hh','hh'),
+        ('hi','hi'),
+        ('hi','hi'),
+        ('hid','hid'),
+        ('hid','hid'),
+        ('hidden','hidden'),
+        ('hidden','hidden'),
+        ('highlight','highlight'),
+        ('highlight','highlight'),
+        ('history','history'),
+        ('history','history'),
+        ('hk','hk'),
+        ('hk','hk'),
+        ('hkmap','hkmap'),
+        ('hkmap','hkmap'),
+        ('hkmapp','hkmapp'),
+        ('hkmapp','hkmapp'),
+        ('hkp','hkp'),
+        ('hkp','hkp'),
+        ('hl','hl'),
+        ('hl','hl'),
+        ('hlg','hlg'),
+        ('hlg','hlg'),
+        ('hls','hls'),
+        ('hls','hls'),
+        ('hlsearch','hlsearch'),
+        ('hlsearch','hlsearch'),
+        ('ic','ic'),
+        ('ic','ic'),
+        ('icon','icon'),
+        ('icon','icon'),
+        ('iconstring','iconstring'),
+        ('iconstring','iconstring'),
+        ('ignorecase','ignorecase'),
+        ('ignorecase','ignorecase'),
+        ('im','im'),
+        ('im','im'),
+        ('imactivatefunc','imactivatefunc'),
+        ('imactivatefunc','imactivatefunc'),
+        ('imactivatekey','imactivatekey'),
+        ('imactivatekey','imactivatekey'),
+        ('imaf','imaf'),
+        ('imaf','imaf'),
+        ('imak','imak'),
+        ('imak','imak'),
+        ('imc','imc'),
+        ('imc','imc'),
+        ('imcmdline','imcmdline'),
+        ('imcmdline','imcmdline'),
+        ('imd','imd'),
+        ('imd','imd'),
+        ('imdisable','imdisable'),
+        ('imdisable','imdisable'),
+        ('imi','imi'),
+        ('imi','imi'),
+        ('iminsert','iminsert'),
+        ('iminsert','iminsert'),
+        ('ims','ims'),
+        ('ims','ims'),
+        ('imsearch','imsearch'),
+        ('imsearch','imsearch'),
+        ('imsf','imsf'),
+        ('imsf','imsf'),
+        ('imst','imst'),
+        ('imst','imst'),
+        ('imstatusfunc','imstatusfunc'),
+        ('imstatusfunc','imstatusfunc'),
+        ('imstyle','imstyle'),
+        ('imstyle','imstyle'),
+        ('inc','inc'),
+        ('inc','inc'),
+        ('include','include'),
+        ('include','include'),
+        ('includeexpr','includeexpr'),
+        ('includeexpr','includeexpr'),
+        ('incsearch','incsearch'),
+        ('incsearch','incsearch'),
+        ('inde','inde'),
+        ('inde','inde'),
+        ('indentexpr','indentexpr'),
+        ('indentexpr','indentexpr'),
+        ('indentkeys','indentkeys'),
+        ('indentkeys','indentkeys'),
+        ('indk','indk'),
+        ('indk','indk'),
+        ('inex','inex'),
+        ('inex','inex'),
+        ('inf','inf'),
+        ('inf','inf'),
+        ('infercase','infercase'),
+        ('infercase','infercase'),
+        ('insertmode','insertmode'),
+        ('insertmode','insertmode'),
+        ('invac','invac'),
+        ('invacd','invacd'),
+        ('invai','invai'),
+        ('invallowrevins','invallowrevins'),
+        ('invar','invar'),
+        ('invarab','invarab'),
+        ('invarabic','invarabic'),
+        ('invarabicshape','invarabicshape'),
+        ('invari','invari'),
+        ('invarshape','invarshape'),
+        ('invasd','invasd'),
+        ('invautochdir','invautochdir'),
+        ('invautocomplete','invautocomplete'),
+        ('invautoindent','invautoindent'),
+        ('invautoread','invautoread'),
+        ('invautoshelldir','invautoshelldir'),
+        ('invautowrite','invautowrite'),
+        ('invautowriteall','invautowriteall'),
+        ('invaw','invaw'),
+        ('invawa','invawa'),
+        ('invbackup','invbackup'),
+        ('invballooneval','invballooneval'),
+        ('invballoonevalterm','invballoonevalterm'),
+        ('invbeval','invbeval'),
+        ('invbevalterm','invbevalterm'),
+        ('invbin','invbin'),
+        ('invbinary','invbinary'),
+        ('invbk','invbk'),
+        ('invbl','invbl'),
+        ('invbomb','invbomb'),
+        ('invbreakindent','invbreakindent'),
+        ('invbri','invbri'),
+        ('invbuflisted','invbuflisted'),
+        ('invcdh','invcdh'),
+        ('invcdhome','invcdhome'),
+        ('invcf','invcf'),
+        ('invci','invci'),
+        ('invcin','invcin'),
+        ('invcindent','invcindent'),
+        ('invcompatible','invcompatible'),
+        ('invconfirm','invconfirm'),
+        ('invcopyindent','invcopyindent'),
+        ('invcp','invcp'),
+        ('invcrb','invcrb'),
+        ('invcscoperelative','invcscoperelative'),
+        ('invcscopetag','invcscopetag'),
+        ('invcscopeverbose','invcscopeverbose'),
+        ('invcsre','invcsre'),
+        ('invcst','invcst'),
+        ('invcsverb','invcsverb'),
+        ('invcuc','invcuc'),
+        ('invcul','invcul'),
+        ('invcursorbind','invcursorbind'),
+        ('invcursorcolumn','invcursorcolumn'),
+        ('invcursorline','invcursorline'),
+        ('invdeco','invdeco'),
+        ('invdelcombine','invdelcombine'),
+        ('invdg','invdg'),
+        ('invdiff','invdiff'),
+        ('invdigraph','invdigraph'),
+        ('invea','invea'),
+        ('inveb','inveb'),
+        ('inved','inved'),
+        ('invedcompatible','invedcompatible'),
+        ('invek','invek'),
+        ('invemo','invemo'),
+        ('invemoji','invemoji'),
+        ('invendoffile','invendoffile'),
+        ('invendofline','invendofline'),
+        ('inveof','inveof'),
+        ('inveol','inveol'),
+        ('invequalalways','invequalalways'),
+        ('inverrorbells','inverrorbells'),
+        ('invesckeys','invesckeys'),
+        ('invet','invet'),
+        ('invex','invex'),
+        ('invexpandtab','invexpandtab'),
+        ('invexrc','invexrc'),
+        ('invfen','invfen'),
+        ('invfic','invfic'),
+        ('invfileignorecase','invfileignorecase'),
+        ('invfixendofline','invfixendofline'),
+        ('invfixeol','invfixeol'),
+        ('invfoldenable','invfoldenable'),
+        ('invfs','invfs'),
+        ('invfsync','invfsync'),
+        ('invgd','invgd'),
+        ('invgdefault','invgdefault'),
+        ('invguipty','invguipty'),
+        ('invhid','invhid'),
+        ('invhidden','invhidden'),
+        ('invhk','invhk'),
+        ('invhkmap','invhkmap'),
+        ('invhkmapp','invhkmapp'),
+        ('invhkp','invhkp'),
+        ('invhls','invhls'),
+        ('invhlsearch','invhlsearch'),
+        ('invic','invic'),
+        ('invicon','invicon'),
+        ('invignorecase','invignorecase'),
+        ('invim','invim'),
+        ('invimc','invimc'),
+        ('invimcmdline','invimcmdline'),
+        ('invimd','invimd'),
+        ('invimdisable','invimdisable'),
+        ('invincsearch','invincsearch'),
+        ('invinf','invinf'),
+        ('invinfercase','invinfercase'),
+        ('invinsertmode','invinsertmode'),
+        ('invis','invis'),
+        ('invjoinspaces','invjoinspaces'),
+        ('invjs','invjs'),
+        ('invlangnoremap','invlangnoremap'),
+        ('invlangremap','invlangremap'),
+        ('invlazyredraw','invlazyredraw'),
+        ('invlbr','invlbr'),
+        ('invlinebreak','invlinebreak'),
+        ('invlisp','invlisp'),
+        ('invlist','invlist'),
+        ('invlnr','invlnr'),
+        ('invloadplugins','invloadplugins'),
+        ('invlpl','invlpl'),
+        ('invlrm','invlrm'),
+        ('invlz','invlz'),
+        ('invma','invma'),
+        ('invmagic','invmagic'),
+        ('invmh','invmh'),
+        ('invml','invml'),
+        ('invmle','invmle'),
+        ('invmlst','invmlst'),
+        ('invmod','invmod'),
+        ('invmodeline','invmodeline'),
+        ('invmodelineexpr','invmodelineexpr'),
+        ('invmodelinestrict','invmodelinestrict'),
+        ('invmodifiable','invmodifiable'),
+        ('invmodified','invmodified'),
+        ('invmore','invmore'),
+        ('invmousef','invmousef'),
+        ('invmousefocus','invmousefocus'),
+        ('invmousehide','invmousehide'),
+        ('invmousemev','invmousemev'),
+        ('invmousemoveevent','invmousemoveevent'),
+        ('invnu','invnu'),
+        ('invnumber','invnumber'),
+        ('invodev','invodev'),
+        ('invopendevice','invopendevice'),
+        ('invpaste','invpaste'),
+        ('invpi','invpi'),
+        ('invpreserveindent','invpreserveindent'),
+        ('invpreviewwindow','invpreviewwindow'),
+        ('invprompt','invprompt'),
+        ('invpvw','invpvw'),
+        ('invreadonly','invreadonly'),
+        ('invrelativenumber','invrelativenumber'),
+        ('invremap','invremap'),
+        ('invrestorescreen','invrestorescreen'),
+        ('invrevins','invrevins'),
+        ('invri','invri'),
+        ('invrightleft','invrightleft'),
+        ('invrl','invrl'),
+        ('invrnu','invrnu'),
+        ('invro','invro'),
+        ('invrs','invrs'),
+        ('invru','invru'),
+        ('invruler','invruler'),
+        ('invsb','invsb'),
+        ('invsc','invsc'),
+        ('invscb','invscb'),
+        ('invscf','invscf'),
+        ('invscrollbind','invscrollbind'),
+        ('invscrollfocus','invscrollfocus'),
+        ('invscs','invscs'),
+        ('invsecure','invsecure'),
+        ('invsft','invsft'),
+        ('invshellslash','invshellslash'),
+        ('invshelltemp','invshelltemp'),
+        ('invshiftround','invshiftround'),
+        ('invshortname','invshortname'),
+        ('invshowcmd','invshowcmd'),
+        ('invshowfulltag','invshowfulltag'),
+        ('invshowmatch','invshowmatch'),
+        ('invshowmode','invshowmode'),
+        ('invsi','invsi'),
+        ('invsm','invsm'),
+        ('invsmartcase','invsmartcase'),
+        ('invsmartindent','invsmartindent'),
+        ('invsmarttab','invsmarttab'),
+        ('invsmd','invsmd'),
+        ('invsmoothscroll','invsmoothscroll'),
+        ('invsms','invsms'),
+        ('invsn','invsn'),
+        ('invsol','invsol'),
+        ('invspell','invspell'),
+        ('invsplitbelow','invsplitbelow'),
+        ('invsplitright','invsplitright'),
+        ('invspr','invspr'),
+        ('invsr','invsr'),
+        ('invssl','invssl'),
+        ('invsta','invsta'),
+        ('invstartofline','invstartofline'),
+        ('invstmp','invstmp'),
+        ('invswapfile','invswapfile'),
+        ('invswf','invswf'),
+        ('invta','invta'),
+        ('invtagbsearch','invtagbsearch'),
+        ('invtagrelative','invtagrelative'),
+        ('invtagsecure','invtagsecure'),
+        ('invtagstack','invtagstack'),
+        ('invtbi','invtbi'),
+        ('invtbidi','invtbidi'),
+        ('invtbs','invtbs'),
+        ('invtermbidi','invtermbidi'),
+        ('invtermguicolors','invtermguicolors'),
+        ('invtermsync','invtermsync'),
+        ('invterse','invterse'),
+        ('invtextauto','invtextauto'),
+        ('invtextmode','invtextmode'),
+        ('invtf','invtf'),
+        ('invtgc','invtgc'),
+        ('invtgst','invtgst'),
+        ('invtildeop','invtildeop'),
+        ('invtimeout','invtimeout'),
+        ('invtitle','invtitle'),
+        ('invto','invto'),
+        ('invtop','invtop'),
+        ('invtr','invtr'),
+        ('invtsc','invtsc'),
+        ('invtsy','invtsy'),
+        ('invttimeout','invttimeout'),
+        ('invttybuiltin','invttybuiltin'),
+        ('invttyfast','invttyfast'),
+        ('invtx','invtx'),
+        ('invudf','invudf'),
+        ('invundofile','invundofile'),
+        ('invvb','invvb'),
+        ('invvisualbell','invvisualbell'),
+        ('invwa','invwa'),
+        ('invwarn','invwarn'),
+        ('invwb','invwb'),
+        ('invweirdinvert','invweirdinvert'),
+        ('invwfb','invwfb'),
+        ('invwfh','invwfh'),
+        ('invwfw','invwfw'),
+        ('invwic','invwic'),
+        ('invwildignorecase','invwildignorecase'),
+        ('invwildmenu','invwildmenu'),
+        ('invwinfixbuf','invwinfixbuf'),
+        ('invwinfixheight','invwinfixheight'),
+        ('invwinfixwidth','invwinfixwidth'),
+        ('invwiv','invwiv'),
+        ('invwmnu','invwmnu'),
+        ('invwrap','invwrap'),
+        ('invwrapscan','invwrapscan'),
+        ('invwrite','invwrite'),
+        ('invwriteany','invwriteany'),
+        ('invwritebackup','invwritebackup'),
+        ('invws','invws'),
+        ('invxtermcodes','invxtermcodes'),
+        ('is','is'),
+        ('is','is'),
+        ('isf','isf'),
+        ('isf','isf'),
+        ('isfname','isfname'),
+        ('isfname','isfname'),
+        ('isi','isi'),
+        ('isi','isi'),
+        ('isident','isident'),
+        ('isident','isident'),
+        ('isk','isk'),
+        ('isk','isk'),
+        ('iskeyword','iskeyword'),
+        ('iskeyword','iskeyword'),
+        ('isp','isp'),
+        ('isp','isp'),
+        ('isprint','isprint'),
+        ('isprint','isprint'),
+        ('joinspaces','joinspaces'),
+        ('joinspaces','joinspaces'),
+        ('jop','jop'),
+        ('jop','jop'),
+        ('js','js'),
+        ('js','js'),
+        ('jumpoptions','jumpoptions'),
+        ('jumpoptions','jumpoptions'),
+        ('key','key'),
+        ('key','key'),
+        ('keymap','keymap'),
+        ('keymap','keymap'),
+        ('keymodel','keymodel'),
+        ('keymodel','keymodel'),
+        ('keyprotocol','keyprotocol'),
+        ('keyprotocol','keyprotocol'),
+        ('keywordprg','keywordprg'),
+        ('keywordprg','keywordprg'),
+        ('km','km'),
+        ('km','km'),
+        ('kmp','kmp'),
+        ('kmp','kmp'),
+        ('kp','kp'),
+        ('kp','kp'),
+        ('kpc','kpc'),
+        ('kpc','kpc'),
+        ('langmap','langmap'),
+        ('langmap','langmap'),
+        ('langmenu','langmenu'),
+        ('langmenu','langmenu'),
+        ('langnoremap','langnoremap'),
+        ('langnoremap','langnoremap'),
+        ('langremap','langremap'),
+        ('langremap','langremap'),
+        ('laststatus','laststatus'),
+        ('laststatus','laststatus'),
+        ('lazyredraw','lazyredraw'),
+        ('lazyredraw','lazyredraw'),
+        ('lbr','lbr'),
+        ('lbr','lbr'),
+        ('lcs','lcs'),
+        ('lcs','lcs'),
+        ('lhi','lhi'),
+        ('lhi','lhi'),
+        ('lhistory','lhistory'),
+        ('lhistory','lhistory'),
+        ('linebreak','linebreak'),
+        ('linebreak','linebreak'),
+        ('lines','lines'),
+        ('lines','lines'),
+        ('linespace','linespace'),
+        ('linespace','linespace'),
+        ('lisp','lisp'),
+        ('lisp','lisp'),
+        ('lispoptions','lispoptions'),
+        ('lispoptions','lispoptions'),
+        ('lispwords','lispwords'),
+        ('lispwords','lispwords'),
+        ('list','list'),
+        ('list','list'),
+        ('listchars','listchars'),
+        ('listchars','listchars'),
+        ('lm','lm'),
+        ('lm','lm'),
+        ('lmap','lmap'),
+        ('lmap','lmap'),
+        ('lnr','lnr'),
+        ('lnr','lnr'),
+        ('loadplugins','loadplugins'),
+        ('loadplugins','loadplugins'),
+        ('lop','lop'),
+        ('lop','lop'),
+        ('lpl','lpl'),
+        ('lpl','lpl'),
+        ('lrm','lrm'),
+        ('lrm','lrm'),
+        ('ls','ls'),
+        ('ls','ls'),
+        ('lsp','lsp'),
+        ('lsp','lsp'),
+        ('luadll','luadll'),
+        ('luadll','luadll'),
+        ('lw','lw'),
+        ('lw','lw'),
+        ('lz','lz'),
+        ('lz','lz'),
+        ('ma','ma'),
+        ('ma','ma'),
+        ('magic','magic'),
+        ('magic','magic'),
+        ('makeef','makeef'),
+        ('makeef','makeef'),
+        ('makeencoding','makeencoding'),
+        ('makeencoding','makeencoding'),
+        ('makeprg','makeprg'),
+        ('makeprg','makeprg'),
+        ('mat','mat'),
+        ('mat','mat'),
+        ('matchpairs','matchpairs'),
+        ('matchpairs','matchpairs'),
+        ('matchtime','matchtime'),
+        ('matchtime','matchtime'),
+        ('maxcombine','maxcombine'),
+        ('maxcombine','maxcombine'),
+        ('maxfuncdepth','maxfuncdepth'),
+        ('maxfuncdepth','maxfuncdepth'),
+        ('maxmapdepth','maxmapdepth'),
+        ('maxmapdepth','maxmapdepth'),
+        ('maxmem','maxmem'),
+        ('maxmem','maxmem'),
+        ('maxmempattern','maxmempattern'),
+        ('maxmempattern','maxmempattern'),
+        ('maxmemtot','maxmemtot'),
+        ('maxmemtot','maxmemtot'),
+        ('maxsearchcount','maxsearchcount'),
+        ('maxsearchcount','maxsearchcount'),
+        ('mco','mco'),
+        ('mco','mco'),
+        ('mef','mef'),
+        ('mef','mef'),
+        ('menc','menc'),
+        ('menc','menc'),
+        ('menuitems','menuitems'),
+        ('menuitems','menuitems'),
+        ('messagesopt','messagesopt'),
+        ('messagesopt','messagesopt'),
+        ('mfd','mfd'),
+        ('mfd','mfd'),
+        ('mh','mh'),
+        ('mh','mh'),
+        ('mis','mis'),
+        ('mis','mis'),
+        ('mkspellmem','mkspellmem'),
+        ('mkspellmem','mkspellmem'),
+        ('ml','ml'),
+        ('ml','ml'),
+        ('mle','mle'),
+        ('mle','mle'),
+        ('mls','mls'),
+        ('mls','mls'),
+        ('mlst','mlst'),
+        ('mlst','mlst'),
+        ('mm','mm'),
+        ('mm','mm'),
+        ('mmd','mmd'),
+        ('mmd','mmd'),
+        ('mmp','mmp'),
+        ('mmp','mmp'),
+        ('mmt','mmt'),
+        ('mmt','mmt'),
+        ('mod','mod'),
+        ('mod','mod'),
+        ('modeline','modeline'),
+        ('modeline','modeline'),
+        ('modelineexpr','modelineexpr'),
+        ('modelineexpr','modelineexpr'),
+        ('modelines','modelines'),
+        ('modelines','modelines'),
+        ('modelinestrict','modelinestrict'),
+        ('modelinestrict','modelinestrict'),
+        ('modifiable','modifiable'),
+        ('modifiable','modifiable'),
+        ('modified','modified'),
+        ('modified','modified'),
+        ('mopt','mopt'),
+        ('mopt','mopt'),
+        ('more','more'),
+        ('more','more'),
+        ('mouse','mouse'),
+        ('mouse','mouse'),
+        ('mousef','mousef'),
+        ('mousef','mousef'),
+        ('mousefocus','mousefocus'),
+        ('mousefocus','mousefocus'),
+        ('mousehide','mousehide'),
+        ('mousehide','mousehide'),
+        ('mousem','mousem'),
+        ('mousem','mousem'),
+        ('mousemev','mousemev'),
+        ('mousemev','mousemev'),
+        ('mousemodel','mousemodel'),
+        ('mousemodel','mousemodel'),
+        ('mousemoveevent','mousemoveevent'),
+        ('mousemoveevent','mousemoveevent'),
+        ('mouses','mouses'),
+        ('mouses','mouses'),
+        ('mouseshape','mouseshape'),
+        ('mouseshape','mouseshape'),
+        ('mouset','mouset'),
+        ('mouset','mouset'),
+        ('mousetime','mousetime'),
+        ('mousetime','mousetime'),
+        ('mp','mp'),
+        ('mp','mp'),
+        ('mps','mps'),
+        ('mps','mps'),
+        ('msc','msc'),
+        ('msc','msc'),
+        ('msm','msm'),
+        ('msm','msm'),
+        ('mzq','mzq'),
+        ('mzq','mzq'),
+        ('mzquantum','mzquantum'),
+        ('mzquantum','mzquantum'),
+        ('mzschemedll','mzschemedll'),
+        ('mzschemedll','mzschemedll'),
+        ('mzschemegcdll','mzschemegcdll'),
+        ('mzschemegcdll','mzschemegcdll'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nf','nf'),
+        ('nf','nf'),
+        ('noac','noac'),
+        ('noacd','noacd'),
+        ('noai','noai'),
+        ('noallowrevins','noallowrevins'),
+        ('noar','noar'),
+        ('noarab','noarab'),
+        ('noarabic','noarabic'),
+        ('noarabicshape','noarabicshape'),
+        ('noari','noari'),
+        ('noarshape','noarshape'),
+        ('noasd','noasd'),
+        ('noautochdir','noautochdir'),
+        ('noautocomplete','noautocomplete'),
+        ('noautoindent','noautoindent'),
+        ('noautoread','noautoread'),
+        ('noautoshelldir','noautoshelldir'),
+        ('noautowrite','noautowrite'),
+        ('noautowriteall','noautowriteall'),
+        ('noaw','noaw'),
+        ('noawa','noawa'),
+        ('nobackup','nobackup'),
+        ('noballooneval','noballooneval'),
+        ('noballoonevalterm','noballoonevalterm'),
+        ('nobeval','nobeval'),
+        ('nobevalterm','nobevalterm'),
+        ('nobin','nobin'),
+        ('nobinary','nobinary'),
+        ('nobk','nobk'),
+        ('nobl','nobl'),
+        ('nobomb','nobomb'),
+        ('nobreakindent','nobreakindent'),
+        ('nobri','nobri'),
+        ('nobuflisted','nobuflisted'),
+        ('nocdh','nocdh'),
+        ('nocdhome','nocdhome'),
+        ('nocf','nocf'),
+        ('noci','noci'),
+        ('nocin','nocin'),
+        ('nocindent','nocindent'),
+        ('nocompatible','nocompatible'),
+        ('noconfirm','noconfirm'),
+        ('nocopyindent','nocopyindent'),
+        ('nocp','nocp'),
+        ('nocrb','nocrb'),
+        ('nocscoperelative','nocscoperelative'),
+        ('nocscopetag','nocscopetag'),
+        ('nocscopeverbose','nocscopeverbose'),
+        ('nocsre','nocsre'),
+        ('nocst','nocst'),
+        ('nocsverb','nocsverb'),
+        ('nocuc','nocuc'),
+        ('nocul','nocul'),
+        ('nocursorbind','nocursorbind'),
+        ('nocursorcolumn','nocursorcolumn'),
+        ('nocursorline','nocursorline'),
+        ('nodeco','nodeco'),
+        ('nodelcombine','nodelcombine'),
+        ('nodg','nodg'),
+        ('nodiff','nodiff'),
+        ('nodigraph','nodigraph'),
+        ('noea','noea'),
+        ('noeb','noeb'),
+        ('noed','noed'),
+        ('noedcompatible','noedcompatible'),
+        ('noek','noek'),
+        ('noemo','noemo'),
+        ('noemoji','noemoji'),
+        ('noendoffile','noendoffile'),
+        ('noendofline','noendofline'),
+        ('noeof','noeof'),
+        ('noeol','noeol'),
+        ('noequalalways','noequalalways'),
+        ('noerrorbells','noerrorbells'),
+        ('noesckeys','noesckeys'),
+        ('noet','noet'),
+        ('noex','noex'),
+        ('noexpandtab','noexpandtab'),
+        ('noexrc','noexrc'),
+        ('nofen','nofen'),
+        ('nofic','nofic'),
+        ('nofileignorecase','nofileignorecase'),
+        ('nofixendofline','nofixendofline'),
+        ('nofixeol','nofixeol'),
+        ('nofoldenable','nofoldenable'),
+        ('nofs','nofs'),
+        ('nofsync','nofsync'),
+        ('nogd','nogd'),
+        ('nogdefault','nogdefault'),
+        ('noguipty','noguipty'),
+        ('nohid','nohid'),
+        ('nohidden','nohidden'),
+        ('nohk','nohk'),
+        ('nohkmap','nohkmap'),
+        ('nohkmapp','nohkmapp'),
+        ('nohkp','nohkp'),
+        ('nohls','nohls'),
+        ('nohlsearch','nohlsearch'),
+        ('noic','noic'),
+        ('noicon','noicon'),
+        ('noignorecase','noignorecase'),
+        ('noim','noim'),
+        ('noimc','noimc'),
+        ('noimcmdline','noimcmdline'),
+        ('noimd','noimd'),
+        ('noimdisable','noimdisable'),
+        ('noincsearch','noincsearch'),
+        ('noinf','noinf'),
+        ('noinfercase','noinfercase'),
+        ('noinsertmode','noinsertmode'),
+        ('nois','nois'),
+        ('nojoinspaces','nojoinspaces'),
+        ('nojs','nojs'),
+        ('nolangnoremap','nolangnoremap'),
+        ('nolangremap','nolangremap'),
+        ('nolazyredraw','nolazyredraw'),
+        ('nolbr','nolbr'),
+        ('nolinebreak','nolinebreak'),
+        ('nolisp','nolisp'),
+        ('nolist','nolist'),
+        ('nolnr','nolnr'),
+        ('noloadplugins','noloadplugins'),
+        ('nolpl','nolpl'),
+        ('nolrm','nolrm'),
+        ('nolz','nolz'),
+        ('noma','noma'),
+        ('nomagic','nomagic'),
+        ('nomh','nomh'),
+        ('noml','noml'),
+        ('nomle','nomle'),
+        ('nomlst','nomlst'),
+        ('nomod','nomod'),
+        ('nomodeline','nomodeline'),
+        ('nomodelineexpr','nomodelineexpr'),
+        ('nomodelinestrict','nomodelinestrict'),
+        ('nomodifiable','nomodifiable'),
+        ('nomodified','nomodified'),
+        ('nomore','nomore'),
+        ('nomousef','nomousef'),
+        ('nomousefocus','nomousefocus'),
+        ('nomousehide','nomousehide'),
+        ('nomousemev','nomousemev'),
+        ('nomousemoveevent','nomousemoveevent'),
+        ('nonu','nonu'),
+        ('nonumber','nonumber'),
+        ('noodev','noodev'),
+        ('noopendevice','noopendevice'),
+        ('nopaste','nopaste'),
+        ('nopi','nopi'),
+        ('nopreserveindent','nopreserveindent'),
+        ('nopreviewwindow','nopreviewwindow'),
+        ('noprompt','noprompt'),
+        ('nopvw','nopvw'),
+        ('noreadonly','noreadonly'),
+        ('norelativenumber','norelativenumber'),
+        ('noremap','noremap'),
+        ('norestorescreen','norestorescreen'),
+        ('norevins','norevins'),
+        ('nori','nori'),
+        ('norightleft','norightleft'),
+        ('norl','norl'),
+        ('nornu','nornu'),
+        ('noro','noro'),
+        ('nors','nors'),
+        ('noru','noru'),
+        ('noruler','noruler'),
+        ('nosb','nosb'),
+        ('nosc','nosc'),
+        ('noscb','noscb'),
+        ('noscf','noscf'),
+        ('noscrollbind','noscrollbind'),
+        ('noscrollfocus','noscrollfocus'),
+        ('noscs','noscs'),
+        ('nosecure','nosecure'),
+        ('nosft','nosft'),
+        ('noshellslash','noshellslash'),
+        ('noshelltemp','noshelltemp'),
+        ('noshiftround','noshiftround'),
+        ('noshortname','noshortname'),
+        ('noshowcmd','noshowcmd'),
+        ('noshowfulltag','noshowfulltag'),
+        ('noshowmatch','noshowmatch'),
+        ('noshowmode','noshowmode'),
+        ('nosi','nosi'),
+        ('nosm','nosm'),
+        ('nosmartcase','nosmartcase'),
+        ('nosmartindent','nosmartindent'),
+        ('nosmarttab','nosmarttab'),
+        ('nosmd','nosmd'),
+        ('nosmoothscroll','nosmoothscroll'),
+        ('nosms','nosms'),
+        ('nosn','nosn'),
+        ('nosol','nosol'),
+        ('nospell','nospell'),
+        ('nosplitbelow','nosplitbelow'),
+        ('nosplitright','nosplitright'),
+        ('nospr','nospr'),
+        ('nosr','nosr'),
+        ('nossl','nossl'),
+        ('nosta','nosta'),
+        ('nostartofline','nostartofline'),
+        ('nostmp','nostmp'),
+        ('noswapfile','noswapfile'),
+        ('noswf','noswf'),
+        ('nota','nota'),
+        ('notagbsearch','notagbsearch'),
+        ('notagrelative','notagrelative'),
+        ('notagsecure','notagsecure'),
+        ('notagstack','notagstack'),
+        ('notbi','notbi'),
+        ('notbidi','notbidi'),
+        ('notbs','notbs'),
+        ('notermbidi','notermbidi'),
+        ('notermguicolors','notermguicolors'),
+        ('notermsync','notermsync'),
+        ('noterse','noterse'),
+        ('notextauto','notextauto'),
+        ('notextmode','notextmode'),
+        ('notf','notf'),
+        ('notgc','notgc'),
+        ('notgst','notgst'),
+        ('notildeop','notildeop'),
+        ('notimeout','notimeout'),
+        ('notitle','notitle'),
+        ('noto','noto'),
+        ('notop','notop'),
+        ('notr','notr'),
+        ('notsc','notsc'),
+        ('notsy','notsy'),
+        ('nottimeout','nottimeout'),
+        ('nottybuiltin','nottybuiltin'),
+        ('nottyfast','nottyfast'),
+        ('notx','notx'),
+        ('noudf','noudf'),
+        ('noundofile','noundofile'),
+        ('novb','novb'),
+        ('novisualbell','novisualbell'),
+        ('nowa','nowa'),
+        ('nowarn','nowarn'),
+        ('nowb','nowb'),
+        ('noweirdinvert','noweirdinvert'),
+        ('nowfb','nowfb'),
+        ('nowfh','nowfh'),
+        ('nowfw','nowfw'),
+        ('nowic','nowic'),
+        ('nowildignorecase','nowildignorecase'),
+        ('nowildmenu','nowildmenu'),
+        ('nowinfixbuf','nowinfixbuf'),
+        ('nowinfixheight','nowinfixheight'),
+        ('nowinfixwidth','nowinfixwidth'),
+        ('nowiv','nowiv'),
+        ('nowmnu','nowmnu'),
+        ('nowrap','nowrap'),
+        ('nowrapscan','nowrapscan'),
+        ('nowrite','nowrite'),
+        ('nowriteany','nowriteany'),
+        ('nowritebackup','nowritebackup'),
+        ('nows','nows'),
+        ('noxtermcodes','noxtermcodes'),
+        ('nrformats','nrformats'),
+        ('nrformats','nrformats'),
+        ('nu','nu'),
+        ('nu','nu'),
+        ('number','number'),
+        ('number','number'),
+        ('numberwidth','numberwidth'),
+        ('numberwidth','numberwidth'),
+        ('nuw','nuw'),
+        ('nuw','nuw'),
+        ('odev','odev'),
+        ('odev','odev'),
+        ('ofu','ofu'),
+        ('ofu','ofu'),
+        ('omnifunc','omnifunc'),
+        ('omnifunc','omnifunc'),
+        ('opendevice','opendevice'),
+        ('opendevice','opendevice'),
+        ('operatorfunc','operatorfunc'),
+        ('operatorfunc','operatorfunc'),
+        ('opfunc','opfunc'),
+        ('opfunc','opfunc'),
+        ('osctimeoutlen','osctimeoutlen'),
+        ('osctimeoutlen','osctimeoutlen'),
+        ('ost','ost'),
+        ('ost','ost'),
+        ('pa','pa'),
+        ('pa','pa'),
+        ('packpath','packpath'),
+        ('packpath','packpath'),
+        ('para','para'),
+        ('para','para'),
+        ('paragraphs','paragraphs'),
+        ('paragraphs','paragraphs'),
+        ('paste','paste'),
+        ('paste','paste'),
+        ('pastetoggle','pastetoggle'),
+        ('pastetoggle','pastetoggle'),
+        ('patchexpr','patchexpr'),
+        ('patchexpr','patchexpr'),
+        ('patchmode','patchmode'),
+        ('patchmode','patchmode'),
+        ('path','path'),
+        ('path','path'),
+        ('pb','pb'),
+        ('pb','pb'),
+        ('pdev','pdev'),
+        ('pdev','pdev'),
+        ('penc','penc'),
+        ('penc','penc'),
+        ('perldll','perldll'),
+        ('perldll','perldll'),
+        ('pex','pex'),
+        ('pex','pex'),
+        ('pexpr','pexpr'),
+        ('pexpr','pexpr'),
+        ('pfn','pfn'),
+        ('pfn','pfn'),
+        ('ph','ph'),
+        ('ph','ph'),
+        ('pheader','pheader'),
+        ('pheader','pheader'),
+        ('pi','pi'),
+        ('pi','pi'),
+        ('pm','pm'),
+        ('pm','pm'),
+        ('pmbcs','pmbcs'),
+        ('pmbcs','pmbcs'),
+        ('pmbfn','pmbfn'),
+        ('pmbfn','pmbfn'),
+        ('pmw','pmw'),
+        ('pmw','pmw'),
+        ('popt','popt'),
+        ('popt','popt'),
+        ('pp','pp'),
+        ('pp','pp'),
+        ('preserveindent','preserveindent'),
+        ('preserveindent','preserveindent'),
+        ('previewheight','previewheight'),
+        ('previewheight','previewheight'),
+        ('previewpopup','previewpopup'),
+        ('previewpopup','previewpopup'),
+        ('previewwindow','previewwindow'),
+        ('previewwindow','previewwindow'),
+        ('printdevice','printdevice'),
+        ('printdevice','printdevice'),
+        ('printencoding','printencoding'),
+        ('printencoding','printencoding'),
+        ('printexpr','printexpr'),
+        ('printexpr','printexpr'),
+        ('printfont','printfont'),
+        ('printfont','printfont'),
+        ('printheader','printheader'),
+        ('printheader','printheader'),
+        ('printmbcharset','printmbcharset'),
+        ('printmbcharset','printmbcharset'),
+        ('printmbfont','printmbfont'),
+        ('printmbfont','printmbfont'),
+        ('printoptions','printoptions'),
+        ('printoptions','printoptions'),
+        ('prompt','prompt'),
+        ('prompt','prompt'),
+        ('pt','pt'),
+        ('pt','pt'),
+        ('pumborder','pumborder'),
+        ('pumborder','pumborder'),
+        ('pumheight','pumheight'),
+        ('pumheight','pumheight'),
+        ('pummaxwidth','pummaxwidth'),
+        ('pummaxwidth','pummaxwidth'),
+        ('pumopt','pumopt'),
+        ('pumopt','pumopt'),
+        ('pumwidth','pumwidth'),
+        ('pumwidth','pumwidth'),
+        ('pvh','pvh'),
+        ('pvh','pvh'),
+        ('pvp','pvp'),
+        ('pvp','pvp'),
+        ('pvw','pvw'),
+        ('pvw','pvw'),
+        ('pw','pw'),
+        ('pw','pw'),
+        ('pythondll','pythondll'),
+        ('pythondll','pythondll'),
+        ('pythonhome','pythonhome'),
+        ('pythonhome','pythonhome'),
+        ('pythonthreedll','pythonthreedll'),
+        ('pythonthreedll','pythonthreedll'),
+        ('pythonthreehome','pythonthreehome'),
+        ('pythonthreehome','pythonthreehome'),
+        ('pyx','pyx'),
+        ('pyx','pyx'),
+        ('pyxversion','pyxversion'),
+        ('pyxversion','pyxversion'),
+        ('qe','qe'),
+        ('qe','qe'),
+        ('qftf','qftf'),
+        ('qftf','qftf'),
+        ('quickfixtextfunc','quickfixtextfunc'),
+        ('quickfixtextfunc','quickfixtextfunc'),
+        ('quoteescape','quoteescape'),
+        ('quoteescape','quoteescape'),
+        ('rdt','rdt'),
+        ('rdt','rdt'),
+        ('re','re'),
+        ('re','re'),
+        ('readonly','readonly'),
+        ('readonly','readonly'),
+        ('redrawtime','redrawtime'),
+        ('redrawtime','redrawtime'),
+        ('regexpengine','regexpengine'),
+        ('regexpengine','regexpengine'),
+        ('relativenumber','relativenumber'),
+        ('relativenumber','relativenumber'),
+        ('remap','remap'),
+        ('remap','remap'),
+        ('renderoptions','renderoptions'),
+        ('renderoptions','renderoptions'),
+        ('report','report'),
+        ('report','report'),
+        ('restorescreen','restorescreen'),
+        ('restorescreen','restorescreen'),
+        ('revins','revins'),
+        ('revins','revins'),
+        ('ri','ri'),
+        ('ri','ri'),
+        ('rightleft','rightleft'),
+        ('rightleft','rightleft'),
+        ('rightleftcmd','rightleftcmd'),
+        ('rightleftcmd','rightleftcmd'),
+        ('rl','rl'),
+        ('rl','rl'),
+        ('rlc','rlc'),
+        ('rlc','rlc'),
+        ('rnu','rnu'),
+        ('rnu','rnu'),
+        ('ro','ro'),
+        ('ro','ro'),
+        ('rop','rop'),
+        ('rop','rop'),
+        ('rs','rs'),
+        ('rs','rs'),
+        ('rtp','rtp'),
+        ('rtp','rtp'),
+        ('ru','ru'),
+        ('ru','ru'),
+        ('rubydll','rubydll'),
+        ('rubydll','rubydll'),
+        ('ruf','ruf'),
+        ('ruf','ruf'),
+        ('ruler','ruler'),
+        ('ruler','ruler'),
+        ('rulerformat','rulerformat'),
+        ('rulerformat','rulerformat'),
+        ('runtimepath','runtimepath'),
+        ('runtimepath','runtimepath'),
+        ('sb','sb'),
+        ('sb','sb'),
+        ('sbo','sbo'),
+        ('sbo','sbo'),
+        ('sbr','sbr'),
+        ('sbr','sbr'),
+        ('sc','sc'),
+        ('sc','sc'),
+        ('scb','scb'),
+        ('scb','scb'),
+        ('scf','scf'),
+        ('scf','scf'),
+        ('scl','scl'),
+        ('scl','scl'),
+        ('scr','scr'),
+        ('scr','scr'),
+        ('scroll','scroll'),
+        ('scroll','scroll'),
+        ('scrollbind','scrollbind'),
+        ('scrollbind','scrollbind'),
+        ('scrollfocus','scrollfocus'),
+        ('scrollfocus','scrollfocus'),
+        ('scrolljump','scrolljump'),
+        ('scrolljump','scrolljump'),
+        ('scrolloff','scrolloff'),
+        ('scrolloff','scrolloff'),
+        ('scrolloffpad','scrolloffpad'),
+        ('scrolloffpad','scrolloffpad'),
+        ('scrollopt','scrollopt'),
+        ('scrollopt','scrollopt'),
+        ('scs','scs'),
+        ('scs','scs'),
+        ('sect','sect'),
+        ('sect','sect'),
+        ('sections','sections'),
+        ('sections','sections'),
+        ('secure','secure'),
+        ('secure','secure'),
+        ('sel','sel'),
+        ('sel','sel'),
+        ('selection','selection'),
+        ('selection','selection'),
+        ('selectmode','selectmode'),
+        ('selectmode','selectmode'),
+        ('sessionoptions','sessionoptions'),
+        ('sessionoptions','sessionoptions'),
+        ('sft','sft'),
+        ('sft','sft'),
+        ('sh','sh'),
+        ('sh','sh'),
+        ('shcf','shcf'),
+        ('shcf','shcf'),
+        ('shell','shell'),
+        ('shell','shell'),
+        ('shellcmdflag','shellcmdflag'),
+        ('shellcmdflag','shellcmdflag'),
+        ('shellpipe','shellpipe'),
+        ('shellpipe','shellpipe'),
+        ('shellquote','shellquote'),
+        ('shellquote','shellquote'),
+        ('shellredir','shellredir'),
+        ('shellredir','shellredir'),
+        ('shellslash','shellslash'),
+        ('shellslash','shellslash'),
+        ('shelltemp','shelltemp'),
+        ('shelltemp','shelltemp'),
+        ('shelltype','shelltype'),
+        ('shelltype','shelltype'),
+        ('shellxescape','shellxescape'),
+        ('shellxescape','shellxescape'),
+        ('shellxquote','shellxquote'),
+        ('shellxquote','shellxquote'),
+        ('shiftround','shiftround'),
+        ('shiftround','shiftround'),
+        ('shiftwidth','shiftwidth'),
+        ('shiftwidth','shiftwidth'),
+        ('shm','shm'),
+        ('shm','shm'),
+        ('shortmess','shortmess'),
+        ('shortmess','shortmess'),
+        ('shortname','shortname'),
+        ('shortname','shortname'),
+        ('showbreak','showbreak'),
+        ('showbreak','showbreak'),
+        ('showcmd','showcmd'),
+        ('showcmd','showcmd'),
+        ('showcmdloc','showcmdloc'),
+        ('showcmdloc','showcmdloc'),
+        ('showfulltag','showfulltag'),
+        ('showfulltag','showfulltag'),
+        ('showmatch','showmatch'),
+        ('showmatch','showmatch'),
+        ('showmode','showmode'),
+        ('showmode','showmode'),
+        ('showtabline','showtabline'),
+        ('showtabline','showtabline'),
+        ('showtabpanel','showtabpanel'),
+        ('showtabpanel','showtabpanel'),
+        ('shq','shq'),
+        ('shq','shq'),
+        ('si','si'),
+        ('si','si'),
+        ('sidescroll','sidescroll'),
+        ('sidescroll','sidescroll'),
+        ('sidescrolloff','sidescrolloff'),
+        ('sidescrolloff','sidescrolloff'),
+        ('signcolumn','signcolumn'),
+        ('signcolumn','signcolumn'),
+        ('siso','siso'),
+        ('siso','siso'),
+        ('sj','sj'),
+        ('sj','sj'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('slm','slm'),
+        ('slm','slm'),
+        ('sloc','sloc'),
+        ('sloc','sloc'),
+        ('sm','sm'),
+        ('sm','sm'),
+        ('smartcase','smartcase'),
+        ('smartcase','smartcase'),
+        ('smartindent','smartindent'),
+        ('smartindent','smartindent'),
+        ('smarttab','smarttab'),
+        ('smarttab','smarttab'),
+        ('smc','smc'),
+        ('smc','smc'),
+        ('smd','smd'),
+        ('smd','smd'),
+        ('smoothscroll','smoothscroll'),
+        ('smoothscroll','smoothscroll'),
+        ('sms','sms'),
+        ('sms','sms'),
+        ('sn','sn'),
+        ('sn','sn'),
+        ('so','so'),
+        ('so','so'),
+        ('softtabstop','softtabstop'),
+        ('softtabstop','softtabstop'),
+        ('sol','sol'),
+        ('sol','sol'),
+        ('sop','sop'),
+        ('sop','sop'),
+        ('sp','sp'),
+        ('sp','sp'),
+        ('spc','spc'),
+        ('spc','spc'),
+        ('spell','spell'),
+        ('spell','spell'),
+        ('spellcapcheck','spellcapcheck'),
+        ('spellcapcheck','spellcapcheck'),
+        ('spellfile','spellfile'),
+        ('spellfile','spellfile'),
+        ('spelllang','spelllang'),
+        ('spelllang','spelllang'),
+        ('spelloptions','spelloptions'),
+        ('spelloptions','spelloptions'),
+        ('spellsuggest','spellsuggest'),
+        ('spellsuggest','spellsuggest'),
+        ('spf','spf'),
+        ('spf','spf'),
+        ('spk','spk'),
+        ('spk','spk'),
+        ('spl','spl'),
+        ('spl','spl'),
+        ('splitbelow','splitbelow'),
+        ('splitbelow','splitbelow'),
+        ('splitkeep','splitkeep'),
+        ('splitkeep','splitkeep'),
+        ('splitright','splitright'),
+        ('splitright','splitright'),
+        ('spo','spo'),
+        ('spo','spo'),
+        ('spr','spr'),
+        ('spr','spr'),
+        ('sps','sps'),
+        ('sps','sps'),
+        ('sr','sr'),
+        ('sr','sr'),
+        ('srr','srr'),
+        ('srr','srr'),
+        ('ss','ss'),
+        ('ss','ss'),
+        ('ssl','ssl'),
+        ('ssl','ssl'),
+        ('ssop','ssop'),
+        ('ssop','ssop'),
+        ('st','st'),
+        ('st','st'),
+        ('sta','sta'),
+        ('sta','sta'),
+        ('stal','stal'),
+        ('stal','stal'),
+        ('startofline','startofline'),
+        ('startofline','startofline'),
+        ('statusline','statusline'),
+        ('statusline','statusline'),
+        ('statuslineopt','statuslineopt'),
+        ('statuslineopt','statuslineopt'),
+        ('stl','stl'),
+        ('stl','stl'),
+        ('stlo','stlo'),
+        ('stlo','stlo'),
+        ('stmp','stmp'),
+        ('stmp','stmp'),
+        ('stpl','stpl'),
+        ('stpl','stpl'),
+        ('sts','sts'),
+        ('sts','sts'),
+        ('su','su'),
+        ('su','su'),
+        ('sua','sua'),
+        ('sua','sua'),
+        ('suffixes','suffixes'),
+        ('suffixes','suffixes'),
+        ('suffixesadd','suffixesadd'),
+        ('suffixesadd','suffixesadd'),
+        ('sw','sw'),
+        ('sw','sw'),
+        ('swapfile','swapfile'),
+        ('swapfile','swapfile'),
+        ('swapsync','swapsync'),
+        ('swapsync','swapsync'),
+        ('swb','swb'),
+        ('swb','swb'),
+        ('swf','swf'),
+        ('swf','swf'),
+        ('switchbuf','switchbuf'),
+        ('switchbuf','switchbuf'),
+        ('sws','sws'),
+        ('sws','sws'),
+        ('sxe','sxe'),
+        ('sxe','sxe'),
+        ('sxq','sxq'),
+        ('sxq','sxq'),
+        ('syn','syn'),
+        ('syn','syn'),
+        ('synmaxcol','synmaxcol'),
+        ('synmaxcol','synmaxcol'),
+        ('syntax','syntax'),
+        ('syntax','syntax'),
+        ('t_8b','t_8b'),
+        ('t_8b','t_8b'),
+        ('t_8f','t_8f'),
+        ('t_8f','t_8f'),
+        ('t_8u','t_8u'),
+        ('t_8u','t_8u'),
+        ('t_AB','t_AB'),
+        ('t_AB','t_AB'),
+        ('t_AF','t_AF'),
+        ('t_AF','t_AF'),
+        ('t_AL','t_AL'),
+        ('t_AL','t_AL'),
+        ('t_AU','t_AU'),
+        ('t_AU','t_AU'),
+        ('t_BD','t_BD'),
+        ('t_BD','t_BD'),
+        ('t_BE','t_BE'),
+        ('t_BE','t_BE'),
+        ('t_BS','t_BS'),
+        ('t_BS','t_BS'),
+        ('t_CF','t_CF'),
+        ('t_CF','t_CF'),
+        ('t_CS','t_CS'),
+        ('t_CS','t_CS'),
+        ('t_CV','t_CV'),
+        ('t_CV','t_CV'),
+        ('t_Ce','t_Ce'),
+        ('t_Ce','t_Ce'),
+        ('t_Co','t_Co'),
+        ('t_Co','t_Co'),
+        ('t_Cs','t_Cs'),
+        ('t_Cs','t_Cs'),
+        ('t_DL','t_DL'),
+        ('t_DL','t_DL'),
+        ('t_Ds','t_Ds'),
+        ('t_Ds','t_Ds'),
+        ('t_EC','t_EC'),
+        ('t_EC','t_EC'),
+        ('t_EI','t_EI'),
+        ('t_EI','t_EI'),
+        ('t_ES','t_ES'),
+        ('t_ES','t_ES'),
+        ('t_F1','t_F1'),
+        ('t_F1','t_F1'),
+        ('t_F2','t_F2'),
+        ('t_F2','t_F2'),
+        ('t_F3','t_F3'),
+        ('t_F3','t_F3'),
+        ('t_F4','t_F4'),
+        ('t_F4','t_F4'),
+        ('t_F5','t_F5'),
+        ('t_F5','t_F5'),
+        ('t_F6','t_F6'),
+        ('t_F6','t_F6'),
+        ('t_F7','t_F7'),
+        ('t_F7','t_F7'),
+        ('t_F8','t_F8'),
+        ('t_F8','t_F8'),
+        ('t_F9','t_F9'),
+        ('t_F9','t_F9'),
+        ('t_GP','t_GP'),
+        ('t_GP','t_GP'),
+        ('t_IE','t_IE'),
+        ('t_IE','t_IE'),
+        ('t_IS','t_IS'),
+        ('t_IS','t_IS'),
+        ('t_K1','t_K1'),
+        ('t_K1','t_K1'),
+        ('t_K3','t_K3'),
+        ('t_K3','t_K3'),
+        ('t_K4','t_K4'),
+        ('t_K4','t_K4'),
+        ('t_K5','t_K5'),
+        ('t_K5','t_K5'),
+        ('t_K6','t_K6'),
+        ('t_K6','t_K6'),
+        ('t_K7','t_K7'),
+        ('t_K7','t_K7'),
+        ('t_K8','t_K8'),
+        ('t_K8','t_K8'),
+        ('t_K9','t_K9'),
+        ('t_K9','t_K9'),
+        ('t_KA','t_KA'),
+        ('t_KA','t_KA'),
+        ('t_KB','t_KB'),
+        ('t_KB','t_KB'),
+        ('t_KC','t_KC'),
+        ('t_KC','t_KC'),
+        ('t_KD','t_KD'),
+        ('t_KD','t_KD'),
+        ('t_KE','t_KE'),
+        ('t_KE','t_KE'),
+        ('t_KF','t_KF'),
+        ('t_KF','t_KF'),
+        ('t_KG','t_KG'),
+        ('t_KG','t_KG'),
+        ('t_KH','t_KH'),
+        ('t_KH','t_KH'),
+        ('t_KI','t_KI'),
+        ('t_KI','t_KI'),
+        ('t_KJ','t_KJ'),
+        ('t_KJ','t_KJ'),
+        ('t_KK','t_KK'),
+        ('t_KK','t_KK'),
+        ('t_KL','t_KL'),
+        ('t_KL','t_KL'),
+        ('t_RB','t_RB'),
+        ('t_RB','t_RB'),
+        ('t_RC','t_RC'),
+        ('t_RC','t_RC'),
+        ('t_RF','t_RF'),
+        ('t_RF','t_RF'),
+        ('t_RI','t_RI'),
+        ('t_RI','t_RI'),
+        ('t_RK','t_RK'),
+        ('t_RK','t_RK'),
+        ('t_RS','t_RS'),
+        ('t_RS','t_RS'),
+        ('t_RT','t_RT'),
+        ('t_RT','t_RT'),
+        ('t_RV','t_RV'),
+        ('t_RV','t_RV'),
+        ('t_Ri','t_Ri'),
+        ('t_Ri','t_Ri'),
+        ('t_SC','t_SC'),
+        ('t_SC','t_SC'),
+        ('t_SH','t_SH'),
+        ('t_SH','t_SH'),
+        ('t_SI','t_SI'),
+        ('t_SI','t_SI'),
+        ('t_SR','t_SR'),
+        ('t_SR','t_SR'),
+        ('t_ST','t_ST'),
+        ('t_ST','t_ST'),
+        ('t_Sb','t_Sb'),
+        ('t_Sb','t_Sb'),
+        ('t_Sf','t_Sf'),
+        ('t_Sf','t_Sf'),
+        ('t_Si','t_Si'),
+        ('t_Si','t_Si'),
+        ('t_TE','t_TE'),
+        ('t_TE','t_TE'),
+        ('t_TI','t_TI'),
+        ('t_TI','t_TI'),
+        ('t_Te','t_Te'),
+        ('t_Te','t_Te'),
+        ('t_Ts','t_Ts'),
+        ('t_Ts','t_Ts'),
+        ('t_Us','t_Us'),
+        ('t_Us','t_Us'),
+        ('t_VS','t_VS'),
+        ('t_VS','t_VS'),
+        ('t_WP','t_WP'),
+        ('t_WP','t_WP'),
+        ('t_WS','t_WS'),
+        ('t_WS','t_WS'),
+        ('t_XM','t_XM'),
+        ('t_XM','t_XM'),
+        ('t_ZH','t_ZH'),
+        ('t_ZH','t_ZH'),
+        ('t_ZR','t_ZR'),
+        ('t_ZR','t_ZR'),
+        ('t_al','t_al'),
+        ('t_al','t_al'),
+        ('t_bc','t_bc'),
+        ('t_bc','t_bc'),
+        ('t_cd','t_cd'),
+        ('t_cd','t_cd'),
+        ('t_ce','t_ce'),
+        ('t_ce','t_ce'),
+        ('t_cl','t_cl'),
+        ('t_cl','t_cl'),
+        ('t_cm','t_cm'),
+        ('t_cm','t_cm'),
+        ('t_cs','t_cs'),
+        ('t_cs','t_cs'),
+        ('t_da','t_da'),
+        ('t_da','t_da'),
+        ('t_db','t_db'),
+        ('t_db','t_db'),
+        ('t_dl','t_dl'),
+        ('t_dl','t_dl'),
+        ('t_ds','t_ds'),
+        ('t_ds','t_ds'),
+        ('t_fd','t_fd'),
+        ('t_fd','t_fd'),
+        ('t_fe','t_fe'),
+        ('t_fe','t_fe'),
+        ('t_fs','t_fs'),
+        ('t_fs','t_fs'),
+        ('t_k1','t_k1'),
+        ('t_k1','t_k1'),
+        ('t_k2','t_k2'),
+        ('t_k2','t_k2'),
+        ('t_k3','t_k3'),
+        ('t_k3','t_k3'),
+        ('t_k4','t_k4'),
+        ('t_k4','t_k4'),
+        ('t_k5','t_k5'),
+        ('t_k5','t_k5'),
+        ('t_k6','t_k6'),
+        ('t_k6','t_k6'),
+        ('t_k7','t_k7'),
+        ('t_k7','t_k7'),
+        ('t_k8','t_k8'),
+        ('t_k8','t_k8'),
+        ('t_k9','t_k9'),
+        ('t_k9','t_k9'),
+        ('t_kB','t_kB'),
+        ('t_kB','t_kB'),
+        ('t_kD','t_kD'),
+        ('t_kD','t_kD'),
+        ('t_kI','t_kI'),
+        ('t_kI','t_kI'),
+        ('t_kN','t_kN'),
+        ('t_kN','t_kN'),
+        ('t_kP','t_kP'),
+        ('t_kP','t_kP'),
+        ('t_kb','t_kb'),
+        ('t_kb','t_kb'),
+        ('t_kd','t_kd'),
+        ('t_kd','t_kd'),
+        ('t_ke','t_ke'),
+        ('t_ke','t_ke'),
+        ('t_kh','t_kh'),
+        ('t_kh','t_kh'),
+        ('t_kl','t_kl'),
+        ('t_kl','t_kl'),
+        ('t_kr','t_kr'),
+        ('t_kr','t_kr'),
+        ('t_ks','t_ks'),
+        ('t_ks','t_ks'),
+        ('t_ku','t_ku'),
+        ('t_ku','t_ku'),
+        ('t_le','t_le'),
+        ('t_le','t_le'),
+        ('t_mb','t_mb'),
+        ('t_mb','t_mb'),
+        ('t_md','t_md'),
+        ('t_md','t_md'),
+        ('t_me','t_me'),
+        ('t_me','t_me'),
+        ('t_mr','t_mr'),
+        ('t_mr','t_mr'),
+        ('t_ms','t_ms'),
+        ('t_ms','t_ms'),
+        ('t_nd','t_nd'),
+        ('t_nd','t_nd'),
+        ('t_op','t_op'),
+        ('t_op','t_op'),
+        ('t_se','t_se'),
+        ('t_se','t_se'),
+        ('t_so','t_so'),
+        ('t_so','t_so'),
+        ('t_sr','t_sr'),
+        ('t_sr','t_sr'),
+        ('t_te','t_te'),
+        ('t_te','t_te'),
+        ('t_ti','t_ti'),
+        ('t_ti','t_ti'),
+        ('t_ts','t_ts'),
+        ('t_ts','t_ts'),
+        ('t_u7','t_u7'),
+        ('t_u7','t_u7'),
+        ('t_ue','t_ue'),
+        ('t_ue','t_ue'),
+        ('t_us','t_us'),
+        ('t_us','t_us'),
+        ('t_ut','t_ut'),
+        ('t_ut','t_ut'),
+        ('t_vb','t_vb'),
+        ('t_vb','t_vb'),
+        ('t_ve','t_ve'),
+        ('t_ve','t_ve'),
+        ('t_vi','t_vi'),
+        ('t_vi','t_vi'),
+        ('t_vs','t_vs'),
+        ('t_vs','t_vs'),
+        ('t_xn','t_xn'),
+        ('t_xn','t_xn'),
+        ('t_xo','t_xo'),
+        ('t_xo','t_xo'),
+        ('t_xs','t_xs'),
+        ('t_xs','t_xs'),
+        ('ta','ta'),
+        ('ta','ta'),
+        ('tabclose','tabclose'),
+        ('tabclose','tabclose'),
+        ('tabline','tabline'),
+        ('tabline','tabline'),
+        ('tabpagemax','tabpagemax'),
+        ('tabpagemax','tabpagemax'),
+        ('tabpanel','tabpanel'),
+        ('tabpanel','tabpanel'),
+        ('tabpanelopt','tabpanelopt'),
+        ('tabpanelopt','tabpanelopt'),
+        ('tabstop','tabstop'),
+        ('tabstop','tabstop'),
+        ('tag','tag'),
+        ('tag','tag'),
+        ('tagbsearch','tagbsearch'),
+        ('tagbsearch','tagbsearch'),
+        ('tagcase','tagcase'),
+        ('tagcase','tagcase'),
+        ('tagfunc','tagfunc'),
+        ('tagfunc','tagfunc'),
+        ('taglength','taglength'),
+        ('taglength','taglength'),
+        ('tagrelative','tagrelative'),
+        ('tagrelative','tagrelative'),
+        ('tags','tags'),
+        ('tags','tags'),
+        ('tagsecure','tagsecure'),
+        ('tagsecure','tagsecure'),
+        ('tagstack','tagstack'),
+        ('tagstack','tagstack'),
+        ('tal','tal'),
+        ('tal','tal'),
+        ('tb','tb'),
+        ('tb','tb'),
+        ('tbi','tbi'),
+        ('tbi','tbi'),
+        ('tbidi','tbidi'),
+        ('tbidi','tbidi'),
+        ('tbis','tbis'),
+        ('tbis','tbis'),
+        ('tbs','tbs'),
+        ('tbs','tbs'),
+        ('tc','tc'),
+        ('tc','tc'),
+        ('tcl','tcl'),
+        ('tcl','tcl'),
+        ('tcldll','tcldll'),
+        ('tcldll','tcldll'),
+        ('tenc','tenc'),
+        ('tenc','tenc'),
+        ('term','term'),
+        ('term','term'),
+        ('termbidi','termbidi'),
+        ('termbidi','termbidi'),
+        ('termencoding','termencoding'),
+        ('termencoding','termencoding'),
+        ('termguicolors','termguicolors'),
+        ('termguicolors','termguicolors'),
+        ('termresize','termresize'),
+        ('termresize','termresize'),
+        ('termsync','termsync'),
+        ('termsync','termsync'),
+        ('termwinkey','termwinkey'),
+        ('termwinkey','termwinkey'),
+        ('termwinscroll','termwinscroll'),
+        ('termwinscroll','termwinscroll'),
+        ('termwinsize','termwinsize'),
+        ('termwinsize','termwinsize'),
+        ('termwintype','termwintype'),
+        ('termwintype','termwintype'),
+        ('terse','terse'),
+        ('terse','terse'),
+        ('textauto','textauto'),
+        ('textauto','textauto'),
+        ('textmode','textmode'),
+        ('textmode','textmode'),
+        ('textwidth','textwidth'),
+        ('textwidth','textwidth'),
+        ('tf','tf'),
+        ('tf','tf'),
+        ('tfu','tfu'),
+        ('tfu','tfu'),
+        ('tgc','tgc'),
+        ('tgc','tgc'),
+        ('tgst','tgst'),
+        ('tgst','tgst'),
+        ('thesaurus','thesaurus'),
+        ('thesaurus','thesaurus'),
+        ('thesaurusfunc','thesaurusfunc'),
+        ('thesaurusfunc','thesaurusfunc'),
+        ('tildeop','tildeop'),
+        ('tildeop','tildeop'),
+        ('timeout','timeout'),
+        ('timeout','timeout'),
+        ('timeoutlen','timeoutlen'),
+        ('timeoutlen','timeoutlen'),
+        ('title','title'),
+        ('title','title'),
+        ('titlelen','titlelen'),
+        ('titlelen','titlelen'),
+        ('titleold','titleold'),
+        ('titleold','titleold'),
+        ('titlestring','titlestring'),
+        ('titlestring','titlestring'),
+        ('tl','tl'),
+        ('tl','tl'),
+        ('tm','tm'),
+        ('tm','tm'),
+        ('to','to'),
+        ('to','to'),
+        ('toolbar','toolbar'),
+        ('toolbar','toolbar'),
+        ('toolbariconsize','toolbariconsize'),
+        ('toolbariconsize','toolbariconsize'),
+        ('top','top'),
+        ('top','top'),
+        ('tpl','tpl'),
+        ('tpl','tpl'),
+        ('tplo','tplo'),
+        ('tplo','tplo'),
+        ('tpm','tpm'),
+        ('tpm','tpm'),
+        ('tr','tr'),
+        ('tr','tr'),
+        ('trz','trz'),
+        ('trz','trz'),
+        ('ts','ts'),
+        ('ts','ts'),
+        ('tsc','tsc'),
+        ('tsc','tsc'),
+        ('tsl','tsl'),
+        ('tsl','tsl'),
+        ('tsr','tsr'),
+        ('tsr','tsr'),
+        ('tsrfu','tsrfu'),
+        ('tsrfu','tsrfu'),
+        ('tsy','tsy'),
+        ('tsy','tsy'),
+        ('ttimeout','ttimeout'),
+        ('ttimeout','ttimeout'),
+        ('ttimeoutlen','ttimeoutlen'),
+        ('ttimeoutlen','ttimeoutlen'),
+        ('ttm','ttm'),
+        ('ttm','ttm'),
+        ('tty','tty'),
+        ('tty','tty'),
+        ('ttybuiltin','ttybuiltin'),
+        ('ttybuiltin','ttybuiltin'),
+        ('ttyfast','ttyfast'),
+        ('ttyfast','ttyfast'),
+        ('ttym','ttym'),
+        ('ttym','ttym'),
+        ('ttymouse','ttymouse'),
+        ('ttymouse','ttymouse'),
+        ('ttyscroll','ttyscroll'),
+        ('ttyscroll','ttyscroll'),
+        ('ttytype','ttytype'),
+        ('ttytype','ttytype'),
+        ('tw','tw'),
+        ('tw','tw'),
+        ('twk','twk'),
+        ('twk','twk'),
+        ('tws','tws'),
+        ('tws','tws'),
+        ('twsl','twsl'),
+        ('twsl','twsl'),
+        ('twt','twt'),
+        ('twt','twt'),
+        ('tx','tx'),
+        ('tx','tx'),
+        ('uc','uc'),
+        ('uc','uc'),
+        ('udf','udf'),
+        ('udf','udf'),
+        ('udir','udir'),
+        ('udir','udir'),
+        ('ul','ul'),
+        ('ul','ul'),
+        ('undodir','undodir'),
+        ('undodir','undodir'),
+        ('undofile','undofile'),
+        ('undofile','undofile'),
+        ('undolevels','undolevels'),
+        ('undolevels','undolevels'),
+        ('undoreload','undoreload'),
+        ('undoreload','undoreload'),
+        ('updatecount','updatecount'),
+        ('updatecount','updatecount'),
+        ('updatetime','updatetime'),
+        ('updatetime','updatetime'),
+        ('ur','ur'),
+        ('ur','ur'),
+        ('ut','ut'),
+        ('ut','ut'),
+        ('varsofttabstop','varsofttabstop'),
+        ('varsofttabstop','varsofttabstop'),
+        ('vartabstop','vartabstop'),
+        ('vartabstop','vartabstop'),
+        ('vb','vb'),
+        ('vb','vb'),
+        ('vbs','vbs'),
+        ('vbs','vbs'),
+        ('vdir','vdir'),
+        ('vdir','vdir'),
+        ('ve','ve'),
+        ('ve','ve'),
+        ('verbose','verbose'),
+        ('verbose','verbose'),
+        ('verbosefile','verbosefile'),
+        ('verbosefile','verbosefile'),
+        ('vfile','vfile'),
+        ('vfile','vfile'),
+        ('vi','vi'),
+        ('vi','vi'),
+        ('viewdir','viewdir'),
+        ('viewdir','viewdir'),
+        ('viewoptions','viewoptions'),
+        ('viewoptions','viewoptions'),
+        ('vif','vif'),
+        ('vif','vif'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetEqual','vimSetEqual'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('vimSetMod','vimSetMod'),
+        ('viminfo','viminfo'),
+        ('viminfo','viminfo'),
+        ('viminfofile','viminfofile'),
+        ('viminfofile','viminfofile'),
+        ('virtualedit','virtualedit'),
+        ('virtualedit','virtualedit'),
+        ('visualbell','visualbell'),
+        ('visualbell','visualbell'),
+        ('vop','vop'),
+        ('vop','vop'),
+        ('vsts','vsts'),
+        ('vsts','vsts'),
+        ('vts','vts'),
+        ('vts','vts'),
+        ('wa','wa'),
+        ('wa','wa'),
+        ('wak','wak'),
+        ('wak','wak'),
+        ('warn','warn'),
+        ('warn','warn'),
+        ('wb','wb'),
+        ('wb','wb'),
+        ('wc','wc'),
+        ('wc','wc'),
+        ('wcm','wcm'),
+        ('wcm','wcm'),
+        ('wcr','wcr'),
+        ('wcr','wcr'),
+        ('wd','wd'),
+        ('wd','wd'),
+        ('weirdinvert','weirdinvert'),
+        ('weirdinvert','weirdinvert'),
+        ('wfb','wfb'),
+        ('wfb','wfb'),
+        ('wfh','wfh'),
+        ('wfh','wfh'),
+        ('wfw','wfw'),
+        ('wfw','wfw'),
+        ('wh','wh'),
+        ('wh','wh'),
+        ('whichwrap','whichwrap'),
+        ('whichwrap','whichwrap'),
+        ('whl','whl'),
+        ('whl','whl'),
+        ('wi','wi'),
+        ('wi','wi'),
+        ('wic','wic'),
+        ('wic','wic'),
+        ('wig','wig'),
+        ('wig','wig'),
+        ('wildchar','wildchar'),
+        ('wildchar','wildchar'),
+        ('wildcharm','wildcharm'),
+        ('wildcharm','wildcharm'),
+        ('wildignore','wildignore'),
+        ('wildignore','wildignore'),
+        ('wildignorecase','wildignorecase'),
+        ('wildignorecase','wildignorecase'),
+        ('wildmenu','wildmenu'),
+        ('wildmenu','wildmenu'),
+        ('wildmode','wildmode'),
+        ('wildmode','wildmode'),
+        ('wildoptions','wildoptions'),
+        ('wildoptions','wildoptions'),
+        ('wim','wim'),
+        ('wim','wim'),
+        ('winaltkeys','winaltkeys'),
+        ('winaltkeys','winaltkeys'),
+        ('wincolor','wincolor'),
+        ('wincolor','wincolor'),
+        ('window','window'),
+        ('window','window'),
+        ('winfixbuf','winfixbuf'),
+        ('winfixbuf','winfixbuf'),
+        ('winfixheight','winfixheight'),
+        ('winfixheight','winfixheight'),
+        ('winfixwidth','winfixwidth'),
+        ('winfixwidth','winfixwidth'),
+        ('winheight','winheight'),
+        ('winheight','winheight'),
+        ('winhighlight','winhighlight'),
+        ('winhighlight','winhighlight'),
+        ('winminheight','winminheight'),
+        ('winminheight','winminheight'),
+        ('winminwidth','winminwidth'),
+        ('winminwidth','winminwidth'),
+        ('winptydll','winptydll'),
+        ('winptydll','winptydll'),
+        ('winwidth','winwidth'),
+        ('winwidth','winwidth'),
+        ('wiv','wiv'),
+        ('wiv','wiv'),
+        ('wiw','wiw'),
+        ('wiw','wiw'),
+        ('wlseat','wlseat'),
+        ('wlseat','wlseat'),
+        ('wltimeoutlen','wltimeoutlen'),
+        ('wltimeoutlen','wltimeoutlen'),
+        ('wm','wm'),
+        ('wm','wm'),
+        ('wmh','wmh'),
+        ('wmh','wmh'),
+        ('wmnu','wmnu'),
+        ('wmnu','wmnu'),
+        ('wmw','wmw'),
+        ('wmw','wmw'),
+        ('wop','wop'),
+        ('wop','wop'),
+        ('wrap','wrap'),
+        ('wrap','wrap'),
+        ('wrapmargin','wrapmargin'),
+        ('wrapmargin','wrapmargin'),
+        ('wrapscan','wrapscan'),
+        ('wrapscan','wrapscan'),
+        ('write','write'),
+        ('write','write'),
+        ('writeany','writeany'),
+        ('writeany','writeany'),
+        ('writebackup','writebackup'),
+        ('writebackup','writebackup'),
+        ('writedelay','writedelay'),
+        ('writedelay','writedelay'),
+        ('ws','ws'),
+        ('ws','ws'),
+        ('wse','wse'),
+        ('wse','wse'),
+        ('wtm','wtm'),
+        ('wtm','wtm'),
+        ('ww','ww'),
+        ('ww','ww'),
+        ('xtermcodes','xtermcodes'),
+        ('xtermcodes','xtermcodes'),
+    )
+    return var
+option = _getoption()
+
+def _getauto():
+    var = (
+        ('BufAdd','BufAdd'),
+        ('BufCreate','BufCreate'),
+        ('BufDelete','BufDelete'),
+        ('BufEnter','BufEnter'),
+        ('BufFilePost','BufFilePost'),
+        ('BufFilePre','BufFilePre'),
+        ('BufHidden','BufHidden'),
+        ('BufLeave','BufLeave'),
+        ('BufNew','BufNew'),
+        ('BufNewFile','BufNewFile'),
+        ('BufRead','BufRead'),
+        ('BufReadCmd','BufReadCmd'),
+        ('BufReadPost','BufReadPost'),
+        ('BufReadPre','BufReadPre'),
+        ('BufUnload','BufUnload'),
+        ('BufWinEnter','BufWinEnter'),
+        ('BufWinLeave','BufWinLeave'),
+        ('BufWipeout','BufWipeout'),
+        ('BufWrite','BufWrite'),
+        ('BufWriteCmd','BufWriteCmd'),
+        ('BufWritePost','BufWritePost'),
+        ('BufWritePre','BufWritePre'),
+        ('CmdUndefined','CmdUndefined'),
+        ('CmdlineChanged','CmdlineChanged'),
+        ('CmdlineEnter','CmdlineEnter'),
+        ('CmdlineLeave','CmdlineLeave'),
+        ('CmdlineLeavePre','CmdlineLeavePre'),
+        ('CmdwinEnter','CmdwinEnter'),
+        ('CmdwinLeave','CmdwinLeave'),
+        ('ColorScheme','ColorScheme'),
+        ('ColorSchemePre','ColorSchemePre'),
+        ('CompleteChanged','CompleteChanged'),
+        ('CompleteDone','CompleteDone'),
+        ('CompleteDonePre','CompleteDonePre'),
+        ('CursorHold','CursorHold'),
+        ('CursorHoldI','CursorHoldI'),
+        ('CursorMoved','CursorMoved'),
+        ('CursorMovedC','CursorMovedC'),
+        ('CursorMovedI','CursorMovedI'),
+        ('DiffUpdated','DiffUpdated'),
+        ('DirChanged','DirChanged'),
+        ('DirChangedPre','DirChangedPre'),
+        ('EncodingChanged','EncodingChanged'),
+        ('ExitPre','ExitPre'),
+        ('FileAppendCmd','FileAppendCmd'),
+        ('FileAppendPost','FileAppendPost'),
+        ('FileAppendPre','FileAppendPre'),
+        ('FileChangedRO','FileChangedRO'),
+        ('FileChangedShell','FileChangedShell'),
+        ('FileChangedShellPost','FileChangedShellPost'),
+        ('FileEncoding','FileEncoding'),
+        ('FileReadCmd','FileReadCmd'),
+        ('FileReadPost','FileReadPost'),
+        ('FileReadPre','FileReadPre'),
+        ('FileType','FileType'),
+        ('FileWriteCmd','FileWriteCmd'),
+        ('FileWritePost','FileWritePost'),
+        ('FileWritePre','FileWritePre'),
+        ('FilterReadPost','FilterReadPost'),
+        ('FilterReadPre','FilterReadPre'),
+        ('FilterWritePost','FilterWritePost'),
+        ('FilterWritePre','FilterWritePre'),
+        ('FocusGained','FocusGained'),
+        ('FocusLost','FocusLost'),
+        ('FuncUndefined','FuncUndefined'),
+        ('GUIEnter','GUIEnter'),
+        ('GUIFailed','GUIFailed'),
+        ('InsertChange','InsertChange'),
+        ('InsertCharPre','InsertCharPre'),
+        ('InsertEnter','InsertEnter'),
+        ('InsertLeave','InsertLeave'),
+        ('InsertLeavePre','InsertLeavePre'),
+        ('KeyInputPre','KeyInputPre'),
+        ('MenuPopup','MenuPopup'),
+        ('ModeChanged','ModeChanged'),
+        ('OptionSet','OptionSet'),
+        ('QuickFixCmdPost','QuickFixCmdPost'),
+        ('QuickFixCmdPre','QuickFixCmdPre'),
+        ('QuitPre','QuitPre'),
+        ('RemoteReply','RemoteReply'),
+        ('SafeState','SafeState'),
+        ('SafeStateAgain','SafeStateAgain'),
+        ('SessionLoadPost','SessionLoadPost'),
+        ('SessionLoadPre','SessionLoadPre'),
+        ('SessionWritePost','SessionWritePost'),
+        ('ShellCmdPost','ShellCmdPost'),
+        ('ShellFilterPost','ShellFilterPost'),
+        ('SigUSR1','SigUSR1'),
+        ('SourceCmd','SourceCmd'),
+        ('SourcePost','SourcePost'),
+        ('SourcePre','SourcePre'),
+        ('SpellFileMissing','SpellFileMissing'),
+        ('StdinReadPost','StdinReadPost'),
+        ('StdinReadPre','StdinReadPre'),
+        ('SwapExists','SwapExists'),
+        ('Syntax','Syntax'),
+        ('TabClosed','TabClosed'),
+        ('TabClosedPre','TabClosedPre'),
+        ('TabEnter','TabEnter'),
+        ('TabLeave','TabLeave'),
+        ('TabNew','TabNew'),
+        ('TermChanged','TermChanged'),
+        ('TermResponse','TermResponse'),
+        ('TermResponseAll','TermResponseAll'),
+        ('TerminalOpen','TerminalOpen'),
+        ('TerminalWinOpen','TerminalWinOpen'),
+        ('TextChanged','TextChanged'),
+        ('TextChangedI','TextChangedI'),
+        ('TextChangedP','TextChangedP'),
+        ('TextChangedT','TextChangedT'),
+        ('TextPutPost','TextPutPost'),
+        ('TextPutPre','TextPutPre'),
+        ('TextYankPost','TextYankPost'),
+        ('VimEnter','VimEnter'),
+        ('VimLeave','VimLeave'),
+        ('VimLeavePre','VimLeavePre'),
+        ('VimResized','VimResized'),
+        ('VimResume','VimResume'),
+        ('VimSuspend','VimSuspend'),
+        ('WinClosed','WinClosed'),
+        ('WinEnter','WinEnter'),
+        ('WinLeave','WinLeave'),
+        ('WinNew','WinNew'),
+        ('WinNewPre','WinNewPre'),
+        ('WinResized','WinResized'),
+        ('WinScrolled','WinScrolled'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('nextgroup','nextgroup'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('skipwhite','skipwhite'),
+        ('vimAutoEventSep','vimAutoEventSep'),
+        ('vimAutoEventSep','vimAutoEventSep'),
+        ('vimAutoEventSep','vimAutoEventSep'),
+        ('vimAutocmdPattern','vimAutocmdPattern'),
+        ('vimAutocmdPattern','vimAutocmdPattern'),
+        ('vimAutocmdPattern','vimAutocmdPattern'),
+    )
+    return var
+auto = _getauto()
+
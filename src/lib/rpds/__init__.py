@@ -0,0 +1,5 @@
+from .rpds import *
+
+__doc__ = rpds.__doc__
+if hasattr(rpds, "__all__"):
+    __all__ = rpds.__all__
\ No newline at end of file
@@ -0,0 +1,5 @@
+from sse_starlette.event import ServerSentEvent, JSONServerSentEvent
+from sse_starlette.sse import EventSourceResponse
+
+__all__ = ["EventSourceResponse", "ServerSentEvent", "JSONServerSentEvent"]
+__version__ = "3.5.0"
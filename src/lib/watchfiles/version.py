@@ -0,0 +1,5 @@
+from ._rust_notify import __version__
+
+__all__ = ('VERSION',)
+
+VERSION = __version__
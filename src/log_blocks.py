@@ -0,0 +1,181 @@
+"""
+Block-level reading of ComfyUI logs
+Finds the lines containing keywords in large blocks without decoding every line
+"""
+import re
+from typing import BinaryIO, Dict, Iterator, Optional, Pattern, Tuple
+
+from cache_store import file_identity, read_identity
+from cancellation import check_cancelled
+from log_index import TIMESTAMP_LINE_RE
+from log_rotation import is_compressed, open_log, skip_to
+from log_scanner import complete_length, last_line_end, timestamp_from_match
+from metrics import count, span
+from progress import expect_bytes, scanned
+
+BLOCK_BYTES = 1024 * 1024
+
+LINE_END_RE = re.compile(b'[\r\n]')
+# The last timestamped line in a range, found by backtracking from its end
+LAST_TIMESTAMP_RE = re.compile(b'(?s).*' + TIMESTAMP_LINE_RE.pattern, re.MULTILINE)
+
+
+def count_line_ends(block: bytes, start: int, end: int) -> int:
+    """Line terminators in block[start:end], counting \\r\\n once."""
+    return block.count(b'\n', start, end) + block.count(b'\r', start, end) - block.count(b'\r\n', start, end)
+
+
+def read_line_blocks(f: BinaryIO, start: int, end: int,
+                     block_bytes: int = BLOCK_BYTES) -> Iterator[Tuple[int, bytes]]:
+    """(offset, block) pairs covering [start, end) of a file, each ending on a line boundary.
+
+    end must itself be a line boundary (see last_line_end). Blocks are at
+    most block_bytes long unless a single line is longer.
+    """
+    f.seek(start)
+    offset = start
+    while offset < end:
+        remaining = end - offset
+        block = f.read(min(block_bytes, remaining))
+        if not block:
+            return
+        while len(block) < remaining:
+            length = complete_length(block)
+            if length:
+                block = block[:length]
+                break
+            more = f.read(min(block_bytes, remaining - len(block)))
+            if not more:
+                break
+            block += more
+        f.seek(offset + len(block))
+        yield offset, block
+        offset += len(block)
+
+
+def stream_line_blocks(f: BinaryIO, block_bytes: int = BLOCK_BYTES) -> Iterator[Tuple[int, bytes]]:
+    """(offset, block) pairs covering a stream from its start, each ending on a line boundary.
+
+    The read_line_blocks() of compressed logs: it never seeks, and the last
+    block ends wherever the stream does.
+    """
+    offset = 0
+    carry = b''
+    while True:
+        data = f.read(block_bytes)
+        if not data:
+            break
+        block = carry + data
+        length = complete_length(block)
+        if not length:
+            carry = block
+            continue
+        carry = block[length:]
+        yield offset, block[:length]
+        offset += length
+    if carry:
+        yield offset, carry
+
+
+def unread_blocks(path: str, state: Dict,
+                  block_bytes: int = BLOCK_BYTES) -> Optional[Iterator[Tuple[int, bytes]]]:
+    """The blocks of a log past state["offset"], or None when nothing needs reading.
+
+    Plain logs are read up to their last complete line; a compressed log
+    doesn't grow, so it is read to its end, as one stream, until state is
+    marked complete (a read stopped early picks up where it stopped). As
+    each block is handed out, state["identity"] is set to the identity of
+    what was read up to its end.
+    """
+    identity = file_identity(path)
+    if is_compressed(path):
+        if state.get("complete"):
+            count("cache_hits", cache="index")
+            return None
+        count("cache_misses", cache="index")
+        expect_bytes(None)
+        return _read_blocks(path, identity, state, None, block_bytes)
+    with open(path, 'rb') as f:
+        # Stop before a last line that may still be being written
+        end = last_line_end(f, identity["size"])
+    if end <= state["offset"] and "identity" in state:
+        count("cache_hits", cache="index")
+        return None
+    count("cache_misses", cache="index")
+    expect_bytes(end - state["offset"])
+    return _read_blocks(path, identity, state, end, block_bytes)
+
+
+def _read_blocks(path: str, identity: Dict, state: Dict, end: Optional[int],
+                 block_bytes: int) -> Iterator[Tuple[int, bytes]]:
+    offset = state["offset"]
+    with open_log(path) as f:
+        if end is not None:
+            blocks = read_line_blocks(f, offset, end, block_bytes)
+        else:
+            # Archives can't seek: decompress up to where an earlier read stopped
+            skip_to(f, offset, 0)
+            blocks = ((offset + start, block) for start, block in stream_line_blocks(f, block_bytes))
+        while True:
+            with span("read"):
+                item = next(blocks, None)
+            if item is None:
+                break
+            offset, block = item
+            check_cancelled()
+            state["identity"] = read_identity(identity, offset + len(block))
+            yield offset, block
+            scanned(len(block))
+            count("bytes_read", len(block), scan="index")
+            offset += len(block)
+    state["identity"] = read_identity(identity, offset)
+    if end is None:
+        state["complete"] = True
+
+
+class KeywordLines:
+    """Finds the lines of consecutive blocks that contain a keyword.
+
+    keyword_re is searched over each lowercased block as a whole, so the
+    lines without a keyword are never decoded; line numbers are counted with
+    bytes.count() and the latest timestamp found with one backtracking
+    search per candidate line. line_number and last_time carry over from one
+    block to the next, and callers may update last_time themselves. The
+    lines and keyword searches get counted in the process metrics.
+    """
+
+    def __init__(self, keyword_re: Pattern[bytes], line_number: int = 1, last_time: Optional[float] = None):
+        self.keyword_re = keyword_re
+        self.line_number = line_number
+        self.last_time = last_time
+
+    def scan(self, block: bytes) -> Iterator[Tuple[int, int, int]]:
+        """Yield (start, end, line_number) for each candidate line; last_time is current for it."""
+        first_line = self.line_number
+        line_start = 0        # start of the line self.line_number refers to
+        timestamp_from = 0    # where the search for the latest timestamp resumes
+        next_line = 0         # start of the line after the last candidate
+        for m in self.keyword_re.finditer(block.lower()):
+            if m.start() < next_line:
+                continue
+            start = max(block.rfind(b'\n', next_line, m.start()), block.rfind(b'\r', next_line, m.start()),
+                        next_line - 1) + 1
+            line_end = LINE_END_RE.search(block, m.end())
+            end = line_end.start() if line_end else len(block)
+            next_line = end + 1
+
+            self.line_number += count_line_ends(block, line_start, start)
+            line_start = start
+            t = LAST_TIMESTAMP_RE.match(block, timestamp_from, end)
+            if t:
+                self.last_time = timestamp_from_match(t) or self.last_time
+            timestamp_from = start
+
+            yield start, end, self.line_number
+
+        t = LAST_TIMESTAMP_RE.match(block, timestamp_from)
+        if t:
+            self.last_time = timestamp_from_match(t) or self.last_time
+        self.line_number += count_line_ends(block, line_start, len(block))
+        count("lines_scanned", self.line_number - first_line, scan="index")
+        count("patterns_evaluated", 1, scan="index")
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Shared log daemon for ComfyUI Log Debugger
+One long-lived process keeps the log inventory, indexes and watchers warm, and the MCP servers on this machine proxy their tool calls to it
+"""
+import asyncio
+import contextvars
+import functools
+import hashlib
+import inspect
+import os
+import secrets
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from typing import Callable, Dict, Optional, Tuple
+
+from cache_store import cache_dir, get_setting
+from cancellation import CallCancelled, check_cancelled, run_cancellable
+from debugger_server import ComfyUILogDebugger
+from metrics import measure_tool, start_dumping
+from progress import CallProgress, forward_progress, time_left, track
+from tool_names import TOOL_NAMES
+from tool_runner import max_concurrent_tools
+
+DEFAULT_IDLE_MINUTES = 30
+START_TIMEOUT_SECONDS = 10
+# How long a client waits for the daemon's next message before checking whether its own call was cancelled
+CANCEL_CHECK_SECONDS = 0.2
+# Unix socket paths are limited to about 104 bytes
+MAX_SOCKET_PATH = 100
+CONNECT_ERRORS = (OSError, EOFError, AuthenticationError)
+
+
+def idle_minutes() -> float:
+    """Minutes without tool calls before the daemon exits (COMFYUI_DAEMON_IDLE_MINUTES, default 30)."""
+    try:
+        return float(get_setting('COMFYUI_DAEMON_IDLE_MINUTES') or DEFAULT_IDLE_MINUTES)
+    except ValueError:
+        return DEFAULT_IDLE_MINUTES
+
+
+def daemon_address() -> Tuple[str, str]:
+    """(address, family) of the daemon for this cache directory: a named pipe on Windows, a Unix socket elsewhere."""
+    base = os.path.abspath(cache_dir())
+    key = hashlib.sha1(base.encode('utf-8')).hexdigest()[:16]
+    if sys.platform == 'win32':
+        return rf'\\.\pipe\comfy-guru-{key}', 'AF_PIPE'
+    path = os.path.join(base, 'daemon.sock')
+    if len(path) > MAX_SOCKET_PATH:
+        path = os.path.join(tempfile.gettempdir(), f'comfy-guru-{os.getuid()}-{key}.sock')
+    return path, 'AF_UNIX'
+
+
+def _authkey() -> bytes:
+    """The secret the daemon and its clients prove to each other that they share, made on first use.
+
+    It is kept in the cache directory, readable by this user only, so other
+    users on the machine can neither call the daemon nor pose as it.
+    """
+    path = os.path.join(cache_dir(), 'daemon.key')
+    for _ in range(50):
+        try:
+            with open(path, 'rb') as f:
+                key = f.read()
+            if key:
+                return key
+        except FileNotFoundError:
+            os.makedirs(cache_dir(), exist_ok=True)
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                continue
+            key = secrets.token_hex(32).encode('ascii')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(key)
+            return key
+        # Another process has just created it and not written it yet
+        time.sleep(0.01)
+    raise OSError(f"Daemon key {path} is empty")
+
+
+def _run_async(method: Callable, **kwargs):
+    return asyncio.run(method(**kwargs))
+
+
+class LogDaemon:
+    """Serves the debugger's tools to the MCP servers on this machine.
+
+    Each connection carries one call: (tool name, arguments, seconds until
+    the caller's deadline). The call runs in a pool of max_concurrent
+    threads with the same cancellation and progress as in the MCP server;
+    progress is sent back as ("progress", done, total, message) and the
+    outcome as ("result", value) or ("error", message). A client that sends
+    anything more, or hangs up, cancels its call. The daemon exits once no
+    call has been made for idle_seconds.
+    """
+
+    def __init__(self, debugger: ComfyUILogDebugger, max_concurrent: Optional[int] = None,
+                 idle_seconds: Optional[float] = None):
+        self.debugger = debugger
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent or max_concurrent_tools(),
+                                           thread_name_prefix="comfy-guru-daemon")
+        self.idle_seconds = idle_minutes() * 60 if idle_seconds is None else idle_seconds
+        self.address, self.family = daemon_address()
+        self.authkey = _authkey()
+        self.closing = False
+        self._active = 0
+        self._last_call = time.monotonic()
+        self._lock = threading.Lock()
+
+    def serve(self):
+        """Accept calls until idle; returns at once if another daemon already serves this cache directory."""
+        try:
+            Client(self.address, self.family, authkey=self.authkey).close()
+            return
+        except CONNECT_ERRORS:
+            if self.family == 'AF_UNIX' and os.path.exists(self.address):
+                # Left behind by a daemon that didn't exit cleanly
+                os.unlink(self.address)
+        try:
+            listener = Listener(self.address, self.family, authkey=self.authkey)
+        except OSError:
+            # Another daemon started first
+            return
+        threading.Thread(target=self._expire, name="comfy-guru-daemon-idle", daemon=True).start()
+        try:
+            while not self.closing:
+                try:
+                    conn = listener.accept()
+                except CONNECT_ERRORS:
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            listener.close()
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _expire(self):
+        while True:
+            time.sleep(min(60.0, max(1.0, self.idle_seconds / 4)))
+            with self._lock:
+                idle = self._active == 0 and time.monotonic() - self._last_call >= self.idle_seconds
+                self.closing = idle
+            if idle:
+                # Wake the accept() in serve() so it sees closing
+                try:
+                    Client(self.address, self.family, authkey=self.authkey).close()
+                except CONNECT_ERRORS:
+                    pass
+                return
+
+    def _busy(self, change: int):
+        with self._lock:
+            self._active += change
+            self._last_call = time.monotonic()
+
+    def _handle(self, conn):
+        try:
+            name, kwargs, seconds = conn.recv()
+        except (EOFError, OSError, TypeError, ValueError):
+            # A probe, or a malformed request
+            conn.close()
+            return
+        send_lock = threading.Lock()
+        closed = False
+
+        def send(*message):
+            # Called from the worker threads too, so never after the connection is closed
+            with send_lock:
+                if not closed:
+                    try:
+                        conn.send(message)
+                    except OSError:
+                        pass
+
+        if name not in TOOL_NAMES:
+            send("error", f"Unknown tool: {name}")
+            conn.close()
+            return
+        method = getattr(self.debugger, name)
+        if inspect.iscoroutinefunction(method):
+            method = functools.partial(_run_async, method)
+
+        cancelled = threading.Event()
+        progress = CallProgress(functools.partial(send, "progress"),
+                                time.monotonic() + seconds if seconds is not None else None)
+        context = contextvars.copy_context()
+        context.run(track, progress)
+
+        def reply(future):
+            # The outcome goes out the moment the call ends, from the thread that ran it
+            progress.close()
+            self._busy(-1)
+            if future.cancelled():
+                return
+            try:
+                send("result", future.result())
+            except CallCancelled:
+                pass
+            except Exception as e:
+                send("error", f"{name} failed in the log daemon: {e}")
+
+        self._busy(1)
+        future = self.executor.submit(context.run, run_cancellable, cancelled, measure_tool, name, method, **kwargs)
+        future.add_done_callback(reply)
+        try:
+            # The client hangs up once it has the outcome; anything before that cancels the call
+            conn.recv()
+        except (EOFError, OSError):
+            pass
+        finally:
+            if not future.done():
+                future.cancel()
+                cancelled.set()
+            with send_lock:
+                closed = True
+                conn.close()
+
+
+def _spawn_daemon():
+    """Start the daemon in the background, detached from this server's session and stdio."""
+    if sys.platform == 'win32':
+        flags = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        flags = {"start_new_session": True}
+    os.makedirs(cache_dir(), exist_ok=True)
+    with open(os.path.join(cache_dir(), 'daemon.log'), 'ab') as log:
+        subprocess.Popen([sys.executable, os.path.abspath(__file__)], stdin=subprocess.DEVNULL,
+                         stdout=log, stderr=log, close_fds=True, **flags)
+
+
+class DaemonClient:
+    """Stands in for ComfyUILogDebugger in an MCP server, running its tools in the log daemon.
+
+    The daemon is started on the first call if it isn't running (or has
+    exited since), and shared by every server using the same cache
+    directory. If it can't be reached, calls run on fallback instead.
+    Cancelling a call here cancels it in the daemon, and the daemon's
+    progress notifications are passed on to this server's client.
+    """
+
+    def __init__(self, fallback: Optional[ComfyUILogDebugger] = None):
+        self.fallback = fallback
+        self.address, self.family = daemon_address()
+        self.authkey = _authkey()
+        self._start_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Callable:
+        if name not in TOOL_NAMES:
+            raise AttributeError(name)
+        method = getattr(ComfyUILogDebugger, name)
+
+        # The tool's signature and docstring, without self
+        signature = inspect.signature(method)
+        signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            return self.call(name, signature.bind(*args, **kwargs).arguments)
+        call.__signature__ = signature
+        return call
+
+    def _connect(self):
+        try:
+            return Client(self.address, self.family, authkey=self.authkey)
+        except CONNECT_ERRORS:
+            pass
+        with self._start_lock:
+            try:
+                return Client(self.address, self.family, authkey=self.authkey)
+            except CONNECT_ERRORS:
+                _spawn_daemon()
+            deadline = time.monotonic() + START_TIMEOUT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(0.1)
+                try:
+                    return Client(self.address, self.family, authkey=self.authkey)
+                except CONNECT_ERRORS:
+                    pass
+        return None
+
+    def call(self, name: str, kwargs: Dict):
+        """Run one tool in the daemon and wait for its result, passing on its progress."""
+        conn = self._connect()
+        if conn is None:
+            if self.fallback is None:
+                return {"error": "The log daemon could not be started; see daemon.log in the cache directory"}
+            method = getattr(self.fallback, name)
+            if inspect.iscoroutinefunction(method):
+                return _run_async(method, **kwargs)
+            return method(**kwargs)
+
+        with conn:
+            try:
+                conn.send((name, kwargs, time_left()))
+                while True:
+                    try:
+                        check_cancelled()
+                    except CallCancelled:
+                        conn.send(("cancel",))
+                        raise
+                    # Returns as soon as a message arrives; the timeout only bounds
+                    # how long a cancellation here goes unnoticed
+                    if not conn.poll(CANCEL_CHECK_SECONDS):
+                        continue
+                    kind, *message = conn.recv()
+                    if kind == "progress":
+                        forward_progress(*message)
+                    elif kind == "result":
+                        return message[0]
+                    else:
+                        return {"error": message[0]}
+            except (EOFError, OSError) as e:
+                return {"error": f"Lost the log daemon during {name}: {e or 'it exited'}"}
+
+
+def main():
+    debugger = ComfyUILogDebugger(watch_inventory=get_setting('COMFYUI_WATCH', 'true').lower() != 'false')
+    start_dumping()
+    LogDaemon(debugger).serve()
+
+
+if __name__ == "__main__":
+    # Dependencies installed for the MCP server on first run
+    lib_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib')
+    if os.path.exists(lib_dir):
+        sys.path.insert(0, lib_dir)
+    main()
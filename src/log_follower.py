@@ -0,0 +1,162 @@
+"""
+In-process log follower for ComfyUI Log Debugger
+Returns bounded batches of new log lines with a resume cursor, waiting on inotify or polling
+"""
+import asyncio
+import hashlib
+import io
+import os
+from typing import Dict, List, Optional, Tuple
+
+from fs_events import Inotify, inotify_available
+from log_scanner import complete_length, iter_lines, last_line_end, lines_before
+
+MAX_BATCH_LINES = 1000
+MAX_BATCH_BYTES = 1024 * 1024
+MAX_WAIT_SECONDS = 30.0
+POLL_INTERVAL = 0.5
+CURSOR_HEAD_BYTES = 1024
+
+
+async def _wait_for_inotify(path: str, timeout: float) -> bool:
+    """Wait on inotify for an event about path in its directory."""
+    directory = os.path.dirname(os.path.abspath(path))
+    name = os.path.basename(path)
+    watch = Inotify()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        watch.add_watch(directory)
+        while True:
+            ready = loop.create_future()
+            loop.add_reader(watch.fileno(), lambda: ready.done() or ready.set_result(None))
+            try:
+                await asyncio.wait_for(ready, max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                loop.remove_reader(watch.fileno())
+            if any(event_name == name for _, _, event_name in watch.read_events()):
+                return True
+    finally:
+        watch.close()
+
+
+def _head_hash(f, length: int) -> str:
+    f.seek(0)
+    return hashlib.sha1(f.read(length)).hexdigest()[:12]
+
+
+def make_cursor(inode: int, offset: int, head_hash: str) -> str:
+    return f"{inode}:{offset}:{head_hash}"
+
+
+def parse_cursor(cursor: str) -> Optional[Tuple[int, int, str]]:
+    try:
+        inode, offset, head_hash = cursor.split(':')
+        return int(inode), int(offset), head_hash
+    except (AttributeError, ValueError):
+        return None
+
+
+class LogFollower:
+    """Follows a log across tool calls without holding a process or a thread.
+
+    Each call reads what was appended since the cursor it is given, at most
+    max_lines complete lines and MAX_BATCH_BYTES, and returns a new cursor.
+    The cursor records the file's inode and a hash of its first bytes, so a
+    rotated log (new inode) or a truncated or rewritten one (shorter, or
+    different leading bytes) is detected and followed from its start. When
+    there is nothing new, a call can wait up to wait_seconds for the file to
+    change, on inotify where available and by polling otherwise.
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        self.poll_interval = poll_interval
+
+    async def follow(self, path: str, cursor: Optional[str] = None, max_lines: int = 100,
+                     wait_seconds: float = 0.0) -> Dict:
+        max_lines = max(1, min(max_lines, MAX_BATCH_LINES))
+        wait_seconds = max(0.0, min(wait_seconds, MAX_WAIT_SECONDS))
+
+        batch = self._read_batch(path, cursor, max_lines)
+        if not batch["lines"] and not batch["has_more"] and wait_seconds and cursor:
+            if await self.wait_for_change(path, wait_seconds):
+                batch = self._read_batch(path, cursor, max_lines)
+        return batch
+
+    def _read_batch(self, path: str, cursor: Optional[str], max_lines: int) -> Dict:
+        status = "ok"
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            position = parse_cursor(cursor) if cursor else None
+
+            if position is None:
+                # No cursor: start with the last max_lines lines, like tail
+                end = last_line_end(f, stat.st_size)
+                lines = lines_before(f, end, max_lines)
+                return {
+                    "log_file": path,
+                    "lines": [line.rstrip('\n') for line in lines],
+                    "cursor": make_cursor(stat.st_ino, end, _head_hash(f, min(end, CURSOR_HEAD_BYTES))),
+                    "has_more": False,
+                    "status": status,
+                }
+
+            inode, offset, head_hash = position
+            if inode != stat.st_ino:
+                status, offset = "rotated", 0
+            elif stat.st_size < offset or _head_hash(f, min(offset, CURSOR_HEAD_BYTES)) != head_hash:
+                status, offset = "truncated", 0
+
+            f.seek(offset)
+            data = f.read(min(stat.st_size - offset, MAX_BATCH_BYTES))
+            complete = complete_length(data)
+            lines, next_offset = self._take_lines(data[:complete], offset, max_lines)
+            has_more = next_offset < offset + complete or offset + len(data) < stat.st_size
+            head_hash = _head_hash(f, min(next_offset, CURSOR_HEAD_BYTES))
+
+        return {
+            "log_file": path,
+            "lines": lines,
+            "cursor": make_cursor(stat.st_ino, next_offset, head_hash),
+            "has_more": has_more,
+            "status": status,
+        }
+
+    @staticmethod
+    def _take_lines(data: bytes, offset: int, max_lines: int) -> Tuple[List[str], int]:
+        """Up to max_lines lines from data, and the offset of the first one not taken."""
+        lines = []
+        for line_offset, line in iter_lines(io.BytesIO(data), offset):
+            if len(lines) == max_lines:
+                return lines, line_offset
+            lines.append(line.rstrip('\n'))
+        return lines, offset + len(data)
+
+    async def wait_for_change(self, path: str, timeout: float) -> bool:
+        """Wait until the log changes (grows, is rotated or rewritten) or timeout passes."""
+        if inotify_available():
+            try:
+                return await _wait_for_inotify(path, timeout)
+            except OSError:
+                pass
+        return await self._poll(path, timeout)
+
+    async def _poll(self, path: str, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        initial = self._stat_key(path)
+        while loop.time() < deadline:
+            await asyncio.sleep(min(self.poll_interval, max(0.0, deadline - loop.time())))
+            if self._stat_key(path) != initial:
+                return True
+        return False
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[Tuple]:
+        try:
+            stat = os.stat(path)
+            return stat.st_ino, stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
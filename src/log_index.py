@@ -0,0 +1,147 @@
+"""
+Sparse timestamp index for ComfyUI logs
+Maps log time to byte offset so time-bounded queries seek instead of scanning
+"""
+import bisect
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+from cache_store import cache_file, file_identity, is_continuation, load_json, save_json
+from log_scanner import TIMESTAMP_RE, timestamp_from_match
+
+INDEX_VERSION = 1
+INDEX_BLOCK_BYTES = 1024 * 1024
+
+TIMESTAMP_LINE_RE = re.compile(b'^' + TIMESTAMP_RE.pattern.encode('ascii'), re.MULTILINE)
+
+
+def count_lines(data: bytes, after_cr: bool = False) -> int:
+    """Count line terminators the way readlines() does: \\n, \\r\\n and a bare \\r.
+
+    after_cr says the previous block ended in \\r, so a leading \\n completes
+    that \\r\\n rather than ending another line.
+    """
+    count = data.count(b'\n') + data.count(b'\r') - data.count(b'\r\n')
+    if after_cr and data[:1] == b'\n':
+        count -= 1
+    return count
+
+
+class TimestampIndex:
+    """Sparse time -> (byte offset, line number) index, persisted per log file.
+
+    One entry is kept per block of the file: the first line start in the
+    block and the first timestamp found at or after it (or the latest one
+    before it, if the block has none). Line terminators are
+    counted with bytes.count() and timestamps found with one regex search per
+    block, so building the index runs at close to disk speed. Logs that only
+    grew are indexed from where the last update stopped; rotated or truncated
+    logs are re-indexed from the start.
+
+    Seeking assumes timestamps in a log only move forward, which holds for
+    ComfyUI's own logging.
+    """
+
+    def __init__(self, block_bytes: int = INDEX_BLOCK_BYTES):
+        self.block_bytes = block_bytes
+        self._indexes: Dict[str, Dict] = {}
+
+    def update(self, log_path: str) -> Dict:
+        """Bring the index for a log up to date with its current size."""
+        path = os.path.abspath(log_path)
+        index_file = cache_file('timestamp_index', path)
+        index = self._indexes.get(path) or load_json(index_file)
+
+        if (not index or index.get("version") != INDEX_VERSION
+                or not is_continuation(index.get("identity"), path)):
+            index = {
+                "version": INDEX_VERSION,
+                "identity": None,
+                "entries": [],  # [offset, line_number, timestamp]
+                "end_offset": 0,
+                "end_line": 1,
+                "after_cr": False,
+                "last_time": None,
+            }
+
+        identity = file_identity(path)
+        if index["identity"] is None or identity["size"] > index["end_offset"]:
+            self._extend(path, index, identity["size"])
+            index["identity"] = identity
+            save_json(index_file, index)
+
+        self._indexes[path] = index
+        return index
+
+    def _extend(self, path: str, index: Dict, size: int):
+        offset = index["end_offset"]
+        line_number = index["end_line"]
+        after_cr = index["after_cr"]
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            while offset < size:
+                block = f.read(min(self.block_bytes, size - offset))
+                if not block:
+                    break
+
+                if offset == 0:
+                    start = 0
+                else:
+                    newline = block.find(b'\n')
+                    start = newline + 1 if newline != -1 else len(block)
+
+                if start < len(block):
+                    # Every line before this entry is at most last_time old, so
+                    # the key never drops below it and keys stay sorted
+                    m = TIMESTAMP_LINE_RE.search(block, start)
+                    timestamp = timestamp_from_match(m) if m else None
+                    if timestamp is None or (index["last_time"] is not None and timestamp < index["last_time"]):
+                        timestamp = index["last_time"]
+                    entry_line = line_number + count_lines(block[:start], after_cr)
+                    index["entries"].append([offset + start, entry_line, timestamp])
+
+                last_time = self._last_timestamp(block)
+                if last_time is not None:
+                    index["last_time"] = max(last_time, index["last_time"] or last_time)
+
+                line_number += count_lines(block, after_cr)
+                after_cr = block.endswith(b'\r')
+                offset += len(block)
+
+        index["end_offset"] = offset
+        index["end_line"] = line_number
+        index["after_cr"] = after_cr
+
+    @staticmethod
+    def _last_timestamp(block: bytes) -> Optional[float]:
+        """Timestamp of the last timestamped line in a block, searching backwards."""
+        end = len(block)
+        while True:
+            start = block.rfind(b'\n', 0, end) + 1
+            m = TIMESTAMP_LINE_RE.match(block, start)
+            timestamp = timestamp_from_match(m) if m else None
+            if timestamp is not None:
+                return timestamp
+            if start == 0:
+                return None
+            end = start - 1
+
+    def seek(self, log_path: str, since: float) -> Optional[Tuple[int, int]]:
+        """Return (byte offset, line number) to start reading lines logged at or after since.
+
+        Every line before the returned offset is older than since. Returns
+        None if the log has no timestamps to index.
+        """
+        index = self.update(log_path)
+        if index["last_time"] is None:
+            return None
+
+        entries = index["entries"]
+        keys = [entry[2] if entry[2] is not None else float('-inf') for entry in entries]
+        position = bisect.bisect_left(keys, since) - 1
+        if position < 0:
+            return 0, 1
+        offset, line_number, _ = entries[position]
+        return offset, line_number
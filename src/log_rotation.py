@@ -0,0 +1,111 @@
+"""
+Rotated and compressed ComfyUI logs
+Streams gzip and zstd archives without temp files and finds the rotated segments of a log
+"""
+import gzip
+import io
+import os
+import re
+import zlib
+from collections import deque
+from typing import BinaryIO, List
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from log_scanner import iter_lines, read_raw_lines
+
+COMPRESSED_SUFFIXES = ('.gz', '.zst')
+SKIP_BYTES = 1024 * 1024
+# What reading a damaged or truncated log can raise
+READ_ERRORS = ((OSError, EOFError, zlib.error)
+               + ((zstd.ZstdError,) if zstd is not None else ())
+               + ((zstandard.ZstdError,) if zstandard is not None else ()))
+# comfyui.log.1, comfyui.log.2024-06-15, with or without a compression suffix
+ROTATED_RE = re.compile(r'^(?P<base>.+\.log)\.[\w-]+$')
+
+
+class ForwardReader(io.BufferedReader):
+    """A buffered decompression stream that seeks forward by reading ahead."""
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        position = self.tell()
+        if whence == io.SEEK_CUR:
+            offset += position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Compressed logs can't seek from their end")
+        if offset < position:
+            raise io.UnsupportedOperation("Compressed logs can only seek forward")
+        while position < offset:
+            data = self.read(min(offset - position, SKIP_BYTES))
+            if not data:
+                break
+            position += len(data)
+        return position
+
+
+def is_compressed(path: str) -> bool:
+    return path.endswith(COMPRESSED_SUFFIXES)
+
+
+def open_log(path: str) -> BinaryIO:
+    """Open a log as bytes, decompressing gzip and zstd archives as they are read.
+
+    Archives can only be read forward cheaply: seeking back restarts the
+    decompression, and zstd streams without Python 3.14 can't seek back at all.
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.zst'):
+        if zstd is not None:
+            return zstd.open(path, 'rb')
+        if zstandard is None:
+            raise OSError(f"Reading {os.path.basename(path)} needs Python 3.14 or the zstandard package")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True, closefd=True)
+        return ForwardReader(reader)
+    return open(path, 'rb')
+
+
+def skip_to(f: BinaryIO, offset: int, context_lines: int) -> List[str]:
+    """Read forward to offset (a line start), returning the context_lines lines before it.
+
+    The stream version of lines_before(), for archives that can't seek back.
+    """
+    before = deque(maxlen=context_lines)
+    for _, line in iter_lines(read_raw_lines(f, f.tell(), offset)):
+        before.append(line)
+    return list(before) if context_lines else []
+
+
+def rotation_base(name: str) -> str:
+    """The live log name a file belongs to: comfyui.log for comfyui.log.2.gz, itself otherwise."""
+    for suffix in COMPRESSED_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    m = ROTATED_RE.match(name)
+    return m.group('base') if m else name
+
+
+def rotated_segments(log_path: str) -> List[str]:
+    """The rotated and archived segments of a live log, newest first, without the log itself."""
+    directory, name = os.path.split(os.path.abspath(log_path))
+    if rotation_base(name) != name:
+        return []
+    segments = []
+    try:
+        for entry in os.scandir(directory):
+            if entry.name != name and rotation_base(entry.name) == name and entry.is_file():
+                segments.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return []
+    return [path for _, path in sorted(segments, reverse=True)]
@@ -0,0 +1,522 @@
+"""
+Log scanning primitives for ComfyUI Log Debugger
+Compiles error patterns once and streams errors out of logs in a single pass
+"""
+import hashlib
+import json
+import re
+import sys
+import time
+from collections import deque
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from cancellation import check_cancelled
+from metrics import count, span
+from progress import scanned, time_is_up
+
+REGEX_METACHARS = set('.^$*+?{}[]\\|()')
+
+# "2024-06-15 12:34:56,789", "[2024-06-15 12:34:56.789]" and ISO "2024-06-15T12:34:56"
+TIMESTAMP_RE = re.compile(r'\[?(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:[.,](\d{1,6}))?')
+
+
+def is_literal(pattern_str: str) -> bool:
+    """True if a pattern has no regex syntax and can be matched as plain text."""
+    return not any(c in REGEX_METACHARS for c in pattern_str)
+
+
+def trie_regex(words: List[str]) -> str:
+    """Build a regex that matches any of the words, factored by common prefix.
+
+    The regex engine tries alternations one branch at a time, so a flat
+    "a|b|c|..." over hundreds of literals costs hundreds of attempts at every
+    character. Factoring the literals into a trie means each character only
+    follows a single branch.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict) -> str:
+        if list(node) == ['']:
+            return ''
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        regex = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            regex = f'(?:{regex})?'
+        return regex
+
+    return emit(trie)
+
+
+class ErrorMatcher:
+    """Precompiled matcher for the error patterns in error_patterns.json.
+
+    Every line goes through one prefilter search. Literal patterns (most of
+    error_patterns.json) are merged into a single prefix trie matched against
+    the lowercased line; patterns with regex syntax are merged into one
+    case-insensitive alternation. Only lines that pass the prefilter are
+    checked against the per-type alternations, because one line may match
+    several error types.
+    """
+
+    def __init__(self, error_patterns: Dict[str, List[str]]):
+        self.error_patterns = error_patterns
+        self.fingerprint = hashlib.sha1(json.dumps(error_patterns, sort_keys=True).encode('utf-8')).hexdigest()
+        self.type_regexes: List[Tuple[str, re.Pattern]] = []
+
+        literals = []
+        regexes = []
+        for error_type, patterns in error_patterns.items():
+            valid = []
+            for pattern_str in patterns:
+                try:
+                    re.compile(pattern_str)
+                except re.error as e:
+                    print(f"Skipping invalid pattern {pattern_str!r} for {error_type}: {e}", file=sys.stderr)
+                    continue
+                valid.append(pattern_str)
+                if is_literal(pattern_str):
+                    literals.append(pattern_str.lower())
+                else:
+                    regexes.append(pattern_str)
+            if valid:
+                alternation = "|".join(f"(?:{p})" for p in valid)
+                self.type_regexes.append((error_type, re.compile(alternation, re.IGNORECASE)))
+
+        self.literal_prefilter: Optional[re.Pattern] = re.compile(trie_regex(literals)) if literals else None
+        self.regex_prefilter: Optional[re.Pattern] = None
+        if regexes:
+            try:
+                self.regex_prefilter = re.compile("|".join(f"(?:{p})" for p in regexes), re.IGNORECASE)
+            except re.error:
+                # Patterns with their own group names can't be merged; let every
+                # line through to the per-type check instead.
+                self.regex_prefilter = re.compile('', re.IGNORECASE)
+
+    def match(self, line: str) -> List[str]:
+        """Return the error types matched by a line, in error_patterns.json order."""
+        if not ((self.literal_prefilter is not None and self.literal_prefilter.search(line.lower()))
+                or (self.regex_prefilter is not None and self.regex_prefilter.search(line))):
+            return []
+        return [error_type for error_type, regex in self.type_regexes if regex.search(line)]
+
+    def searches(self, lines: int, matched_lines: int) -> int:
+        """At most how many regex searches match() made for lines lines, matched_lines of which matched."""
+        prefilters = (self.literal_prefilter is not None) + (self.regex_prefilter is not None)
+        return lines * prefilters + matched_lines * len(self.type_regexes)
+
+
+@lru_cache(maxsize=4096)
+def _minute_epoch(year: int, month: int, day: int, hour: int, minute: int) -> float:
+    return time.mktime((year, month, day, hour, minute, 0, 0, 0, -1))
+
+
+def timestamp_from_match(m) -> Optional[float]:
+    """Epoch seconds for a TIMESTAMP_RE match (str or bytes), read as local time."""
+    try:
+        year, month, day, hour, minute, second = (int(g) for g in m.groups()[:6])
+        fraction = m.group(7)
+        seconds = second + (int(fraction) / 10 ** len(fraction) if fraction else 0)
+        return _minute_epoch(year, month, day, hour, minute) + seconds
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_timestamp(line: str) -> Optional[float]:
+    """Epoch seconds of the timestamp a log line starts with, or None."""
+    m = TIMESTAMP_RE.match(line)
+    return timestamp_from_match(m) if m else None
+
+
+def iter_lines(f: BinaryIO, offset: int = 0) -> Iterator[Tuple[int, str]]:
+    """Stream (byte_offset, line) pairs from a binary log file.
+
+    Lines are split the way text-mode readlines() splits them (on \\n, \\r\\n
+    and a bare \\r, which tqdm progress bars write constantly) and come back
+    decoded with a normalized \\n terminator, so line numbers match the old
+    readlines() based scan while still tracking byte offsets.
+    """
+    for raw in f:
+        if b'\r' not in raw:
+            yield offset, _decode_line(raw)
+            offset += len(raw)
+            continue
+
+        parts = raw.split(b'\r')
+        last = parts.pop()
+        for i, part in enumerate(parts):
+            if i == len(parts) - 1 and last == b'\n':
+                yield offset, _decode_line(part + b'\r\n')
+                offset += len(part) + 2
+                last = b''
+            else:
+                yield offset, _decode_line(part + b'\r')
+                offset += len(part) + 1
+        if last:
+            yield offset, _decode_line(last)
+            offset += len(last)
+
+
+def lines_before(f, position: int, count: int) -> List[str]:
+    """The last count lines ending at position (a line start) of a binary file or mmap."""
+    if count <= 0 or position == 0:
+        return []
+    window = 4096
+    while True:
+        low = max(0, position - window)
+        lines = [line for _, line in iter_lines(read_raw_lines(f, low, position))]
+        if low == 0:
+            return lines[-count:]
+        # The first line read may start before low, so it doesn't count
+        if len(lines) > count:
+            return lines[-count:]
+        window *= 4
+
+
+def read_raw_lines(f, start: int, end: int, extra_lines: int = 0) -> Iterator[bytes]:
+    """Binary lines of a file or mmap from start up to end, then extra_lines more past it."""
+    f.seek(start)
+    while f.tell() < end:
+        raw = f.readline()
+        if not raw:
+            return
+        if f.tell() > end:
+            raw = raw[:end - (f.tell() - len(raw))]
+            yield raw
+            return
+        yield raw
+    for _ in range(extra_lines):
+        raw = f.readline()
+        if not raw:
+            return
+        yield raw
+
+
+def complete_length(data: bytes) -> int:
+    """Length of data up to the end of its last complete line.
+
+    A trailing \\r may be the first half of a \\r\\n still being written,
+    so it only ends a line once something follows it.
+    """
+    return max(data.rfind(b'\n'), data.rfind(b'\r', 0, len(data) - 1)) + 1
+
+
+def last_line_end(f, size: int, window: int = 64 * 1024) -> int:
+    """Offset just past the last complete line in the first size bytes of a file."""
+    while True:
+        start = max(0, size - window)
+        f.seek(start)
+        length = complete_length(f.read(size - start))
+        if length or start == 0:
+            return start + length
+        window *= 4
+
+
+def _decode_line(raw: bytes) -> str:
+    line = raw.decode('utf-8', errors='ignore')
+    if line.endswith('\r\n'):
+        return line[:-2] + '\n'
+    if line.endswith('\r'):
+        return line[:-1] + '\n'
+    return line
+
+
+TRACEBACK_HEADER = 'Traceback (most recent call last)'
+# What Python prints between the exceptions of a chain
+CHAIN_CONNECTORS = ('During handling of the above exception', 'The above exception was the direct cause')
+# Blank and connector lines allowed after a traceback line before its chain is over
+MAX_CHAIN_GAP = 4
+# Longest traceback chain or merged error span; longer ones are cut there
+MAX_SPAN_LINES = 1000
+
+
+def _message(line: str) -> str:
+    """A log line without the timestamp it starts with, keeping its indentation."""
+    m = TIMESTAMP_RE.match(line)
+    if not m:
+        return line
+    rest = line[m.end():]
+    rest = rest[1:] if rest.startswith(']') else rest
+    return rest[1:] if rest.startswith(' ') else rest
+
+
+class TracebackTracker:
+    """Follows Python tracebacks, chained exceptions included, one line at a time.
+
+    A chain starts at "Traceback (most recent call last):" and takes the
+    indented frame lines after it, the exception line, indented lines
+    continuing the exception message and, after "During handling of the
+    above exception" or "The above exception was the direct cause", the
+    next traceback. start and end are the first and last line of the open
+    chain; blank and connector lines only count once the chain goes on
+    past them.
+    """
+
+    def __init__(self):
+        self.state = None  # None, 'frames', 'after' (the exception line) or 'gap' (past a connector)
+        self.start = 0
+        self.end = 0
+        self.exception_line = 0
+
+    @property
+    def open(self) -> bool:
+        return self.state is not None
+
+    def feed(self, line: str, number: int) -> bool:
+        """Advance past a line; True if it belongs to the open chain, for now at least."""
+        if self.state is None:
+            if TRACEBACK_HEADER not in line:
+                return False
+            return self._begin(number)
+
+        if number - self.end > MAX_CHAIN_GAP or number - self.start >= MAX_SPAN_LINES:
+            self.state = None
+            return self.feed(line, number)
+
+        body = _message(line)
+        if TRACEBACK_HEADER in body:
+            if self.state == 'after':
+                # A new traceback without a connector is a separate error
+                return self._begin(number)
+            self.state, self.end = 'frames', number
+            return True
+        if not body.strip():
+            return True
+        indented = body[0] in ' \t'
+        if self.state == 'frames':
+            self.end = number
+            if not indented:
+                self.state, self.exception_line = 'after', number
+            return True
+        if any(connector in body for connector in CHAIN_CONNECTORS):
+            self.state = 'gap'
+            return True
+        if self.state == 'after' and indented:
+            self.end = number
+            return True
+        self.state = None
+        return False
+
+    def _begin(self, number: int) -> bool:
+        self.state, self.start, self.end = 'frames', number, number
+        return True
+
+
+class ErrorScan:
+    """Stream error spans out of a binary log file in bounded memory.
+
+    Each match gets context_lines of context either side, except that a
+    match inside a Python traceback takes the whole exception chain, from
+    context_lines before "Traceback (most recent call last):" through the
+    last exception line, instead. Matches whose context overlaps or touches
+    are merged into one span, reported once: its error_types, start_line
+    and end_line, the context text, and as line_number/error_line/type the
+    final exception line of its traceback chain, or else its first match.
+    Lines are held only until their span is complete, at most
+    MAX_SPAN_LINES for a span and 2 * context_lines otherwise.
+
+    Scanning starts at the file's current position, which must be byte
+    start_offset and line start_line; before seeds the leading context when
+    that isn't the start of the file. If since is given, only errors on lines
+    whose timestamp (or the last timestamp before them) is at or after since
+    are reported.
+
+    Once iterated, resume_offset/resume_line/resume_context mark where a later
+    scan of the same file can pick up: every span ending before resume_line
+    is final, while later ones (whose context reaches the end of the file,
+    where the last line may still be being written) will be produced again
+    by the resumed scan. With clean_window=(first, last), clean_lines lists
+    the lines in that range where no span or traceback was in progress, so
+    separately scanned parts of a file can be joined where both agree.
+
+    Inside a tool call the scan reports its progress every 4096 lines, and
+    once the call's time is up it stops there, sets cut_short and ends as if
+    the file did, so the resume point still holds; with stop_in_time=False it
+    runs to the end regardless (a cancelled call still stops it). The bytes, lines and
+    pattern searches it gets through are counted in the process metrics.
+    """
+
+    def __init__(self, f: BinaryIO, matcher: ErrorMatcher, context_lines: int = 5,
+                 start_offset: int = 0, start_line: int = 1, since: Optional[float] = None,
+                 before: Optional[List[str]] = None, clean_window: Optional[Tuple[int, int]] = None,
+                 stop_in_time: bool = True):
+        self.f = f
+        self.matcher = matcher
+        self.context_lines = max(0, context_lines)
+        self.start_offset = start_offset
+        self.start_line = start_line
+        self.since = since
+        self.before = list(before or [])[-self.context_lines:] if self.context_lines else []
+        self.clean_window = clean_window
+        self.stop_in_time = stop_in_time
+
+        self.lines_scanned = 0
+        self.matched_lines = 0
+        self.matches = 0
+        self.cut_short = False
+        self.clean_lines: List[int] = []
+        self.resume_offset = start_offset
+        self.resume_line = start_line
+        self.resume_context = list(self.before)
+        self._history = deque()
+
+    def __iter__(self) -> Iterator[Dict]:
+        with span("scan", scan="errors"):
+            yield from self._scan()
+
+    def _scan(self) -> Iterator[Dict]:
+        context_lines = self.context_lines
+        since = self.since
+        tracker = TracebackTracker()
+        # (line_number, offset, line) from the oldest line a span or the resume point may need
+        held = self._history = deque()
+        first_line = self.start_line - len(self.before)
+        held.extend((first_line + i, None, line) for i, line in enumerate(self.before))
+        clean_first, clean_last = self.clean_window or (0, -1)
+        window = 2 * context_lines + 1
+        pending = None
+        emitted_end = first_line - 1
+        line_time = None
+        line_number = self.start_line - 1
+        offset = reported = self.start_offset
+        reported_matches = reported_lines = reported_matched = 0
+
+        for line_number, (offset, line) in enumerate(iter_lines(self.f, self.start_offset), self.start_line):
+            self.lines_scanned += 1
+
+            if pending is not None and self._span_done(pending, tracker, line_number):
+                yield self._finish_span(pending, held)
+                emitted_end = pending["end"]
+                pending = None
+            if (clean_first <= line_number <= clean_last and pending is None and not tracker.open
+                    and line_number > emitted_end + context_lines + 1):
+                self.clean_lines.append(line_number)
+
+            in_chain = (tracker.state is not None or TRACEBACK_HEADER in line) and tracker.feed(line, line_number)
+            held.append((line_number, offset, line))
+
+            if since is not None:
+                timestamp = parse_timestamp(line)
+                if timestamp is not None:
+                    line_time = timestamp
+
+            error_types = self.matcher.match(line)
+            if error_types:
+                self.matched_lines += 1
+            if error_types and (since is None or (line_time is not None and line_time >= since)):
+                self.matches += 1
+                if in_chain:
+                    start, end = tracker.start - context_lines, max(tracker.end, line_number)
+                else:
+                    start, end = line_number - context_lines, line_number + context_lines
+                start = max(start, emitted_end + 1, held[0][0])
+                if pending is None or start > pending["end"] + 1:
+                    if pending is not None:
+                        yield self._finish_span(pending, held)
+                        emitted_end = pending["end"]
+                    pending = {"start": start, "end": end, "chain": None, "types": [], "first": None,
+                            "exception": None}
+                pending["end"] = max(pending["end"], end)
+                pending["types"].extend(t for t in error_types if t not in pending["types"])
+                if pending["first"] is None:
+                    pending["first"] = (line_number, line, error_types)
+                if in_chain:
+                    pending["chain"] = tracker.start
+
+            if pending is not None and tracker.open and pending["chain"] == tracker.start:
+                pending["end"] = max(pending["end"], tracker.end)
+                if tracker.exception_line == line_number:
+                    pending["exception"] = (line_number, line, error_types)
+
+            if pending is None and tracker.state is None:
+                if len(held) > window:
+                    held.popleft()
+            else:
+                floor = line_number - context_lines
+                if pending is not None:
+                    floor = min(floor, pending["start"])
+                if tracker.state is not None:
+                    floor = min(floor, tracker.start - context_lines)
+                while held[0][0] < floor - context_lines:
+                    held.popleft()
+
+            if not self.lines_scanned & 0xFFF:
+                check_cancelled()
+                self._report(offset - reported, self.lines_scanned - reported_lines,
+                             self.matched_lines - reported_matched, self.matches - reported_matches)
+                reported, reported_matches = offset, self.matches
+                reported_lines, reported_matched = self.lines_scanned, self.matched_lines
+                if self.stop_in_time and time_is_up():
+                    # Out of time: finish as if the log ended here, so the
+                    # resume point is where a later scan picks up
+                    self.cut_short = True
+                    break
+
+        self._report(offset - reported, self.lines_scanned - reported_lines,
+                     self.matched_lines - reported_matched, self.matches - reported_matches)
+
+        # The last line may still be being written, so neither it nor any span
+        # whose context reaches it is final yet
+        resume_line = line_number - context_lines
+        if pending is not None:
+            resume_line = min(resume_line, pending["start"])
+        if tracker.open:
+            resume_line = min(resume_line, tracker.start - context_lines)
+        if resume_line > self.start_line:
+            self._set_resume_point(held, resume_line)
+
+        if pending is not None:
+            yield self._finish_span(pending, held)
+
+    def _report(self, byte_count: int, lines: int, matched_lines: int, matches: int):
+        scanned(byte_count, matches)
+        count("bytes_read", byte_count, scan="errors")
+        count("lines_scanned", lines, scan="errors")
+        count("patterns_evaluated", self.matcher.searches(lines, matched_lines), scan="errors")
+
+    def _span_done(self, span: Dict, tracker: TracebackTracker, line_number: int) -> bool:
+        """True once nothing from line_number on can extend the span."""
+        if line_number - span["start"] >= MAX_SPAN_LINES:
+            return True
+        if tracker.open and span["chain"] == tracker.start:
+            return False
+        if line_number <= span["end"] + self.context_lines + 1:
+            return False
+        # A traceback in progress takes its span from its header, so a match
+        # further down may still reach back to this span
+        return not (tracker.open and tracker.start - self.context_lines <= span["end"] + 1)
+
+    @staticmethod
+    def _finish_span(span: Dict, held: deque) -> Dict:
+        start, end = span["start"], span["end"]
+        lines = [line for number, _, line in held if start <= number <= end]
+        line_number, line, error_types = span["exception"] or span["first"]
+        return {
+            "type": error_types[0] if error_types else span["types"][0],
+            "error_types": span["types"],
+            "line_number": line_number,
+            "error_line": line.strip(),
+            "start_line": max(start, held[0][0]) if held else start,
+            "end_line": min(end, held[-1][0]) if held else end,
+            "context": "".join(lines).strip(),
+        }
+
+    def line_offset(self, line_number: int) -> Optional[int]:
+        """Byte offset of a line read recently, such as the start of the span just yielded."""
+        for number, offset, _ in reversed(self._history):
+            if number == line_number:
+                return offset
+        return None
+
+    def _set_resume_point(self, held: deque, resume_line: int):
+        lines = list(held)
+        resume_index = next(i for i, (number, _, _) in enumerate(lines) if number == resume_line)
+        self.resume_line = resume_line
+        self.resume_offset = lines[resume_index][1]
+        context = [line for _, _, line in lines[:resume_index]]
+        self.resume_context = context[-self.context_lines:] if self.context_lines else []
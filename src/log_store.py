@@ -0,0 +1,159 @@
+"""
+Parse-once structured store for ComfyUI logs
+Keeps notable log lines as indexed SQLite records so repeated queries don't rescan raw text
+"""
+import json
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from log_blocks import BLOCK_BYTES
+from log_rotation import open_log
+from log_scanner import REGEX_METACHARS, TIMESTAMP_RE, ErrorMatcher, is_literal, trie_regex
+from log_tables import LogTables, Row, TableIndex
+
+STORE_VERSION = 2
+
+NOTABLE_LEVELS = ('WARNING', 'ERROR', 'CRITICAL')
+LEVEL_ALIASES = {'WARN': 'WARNING', 'FATAL': 'CRITICAL'}
+GROUP_COLUMNS = ('error_type', 'level', 'source')
+# Where a record's group_by value is kept: its row key, or its data [offset, length, level, source]
+GROUP_SQL = {'error_type': "key", 'level': "json_extract(data, '$[2]')", 'source': "json_extract(data, '$[3]')"}
+
+# "WARNING: ...", "[ERROR] ...", Python logging's "ERROR:root:..."
+LEVEL_RE = re.compile(r'\[?(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)\]?(?::(?P<logger>[\w.]+):|:|\s)')
+# "[ComfyUI-Manager] ..." style prefixes
+SOURCE_RE = re.compile(r'\[(?P<source>[A-Za-z][^\]]{0,63})\]\s*')
+# Cheap test for lines that may carry a notable level
+NOTABLE_HINT_RE = re.compile(r'WARN|ERROR|CRITICAL|FATAL')
+# Every non-empty line, for error patterns no keyword can stand in for
+EVERY_LINE_RE = re.compile(b'[^\r\n]')
+
+
+def notable_keywords(matcher: ErrorMatcher) -> Pattern[bytes]:
+    """A keyword regex, for lowercased blocks, found on every line that may be notable.
+
+    That is the error patterns and the level names. A pattern whose only
+    regex syntax is grouping parentheses matches its text without them;
+    with any other regex syntax, or text outside ASCII (which lowercases
+    differently as bytes), every line is decoded and checked instead.
+    """
+    words = ['warn', 'error', 'critical', 'fatal']
+    for patterns in matcher.error_patterns.values():
+        for pattern in patterns:
+            if not is_literal(pattern):
+                if '(?' in pattern or not set(pattern) & REGEX_METACHARS <= {'(', ')'}:
+                    return EVERY_LINE_RE
+                pattern = pattern.replace('(', '').replace(')', '')
+            if not pattern or not pattern.isascii():
+                return EVERY_LINE_RE
+            words.append(pattern.lower())
+    return re.compile(trie_regex(words).encode('ascii'))
+
+
+def parse_prefix(line: str) -> Tuple[Optional[str], Optional[str]]:
+    """The level and source a log line starts with (after any timestamp), or None for each."""
+    m = TIMESTAMP_RE.match(line)
+    rest = line[m.end():].lstrip('] ') if m else line.lstrip()
+    level = source = None
+    m = SOURCE_RE.match(rest)
+    if m and not LEVEL_RE.match(rest):
+        # "[ComfyUI-Manager] ERROR: ..."
+        source = m.group('source')
+        rest = rest[m.end():]
+    m = LEVEL_RE.match(rest)
+    if m:
+        level = LEVEL_ALIASES.get(m.group(1), m.group(1))
+        source = source or m.group('logger')
+    return level, source
+
+
+class LogStore(TableIndex):
+    """Structured records for notable log lines, kept in the LogTables.
+
+    Each log is parsed once: every line holding an error pattern or a level
+    name is checked against the error patterns and its level and source
+    prefix are read, and lines with an error type or a WARNING/ERROR/CRITICAL
+    level are stored as records of (line number, timestamp, error type, byte
+    offset and length, level, source), one per error type matched. Ordinary
+    lines stay in the log only; a record's offset reads its text back with
+    one seek.
+
+    Records are extended as the log grows, a batch of blocks at a time, so
+    a parse stopped by the call's deadline or cancellation keeps what it got
+    through; a rotated or rewritten log, or changed error patterns, drop them
+    and parse again. Compressed logs are parsed as a stream, and their
+    offsets count decompressed bytes. Queries by type and time use the rows'
+    key and timestamp.
+    """
+
+    KIND = 'log_store'
+    VERSION = STORE_VERSION
+
+    def __init__(self, tables: LogTables, matcher: ErrorMatcher, block_bytes: int = BLOCK_BYTES):
+        super().__init__(tables, block_bytes)
+        self.matcher = matcher
+        self.KEYWORD_RE = notable_keywords(matcher)
+
+    def new_state(self) -> Dict:
+        return {"patterns_key": self.matcher.fingerprint}
+
+    def is_current(self, state: Dict) -> bool:
+        return state.get("patterns_key") == self.matcher.fingerprint
+
+    def process_line(self, state: Dict, rows: List[Row], line: str, start: int, end: int, number: int):
+        error_types = self.matcher.match(line)
+        level = source = None
+        if error_types or NOTABLE_HINT_RE.search(line):
+            level, source = parse_prefix(line)
+        if error_types or level in NOTABLE_LEVELS:
+            rows.extend(("record", error_type, number, state["last_time"], [start, end - start, level, source])
+                        for error_type in error_types or [None])
+
+    def records(self, log_path: str, log_id: Optional[int], error_type: Optional[str] = None,
+                level: Optional[str] = None, since: Optional[float] = None, limit: int = 100) -> List[Dict]:
+        """The newest records of a log (as update() returned it) matching the filters, with their line text."""
+        where, params = self._filters(log_id, error_type, level, since)
+        rows = [(key, line_number, timestamp, json.loads(data)) for key, line_number, timestamp, data in
+                self.tables.select(f"SELECT key, line_number, timestamp, data FROM rows WHERE {where} "
+                                   "ORDER BY line_number DESC LIMIT ?", tuple(params + [limit]))]
+
+        # Read in file order, so an archive is decompressed forward once
+        texts = {}
+        with open_log(log_path) as f:
+            for offset, length in sorted({(data[0], data[1]) for _, _, _, data in rows}):
+                f.seek(offset)
+                texts[offset] = f.read(length).decode('utf-8', errors='ignore').strip()
+        return [{
+            "line_number": line_number,
+            "timestamp": timestamp,
+            "level": level,
+            "source": source,
+            "error_type": error_type,
+            "text": texts[offset],
+        } for error_type, line_number, timestamp, (offset, _, level, source) in rows]
+
+    def counts(self, log_id: Optional[int], group_by: str = 'error_type', error_type: Optional[str] = None,
+               level: Optional[str] = None, since: Optional[float] = None) -> Dict[str, int]:
+        """Record counts of a log (as update() returned it) grouped by error_type, level or source."""
+        if group_by not in GROUP_COLUMNS:
+            raise ValueError(f"group_by must be one of {', '.join(GROUP_COLUMNS)}")
+        where, params = self._filters(log_id, error_type, level, since)
+        column = GROUP_SQL[group_by]
+        rows = self.tables.select(f"SELECT {column}, COUNT(*) FROM rows WHERE {where} GROUP BY {column}",
+                                  tuple(params))
+        return {str(key) if key is not None else "none": number for key, number in rows}
+
+    @staticmethod
+    def _filters(log_id: Optional[int], error_type: Optional[str], level: Optional[str],
+                 since: Optional[float]) -> Tuple[str, List]:
+        clauses, params = ["log_id = ?", "type = 'record'"], [log_id]
+        if error_type:
+            clauses.append("key = ?")
+            params.append(error_type)
+        if level:
+            clauses.append(f"{GROUP_SQL['level']} = ?")
+            params.append(LEVEL_ALIASES.get(level.upper(), level.upper()))
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        return " AND ".join(clauses), params
@@ -0,0 +1,245 @@
+"""
+Append-only tables for incremental ComfyUI log indexes
+Stores what each index extracts from a log as SQLite rows, so extending it writes only what the new lines added
+"""
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from cache_store import cache_dir, is_continuation
+from log_blocks import BLOCK_BYTES, KeywordLines, unread_blocks
+from metrics import count
+from progress import time_is_up
+
+TABLES_VERSION = 1
+# Blocks read between saves, which bounds the rows held in memory and the work lost to a cancelled call
+SAVE_BLOCKS = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    UNIQUE (kind, path)
+);
+CREATE TABLE IF NOT EXISTS rows (
+    log_id INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    key TEXT,
+    line_number INTEGER NOT NULL,
+    timestamp REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rows_by_key ON rows (log_id, type, key);
+"""
+
+# A row to append: (type, key, line_number, timestamp, data), where data is anything JSON can hold
+Row = Tuple[str, Optional[str], int, Optional[float], Any]
+
+
+class LogTables:
+    """Per-log state and append-only rows for incremental indexes, in one SQLite database.
+
+    Each index (a kind, such as "vram_events") keeps a small JSON state per
+    log - how far it has read, the log's identity and whatever it carries
+    from one line to the next - and rows that are only ever appended: one per
+    event, sample or error found, with a type, an optional key, a line
+    number, a timestamp and JSON data. Extending an index rewrites its state
+    and inserts the new rows, however many are stored already. A state made
+    by another version of the index, or for a log since rotated or rewritten,
+    is dropped with its rows. The database lives at
+    COMFYUI_CACHE_DIR/log_tables.sqlite3 and is shared by every index.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or os.path.join(cache_dir(), 'log_tables.sqlite3')
+        self.lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            if db.execute("PRAGMA user_version").fetchone()[0] != TABLES_VERSION:
+                db.executescript("DROP TABLE IF EXISTS rows; DROP TABLE IF EXISTS logs;")
+                db.execute(f"PRAGMA user_version = {TABLES_VERSION}")
+            db.executescript(SCHEMA)
+            self._db = db
+        return self._db
+
+    def load(self, kind: str, log_path: str, version: int) -> Optional[Tuple[int, Dict]]:
+        """(log id, state) saved for a log by this version of the index, or None to start it over."""
+        path = os.path.abspath(log_path)
+        with self.lock:
+            row = self._connect().execute("SELECT id, state FROM logs WHERE kind = ? AND path = ?",
+                                          (kind, path)).fetchone()
+        if row is None:
+            count("cache_misses", cache=kind)
+            return None
+        state = json.loads(row[1])
+        if state.get("version") != version or not is_continuation(state.get("identity"), path):
+            count("cache_misses", cache=kind)
+            return None
+        count("cache_hits", cache=kind)
+        return row[0], state
+
+    def save(self, kind: str, log_path: str, state: Dict, rows: List[Row],
+             log_id: Optional[int], from_offset: int) -> Optional[int]:
+        """Store a log's state and append rows found since from_offset; returns the log id.
+
+        log_id is the one load() returned, or None to drop whatever is stored
+        for the log and start it over. Returns None, storing nothing, if the
+        log was saved past from_offset meanwhile (by another call reading the
+        same lines), so no row is stored twice.
+        """
+        path = os.path.abspath(log_path)
+        encoded = json.dumps(state)
+        with self.lock:
+            db = self._connect()
+            with db:
+                if log_id is None:
+                    for (old_id,) in db.execute("SELECT id FROM logs WHERE kind = ? AND path = ?", (kind, path)):
+                        db.execute("DELETE FROM rows WHERE log_id = ?", (old_id,))
+                        db.execute("DELETE FROM logs WHERE id = ?", (old_id,))
+                    log_id = db.execute("INSERT INTO logs (kind, path, offset, state) VALUES (?, ?, ?, ?)",
+                                        (kind, path, state["offset"], encoded)).lastrowid
+                elif not db.execute("UPDATE logs SET offset = ?, state = ? WHERE id = ? AND offset = ?",
+                                    (state["offset"], encoded, log_id, from_offset)).rowcount:
+                    return None
+                db.executemany("INSERT INTO rows VALUES (?, ?, ?, ?, ?, ?)",
+                               ((log_id, row_type, key, line_number, timestamp, json.dumps(data))
+                                for row_type, key, line_number, timestamp, data in rows))
+        return log_id
+
+    def select(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Run a query over the rows (log_id, type, key, line_number, timestamp, data) and logs tables."""
+        with self.lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def rows(self, log_id: Optional[int], row_type: str, key: Optional[str] = None,
+             since: Optional[float] = None) -> List[Tuple[Optional[str], int, Optional[float], Any]]:
+        """(key, line_number, timestamp, data) of a log's rows of one type, in the order they were found.
+
+        key and since (rows timestamped at or after it) narrow them down.
+        """
+        if log_id is None:
+            return []
+        sql = "SELECT key, line_number, timestamp, data FROM rows WHERE log_id = ? AND type = ?"
+        params = [log_id, row_type]
+        if key is not None:
+            sql += " AND key = ?"
+            params.append(key)
+        if since is not None:
+            sql += " AND timestamp >= ?"
+            params.append(since)
+        return [(key, line_number, timestamp, json.loads(data))
+                for key, line_number, timestamp, data in self.select(sql + " ORDER BY rowid", tuple(params))]
+
+    def close(self):
+        with self.lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class TableIndex:
+    """An index of the keyword lines of a log, extended as the log grows and kept in LogTables.
+
+    Subclasses set KIND, VERSION and KEYWORD_RE, give the state they carry
+    from one line to the next in new_state(), and turn each line holding a
+    keyword into rows in process_line(). update() reads what was appended
+    since the last update in line-aligned blocks, and only the lines with a
+    keyword are decoded; a rotated or rewritten log is read again from the
+    start. remember() keeps what a reader made of the rows in memory until
+    the log's index moves on.
+    """
+
+    KIND = ''
+    VERSION = 1
+    KEYWORD_RE: Pattern[bytes]
+
+    def __init__(self, tables: LogTables, block_bytes: int = BLOCK_BYTES):
+        self.tables = tables
+        self.block_bytes = block_bytes
+        self._remembered: Dict[Optional[int], Tuple[int, Any]] = {}  # log id -> (offset, result)
+
+    def new_state(self) -> Dict:
+        """What a log's state starts with, besides how far it was read."""
+        return {}
+
+    def is_current(self, state: Dict) -> bool:
+        """Whether a saved state was made the way this index works now; if not, the log is read again."""
+        return True
+
+    def process_line(self, state: Dict, rows: List[Row], line: str, start: int, end: int, number: int):
+        """Add the rows a keyword line holds; state["last_time"] is the latest timestamp and may be moved."""
+        raise NotImplementedError
+
+    def update(self, log_path: str) -> Tuple[Optional[int], Dict]:
+        """Read what was appended to a log since the last update; returns its (log id, state).
+
+        What was read is saved every SAVE_BLOCKS blocks, so only that many
+        are held in memory, and a call that is cancelled or out of time
+        keeps what it got through. Once the call's time is up (see
+        progress.time_is_up) the update stops after the block it is on and
+        returns the index as far as it got, with the call marked cut short;
+        the next update carries on from there.
+        """
+        path = os.path.abspath(log_path)
+        loaded = self.tables.load(self.KIND, path, self.VERSION)
+        if loaded is not None and not self.is_current(loaded[1]):
+            loaded = None
+        log_id, state = loaded or (None, dict(
+            self.new_state(), version=self.VERSION, offset=0, line_number=1, last_time=None))
+
+        blocks = unread_blocks(path, state, self.block_bytes)
+        if blocks is None:
+            return log_id, state
+        rows: List[Row] = []
+        unsaved = 0
+        from_offset = state["offset"]
+        lines = KeywordLines(self.KEYWORD_RE, state["line_number"], state["last_time"])
+        try:
+            for offset, block in blocks:
+                for start, stop, number in lines.scan(block):
+                    state["last_time"] = lines.last_time
+                    self.process_line(state, rows, block[start:stop].decode('utf-8', errors='ignore'),
+                                      offset + start, offset + stop, number)
+                    lines.last_time = state["last_time"]
+                state["offset"] = offset + len(block)
+                state["line_number"] = lines.line_number
+                state["last_time"] = lines.last_time
+                unsaved += 1
+
+                out_of_time = time_is_up()
+                if unsaved >= SAVE_BLOCKS or out_of_time:
+                    log_id = self.tables.save(self.KIND, path, state, rows, log_id, from_offset)
+                    if log_id is None:
+                        return self._reload(path, state)
+                    rows, unsaved, from_offset = [], 0, state["offset"]
+                if out_of_time:
+                    return log_id, state
+        finally:
+            blocks.close()
+
+        saved_id = self.tables.save(self.KIND, path, state, rows, log_id, from_offset)
+        if saved_id is None:
+            return self._reload(path, state)
+        return saved_id, state
+
+    def _reload(self, path: str, state: Dict) -> Tuple[Optional[int], Dict]:
+        # Another call got there first; its rows cover these lines
+        return self.tables.load(self.KIND, path, self.VERSION) or (None, state)
+
+    def remember(self, log_id: Optional[int], state: Dict, build: Callable[[], Any]) -> Any:
+        """build()'s result for a log, reused as long as its index hasn't moved on; it must not be changed."""
+        remembered = self._remembered.get(log_id)
+        if remembered is not None and remembered[0] == state["offset"]:
+            return remembered[1]
+        result = build()
+        self._remembered[log_id] = (state["offset"], result)
+        return result
@@ -0,0 +1,196 @@
+"""
+Self-metrics for ComfyUI Log Debugger
+Counts bytes read, lines scanned, patterns evaluated and cache hits, and times tool calls, discovery, reads and serialization
+"""
+import atexit
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_DUMP_INTERVAL = 15.0
+PROMETHEUS_PREFIX = "comfy_guru_"
+PROMETHEUS_EXTENSIONS = ('.prom', '.txt')
+
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Metrics:
+    """Counters and timing spans for one process, shared by all its threads.
+
+    A counter is a running total, such as bytes read; a span is a timed
+    piece of work, such as a discovery, and accumulates how often it ran,
+    its wall and CPU seconds and its longest run. Both are keyed by a name
+    and optional labels (tool="find_errors"). CPU seconds are those of the
+    thread that ran the span, so comparing them with the wall seconds tells
+    waiting on the disk or a subprocess apart from decoding and matching.
+    Hot loops record in batches, so keeping metrics costs next to nothing.
+    """
+
+    def __init__(self):
+        self.counters: Dict[Key, float] = {}
+        self.spans: Dict[Key, List[float]] = {}  # [count, seconds, cpu_seconds, max_seconds]
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def count(self, name: str, amount: float, labels: Dict[str, str]):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def record(self, name: str, labels: Dict[str, str], seconds: float, cpu_seconds: float):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            totals = self.spans.setdefault(key, [0, 0.0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += cpu_seconds
+            totals[3] = max(totals[3], seconds)
+
+    def snapshot(self, reset: bool = False) -> Dict:
+        """Everything recorded so far, as JSON-ready lists sorted by name and labels."""
+        with self._lock:
+            counters, spans, started = dict(self.counters), {k: list(v) for k, v in self.spans.items()}, self.started
+            if reset:
+                self.counters, self.spans, self.started = {}, {}, time.time()
+        return {
+            "since": started,
+            "seconds": time.time() - started,
+            "pid": os.getpid(),
+            "counters": [{"name": name, "labels": dict(labels), "value": value}
+                         for (name, labels), value in sorted(counters.items())],
+            "spans": [{"name": name, "labels": dict(labels), "count": int(totals[0]), "seconds": totals[1],
+                       "cpu_seconds": totals[2], "max_seconds": totals[3]}
+                      for (name, labels), totals in sorted(spans.items())],
+        }
+
+
+_metrics = Metrics()
+# The tool call running this code, if any; set by measure_tool()
+_tool: ContextVar[Optional[str]] = ContextVar('tool', default=None)
+
+
+def count(name: str, amount: float = 1, **labels):
+    """Add amount to the counter name with labels."""
+    if amount:
+        _metrics.count(name, amount, labels)
+
+
+@contextmanager
+def span(name: str, **labels):
+    """Time the code inside as one run of the span name with labels; also works as a decorator."""
+    start, cpu_start = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        _metrics.record(name, labels, time.perf_counter() - start, time.thread_time() - cpu_start)
+
+
+def tool_labels() -> Dict[str, str]:
+    """{"tool": name} inside a tool call measured by measure_tool(), else no labels."""
+    name = _tool.get()
+    return {"tool": name} if name else {}
+
+
+def snapshot(reset: bool = False) -> Dict:
+    """This process's metrics; reset starts them over."""
+    return _metrics.snapshot(reset)
+
+
+def _prometheus_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{key}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def prometheus_text(metrics: Dict) -> str:
+    """A snapshot() in the Prometheus text exposition format."""
+    lines = [f"# TYPE {PROMETHEUS_PREFIX}uptime_seconds gauge",
+             f"{PROMETHEUS_PREFIX}uptime_seconds {metrics['seconds']:.3f}"]
+    declared = set()
+    for counter in metrics["counters"]:
+        name = f"{PROMETHEUS_PREFIX}{counter['name']}_total"
+        if name not in declared:
+            declared.add(name)
+            lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name}{_prometheus_labels(counter['labels'])} {counter['value']:.15g}")
+    for field, suffix, kind in (("count", "calls_total", "counter"), ("seconds", "seconds_total", "counter"),
+                                ("cpu_seconds", "cpu_seconds_total", "counter"), ("max_seconds", "max_seconds", "gauge")):
+        name = f"{PROMETHEUS_PREFIX}span_{suffix}"
+        lines.append(f"# TYPE {name} {kind}")
+        for entry in metrics["spans"]:
+            labels = _prometheus_labels(dict(span=entry["name"], **entry["labels"]))
+            lines.append(f"{name}{labels} {entry[field]:.6g}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path: str) -> bool:
+    """Atomically write this process's metrics to path: Prometheus text for .prom and .txt, JSON otherwise."""
+    metrics = snapshot()
+    if path.lower().endswith(PROMETHEUS_EXTENSIONS):
+        text = prometheus_text(metrics)
+    else:
+        text = json.dumps(metrics, indent=2)
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except OSError as e:
+        print(f"Could not write metrics file {path}: {e}", file=sys.stderr)
+        return False
+
+
+def start_dumping() -> Optional[threading.Thread]:
+    """Write the metrics to COMFYUI_METRICS_FILE every COMFYUI_METRICS_INTERVAL seconds (default 15) and at exit.
+
+    Does nothing when COMFYUI_METRICS_FILE isn't set.
+    """
+    # Imported here: cache_store imports the log scanners, which record metrics
+    from cache_store import get_setting
+    path = get_setting('COMFYUI_METRICS_FILE')
+    if not path:
+        return None
+    try:
+        interval = max(1.0, float(get_setting('COMFYUI_METRICS_INTERVAL') or DEFAULT_DUMP_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_DUMP_INTERVAL
+
+    def run():
+        while True:
+            time.sleep(interval)
+            dump(path)
+
+    atexit.register(dump, path)
+    thread = threading.Thread(target=run, name="comfy-guru-metrics", daemon=True)
+    thread.start()
+    return thread
+
+
+def measure_tool(name: str, func, *args, **kwargs):
+    """Call the tool func, timing it under tool=name; metrics recorded inside get tool_labels()."""
+    token = _tool.set(name)
+    try:
+        with span("tool", tool=name):
+            result = func(*args, **kwargs)
+    finally:
+        _tool.reset(token)
+    if isinstance(result, dict) and "error" in result:
+        count("tool_errors", tool=name)
+    return result
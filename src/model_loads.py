@@ -0,0 +1,185 @@
+"""
+Model load and reload tracking for ComfyUI logs
+Finds model loads, unloads and load times to measure how much time reloading costs
+"""
+import os
+import re
+from typing import Dict, List, Optional
+
+from execution_stats import percentile
+from log_scanner import parse_timestamp, trie_regex
+from log_tables import Row, TableIndex
+
+MODEL_LOADS_VERSION = 2
+
+MODEL_EXTENSIONS = ('safetensors', 'ckpt', 'pt', 'pth', 'bin', 'gguf', 'sft')
+KEYWORDS = (['requested to load', 'loaded completely', 'loaded partially', 'unloaded', 'startup time']
+            + ['.' + ext for ext in MODEL_EXTENSIONS])
+# Requests still waiting for their "loaded" line; older ones are given up on
+MAX_PENDING_LOADS = 16
+KEYWORD_RE = re.compile(trie_regex(KEYWORDS).encode('ascii'))
+
+REQUESTED_RE = re.compile(r'Requested to load (\S+)')
+LOADED_RE = re.compile(r'loaded (?:completely|partially)', re.IGNORECASE)
+UNLOADED_RE = re.compile(r'(\d+) models? unloaded', re.IGNORECASE)
+STARTUP_RE = re.compile(r'ComfyUI startup time')
+MODEL_FILE_RE = re.compile(r'([^\s"\'=:,]+\.(?:' + '|'.join(MODEL_EXTENSIONS) + r'))\b', re.IGNORECASE)
+FILE_LOAD_RE = re.compile(r'\bload(?:ing|ed)?\b', re.IGNORECASE)
+LOAD_TIME_RE = re.compile(r'\bin ([\d.]+)\s*(?:s|sec|seconds)\b', re.IGNORECASE)
+
+# Folder names and words that tell what kind of model a file or class is
+MODEL_KINDS = [
+    ('lora', ('loras', 'lora', 'lycoris')),
+    ('vae', ('vae', 'autoencoder')),
+    ('text_encoder', ('clip', 'text_encoders', 't5')),
+    ('controlnet', ('controlnet',)),
+    ('upscale', ('upscale_models', 'upscale', 'esrgan')),
+    ('checkpoint', ('checkpoints', 'unet', 'diffusion_models', 'ckpt')),
+]
+
+
+def model_kind(name: str) -> str:
+    lowered = name.lower()
+    for kind, words in MODEL_KINDS:
+        if any(word in lowered for word in words):
+            return kind
+    return 'model'
+
+
+def _new_run() -> Dict:
+    return {"seen": [], "pending": []}
+
+
+class ModelLoadTracker(TableIndex):
+    """Model loads per log, extracted incrementally.
+
+    ComfyUI logs "Requested to load <model class>" each time a model has to
+    be moved onto the GPU, followed by "loaded completely" or "loaded
+    partially" once it is there; loaders and custom nodes often log the
+    model file instead. A load of a model already loaded earlier in the same
+    run is a reload: the model was evicted in between. Load times come from
+    an explicit "in N seconds", or from the timestamps on the request and
+    loaded lines when both have one.
+
+    Loads and unloads are rows in the LogTables, so later calls only read
+    and store what was appended; a load still waiting for its "loaded" line
+    is kept in the log's state until it gets one (or is given up on).
+    """
+
+    KIND = 'model_loads'
+    VERSION = MODEL_LOADS_VERSION
+    KEYWORD_RE = KEYWORD_RE
+
+    def new_state(self) -> Dict:
+        # Pending loads: [name, kind, line_number, timestamp, reload, requested_at]
+        return {"runs": 0, "run": _new_run()}
+
+    def extract(self, log_path: str) -> Dict:
+        """Bring the loads for a log up to date and return them (read-only).
+
+        Returns the log's last timestamp, its unloads as [line, timestamp,
+        models_unloaded] and per model its kind and loads as [line_number,
+        timestamp, seconds, reload], in log order.
+        """
+        log_id, state = self.update(log_path)
+
+        def loads():
+            models: Dict[str, Dict] = {}
+            rows = [(name, line_number, timestamp, data)
+                    for name, line_number, timestamp, data in self.tables.rows(log_id, "load")]
+            rows.extend((name, line_number, timestamp, [kind, None, reload])
+                        for name, kind, line_number, timestamp, reload, _ in state["run"]["pending"])
+            for name, line_number, timestamp, (kind, seconds, reload) in sorted(rows, key=lambda row: row[1]):
+                model = models.setdefault(name, {"kind": kind, "loads": []})
+                model["loads"].append([line_number, timestamp, seconds, reload])
+            return {
+                "last_time": state["last_time"],
+                "unloads": [[line_number, timestamp, unloaded]
+                            for _, line_number, timestamp, unloaded in self.tables.rows(log_id, "unload")],
+                "models": models,
+            }
+        return self.remember(log_id, state, loads)
+
+    def process_line(self, state: Dict, rows: List[Row], line: str, start: int, end: int, number: int):
+        run = state["run"]
+        timestamp = state["last_time"]
+        if STARTUP_RE.search(line):
+            # Requests still waiting never got their "loaded" line
+            rows.extend(_load_row(pending, None) for pending in run["pending"])
+            state["runs"] += 1
+            state["run"] = _new_run()
+            return
+
+        m = REQUESTED_RE.search(line)
+        if m:
+            name = m.group(1)
+            # Closed by the next "loaded completely/partially", in request order
+            run["pending"].append([name, model_kind(name), number, timestamp, self._reload(run, name),
+                                   parse_timestamp(line)])
+            if len(run["pending"]) > MAX_PENDING_LOADS:
+                rows.append(_load_row(run["pending"].pop(0), None))
+            return
+
+        if LOADED_RE.search(line):
+            if run["pending"]:
+                pending = run["pending"].pop(0)
+                rows.append(_load_row(pending, self._load_seconds(line, pending[5])))
+            return
+
+        m = UNLOADED_RE.search(line)
+        if m:
+            rows.append(("unload", None, number, timestamp, int(m.group(1))))
+            return
+
+        m = MODEL_FILE_RE.search(line)
+        if m and FILE_LOAD_RE.search(line):
+            name = os.path.basename(m.group(1).replace('\\', '/'))
+            seconds = LOAD_TIME_RE.search(line)
+            rows.append(("load", name, number, timestamp,
+                         [model_kind(m.group(1)), float(seconds.group(1)) if seconds else None,
+                          self._reload(run, name)]))
+
+    @staticmethod
+    def _reload(run: Dict, name: str) -> bool:
+        if name in run["seen"]:
+            return True
+        run["seen"].append(name)
+        return False
+
+    @staticmethod
+    def _load_seconds(line: str, requested_at: Optional[float]) -> Optional[float]:
+        m = LOAD_TIME_RE.search(line)
+        if m:
+            return float(m.group(1))
+        loaded_at = parse_timestamp(line)
+        if requested_at is not None and loaded_at is not None and loaded_at >= requested_at:
+            return loaded_at - requested_at
+        return None
+
+
+def _load_row(pending: List, seconds: Optional[float]) -> Row:
+    name, kind, line_number, timestamp, reload, _ = pending
+    return "load", name, line_number, timestamp, [kind, seconds, reload]
+
+
+def summarize_model(name: str, kind: str, loads: List[List]) -> Dict:
+    """Load counts and the time reloading cost for one model.
+
+    Reloads without a measured time are costed at the model's median
+    measured load time.
+    """
+    timed = sorted(load[2] for load in loads if load[2] is not None)
+    median = percentile(timed, 50)
+    reloads = [load for load in loads if load[3]]
+    measured = sum((load[2] for load in reloads if load[2] is not None), 0.0)
+    unmeasured = sum(1 for load in reloads if load[2] is None)
+    return {
+        "model": name,
+        "kind": kind,
+        "loads": len(loads),
+        "reloads": len(reloads),
+        "median_load_seconds": median,
+        "measured_reload_seconds": measured,
+        "estimated_lost_seconds": measured + (median or 0.0) * unmeasured,
+        "reloads_without_timing": unmeasured if median is None else 0,
+    }
@@ -0,0 +1,142 @@
+"""
+Response pagination for ComfyUI Log Debugger
+Cuts tool results to a byte budget and hands back an opaque cursor for the rest
+"""
+import base64
+import hashlib
+import json
+from itertools import islice
+from typing import Dict, Iterable, Optional, Tuple
+
+from metrics import count, span, tool_labels
+
+# Default budget for one tool response, as serialized JSON
+MAX_RESPONSE_BYTES = 256 * 1024
+# Room kept for the has_more, next_cursor and truncated fields themselves
+PAGE_FIELDS_BYTES = 512
+# Share of a page the fields besides the paged list may take before they are cut down too
+OTHER_FIELDS_SHARE = 0.5
+# Marks where a string was cut short to fit a page
+TRUNCATION_MARK = "..."
+
+
+class CursorError(ValueError):
+    """A cursor that can't be decoded, belongs to another query or to a log that has changed."""
+
+
+def json_size(value) -> int:
+    return len(json.dumps(value, default=str))
+
+
+def query_key(*args) -> str:
+    """Short hash of a tool's arguments, so a cursor is only accepted by the query that made it."""
+    return hashlib.sha1(json.dumps(args, default=str).encode('utf-8')).hexdigest()[:12]
+
+
+def encode_cursor(query: str, **position) -> str:
+    data = json.dumps(dict(position, q=query), separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, query: str) -> Dict:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise CursorError("Invalid cursor; call again without a cursor") from None
+    if not isinstance(data, dict) or data.get("q") != query:
+        raise CursorError("Cursor was issued for a different query; call again without a cursor")
+    return data
+
+
+def items_within(items: Iterable, budget: int) -> Tuple[int, int]:
+    """How many items, from the front, fit in budget bytes of JSON (always at least one), and their bytes."""
+    used = 0
+    number = 0
+    for item in items:
+        size = json_size(item) + 2
+        if used + size > budget and number:
+            break
+        used += size
+        number += 1
+    return number, used
+
+
+def shrink(value, budget: int):
+    """value cut down to at most budget bytes of JSON, as far as it can be.
+
+    Lists keep the items at their front that fit (the first one cut down if
+    even that doesn't), strings keep their start followed by TRUNCATION_MARK
+    and dicts cut down their largest fields first. Numbers, dict keys and
+    the like are left alone, so a tiny budget may still be exceeded.
+    """
+    if json_size(value) <= budget:
+        return value
+    if isinstance(value, str):
+        keep = max(0, budget - 2 - len(TRUNCATION_MARK))
+        while keep and json_size(value[:keep] + TRUNCATION_MARK) > budget:
+            keep = max(0, keep - (json_size(value[:keep] + TRUNCATION_MARK) - budget))
+        return value[:keep] + TRUNCATION_MARK
+    if isinstance(value, list):
+        number, used = items_within(value, budget)
+        if used > budget:
+            return [shrink(value[0], budget - 2)]
+        return value[:number]
+    if isinstance(value, dict):
+        value = dict(value)
+        for field in sorted(value, key=lambda name: json_size(value[name]), reverse=True):
+            excess = json_size(value) - budget
+            if excess <= 0:
+                break
+            value[field] = shrink(value[field], json_size(value[field]) - excess)
+        return value
+    return value
+
+
+def paginate(result: Dict, key: str, query: str, cursor: Optional[str] = None,
+             max_bytes: Optional[int] = MAX_RESPONSE_BYTES) -> Dict:
+    """Cut the list result[key] to the page a cursor points at.
+
+    The page starts where the cursor's page left off (the front without a
+    cursor) and holds as many items as fit in max_bytes together with the
+    rest of result; a falsy max_bytes means no limit. The rest of result
+    may take up to OTHER_FIELDS_SHARE of max_bytes and is shrink()-ed to
+    that if larger, as is an item too large for a page on its own; the
+    fields cut down are listed in truncated. Adds has_more and a
+    next_cursor for the following page. Raises CursorError for a cursor made
+    by a different query. The JSON sizing is timed as serialization in the
+    process metrics, and the page's size counted as response_bytes.
+    """
+    items = result[key]
+    start = decode_cursor(cursor, query).get("index", 0) if cursor else 0
+    fields = dict(result, **{key: []})
+    truncated = []
+    if max_bytes:
+        labels = tool_labels()
+        with span("serialize", **labels):
+            size = json_size(fields)
+            if size > max_bytes * OTHER_FIELDS_SHARE:
+                fields = shrink(fields, int(max_bytes * OTHER_FIELDS_SHARE))
+                truncated = [name for name in result if name != key and fields[name] != result[name]]
+                size = json_size(fields)
+            budget = max_bytes - size - PAGE_FIELDS_BYTES
+            number, used = items_within(islice(items, start, None), budget)
+            page = items[start:start + number]
+            if used > budget:
+                # One item too large for a page of its own
+                page = [shrink(page[0], budget - 2)]
+                used = json_size(page)
+                truncated.append(key)
+        end = start + number
+        count("response_bytes", size + used, **labels)
+    else:
+        end = len(items)
+        page = items[start:end]
+    has_more = end < len(items)
+    fields.update({
+        key: page,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(query, index=end) if has_more else None,
+    })
+    if truncated:
+        fields["truncated"] = truncated
+    return fields
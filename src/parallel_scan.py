@@ -0,0 +1,169 @@
+"""
+Multi-core scanning of large ComfyUI logs
+Splits a memory-mapped log into newline-aligned chunks and scans them in a process pool
+"""
+import mmap
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from cache_store import get_setting
+from cancellation import check_cancelled
+from log_index import count_lines
+from log_scanner import ErrorMatcher, ErrorScan, lines_before, read_raw_lines
+from progress import time_is_up
+
+CHUNK_BYTES = 32 * 1024 * 1024
+PARALLEL_MIN_BYTES = 256 * 1024 * 1024
+# Lines past a chunk boundary searched for a point where neighbouring chunk scans agree
+SYNC_LINES = 10000
+# How often the wait for chunk scans checks whether the call was cancelled or is out of time
+CHECK_SECONDS = 0.25
+
+_worker_matcher: Optional[ErrorMatcher] = None
+
+
+def scan_workers() -> int:
+    """Worker processes for parallel scans (COMFYUI_SCAN_WORKERS, default: CPU count)."""
+    try:
+        return max(1, int(get_setting('COMFYUI_SCAN_WORKERS') or os.cpu_count() or 1))
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+def parallel_cut(log_path: str, start_offset: int, size: int) -> Optional[int]:
+    """Where a parallel scan of [start_offset, size) should hand over to a sequential one.
+
+    Returns a newline-aligned offset about one chunk before the end of the
+    file, leaving the tail (where the last line may still be being written)
+    to the normal streaming scan, or None if the region is too small or only
+    one worker is configured.
+    """
+    threshold = int(get_setting('COMFYUI_PARALLEL_MIN_MB') or PARALLEL_MIN_BYTES // (1024 * 1024)) * 1024 * 1024
+    if size - start_offset < max(threshold, 2 * CHUNK_BYTES) or scan_workers() < 2:
+        return None
+    with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        cut = mm.find(b'\n', size - CHUNK_BYTES, size)
+    return cut + 1 if cut != -1 else None
+
+
+def _matcher(error_patterns: Dict) -> ErrorMatcher:
+    global _worker_matcher
+    if _worker_matcher is None or _worker_matcher.error_patterns != error_patterns:
+        _worker_matcher = ErrorMatcher(error_patterns)
+    return _worker_matcher
+
+
+def _scan_chunk(log_path: str, error_patterns: Dict, context_lines: int,
+                start: int, end: int) -> Tuple[int, List[Dict], List[int], Tuple[int, int, List[str]]]:
+    """Scan one chunk in a worker process, with line numbers relative to the chunk.
+
+    The lines just before the chunk seed the leading context. Returns the
+    chunk's line count, its final error spans, the lines near its start
+    where the scan was clean (see ErrorScan.clean_window) and its resume
+    point, from which the spans running into the next chunk are rescanned.
+    """
+    with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        line_count = count_lines(mm[start:end])
+        before = lines_before(mm, start, context_lines)
+        scan = ErrorScan(read_raw_lines(mm, start, end), _matcher(error_patterns), context_lines,
+                         start_offset=start, start_line=1, before=before, clean_window=(1, SYNC_LINES))
+        errors = list(scan)
+    errors = [error for error in errors if error["end_line"] < scan.resume_line]
+    return line_count, errors, scan.clean_lines, (scan.resume_offset, scan.resume_line, scan.resume_context)
+
+
+def _shift_lines(error: Dict, shift: int) -> Dict:
+    for key in ("line_number", "start_line", "end_line"):
+        error[key] += shift
+    return error
+
+
+def scan_errors_parallel(log_path: str, error_patterns: Dict, context_lines: int,
+                         start_offset: int, end_offset: int, start_line: int = 1,
+                         workers: Optional[int] = None) -> Optional[Tuple[List[Dict], int, int, List[str]]]:
+    """Scan [start_offset, end_offset) of a log across a process pool.
+
+    end_offset must be a line start (see parallel_cut). A traceback or a run
+    of merged errors may cross a chunk boundary, so the end of each chunk is
+    rescanned from its resume point into the next chunk until that reaches
+    a line where the next chunk's own scan was clean too; from there on both
+    agree. Returns the errors in line order and the byte offset, line number
+    and leading context a sequential ErrorScan should carry on from (at or
+    before end_offset). If the call's time is up first, chunks not yet
+    scanned are dropped and the result covers the chunks done in a row from
+    the start, so the sequential scan carries on from the first gap. Returns
+    None if a process pool can't be used here, no chunk was done in time or
+    the chunks can't be joined, so the caller can fall back to scanning
+    sequentially.
+    """
+    workers = workers or scan_workers()
+    with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        bounds = [start_offset]
+        while bounds[-1] + CHUNK_BYTES < end_offset:
+            newline = mm.find(b'\n', bounds[-1] + CHUNK_BYTES, end_offset)
+            if newline == -1 or newline + 1 >= end_offset:
+                break
+            bounds.append(newline + 1)
+        bounds.append(end_offset)
+
+    # Imported here: multiprocessing is only needed for logs this large
+    from concurrent.futures import ProcessPoolExecutor
+    try:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(bounds) - 1))
+        try:
+            futures = [pool.submit(_scan_chunk, log_path, error_patterns, context_lines, start, end)
+                       for start, end in zip(bounds, bounds[1:])]
+            pending = set(futures)
+            while pending and not time_is_up():
+                check_cancelled()
+                _, pending = wait(pending, timeout=CHECK_SECONDS, return_when=FIRST_COMPLETED)
+            results = []
+            for future in futures:
+                if not future.done():
+                    break
+                results.append(future.result())
+        finally:
+            # Chunks not started yet are dropped; running ones end with their chunk
+            pool.shutdown(wait=False, cancel_futures=True)
+    except (OSError, RuntimeError, NotImplementedError) as e:
+        # BrokenProcessPool is a RuntimeError; sandboxes may forbid spawning
+        print(f"Parallel scan unavailable, scanning sequentially: {e}", file=sys.stderr)
+        return None
+    if not results:
+        return None
+
+    errors = []
+    line_base = start_line
+    sync_line = start_line  # errors of the current chunk count from this line on
+    with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i, (line_count, chunk_errors, _, resume) in enumerate(results):
+            resume_offset, resume_line, resume_context = resume
+            resume_line += line_base - 1
+            if resume_line < sync_line:
+                if i < len(results) - 1:
+                    return None
+                # A last chunk of a few lines, which the bridge into it ran past:
+                # hand over at its resume point, keeping what a scan from there won't find again
+                errors = [error for error in errors if error["end_line"] < resume_line]
+                return errors, resume_offset, resume_line, resume_context
+            errors.extend(error for error in (_shift_lines(e, line_base - 1) for e in chunk_errors)
+                          if error["line_number"] >= sync_line)
+            if i == len(results) - 1:
+                return errors, resume_offset, resume_line, resume_context
+
+            next_base = line_base + line_count
+            next_clean = {line + next_base - 1 for line in results[i + 1][2]}
+            raw_lines = islice(read_raw_lines(mm, resume_offset, bounds[i + 2]), next_base - resume_line + SYNC_LINES)
+            # Cut short, the bridge couldn't reach the sync line, and both chunks' work would be lost
+            bridge = ErrorScan(raw_lines, _matcher(error_patterns), context_lines, resume_offset, resume_line,
+                               before=resume_context, clean_window=(next_base, next_base + SYNC_LINES - 1),
+                               stop_in_time=False)
+            bridge_errors = list(bridge)
+            sync_line = next((line for line in bridge.clean_lines if line in next_clean), None)
+            if sync_line is None:
+                return None
+            errors.extend(error for error in bridge_errors if error["line_number"] < sync_line)
+            line_base = next_base
@@ -0,0 +1,182 @@
+"""
+Progress and deadlines for ComfyUI Log Debugger tool calls
+Lets scans report bytes read and errors found, and stop early with partial results once time is up
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, List, Optional, Tuple
+
+PROGRESS_INTERVAL = 0.5  # seconds between progress notifications
+MB = 1024 * 1024
+
+
+class CallProgress:
+    """What the scans of one tool call have read so far, and when they must stop.
+
+    Scans add the bytes they are about to read with expect() and report
+    what they have read with advance(); every PROGRESS_INTERVAL seconds
+    send(progress, total, message) is called with the bytes read, the bytes
+    expected (None once a compressed log, whose size isn't known until it
+    is read, is involved) and a summary with the errors found and an ETA.
+    Scans running in several threads may share one CallProgress.
+    """
+
+    def __init__(self, send: Optional[Callable] = None, deadline: Optional[float] = None):
+        self.send = send
+        self.deadline = deadline  # time.monotonic() at which scans stop, or None
+        self.total = 0
+        self.sized = True
+        self.done = 0
+        self.matches = 0
+        self.cut_short = False
+        self.started = time.monotonic()
+        self._sent = self.started
+        self._lock = threading.Lock()
+
+    def expect(self, count: Optional[int]):
+        with self._lock:
+            if count is None:
+                self.sized = False
+            else:
+                self.total += count
+
+    def advance(self, count: int, matches: int = 0):
+        with self._lock:
+            self.done += count
+            self.matches += matches
+            now = time.monotonic()
+            send = self.send
+            if send is None or now - self._sent < PROGRESS_INTERVAL:
+                return
+            self._sent = now
+            done, total = self.done, max(self.total, self.done) if self.sized else None
+            message = self.message(now)
+        send(done, total, message)
+
+    def message(self, now: float) -> str:
+        if self.sized:
+            message = f"{self.done / MB:.1f} of {max(self.total, self.done) / MB:.1f} MB scanned"
+        else:
+            message = f"{self.done / MB:.1f} MB scanned"
+        if self.matches:
+            message += f", {self.matches} errors so far"
+        elapsed = now - self.started
+        if self.sized and self.done and elapsed > 0:
+            remaining = (self.total - self.done) * elapsed / self.done
+            message += f", about {remaining:.0f}s left"
+        return message
+
+    def forward(self, progress: float, total: Optional[float], message: str):
+        """Pass on a notification made elsewhere, such as by the log daemon."""
+        with self._lock:
+            send = self.send
+        if send is not None:
+            send(progress, total, message)
+
+    def time_is_up(self) -> bool:
+        if self.deadline is None or time.monotonic() < self.deadline:
+            return False
+        self.cut_short = True
+        return True
+
+    def close(self):
+        """Stop sending; scans that outlive their call run on silently."""
+        with self._lock:
+            self.send = None
+
+
+_progress: ContextVar[Optional[CallProgress]] = ContextVar('progress', default=None)
+# Set by cut_short_within(), to tell one of several concurrent scans of a call whether it was cut short
+_cut_here: ContextVar[Optional[List[bool]]] = ContextVar('cut_here', default=None)
+
+
+def track(progress: Optional[CallProgress]):
+    """Make progress the current call's, in this context and copies made from it."""
+    _progress.set(progress)
+
+
+def current_progress() -> Optional[CallProgress]:
+    """The current call's CallProgress, if it has one."""
+    return _progress.get()
+
+
+def expect_bytes(count: Optional[int]):
+    """Add count bytes (None when not known up front) to what the current call will read."""
+    progress = _progress.get()
+    if progress is not None:
+        progress.expect(count)
+
+
+def scanned(count: int, matches: int = 0):
+    """Report count more bytes read and matches more errors found by the current call."""
+    progress = _progress.get()
+    if progress is not None:
+        progress.advance(count, matches)
+
+
+def time_is_up() -> bool:
+    """True once the current call's deadline has passed; the scan that asks should stop there."""
+    progress = _progress.get()
+    if progress is None or not progress.time_is_up():
+        return False
+    cut_here = _cut_here.get()
+    if cut_here is not None:
+        cut_here.append(True)
+    return True
+
+
+def cut_short_within(func: Callable, *args, **kwargs) -> Tuple[Any, bool]:
+    """func's result, and whether a scan inside it stopped early because time was up.
+
+    cut_short() tells the same for the whole call, which may run other
+    scans at the same time.
+    """
+    cut_here: List[bool] = []
+    token = _cut_here.set(cut_here)
+    try:
+        return func(*args, **kwargs), bool(cut_here)
+    finally:
+        _cut_here.reset(token)
+
+
+def forward_progress(progress: float, total: Optional[float], message: str):
+    """Pass a progress notification made elsewhere on to the current call's client."""
+    current = _progress.get()
+    if current is not None:
+        current.forward(progress, total, message)
+
+
+def time_left() -> Optional[float]:
+    """Seconds until the current call's deadline, or None if it has none."""
+    progress = _progress.get()
+    if progress is None or progress.deadline is None:
+        return None
+    return max(0.0, progress.deadline - time.monotonic())
+
+
+def cut_short() -> bool:
+    """True if a scan of the current call stopped early because time was up."""
+    progress = _progress.get()
+    return progress is not None and progress.cut_short
+
+
+@contextmanager
+def time_budget(seconds: Optional[float]):
+    """Bring the current call's deadline forward to seconds from now, for the scans inside."""
+    progress = _progress.get()
+    token = None
+    if progress is None:
+        progress = CallProgress()
+        token = _progress.set(progress)
+    deadline = progress.deadline
+    if seconds:
+        limit = time.monotonic() + seconds
+        progress.deadline = limit if deadline is None else min(deadline, limit)
+    try:
+        yield progress
+    finally:
+        progress.deadline = deadline
+        if token is not None:
+            _progress.reset(token)
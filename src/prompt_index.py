@@ -0,0 +1,169 @@
+"""
+Prompt ID index for ComfyUI logs
+Maps prompt and workflow IDs to the byte ranges of their executions so lookups seek instead of scanning
+"""
+import re
+from typing import Dict, List, Optional
+
+from log_rotation import open_log
+from log_scanner import ErrorMatcher, iter_lines, parse_timestamp, read_raw_lines, trie_regex
+from log_tables import Row, TableIndex
+
+PROMPT_INDEX_VERSION = 2
+
+# Longest stretch of a single execution read back for a timeline
+MAX_RANGE_BYTES = 8 * 1024 * 1024
+
+UUID = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+ID_KEYWORDS = ['got prompt', 'prompt executed', 'prompt_id', 'prompt id', 'promptid', 'workflow_id', 'workflow id']
+# The middle of a UUID: a leading character class would be tried at every byte
+KEYWORD_RE = re.compile((trie_regex(ID_KEYWORDS) + r'|-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-').encode('ascii'))
+
+UUID_RE = re.compile(UUID, re.IGNORECASE)
+# prompt_id=abc, "prompt_id": "abc", workflow id: abc
+NAMED_ID_RE = re.compile(r'''(?:prompt|workflow)[_ ]?id["']?\s*[:=]\s*["']?([\w-]{4,})''', re.IGNORECASE)
+PROMPT_START_RE = re.compile(r'\bgot prompt\b')
+PROMPT_DONE_RE = re.compile(r'Prompt executed in ([\d.]+) seconds')
+PROGRESS_RE = re.compile(r'\d+%\|')
+MODEL_RE = re.compile(r'Requested to load|loaded (?:completely|partially)|Loading \d+ new models?|models? unloaded',
+                      re.IGNORECASE)
+NODE_RE = re.compile(r'\bnode\b|\bexecuting\b', re.IGNORECASE)
+
+
+def ids_in(line: str) -> List[str]:
+    """Prompt/workflow IDs mentioned on a line, lowercased."""
+    found = [m.group(0).lower() for m in UUID_RE.finditer(line)]
+    found.extend(m.group(1).lower() for m in NAMED_ID_RE.finditer(line))
+    return list(dict.fromkeys(found))
+
+
+class PromptIndex(TableIndex):
+    """Inverted index from prompt/workflow IDs to execution byte ranges, per log.
+
+    ComfyUI logs an execution as "got prompt" ... "Prompt executed in N
+    seconds", and IDs show up on lines inside it (from custom nodes, API
+    front-ends or error reports) or on lines of their own. Every ID seen
+    inside an execution is mapped to that execution's byte range, line
+    number and start time; an ID seen outside one maps to its own line.
+
+    The log is read in line-aligned blocks and only lines holding an ID or
+    an execution boundary are decoded, so building the index costs about as
+    much as reading the file. Each mapping is a row in the LogTables, keyed
+    by the ID, so a lookup reads only its own rows; the execution still
+    open is kept in the log's state.
+    """
+
+    KIND = 'prompt_index'
+    VERSION = PROMPT_INDEX_VERSION
+    KEYWORD_RE = KEYWORD_RE
+
+    def new_state(self) -> Dict:
+        return {"open_prompt": None}
+
+    def process_line(self, state: Dict, rows: List[Row], line: str, start: int, end: int, number: int):
+        current = state["open_prompt"]
+
+        if PROMPT_START_RE.search(line):
+            if current:
+                self._close(state, rows, start)
+            state["open_prompt"] = {"offset": start, "line_number": number, "started_at": state["last_time"],
+                                    "ids": ids_in(line)}
+            return
+
+        found = ids_in(line)
+        if current:
+            current["ids"].extend(i for i in found if i not in current["ids"])
+            if PROMPT_DONE_RE.search(line):
+                self._close(state, rows, end)
+        else:
+            rows.extend(("execution", prompt_id, number, state["last_time"], [start, end]) for prompt_id in found)
+
+    @staticmethod
+    def _close(state: Dict, rows: List[Row], end: int):
+        current = state["open_prompt"]
+        rows.extend(("execution", prompt_id, current["line_number"], current["started_at"], [current["offset"], end])
+                    for prompt_id in current["ids"])
+        state["open_prompt"] = None
+
+    def ranges(self, log_path: str, prompt_id: str) -> List[Dict]:
+        """Byte ranges of the executions mentioning prompt_id, including one still running."""
+        log_id, state = self.update(log_path)
+        key = prompt_id.strip().lower()
+        ranges = [{"start": start, "end": end, "line_number": line_number, "started_at": started_at,
+                   "running": False}
+                  for _, line_number, started_at, (start, end) in self.tables.rows(log_id, "execution", key)]
+        current = state["open_prompt"]
+        if current and key in current["ids"]:
+            ranges.append({"start": current["offset"], "end": state["offset"],
+                           "line_number": current["line_number"], "started_at": current["started_at"],
+                           "running": True})
+        return ranges
+
+    def timeline(self, log_path: str, prompt_id: str, max_lines: int = 200,
+                 error_matcher: Optional[ErrorMatcher] = None) -> List[Dict]:
+        """The executions of prompt_id in a log, each with its timeline of log lines.
+
+        An ID mentioned outside any execution gives a one-line "mentioned"
+        entry. Timeline entries have a kind: queued, model, node, progress
+        (a run of progress bar lines collapsed into one entry with a count),
+        error, finished or log. At most max_lines entries are returned in
+        total.
+        """
+        executions = []
+        budget = max_lines
+        # Ranges come in log order, so an archive is read forward once
+        with open_log(log_path) as f:
+            for entry in self.ranges(log_path, prompt_id):
+                line_number, timestamp = entry["line_number"], entry["started_at"]
+                execution = {
+                    "start_line": line_number,
+                    "started_at": timestamp,
+                    "status": "running" if entry["running"] else "unknown",
+                    "timeline": [],
+                }
+                queued = False
+                raw_lines = read_raw_lines(f, entry["start"], min(entry["end"], entry["start"] + MAX_RANGE_BYTES))
+                for _, line in iter_lines(raw_lines, entry["start"]):
+                    text = line.strip()
+                    timestamp = parse_timestamp(line) or timestamp
+                    item = self._timeline_item(text, error_matcher)
+                    item.update(line_number=line_number, timestamp=timestamp)
+                    line_number += 1
+
+                    timeline = execution["timeline"]
+                    queued = queued or item["kind"] == "queued"
+                    if item["kind"] == "error" and execution["status"] != "finished":
+                        execution["status"] = "error"
+                    if item["kind"] == "finished":
+                        execution["execution_seconds"] = item["execution_seconds"]
+                        if execution["status"] != "error":
+                            execution["status"] = "finished"
+                    if item["kind"] == "progress" and timeline and timeline[-1]["kind"] == "progress":
+                        timeline[-1].update(text=text, count=timeline[-1]["count"] + 1)
+                        continue
+                    if budget > 0:
+                        timeline.append(item)
+                        budget -= 1
+                if execution["status"] == "unknown" and not queued:
+                    execution["status"] = "mentioned"
+                execution["end_line"] = line_number - 1
+                executions.append(execution)
+        return executions
+
+    @staticmethod
+    def _timeline_item(text: str, error_matcher: Optional[ErrorMatcher]) -> Dict:
+        if PROMPT_START_RE.search(text):
+            return {"kind": "queued", "text": text}
+        m = PROMPT_DONE_RE.search(text)
+        if m:
+            return {"kind": "finished", "text": text, "execution_seconds": float(m.group(1))}
+        error_types = error_matcher.match(text) if error_matcher else []
+        if error_types:
+            return {"kind": "error", "text": text, "error_types": error_types}
+        if PROGRESS_RE.search(text):
+            return {"kind": "progress", "text": text, "count": 1}
+        if MODEL_RE.search(text):
+            return {"kind": "model", "text": text}
+        if NODE_RE.search(text):
+            return {"kind": "node", "text": text}
+        return {"kind": "log", "text": text}
@@ -0,0 +1,65 @@
+"""
+Persisted find_errors checkpoints for ComfyUI logs
+Remembers how far each log has been scanned so repeat calls only read appended bytes
+"""
+import os
+from typing import Dict, List, Optional, Tuple
+
+from cache_store import read_identity
+from log_tables import LogTables
+from metrics import count
+
+CHECKPOINT_VERSION = 3
+
+
+class CheckpointStore:
+    """find_errors progress per log file, kept in the LogTables.
+
+    A checkpoint records the file identity (path, inode, size, head hash), the
+    byte offset and line number the next scan resumes from and the lines of
+    leading context before that point; the errors found before it are rows,
+    so saving a checkpoint only stores the errors the last scan added. It
+    only applies to the same context_lines and error patterns it was made
+    with, and is dropped once the log is rotated, truncated or rewritten.
+    The errors last loaded or saved are also kept in memory.
+    """
+
+    def __init__(self, tables: LogTables):
+        self.tables = tables
+        self._errors: Dict[str, Tuple[int, int, List[Dict]]] = {}  # path -> (log id, offset, errors)
+
+    def load(self, log_path: str, context_lines: int, patterns_key: str) -> Optional[Dict]:
+        path = os.path.abspath(log_path)
+        saved = self.tables.load('checkpoints', path, CHECKPOINT_VERSION)
+        if saved is None:
+            return None
+        log_id, checkpoint = saved
+        if checkpoint["context_lines"] != context_lines or checkpoint["patterns_key"] != patterns_key:
+            count("cache_misses", cache="checkpoints")
+            return None
+        cached = self._errors.get(path)
+        if cached is not None and cached[:2] == (log_id, checkpoint["offset"]):
+            errors = cached[2]
+        else:
+            errors = [error for _, _, _, error in self.tables.rows(log_id, "error")]
+            self._errors[path] = (log_id, checkpoint["offset"], errors)
+        return dict(checkpoint, id=log_id, errors=errors)
+
+    def save(self, log_path: str, checkpoint: Optional[Dict], context_lines: int, patterns_key: str,
+             identity: Dict, offset: int, line_number: int, context: List[str], errors: List[Dict]):
+        """Move on from checkpoint (as loaded, or None to start over) to offset, adding errors found since."""
+        path = os.path.abspath(log_path)
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "identity": read_identity(identity, offset),
+            "context_lines": context_lines,
+            "patterns_key": patterns_key,
+            "offset": offset,
+            "line_number": line_number,
+            "context": context,
+        }
+        rows = [("error", None, error["start_line"], None, error) for error in errors]
+        log_id = self.tables.save('checkpoints', path, state, rows, checkpoint and checkpoint["id"],
+                                  checkpoint["offset"] if checkpoint else 0)
+        if log_id is not None:
+            self._errors[path] = (log_id, offset, (checkpoint["errors"] if checkpoint else []) + errors)
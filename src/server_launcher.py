@@ -24,7 +24,7 @@ def check_and_install_dependencies():
             # Install minimal dependencies
             subprocess.check_call([
                 sys.executable, '-m', 'pip', 'install', 
-                'fastmcp>=2.9.0', 'python-dotenv', 'aiofiles', 'psutil',
+                'fastmcp>=2.9.0', 'python-dotenv', 'aiofiles', 'psutil', 'zstandard',
                 '--target', lib_dir,
                 '--quiet', '--disable-pip-version-check'
             ])
@@ -7,10 +7,208 @@ import json
 import subprocess
 import platform
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import Iterator, List, Set, Dict, Optional, Tuple
 import time
 import sys
 
+from cache_store import get_setting, load_json, save_json
+from metrics import count, span
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Common log patterns, matched in an installation and its logs/ subdirectory, with rotated
+# segments (comfyui.log.1, comfyui.log.2024-06-15.gz) and compressed archives
+LOG_PATTERNS = ['*.log', '*.log.[0-9]*', '*.log.gz', '*.log.zst',
+                'console.txt', 'output.txt', 'stderr.txt', 'stdout.txt']
+
+DEFAULT_CACHE_TTL = 300
+PROCESS_CHECK_INTERVAL = 5
+# Launchers that run ComfyUI without naming its main.py (comfy-cli, pip installs)
+COMFYUI_COMMANDS = ('comfy', 'comfy.exe', 'comfyui', 'comfyui.exe')
+
+
+def iter_python_processes() -> Optional[Iterator[Tuple[int, List[str], Optional[str]]]]:
+    """Yield (pid, cmdline, cwd) for running Python processes without forking.
+
+    Uses psutil when installed and reads /proc directly on Linux otherwise.
+    cwd is None when it can't be read (another user's process, for example).
+    Returns None if neither is available.
+    """
+    if psutil is not None:
+        return _iter_psutil_processes()
+    if os.path.isdir('/proc'):
+        return _iter_proc_processes()
+    return None
+
+
+def _iter_psutil_processes():
+    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
+        info = proc.info
+        if 'python' in (info.get('name') or '').lower() and info.get('cmdline'):
+            yield info['pid'], info['cmdline'], info.get('cwd')
+
+
+def _iter_proc_processes():
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/comm', 'r') as f:
+                if 'python' not in f.read().lower():
+                    continue
+            with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                cmdline = [arg.decode('utf-8', errors='ignore') for arg in f.read().split(b'\0') if arg]
+        except OSError:
+            continue
+        try:
+            cwd = os.readlink(f'/proc/{entry}/cwd')
+        except OSError:
+            cwd = None
+        if cmdline:
+            yield int(entry), cmdline, cwd
+
+
+def looks_like_comfyui(cmdline: List[str]) -> bool:
+    """Whether a Python command line runs ComfyUI: its main.py, or the comfy / comfyui launchers."""
+    for arg in cmdline[1:]:
+        name = os.path.basename(arg).lower()
+        if name == 'main.py' or name in COMFYUI_COMMANDS:
+            return True
+    return False
+
+
+def _parent_pid(pid: int) -> Optional[int]:
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).ppid()
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            # The command name in parentheses may itself hold spaces
+            return int(f.read().rsplit(')', 1)[1].split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def is_descendant(pid: int, ancestor: int) -> bool:
+    """Whether a process was started, directly or not, by ancestor."""
+    for _ in range(64):
+        pid = _parent_pid(pid)
+        if pid is None or pid <= 1:
+            return False
+        if pid == ancestor:
+            return True
+    return False
+
+
+@span("discovery.process_table")
+def process_table_key() -> Optional[List[int]]:
+    """Cheap fingerprint of the running ComfyUI processes, or None if unavailable.
+
+    The PIDs of Python processes whose command line looks like ComfyUI,
+    leaving out this server and the processes it started (scan workers,
+    the log daemon), which come and go without ComfyUI starting or
+    stopping. Without psutil or /proc the discovery cache relies on its
+    TTL to notice ComfyUI starting or stopping.
+    """
+    processes = iter_python_processes()
+    if processes is None:
+        return None
+    me = os.getpid()
+    return sorted(pid for pid, cmdline, _ in processes
+                  if pid != me and looks_like_comfyui(cmdline) and not is_descendant(pid, me))
+
+
+class DiscoveryCache:
+    """Discovery results kept between calls, in memory and optionally on disk.
+
+    A cached result is reused until its TTL (COMFYUI_DISCOVERY_TTL seconds)
+    expires, the .env file or any known path, installation or logs/
+    directory changes mtime (a log was created, deleted or renamed), or the set of running
+    ComfyUI processes changes (see process_table_key). The process table is only re-read every
+    PROCESS_CHECK_INTERVAL seconds, so most hits cost a handful of stat()
+    calls. Set COMFYUI_DISCOVERY_CACHE to a file path to persist results for
+    new sessions.
+    """
+
+    def __init__(self):
+        self.entry = None
+        self.checked_processes_at = 0.0
+
+    @staticmethod
+    def ttl() -> float:
+        try:
+            return float(get_setting('COMFYUI_DISCOVERY_TTL') or DEFAULT_CACHE_TTL)
+        except ValueError:
+            return DEFAULT_CACHE_TTL
+
+    @staticmethod
+    def watched_paths(installations: List[str]) -> List[str]:
+        paths = [str(Path(__file__).parent.parent / '.env')]
+        for installation in installations:
+            paths.append(installation)
+            paths.append(os.path.join(installation, 'logs'))
+        return paths
+
+    @staticmethod
+    def path_mtimes(paths: List[str]) -> Dict[str, Optional[float]]:
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+
+    def get(self) -> Optional[Dict]:
+        entry = self.entry
+        if entry is None:
+            cache_file = get_setting('COMFYUI_DISCOVERY_CACHE')
+            entry = load_json(cache_file) if cache_file else None
+            if entry is None:
+                return None
+            self.checked_processes_at = 0.0
+
+        now = time.time()
+        if now - entry['created'] > self.ttl():
+            return None
+        if self.path_mtimes(list(entry['mtimes'])) != entry['mtimes']:
+            return None
+        if now - self.checked_processes_at > PROCESS_CHECK_INTERVAL:
+            if process_table_key() != entry['process_key']:
+                return None
+            self.checked_processes_at = now
+
+        self.entry = entry
+        result = dict(entry['result'])
+        # Logs are appended to constantly, so refresh the newest-first order
+        result['log_files'] = sorted(result['log_files'],
+                                     key=lambda x: os.path.getmtime(x) if os.path.exists(x) else 0,
+                                     reverse=True)
+        result['cached'] = True
+        return result
+
+    def put(self, result: Dict, process_key: Optional[List[int]], known_paths: List[str]):
+        installations = sorted(set(result['installations']) | set(known_paths))
+        self.entry = {
+            'created': time.time(),
+            'mtimes': self.path_mtimes(self.watched_paths(installations)),
+            'process_key': process_key,
+            'result': result,
+        }
+        self.checked_processes_at = time.time()
+        cache_file = get_setting('COMFYUI_DISCOVERY_CACHE')
+        if cache_file:
+            save_json(cache_file, self.entry)
+
+
+_discovery_cache = DiscoveryCache()
+
+
 class SimpleActiveDiscovery:
     def __init__(self):
         # Load known paths from .env
@@ -34,55 +232,77 @@ class SimpleActiveDiscovery:
                 
         return paths
     
+    @span("discovery.processes")
     def find_active_comfyui(self) -> Set[str]:
         """Find actively running ComfyUI processes"""
         active = set()
-        
+
         try:
-            if platform.system() == "Windows":
-                # Use tasklist to find Python processes (skip /V for speed)
-                cmd = ['tasklist', '/FO', 'CSV']
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                
-                # Also try wmic for more detail
-                wmic_cmd = 'wmic process where "name=\'python.exe\'" get ProcessId,CommandLine /format:csv'
+            processes = iter_python_processes()
+            if processes is None:
+                return self._find_active_by_shell()
+
+            for pid, cmdline, cwd in processes:
+                script = next((arg for arg in cmdline[1:] if os.path.basename(arg) == 'main.py'), None)
+                if script is None:
+                    continue
+                path = Path(script)
+                if not path.is_absolute():
+                    if cwd is None:
+                        continue
+                    # "python main.py" started from inside the installation
+                    path = Path(cwd) / path
+                path = path.parent
+                is_server = '--listen' in cmdline or '--port' in cmdline
+                if path.exists() and (is_server or self.verify_installation(str(path))):
+                    active.add(str(path.resolve()))
+                    print(f"   [ACTIVE] Found running ComfyUI: {path} (pid {pid})", file=sys.stderr)
+        except Exception as e:
+            print(f"   Error checking processes: {e}", file=sys.stderr)
+
+        return active
+
+    def _find_active_by_shell(self) -> Set[str]:
+        """Fallback for systems with neither psutil nor /proc: parse wmic / ps output"""
+        active = set()
+
+        if platform.system() == "Windows":
+            wmic_cmd = 'wmic process where "name=\'python.exe\'" get ProcessId,CommandLine /format:csv'
+            with span("subprocess", command="wmic"):
                 wmic_result = subprocess.run(wmic_cmd, shell=True, capture_output=True, text=True, timeout=5)
-                
-                # Parse wmic output
-                for line in wmic_result.stdout.splitlines():
-                    if 'main.py' in line and ('--listen' in line or '--port' in line):
-                        # This is likely ComfyUI
-                        # Extract the directory
-                        parts = line.split('"')
-                        for i, part in enumerate(parts):
-                            if 'python.exe' in part.lower() and i+1 < len(parts):
-                                # Next part might be the script
-                                script = parts[i+1].strip()
-                                if 'main.py' in script:
-                                    path = Path(script).parent
-                                    if path.exists():
-                                        active.add(str(path.resolve()))
-                                        # Log to stderr for debugging
-                                        print(f"   [ACTIVE] Found running ComfyUI: {path}", file=sys.stderr)
-                                        break
-            else:
-                # Unix-like systems
-                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-                for line in result.stdout.splitlines():
-                    if 'python' in line and 'main.py' in line and ('--listen' in line or '--port' in line):
-                        parts = line.split()
-                        for part in parts:
-                            if 'main.py' in part:
-                                path = Path(part).parent
+
+            # Parse wmic output
+            for line in wmic_result.stdout.splitlines():
+                if 'main.py' in line and ('--listen' in line or '--port' in line):
+                    # This is likely ComfyUI
+                    # Extract the directory
+                    parts = line.split('"')
+                    for i, part in enumerate(parts):
+                        if 'python.exe' in part.lower() and i+1 < len(parts):
+                            # Next part might be the script
+                            script = parts[i+1].strip()
+                            if 'main.py' in script:
+                                path = Path(script).parent
                                 if path.exists():
                                     active.add(str(path.resolve()))
-                                    print(f"   [ACTIVE] Found running ComfyUI: {path}")
+                                    print(f"   [ACTIVE] Found running ComfyUI: {path}", file=sys.stderr)
                                     break
-        except Exception as e:
-            print(f"   Error checking processes: {e}", file=sys.stderr)
-            
+        else:
+            with span("subprocess", command="ps"):
+                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True, timeout=5)
+            for line in result.stdout.splitlines():
+                if 'python' in line and 'main.py' in line and ('--listen' in line or '--port' in line):
+                    parts = line.split()
+                    for part in parts:
+                        if 'main.py' in part:
+                            path = Path(part).parent
+                            if path.exists():
+                                active.add(str(path.resolve()))
+                                print(f"   [ACTIVE] Found running ComfyUI: {path}", file=sys.stderr)
+                                break
+
         return active
-    
+
     def verify_installation(self, path: str) -> bool:
         """Verify if a path is a valid ComfyUI installation"""
         required_files = ['main.py', 'nodes.py', 'execution.py']
@@ -98,15 +318,14 @@ class SimpleActiveDiscovery:
                 
         return found >= 2  # At least 2 out of 3 required files
     
-    def find_log_files(self, installation: str) -> List[str]:
+    @staticmethod
+    @span("discovery.log_files")
+    def find_log_files(installation: str) -> List[str]:
         """Find log files in a ComfyUI installation"""
         logs = []
         path = Path(installation)
         
-        # Common log patterns
-        patterns = ['*.log', 'console.txt', 'output.txt', 'stderr.txt', 'stdout.txt']
-        
-        for pattern in patterns:
+        for pattern in LOG_PATTERNS:
             for log in path.glob(pattern):
                 if log.is_file():
                     logs.append(str(log))
@@ -114,13 +333,14 @@ class SimpleActiveDiscovery:
         # Also check logs subdirectory
         logs_dir = path / 'logs'
         if logs_dir.exists():
-            for pattern in patterns:
+            for pattern in LOG_PATTERNS:
                 for log in logs_dir.glob(pattern):
                     if log.is_file():
                         logs.append(str(log))
                         
         return logs
     
+    @span("discovery")
     def discover(self) -> Dict:
         """Simple discovery focusing on active and known installations"""
         # Log to stderr instead of stdout
@@ -177,10 +397,20 @@ class SimpleActiveDiscovery:
         }
 
 
-def simple_discover_all() -> Dict:
-    """Main entry point for simple discovery"""
+def simple_discover_all(refresh: bool = False) -> Dict:
+    """Main entry point for simple discovery, served from the cache when still valid"""
+    if not refresh:
+        cached = _discovery_cache.get()
+        if cached is not None:
+            count("cache_hits", cache="discovery")
+            return cached
+        count("cache_misses", cache="discovery")
+
+    process_key = process_table_key()
     discovery = SimpleActiveDiscovery()
-    return discovery.discover()
+    result = discovery.discover()
+    _discovery_cache.put(result, process_key, discovery.known_paths)
+    return result
 
 
 if __name__ == '__main__':
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """
 Standalone MCP server for ComfyUI Log Debugger
+FastMCP is imported in main(); the debugger, discovery, the
+inventory watcher and log reading wait for the first tool call
 """
 
 import sys
 import os
-import subprocess
+import importlib.util
 import traceback
 
 # Enable debug logging to stderr
@@ -28,15 +30,16 @@ sys.path.insert(0, current_dir)
 lib_dir = os.path.join(current_dir, 'lib')
 fastmcp_path = os.path.join(lib_dir, 'fastmcp')
 
-if not os.path.exists(fastmcp_path):
+if not os.path.exists(fastmcp_path) and importlib.util.find_spec('fastmcp') is None:
     debug_log("Dependencies not found, installing...")
     os.makedirs(lib_dir, exist_ok=True)
     
     try:
+        import subprocess
         # Install minimal dependencies
         cmd = [
             sys.executable, '-m', 'pip', 'install', 
-            'fastmcp>=2.9.0', 'python-dotenv', 'aiofiles', 'psutil',
+            'fastmcp>=2.9.0', 'python-dotenv', 'aiofiles', 'psutil', 'zstandard',
             '--target', lib_dir,
             '--quiet', '--disable-pip-version-check'
         ]
@@ -68,42 +71,71 @@ if os.path.exists(lib_dir):
     sys.path.insert(0, lib_dir)
     debug_log(f"Added to path: {lib_dir}")
 
-# Try to import FastMCP
-try:
-    debug_log("Importing FastMCP...")
-    from fastmcp import FastMCP
-    debug_log("FastMCP imported successfully")
-except ImportError as e:
-    debug_log(f"Error importing FastMCP: {e}")
-    debug_log(f"Python path: {sys.path}")
-    debug_log(f"Lib directory contents: {os.listdir(lib_dir) if os.path.exists(lib_dir) else 'Does not exist'}")
-    sys.exit(1)
-
-# Import debugger server
-try:
-    debug_log("Importing debugger_server...")
+def load_tools():
+    """The debugger's tools, run by a ToolRunner, by name; imported and created for the first tool call."""
+    from cache_store import get_setting
     from debugger_server import ComfyUILogDebugger
-    debug_log("debugger_server imported successfully")
-except Exception as e:
-    debug_log(f"Error importing debugger_server: {e}")
-    debug_log(traceback.format_exc())
-    sys.exit(1)
+    from metrics import start_dumping
+    from tool_names import TOOL_NAMES
+    from tool_runner import ToolRunner
+
+    # The inventory watcher starts with the first tool call that lists logs
+    debugger = ComfyUILogDebugger(watch_inventory=get_setting('COMFYUI_WATCH', 'true').lower() != 'false')
+    backend = debugger
+    if get_setting('COMFYUI_DAEMON', 'false').lower() == 'true':
+        # Proxy to the shared log daemon, started with the first tool call;
+        # the local debugger only runs tools if the daemon can't be reached
+        from log_daemon import DaemonClient
+        backend = DaemonClient(fallback=debugger)
+        debug_log("Tool calls go to the shared log daemon")
+    else:
+        # With the daemon, its metrics are the ones that count and it writes them itself
+        start_dumping()
+
+    # The tools run in the runner's thread pool, so a long scan doesn't
+    # block other calls or cancellation
+    runner = ToolRunner()
+    return {name: runner.tool(getattr(backend, name)) for name in TOOL_NAMES}
+
 
 def main():
+    # Try to import FastMCP
+    try:
+        debug_log("Importing FastMCP...")
+        from fastmcp import FastMCP
+        debug_log("FastMCP imported successfully")
+    except ImportError as e:
+        debug_log(f"Error importing FastMCP: {e}")
+        debug_log(f"Python path: {sys.path}")
+        debug_log(f"Lib directory contents: {os.listdir(lib_dir) if os.path.exists(lib_dir) else 'Does not exist'}")
+        sys.exit(1)
+
+    tools = {}
+
+    async def call(name, **arguments):
+        if not tools:
+            try:
+                debug_log("Importing debugger_server for the first tool call...")
+                tools.update(load_tools())
+                debug_log("debugger_server imported successfully")
+            except Exception as e:
+                debug_log(f"Error importing debugger_server: {e}")
+                debug_log(traceback.format_exc())
+                return {"error": f"Could not load the log debugger: {e}"}
+        return await tools[name](**arguments)
+
     try:
         debug_log("Creating MCP server...")
         # Create the MCP server
         mcp = FastMCP("Comfy Guru")
-        debugger = ComfyUILogDebugger()
-        
+
         debug_log("Registering tools...")
-        # Register the debugger methods as tools
-        mcp.tool()(debugger.get_logs)
-        mcp.tool()(debugger.find_errors) 
-        mcp.tool()(debugger.tail_log)
-        mcp.tool()(debugger.monitor_gpu_memory_warnings)
-        mcp.tool()(debugger.find_workflow_by_id)
-        
+        # Stubs with the tools' signatures and docstrings, read without importing
+        # the debugger; it is imported and created with the first tool call
+        from tool_names import tool_stubs
+        for stub in tool_stubs(call):
+            mcp.tool()(stub)
+
         debug_log("Starting server with stdio transport...")
         # Run the server
         mcp.run()
@@ -0,0 +1,80 @@
+"""
+MCP tool names and signatures for ComfyUI Log Debugger
+Reads the tools' signatures and docstrings from debugger_server.py's source, so a server can list them before importing it
+"""
+import ast
+import builtins
+import importlib
+import inspect
+import os
+from typing import Any, Awaitable, Callable, Dict, List
+
+# The ComfyUILogDebugger methods served as MCP tools, in the order they are listed
+TOOL_NAMES = (
+    "get_logs",
+    "find_errors",
+    "find_errors_all",
+    "query_log",
+    "tail_log",
+    "monitor_gpu_memory_warnings",
+    "analyze_execution_times",
+    "analyze_model_loads",
+    "find_workflow_by_id",
+    "get_metrics",
+)
+
+DEBUGGER_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'debugger_server.py')
+
+
+def _value(node: ast.expr, imported: Dict[str, str]) -> Any:
+    """A default or annotation: a literal, a builtin, or a constant imported by debugger_server."""
+    if isinstance(node, ast.Name):
+        if hasattr(builtins, node.id):
+            return getattr(builtins, node.id)
+        return getattr(importlib.import_module(imported[node.id]), node.id)
+    return ast.literal_eval(node)
+
+
+def _signature(method: ast.FunctionDef, imported: Dict[str, str]) -> inspect.Signature:
+    args = method.args
+    # Defaults belong to the last parameters; self is dropped
+    defaults = [inspect.Parameter.empty] * (len(args.args) - len(args.defaults)) + list(args.defaults)
+    parameters = []
+    for arg, default in list(zip(args.args, defaults))[1:]:
+        parameters.append(inspect.Parameter(
+            arg.arg, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=default if default is inspect.Parameter.empty else _value(default, imported),
+            annotation=inspect.Parameter.empty if arg.annotation is None else _value(arg.annotation, imported)))
+    return inspect.Signature(parameters)
+
+
+def tool_stubs(call: Callable[..., Awaitable]) -> List[Callable]:
+    """An async function per tool, in TOOL_NAMES order, that awaits call(name, **arguments).
+
+    Each has the name, signature and docstring of the ComfyUILogDebugger
+    method, read from debugger_server.py without importing it (or the log
+    scanners, SQLite and process pools it brings in), so an MCP server can
+    list its tools at once and load the debugger with the first call.
+    """
+    with open(DEBUGGER_SOURCE, encoding='utf-8') as f:
+        module = ast.parse(f.read(), DEBUGGER_SOURCE)
+    imported = {alias.asname or alias.name: node.module for node in module.body
+                if isinstance(node, ast.ImportFrom) for alias in node.names}
+    debugger = next(node for node in module.body
+                    if isinstance(node, ast.ClassDef) and node.name == 'ComfyUILogDebugger')
+    methods = {node.name: node for node in debugger.body
+               if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+
+    return [_stub(name, _signature(methods[name], imported), ast.get_docstring(methods[name], clean=False), call)
+            for name in TOOL_NAMES]
+
+
+def _stub(name: str, signature: inspect.Signature, doc: str, call: Callable[..., Awaitable]) -> Callable:
+    async def tool(**arguments):
+        return await call(name, **arguments)
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = doc
+    tool.__signature__ = signature
+    tool.__annotations__ = {parameter.name: parameter.annotation for parameter in signature.parameters.values()
+                            if parameter.annotation is not inspect.Parameter.empty}
+    return tool
@@ -0,0 +1,116 @@
+"""
+Off-loop tool execution for the MCP server
+Runs the debugger's blocking tools in a bounded thread pool with per-call timeouts and cancellation
+"""
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from cache_store import get_setting
+from cancellation import run_cancellable
+from metrics import count, measure_tool
+from progress import CallProgress, track
+
+DEFAULT_MAX_CONCURRENT = 4
+DEFAULT_TIMEOUT_SECONDS = 120.0
+# Scans stop and return what they have found once this much of the timeout has passed
+PARTIAL_RESULTS_AT = 0.9
+
+
+def max_concurrent_tools() -> int:
+    """Tool calls run at once (COMFYUI_MAX_CONCURRENT_TOOLS, default 4)."""
+    try:
+        return max(1, int(get_setting('COMFYUI_MAX_CONCURRENT_TOOLS') or DEFAULT_MAX_CONCURRENT))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENT
+
+
+def tool_timeout() -> float:
+    """Seconds a tool call may take (COMFYUI_TOOL_TIMEOUT, default 120; 0 for no limit)."""
+    try:
+        return max(0.0, float(get_setting('COMFYUI_TOOL_TIMEOUT') or DEFAULT_TIMEOUT_SECONDS))
+    except ValueError:
+        return DEFAULT_TIMEOUT_SECONDS
+
+
+def _progress_sender() -> Optional[Callable]:
+    """A thread-safe send(progress, total, message) for the MCP request being handled, if any."""
+    try:
+        from fastmcp.server.dependencies import get_context
+        request = get_context()
+    except (ImportError, RuntimeError):
+        return None
+    loop = asyncio.get_running_loop()
+
+    def send(progress, total, message):
+        # Only sent if the client asked for progress with a progressToken
+        asyncio.run_coroutine_threadsafe(request.report_progress(progress, total, message), loop)
+    return send
+
+
+class ToolRunner:
+    """Turns blocking debugger methods into async MCP tools.
+
+    Each call runs in a pool of max_concurrent threads, so the stdio server
+    keeps reading requests (and cancellations) while scans and discovery
+    run, and at most max_concurrent of them run at once; the rest wait for
+    a thread. A call that the client cancels or that takes longer than
+    timeout seconds is abandoned: if it is still waiting it never starts,
+    and if it is running, its scan stops at the next check_cancelled().
+    A timed out call returns an error result; a cancelled one is cancelled.
+
+    Scans report their progress to the client as MCP progress
+    notifications, and once PARTIAL_RESULTS_AT of the timeout has passed
+    they stop, so the tool can return what it has found before the call
+    times out. Blocking calls are timed in the process metrics.
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None, timeout: Optional[float] = None):
+        self.max_concurrent = max_concurrent or max_concurrent_tools()
+        self.timeout = tool_timeout() if timeout is None else timeout
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="comfy-guru-tool")
+
+    def tool(self, method: Callable) -> Callable:
+        """An async tool function for method, with its name, signature and docstring."""
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def call(*args, **kwargs):
+                return await self._limit(method.__name__, method(*args, **kwargs))
+        else:
+            @functools.wraps(method)
+            async def call(*args, **kwargs):
+                return await self.run(method, *args, **kwargs)
+        return call
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run a blocking func in the pool and wait for it, within the timeout."""
+        cancelled = threading.Event()
+        deadline = time.monotonic() + self.timeout * PARTIAL_RESULTS_AT if self.timeout else None
+        progress = CallProgress(_progress_sender(), deadline)
+        context = contextvars.copy_context()
+        context.run(track, progress)
+        future = self.executor.submit(context.run, run_cancellable, cancelled, measure_tool, func.__name__, func,
+                                      *args, **kwargs)
+        try:
+            return await self._limit(func.__name__, asyncio.wrap_future(future))
+        finally:
+            progress.close()
+            if not future.done():
+                future.cancel()
+                cancelled.set()
+
+    async def _limit(self, name: str, awaitable):
+        try:
+            return await asyncio.wait_for(awaitable, self.timeout or None)
+        except asyncio.TimeoutError:
+            count("tool_timeouts", tool=name)
+            return {"error": f"{name} timed out after {self.timeout:g} seconds; "
+                             f"narrow it down (last_minutes, log_path) or raise COMFYUI_TOOL_TIMEOUT"}
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
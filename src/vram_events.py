@@ -0,0 +1,331 @@
+"""
+GPU memory event extraction for ComfyUI logs
+Streams OOMs, partial loads, lowvram/offload and free-VRAM lines into events and per-run pressure series
+"""
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+from log_scanner import TIMESTAMP_RE, timestamp_from_match, trie_regex
+from log_tables import Row, TableIndex
+
+VRAM_EVENTS_VERSION = 2
+
+# Byte multipliers. ComfyUI's "MB" is MiB (it divides by 1024 * 1024), so
+# decimal-looking units are read as binary ones too.
+UNITS = {
+    'b': 1,
+    'kb': 1024, 'kib': 1024,
+    'mb': 1024 ** 2, 'mib': 1024 ** 2,
+    'gb': 1024 ** 3, 'gib': 1024 ** 3,
+    'tb': 1024 ** 4, 'tib': 1024 ** 4,
+}
+
+# Memory pressure levels, from a model fitting in VRAM to running out of it
+PRESSURE_NONE = 0
+PRESSURE_OFFLOAD = 1
+PRESSURE_LOWVRAM = 2
+PRESSURE_OOM = 3
+
+SIZE = r'([\d.]+)\s*([KMGT]i?B|B)\b'
+
+OOM_RE = re.compile(r'out of memory|OutOfMemoryError|Allocation on device|\bOOM\b', re.IGNORECASE)
+OOM_TRIED_RE = re.compile(r'Tried to allocate ' + SIZE, re.IGNORECASE)
+OOM_TOTAL_RE = re.compile(SIZE + r' total capacity|total capacity of ' + SIZE, re.IGNORECASE)
+OOM_FREE_RE = re.compile(SIZE + r' free\b|of which ' + SIZE + r' is free', re.IGNORECASE)
+OOM_ALLOCATED_RE = re.compile(SIZE + r' already allocated|' + SIZE + r' is allocated by PyTorch',
+                              re.IGNORECASE)
+LOADED_RE = re.compile(r'loaded (partially|completely);?\s+([\d.]+)\s+([\d.]+)', re.IGNORECASE)
+VRAM_STATE_RE = re.compile(r'Set vram state to:\s*(\w+)', re.IGNORECASE)
+LOWVRAM_RE = re.compile(r'\blow_?vram\b|\bno_vram\b', re.IGNORECASE)
+UNLOADED_RE = re.compile(r'(\d+) models? unloaded', re.IGNORECASE)
+OFFLOAD_RE = re.compile(r'\boffload(?:ing|ed)?\b|unloading models', re.IGNORECASE)
+VRAM_FREE_RE = re.compile(r'(?:free vram|vram free|free memory)[\s:=]+([\d.]+)\s*([KMGT]i?B)?', re.IGNORECASE)
+TOTAL_VRAM_RE = re.compile(r'Total VRAM\s+([\d.]+)\s*([KMGT]i?B)', re.IGNORECASE)
+STARTUP_RE = re.compile(r'ComfyUI startup time')
+PROMPT_START_RE = re.compile(r'\bgot prompt\b')
+PROMPT_DONE_RE = re.compile(r'Prompt executed in ([\d.]+) seconds')
+
+# One OOM is reported by several lines (the exception, the end of its
+# traceback, ComfyUI unloading models); those within this many lines merge
+OOM_MERGE_LINES = 100
+# Most points of a run's pressure series returned; longer ones keep the peak of each stretch
+MAX_SERIES_POINTS = 100
+# Most prompts under memory pressure returned per run, the newest
+MAX_PRESSURED_PROMPTS = 10
+
+# Lowercase words at least one of which is on every line the patterns above
+# can match; blocks of the log are searched for these before any line is decoded
+KEYWORDS = ['memory', 'alloc', 'oom', 'loaded', 'vram', 'offload', 'unload',
+            'startup time', 'got prompt', 'prompt executed']
+KEYWORD_RE = re.compile(trie_regex(KEYWORDS).encode('ascii'))
+
+
+def to_bytes(amount: str, unit: Optional[str] = 'MB') -> Optional[int]:
+    """Convert "2.00" "GiB" style amounts to bytes."""
+    try:
+        return int(float(amount) * UNITS[(unit or 'MB').lower()])
+    except (ValueError, KeyError):
+        return None
+
+
+def _size(pattern, line: str) -> Optional[int]:
+    m = pattern.search(line)
+    if not m:
+        return None
+    groups = [g for g in m.groups() if g is not None]
+    return to_bytes(groups[0], groups[1])
+
+
+def classify_line(line: str, total_vram: Optional[int] = None) -> Optional[Dict]:
+    """The GPU memory event a log line reports, or None.
+
+    Returns a dict with a "type" (oom, loaded_partially, loaded_completely,
+    vram_state, lowvram, offload or vram_free), a "pressure" level and
+    whatever byte amounts the line carries.
+    """
+    if OOM_RE.search(line):
+        event = {"type": "oom", "pressure": PRESSURE_OOM}
+        for key, pattern in (("requested_bytes", OOM_TRIED_RE), ("total_bytes", OOM_TOTAL_RE),
+                             ("free_bytes", OOM_FREE_RE), ("allocated_bytes", OOM_ALLOCATED_RE)):
+            amount = _size(pattern, line)
+            if amount is not None:
+                event[key] = amount
+        return event
+
+    m = LOADED_RE.search(line)
+    if m:
+        # "loaded partially <budget MB> <loaded MB> <patches>"
+        partial = m.group(1).lower() == 'partially'
+        return {
+            "type": "loaded_partially" if partial else "loaded_completely",
+            "pressure": PRESSURE_LOWVRAM if partial else PRESSURE_NONE,
+            "budget_bytes": to_bytes(m.group(2)),
+            "loaded_bytes": to_bytes(m.group(3)),
+        }
+
+    m = VRAM_STATE_RE.search(line)
+    if m:
+        state = m.group(1).upper()
+        low = state in ('LOW_VRAM', 'NO_VRAM', 'DISABLED')
+        return {"type": "vram_state", "pressure": PRESSURE_LOWVRAM if low else PRESSURE_NONE, "state": state}
+
+    m = UNLOADED_RE.search(line)
+    if m:
+        count = int(m.group(1))
+        return {"type": "offload", "pressure": PRESSURE_OFFLOAD, "models": count} if count else None
+
+    if LOWVRAM_RE.search(line):
+        return {"type": "lowvram", "pressure": PRESSURE_LOWVRAM}
+
+    if OFFLOAD_RE.search(line):
+        return {"type": "offload", "pressure": PRESSURE_OFFLOAD}
+
+    m = VRAM_FREE_RE.search(line)
+    if m:
+        free = to_bytes(m.group(1), m.group(2))
+        if free is None:
+            return None
+        pressure = PRESSURE_NONE
+        if total_vram:
+            if free < total_vram * 0.1:
+                pressure = PRESSURE_LOWVRAM
+            elif free < total_vram * 0.25:
+                pressure = PRESSURE_OFFLOAD
+        return {"type": "vram_free", "pressure": pressure, "free_bytes": free}
+    return None
+
+
+def _new_run(number: int, line_number: int, timestamp: Optional[float]) -> Dict:
+    return {
+        "run": number,
+        "start_line": line_number,
+        "started_at": timestamp,
+        "total_vram_bytes": None,
+        "prompts": 0,
+        "event_counts": {},
+        "peak_pressure": PRESSURE_NONE,
+        "current_prompt": None,
+    }
+
+
+def downsample(series: List[List], points: int = MAX_SERIES_POINTS) -> List[List]:
+    """At most points points of a [line_number, timestamp, pressure] series.
+
+    A longer series is cut into that many stretches, each given by its first
+    line and timestamp and its highest pressure, so peaks are never lost.
+    """
+    if len(series) <= points:
+        return series
+    sampled = []
+    for i in range(points):
+        stretch = series[len(series) * i // points:len(series) * (i + 1) // points]
+        sampled.append(stretch[0][:2] + [max(point[2] for point in stretch)])
+    return sampled
+
+
+class VramEventExtractor(TableIndex):
+    """Extracts GPU memory events from ComfyUI logs, incrementally.
+
+    A log is split into runs at each ComfyUI startup. Within a run, every
+    event is tagged with the prompt ("got prompt" ... "Prompt executed")
+    that was executing, and prompts that hit any memory pressure are listed
+    with their execution time, so slow prompts can be tied to offloading.
+    A run's pressure series has one [line_number, timestamp, pressure] point
+    per event. "loaded completely" lines, by far the most common and without
+    any pressure, are only counted in their run's event_counts.
+
+    Events, finished runs and pressured prompts are rows in the LogTables,
+    so later calls only store what was appended since; the run and prompt
+    in progress, and an OOM that may still merge with the next line, are
+    kept in the log's state.
+    """
+
+    KIND = 'vram_events'
+    VERSION = VRAM_EVENTS_VERSION
+    KEYWORD_RE = KEYWORD_RE
+
+    def new_state(self) -> Dict:
+        return {"runs": 0, "run": None, "pending_oom": None}
+
+    def process_line(self, state: Dict, rows: List[Row], line: str, start: int, end: int, number: int):
+        run = state["run"]
+
+        if STARTUP_RE.search(line) or run is None:
+            # "** ComfyUI startup time: 2024-06-15 10:00:00.123"
+            m = TIMESTAMP_RE.search(line)
+            if m:
+                state["last_time"] = timestamp_from_match(m) or state["last_time"]
+            run = self._new_run(state, rows, number)
+
+        m = TOTAL_VRAM_RE.search(line)
+        if m:
+            if run["total_vram_bytes"] is not None:
+                # Restarted without a startup banner we recognise
+                run = self._new_run(state, rows, number)
+            run["total_vram_bytes"] = to_bytes(m.group(1), m.group(2))
+            return
+
+        if PROMPT_START_RE.search(line):
+            run["prompts"] += 1
+            run["current_prompt"] = {"prompt": run["prompts"], "start_line": number,
+                                     "started_at": state["last_time"], "peak_pressure": PRESSURE_NONE,
+                                     "events": 0}
+            return
+
+        m = PROMPT_DONE_RE.search(line)
+        if m:
+            prompt = run["current_prompt"]
+            if prompt and prompt["events"] and prompt["peak_pressure"] > PRESSURE_NONE:
+                prompt["execution_seconds"] = float(m.group(1))
+                rows.append(("prompt", str(run["run"]), prompt["start_line"], prompt["started_at"], prompt))
+            run["current_prompt"] = None
+            return
+
+        event = classify_line(line, run["total_vram_bytes"])
+        if event is None:
+            return
+        prompt = run["current_prompt"]
+        prompt_number = prompt["prompt"] if prompt else None
+        previous = state["pending_oom"]
+        if (event["type"] == "oom" and previous and previous["run"] == run["run"]
+                and previous["prompt"] == prompt_number and number - previous["line_number"] <= OOM_MERGE_LINES):
+            for key, value in event.items():
+                previous.setdefault(key, value)
+            previous["lines"] = previous.get("lines", 1) + 1
+            return
+        if previous:
+            rows.append(_event_row(previous))
+            state["pending_oom"] = None
+        if event["type"] == "loaded_completely":
+            run["event_counts"]["loaded_completely"] = run["event_counts"].get("loaded_completely", 0) + 1
+            if prompt:
+                prompt["events"] += 1
+            return
+
+        event.update(run=run["run"], prompt=prompt_number, line_number=number,
+                     timestamp=state["last_time"], line=line.strip())
+        if event["type"] == "oom":
+            # Stored once the lines after it can no longer merge into it
+            state["pending_oom"] = event
+        else:
+            rows.append(_event_row(event))
+        run["event_counts"][event["type"]] = run["event_counts"].get(event["type"], 0) + 1
+        run["peak_pressure"] = max(run["peak_pressure"], event["pressure"])
+        if prompt:
+            prompt["events"] += 1
+            prompt["peak_pressure"] = max(prompt["peak_pressure"], event["pressure"])
+
+    @staticmethod
+    def _new_run(state: Dict, rows: List[Row], number: int) -> Dict:
+        finished = state["run"]
+        if finished is not None:
+            rows.append(("run", None, finished["start_line"], finished["started_at"],
+                         {key: value for key, value in finished.items() if key != "current_prompt"}))
+        state["runs"] += 1
+        state["run"] = _new_run(state["runs"], number, state["last_time"])
+        return state["run"]
+
+    def events(self, log_id: Optional[int], state: Dict, since: Optional[float] = None,
+               limit: int = 100) -> Tuple[List[Dict], Dict[str, int]]:
+        """The newest limit events (oldest first) at or after since, and the count of each type."""
+        pending = state["pending_oom"]
+        if not _in_window(pending, since):
+            pending = None
+        where, params = "log_id = ? AND type = 'event'", [log_id]
+        if since is not None:
+            where += " AND timestamp >= ?"
+            params.append(since)
+        counts = dict(self.tables.select(f"SELECT key, COUNT(*) FROM rows WHERE {where} GROUP BY key", tuple(params)))
+        if pending is not None:
+            counts["oom"] = counts.get("oom", 0) + 1
+        if limit <= 0:
+            return [], counts
+        limit -= pending is not None
+        rows = self.tables.select(f"SELECT data FROM rows WHERE {where} ORDER BY rowid DESC LIMIT ?",
+                                  tuple(params + [limit]))
+        events = [json.loads(data) for (data,) in reversed(rows)]
+        if pending is not None:
+            events.append(pending)
+        return events, counts
+
+    def runs(self, log_id: Optional[int], state: Dict, since: Optional[float] = None) -> List[Dict]:
+        """The runs of a log with their pressure series (downsampled) and newest pressured prompts.
+
+        With since, the series only covers events at or after it, and runs
+        without any are left out.
+        """
+        runs = [data for _, _, _, data in self.tables.rows(log_id, "run")]
+        if state["run"] is not None:
+            runs.append({key: value for key, value in state["run"].items() if key != "current_prompt"})
+
+        series: Dict[int, List[List]] = {}
+        events = [data for _, _, _, data in self.tables.rows(log_id, "event", since=since)]
+        if _in_window(state["pending_oom"], since):
+            events.append(state["pending_oom"])
+        for event in events:
+            series.setdefault(event["run"], []).append([event["line_number"], event["timestamp"], event["pressure"]])
+        prompts: Dict[int, List[Dict]] = {}
+        for key, _, _, prompt in self.tables.rows(log_id, "prompt"):
+            prompts.setdefault(int(key), []).append(prompt)
+
+        result = []
+        for run in runs:
+            points = series.get(run["run"], [])
+            if since is not None and not points:
+                continue
+            pressured = prompts.get(run["run"], [])
+            result.append(dict(run, series=downsample(points), series_points=len(points),
+                               pressured_prompts=pressured[-MAX_PRESSURED_PROMPTS:],
+                               pressured_prompts_total=len(pressured)))
+        return result
+
+
+def _in_window(event: Optional[Dict], since: Optional[float]) -> bool:
+    if event is None:
+        return False
+    return since is None or (event["timestamp"] is not None and event["timestamp"] >= since)
+
+
+def _event_row(event: Dict) -> Row:
+    return "event", event["type"], event["line_number"], event["timestamp"], event
@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the ComfyUI Log Debugger tests
+"""
+import os
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from synthetic_log import write_log  # noqa: E402
+
+SYNTHETIC_LOG_BYTES = 2 * 1024 * 1024
+
+
+@pytest.fixture(scope="session")
+def synthetic_log(tmp_path_factory):
+    """A deterministic 2 MB comfyui.log with tracebacks, VRAM warnings, model loads and prompts."""
+    path = str(tmp_path_factory.mktemp("logs") / "comfyui.log")
+    write_log(path, SYNTHETIC_LOG_BYTES, seed=0, workers=1)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """An empty cache directory for checkpoints, indexes and the log store."""
+    path = str(tmp_path / "cache")
+    monkeypatch.setenv("COMFYUI_CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def debugger(cache_dir, synthetic_log):
+    """A ComfyUILogDebugger whose discovery finds only the synthetic log."""
+    from debugger_server import ComfyUILogDebugger
+    debugger = ComfyUILogDebugger()
+    debugger._discover_logs = lambda refresh=False: {
+        "log_files": [synthetic_log],
+        "log_details": {synthetic_log: {"size": os.path.getsize(synthetic_log)}},
+    }
+    return debugger
+
+
+@pytest.fixture(scope="session")
+def prompt_id(synthetic_log):
+    """The ID of the first prompt queued in the synthetic log."""
+    with open(synthetic_log, encoding='utf-8') as f:
+        return re.search(r"prompt_id: ([0-9a-f-]{36})", f.read()).group(1)
@@ -0,0 +1,168 @@
+"""
+Tests for rotated and compressed logs: archives read like plain logs, paged from one scan, and windows across segments
+"""
+import asyncio
+import gzip
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import debugger_server
+import log_rotation
+from log_rotation import rotated_segments
+from test_log_tables import out_of_time
+
+
+def log_text(start, minutes, errors_every=7):
+    """A log of one line a minute from start, with an error (and its traceback) every few minutes."""
+    lines = []
+    for minute in range(minutes):
+        stamp = (start + timedelta(minutes=minute)).strftime('[%Y-%m-%d %H:%M:%S.000]')
+        if minute % errors_every == errors_every - 1:
+            lines += [f"{stamp} Traceback (most recent call last):",
+                      '  File "nodes.py", line 10, in load',
+                      f"RuntimeError: CUDA out of memory at minute {minute}"]
+        else:
+            lines.append(f"{stamp} step {minute}: all fine")
+    return "".join(line + "\n" for line in lines).encode('utf-8')
+
+
+def compress(data, suffix):
+    if suffix == '.gz':
+        return gzip.compress(data)
+    if log_rotation.zstd is not None:
+        return log_rotation.zstd.compress(data)
+    return log_rotation.zstandard.ZstdCompressor().compress(data)
+
+
+SUFFIXES = ['.gz', pytest.param('.zst', marks=pytest.mark.skipif(
+    log_rotation.zstd is None and log_rotation.zstandard is None, reason="no zstd module installed"))]
+
+
+def write(path, data, age_minutes=0):
+    with open(path, 'wb') as f:
+        f.write(data)
+    when = time.time() - age_minutes * 60
+    os.utime(path, (when, when))
+    return str(path)
+
+
+def without_file(errors):
+    return [{key: value for key, value in error.items() if key != "log_file"} for error in errors]
+
+
+def all_pages(debugger, path, max_bytes, **arguments):
+    errors, cursor, pages = [], None, []
+    while True:
+        result = debugger.find_errors(path, cluster=False, cursor=cursor, max_bytes=max_bytes, **arguments)
+        assert "error" not in result, result
+        errors += result["errors"]
+        pages.append(result["errors"])
+        if not result["has_more"]:
+            return errors, pages
+        cursor = result["next_cursor"]
+
+
+@pytest.fixture
+def plain(tmp_path):
+    return write(tmp_path / "plain.log", log_text(datetime(2024, 6, 15, 12), 300))
+
+
+@pytest.mark.parametrize("suffix", SUFFIXES)
+def test_archive_errors_match_the_plain_log(debugger, plain, tmp_path, suffix):
+    with open(plain, 'rb') as f:
+        archive = write(tmp_path / ("old.log.1" + suffix), compress(f.read(), suffix))
+    expected = debugger.find_errors(plain, cluster=False, max_bytes=0)["errors"]
+    assert len(expected) == 300 // 7
+    assert without_file(debugger.find_errors(archive, cluster=False, max_bytes=0)["errors"]) == without_file(expected)
+    clustered = debugger.find_errors(archive)
+    assert clustered["total_errors"] == len(expected) and clustered["distinct_errors"] == 1
+
+
+@pytest.mark.parametrize("suffix", SUFFIXES)
+def test_archive_is_paged_from_one_scan(debugger, plain, tmp_path, monkeypatch, suffix):
+    with open(plain, 'rb') as f:
+        archive = write(tmp_path / ("old.log.1" + suffix), compress(f.read(), suffix))
+    opened = []
+
+    def counting_open_log(path):
+        opened.append(path)
+        return log_rotation.open_log(path)
+
+    monkeypatch.setattr(debugger_server, "open_log", counting_open_log)
+    errors, pages = all_pages(debugger, archive, 2000)
+    assert len(pages) > 5
+    # Later pages are cut from the first one's scan instead of decompressing the archive again
+    assert opened == [archive]
+    assert without_file(errors) == without_file(debugger.find_errors(plain, cluster=False, max_bytes=0)["errors"])
+
+
+def test_tail_log_refuses_archives(debugger, plain, tmp_path):
+    with open(plain, 'rb') as f:
+        archive = write(tmp_path / "old.log.1.gz", gzip.compress(f.read()))
+    assert "can't be tailed" in asyncio.run(debugger.tail_log(archive))["error"]
+
+
+def test_damaged_archive_is_a_read_error(debugger, plain, tmp_path):
+    with open(plain, 'rb') as f:
+        data = gzip.compress(f.read())
+    archive = write(tmp_path / "old.log.1.gz", data[:len(data) // 2])
+    for arguments in ({}, {"cluster": False, "max_bytes": 0}, {"cluster": False}):
+        assert debugger.find_errors(archive, **arguments)["error"].startswith("Failed to read log: ")
+
+
+def test_rotated_segments_newest_first(tmp_path):
+    log = write(tmp_path / "comfyui.log", b"now\n")
+    first = write(tmp_path / "comfyui.log.1", b"older\n", age_minutes=10)
+    second = write(tmp_path / "comfyui.log.2.gz", gzip.compress(b"older still\n"), age_minutes=20)
+    dated = write(tmp_path / "comfyui.log.2024-06-15.zst", b"", age_minutes=30)
+    write(tmp_path / "other.log.1", b"another log\n")
+    assert rotated_segments(log) == [first, second, dated]
+    # A segment has no segments of its own
+    assert rotated_segments(first) == []
+
+
+@pytest.fixture
+def segments(tmp_path):
+    """comfyui.log and its rotated segments: one too old for the last hour, and one only partly in it."""
+    now = datetime.now().replace(microsecond=0)
+    log = tmp_path / "comfyui.log"
+    write(str(log) + ".3.gz", gzip.compress(log_text(now - timedelta(hours=5), 60)), age_minutes=240)
+    write(str(log) + ".2.gz", gzip.compress(log_text(now - timedelta(minutes=100), 60)), age_minutes=40)
+    write(str(log) + ".1", log_text(now - timedelta(minutes=40), 20), age_minutes=20)
+    return write(log, log_text(now - timedelta(minutes=20), 20, errors_every=6))
+
+
+def test_last_minutes_walks_segments_oldest_first(debugger, segments):
+    errors = debugger.find_errors(segments, last_minutes=60, context_lines=2, cluster=False, max_bytes=0)["errors"]
+    files = [os.path.basename(error["log_file"]) for error in errors]
+    assert files == sorted(files, key=["comfyui.log.2.gz", "comfyui.log.1", "comfyui.log"].index)
+    assert set(files) == {"comfyui.log.2.gz", "comfyui.log.1", "comfyui.log"}
+    # Only the part of the .2.gz segment written in the last hour
+    minutes = [int(error["error_line"].rsplit(" ", 1)[1]) for error in errors if error["log_file"].endswith(".2.gz")]
+    assert minutes and min(minutes) >= 40
+
+    # Pages of one error carry on inside the archive; larger ones cross from one segment to the next
+    for max_bytes in (1500, 2500):
+        paged, pages = all_pages(debugger, segments, max_bytes, last_minutes=60, context_lines=2)
+        assert paged == errors
+    assert any(len({error["log_file"] for error in page}) > 1 for page in pages)
+
+
+
+def test_archive_page_out_of_time_carries_on(debugger, tmp_path):
+    plain = write(tmp_path / "plain.log", log_text(datetime(2024, 6, 15, 12), 10000))
+    with open(plain, 'rb') as f:
+        archive = write(tmp_path / "old.log.1.gz", gzip.compress(f.read()))
+    first, _ = out_of_time(debugger.find_errors, archive, None, 5, False, None, 10 ** 6)
+    assert first["partial"] and first["has_more"] and first["errors"]
+    # The next page scans the archive again, this time to the end, and carries on after the first
+    errors = first["errors"]
+    cursor = first["next_cursor"]
+    while cursor:
+        result = debugger.find_errors(archive, cluster=False, cursor=cursor, max_bytes=10 ** 6)
+        errors += result["errors"]
+        cursor = result["next_cursor"]
+    assert without_file(errors) == without_file(debugger.find_errors(plain, cluster=False, max_bytes=0)["errors"])
@@ -0,0 +1,67 @@
+"""
+Tests for find_errors checkpoints: resuming a growing log and starting over on a rewritten one
+"""
+import contextvars
+import time
+
+from log_scanner import ErrorScan
+from progress import CallProgress, cut_short_within, track
+
+
+def full_scan(debugger, path, context_lines=5):
+    with open(path, 'rb') as f:
+        return [dict(error, log_file=path) for error in ErrorScan(f, debugger.error_matcher, context_lines)]
+
+
+def write_part(source, path, fraction):
+    with open(source, 'rb') as f:
+        data = f.read()
+    cut = data.rfind(b'\n', 0, int(len(data) * fraction)) + 1
+    with open(path, 'wb') as f:
+        f.write(data[:cut])
+    return data[cut:]
+
+
+def test_growing_log_resumes_from_checkpoint(debugger, synthetic_log, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    rest = write_part(synthetic_log, path, 0.5)
+    first = debugger._file_errors(path, None, 5)
+    checkpoint = debugger.checkpoints.load(path, 5, debugger.error_matcher.fingerprint)
+    assert checkpoint is not None and checkpoint["offset"] > 0
+
+    with open(path, 'ab') as f:
+        f.write(rest)
+    errors = debugger._file_errors(path, None, 5)
+    assert errors == full_scan(debugger, path)
+    assert len(errors) > len(first)
+    # Asking again reads nothing new and returns the same
+    assert debugger._file_errors(path, None, 5) == errors
+
+
+def test_scan_cut_short_resumes_where_it_stopped(debugger, synthetic_log):
+    expired = CallProgress(None, time.monotonic() - 1)
+
+    def scan_out_of_time():
+        track(expired)
+        return cut_short_within(debugger._file_errors, synthetic_log, None, 5)
+
+    errors, was_cut_short = contextvars.copy_context().run(scan_out_of_time)
+    assert was_cut_short
+    assert debugger.checkpoints.load(synthetic_log, 5, debugger.error_matcher.fingerprint)["offset"] > 0
+    assert debugger._file_errors(synthetic_log, None, 5) == full_scan(debugger, synthetic_log)
+
+
+def test_truncated_log_starts_over(debugger, synthetic_log, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write_part(synthetic_log, path, 0.6)
+    debugger._file_errors(path, None, 5)
+
+    # Rewritten from the start with less text: the old errors must not survive
+    write_part(synthetic_log, path, 0.3)
+    assert debugger._file_errors(path, None, 5) == full_scan(debugger, path)
+
+
+def test_checkpoint_is_per_context_lines(debugger, synthetic_log):
+    debugger._file_errors(synthetic_log, None, 5)
+    assert debugger.checkpoints.load(synthetic_log, 2, debugger.error_matcher.fingerprint) is None
+    assert debugger._file_errors(synthetic_log, None, 2) == full_scan(debugger, synthetic_log, 2)
@@ -0,0 +1,107 @@
+"""
+Tests for the discovery cache: reused until its TTL, a watched directory or the running ComfyUI processes change
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import simple_active_discovery
+from simple_active_discovery import DiscoveryCache, looks_like_comfyui, process_table_key
+
+
+@pytest.fixture
+def installation(tmp_path, monkeypatch):
+    monkeypatch.delenv("COMFYUI_DISCOVERY_CACHE", raising=False)
+    monkeypatch.setenv("COMFYUI_DISCOVERY_TTL", "300")
+    path = tmp_path / "ComfyUI"
+    (path / "logs").mkdir(parents=True)
+    log = path / "logs" / "comfyui.log"
+    log.write_text("Starting server\n")
+    return path
+
+
+@pytest.fixture
+def cache(installation, monkeypatch):
+    monkeypatch.setattr(simple_active_discovery, "process_table_key", lambda: [100])
+    cache = DiscoveryCache()
+    cache.put({"installations": [str(installation)], "log_files": [str(installation / "logs" / "comfyui.log")]},
+              [100], [])
+    return cache
+
+
+def test_reused_until_the_ttl(cache, monkeypatch):
+    assert cache.get()["cached"]
+    cache.entry["created"] -= 301
+    assert cache.get() is None
+
+
+def test_changed_directory_invalidates(cache, installation):
+    assert cache.get() is not None
+    new_log = installation / "logs" / "comfyui.log.1"
+    new_log.write_text("rotated\n")
+    later = time.time() + 10
+    os.utime(installation / "logs", (later, later))
+    assert cache.get() is None
+
+
+def test_changed_processes_invalidate(cache, monkeypatch):
+    monkeypatch.setattr(simple_active_discovery, "process_table_key", lambda: [100, 200])
+    # The process table is only read every PROCESS_CHECK_INTERVAL seconds
+    assert cache.get() is not None
+    cache.checked_processes_at = 0.0
+    assert cache.get() is None
+
+
+def test_looks_like_comfyui():
+    assert looks_like_comfyui(["python", "main.py", "--listen"])
+    assert looks_like_comfyui(["/usr/bin/python3", "/opt/ComfyUI/main.py"])
+    assert looks_like_comfyui(["python", "/usr/local/bin/comfy", "launch"])
+    assert not looks_like_comfyui(["python", "-m", "pytest"])
+    assert not looks_like_comfyui(["python", "/opt/comfy-guru/src/standalone_mcp_server.py"])
+    assert not looks_like_comfyui(["main.py"])
+
+
+@pytest.fixture
+def fake_comfyui(tmp_path):
+    main = tmp_path / "main.py"
+    main.write_text("import time\ntime.sleep(60)\n")
+    return str(main)
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 10
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc') and simple_active_discovery.psutil is None,
+                    reason="needs psutil or /proc")
+def test_process_key_leaves_out_own_children(fake_comfyui):
+    before = process_table_key()
+    child = subprocess.Popen([sys.executable, fake_comfyui])
+    try:
+        time.sleep(0.2)
+        assert child.pid not in process_table_key()
+    finally:
+        child.kill()
+        child.wait()
+    assert process_table_key() == before
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc') and simple_active_discovery.psutil is None,
+                    reason="needs psutil or /proc")
+def test_process_key_sees_comfyui_start_and_stop(fake_comfyui):
+    # Started through a parent that exits, so it isn't this process's descendant
+    launcher = ("import subprocess, sys; print(subprocess.Popen([sys.executable, sys.argv[1]], "
+                "stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True).pid)")
+    pid = int(subprocess.run([sys.executable, '-c', launcher, fake_comfyui], capture_output=True, text=True,
+                             check=True).stdout)
+    try:
+        wait_for(lambda: pid in process_table_key())
+    finally:
+        os.kill(pid, 9)
+    wait_for(lambda: pid not in process_table_key())
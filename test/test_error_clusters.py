@@ -0,0 +1,66 @@
+"""
+Tests for error clustering: numbers, paths and hex IDs are masked so repeats of one error become one cluster
+"""
+import pytest
+
+from error_clusters import cluster_errors, fingerprint, normalize_message
+
+
+@pytest.mark.parametrize("line, message", [
+    ("[2024-06-15 12:00:00.123] RuntimeError: CUDA out of memory. Tried to allocate 2.00 GiB",
+     "RuntimeError: CUDA out of memory. Tried to allocate <n> GiB"),
+    ("FileNotFoundError: /home/alice/ComfyUI/models/checkpoints/a.safetensors not found",
+     "FileNotFoundError: <path> not found"),
+    ("FileNotFoundError: C:\\Users\\bob\\ComfyUI\\models\\b.safetensors not found",
+     "FileNotFoundError: <path> not found"),
+    ("Error: tensor at 0x7f3a2b1c failed", "Error: tensor at <hex> failed"),
+    ("Error: prompt 3fa85f64-5717-4562-b3fc-2c963f66afa6 failed", "Error: prompt <hex> failed"),
+    ("Error at step 12 of   30", "Error at step <n> of <n>"),
+    # Words made of hex letters are words
+    ("Error: Decoder failed, cafe babe", "Error: Decoder failed, cafe babe"),
+])
+def test_normalize_message(line, message):
+    assert normalize_message(line) == message
+
+
+def error(error_type, line, line_number, log_file="comfyui.log"):
+    return {"type": error_type, "error_line": line, "line_number": line_number, "context": f"context {line_number}",
+            "log_file": log_file}
+
+
+def test_variants_collapse_into_one_cluster():
+    errors = [
+        error("FileNotFound", "[2024-06-15 12:00:01.000] FileNotFoundError: /a/models/x.safetensors (0x1f) try 1", 10),
+        error("FileNotFound", "[2024-06-15 12:00:02.000] FileNotFoundError: /b/models/y.safetensors (0x2e) try 2", 20),
+        error("CUDA_OUT_OF_MEMORY", "CUDA out of memory. Tried to allocate 1.50 GiB", 25),
+        error("FileNotFound", "[2024-06-15 12:00:03.000] FileNotFoundError: C:\\m\\models\\z.ckpt (0x3d) try 3", 30),
+        # Same message, another error type
+        error("GeneralError", "FileNotFoundError: /c/models/w.safetensors (0x4c) try 4", 40),
+    ]
+    files, oom, general = cluster_errors(errors)
+    assert (files["type"], files["count"], files["message"]) == (
+        "FileNotFound", 3, "FileNotFoundError: <path> (<hex>) try <n>")
+    assert files["fingerprint"] == fingerprint("FileNotFound", files["message"])
+    assert (files["first"]["line_number"], files["last"]["line_number"]) == (10, 30)
+    assert files["first"]["timestamp"] < files["last"]["timestamp"]
+    # The latest occurrence stands for the cluster
+    assert files["error_line"] == errors[3]["error_line"] and files["context"] == "context 30"
+    assert (oom["count"], general["count"]) == (1, 1)
+    assert general["message"] == files["message"] and general["fingerprint"] != files["fingerprint"]
+
+
+def test_find_errors_clusters(debugger, tmp_path):
+    path = tmp_path / "comfyui.log"
+    lines = []
+    for i in range(12):
+        lines += [f"step {i}: all fine"] * 12
+        lines.append(f"Error: failed to load /models/loras/lora_{i}.safetensors after {i * 1.5} seconds")
+        lines += [f"step {i}: all fine"] * 12
+        if i % 4 == 0:
+            lines.append(f"RuntimeError: CUDA out of memory. Tried to allocate {i + 1}.00 GiB")
+    path.write_text("".join(line + "\n" for line in lines))
+    result = debugger.find_errors(str(path), context_lines=2)
+    assert result["total_errors"] == 15 and result["distinct_errors"] == 2
+    loads, oom = result["clusters"]
+    assert loads["count"] == 12 and "lora_11" in loads["error_line"]
+    assert oom["count"] == 3 and oom["message"] == "RuntimeError: CUDA out of memory. Tried to allocate <n> GiB"
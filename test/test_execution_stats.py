@@ -0,0 +1,95 @@
+"""
+Tests for execution-time analytics: percentiles, regressions and samples kept up to date as a log grows
+"""
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from execution_stats import find_regression, parse_timing, percentile, summarize
+
+
+def write(path, lines, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+def stamped(when, line):
+    return f"[{when.strftime('%Y-%m-%d %H:%M:%S')}.000] {line}"
+
+
+def test_percentiles():
+    assert percentile([], 50) is None
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+    assert summarize([3.0, 1.0, 2.0]) == {"count": 3, "p50": 2.0, "p95": pytest.approx(2.9), "p99": pytest.approx(2.98),
+                                          "max": 3.0, "total_seconds": 6.0}
+
+
+def test_parse_timing():
+    assert parse_timing("Prompt executed in 1 minute, 5.50 seconds") == {"kind": "prompt", "name": "prompt",
+                                                                         "seconds": 65.5}
+    assert parse_timing("#3 [KSampler]: 5.12s")["name"] == "KSampler"
+    assert parse_timing("VAEDecode took 850ms")["seconds"] == 0.85
+    assert parse_timing("100%|##########| 20/20 [00:04<00:00,  4.51it/s]")["seconds"] == 4.0
+    assert parse_timing(" 50%|#####     | 10/20 [00:02<00:02,  4.51it/s]") is None
+
+
+def test_regression_needs_a_slower_median():
+    samples = [[i, None, 1.0] for i in range(10)] + [[i, None, 2.0] for i in range(10, 13)]
+    regression = find_regression("node", "VAEDecode", samples, None)
+    assert regression["ratio"] == 2.0 and regression["recent_count"] == 3
+    assert find_regression("node", "VAEDecode", [[i, None, 1.0] for i in range(13)], None) is None
+    # Too few samples to tell
+    assert find_regression("node", "VAEDecode", [[0, None, 1.0]] * 3 + [[1, None, 9.0]] * 2, None) is None
+
+
+def test_windowed_regression(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    now = datetime.now()
+    lines = [stamped(now - timedelta(hours=2, minutes=i), "Prompt executed in 10.00 seconds") for i in range(5)]
+    lines += [stamped(now - timedelta(minutes=i), "Prompt executed in 20.00 seconds") for i in range(5, 0, -1)]
+    write(path, lines)
+    result = debugger.analyze_execution_times(path, last_minutes=30)
+    assert result["prompts"]["count"] == 5 and result["prompts"]["p50"] == 20.0
+    regression, = result["regressions"]
+    assert (regression["kind"], regression["name"], regression["ratio"]) == ("prompt", "prompt", 2.0)
+
+
+def test_node_named_prompt_is_not_a_prompt(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, ["Prompt executed in 5.00 seconds"] * 2 + ["prompt took 1.0s"] * 3)
+    result = debugger.analyze_execution_times(path)
+    assert result["prompts"]["count"] == 2 and result["prompts"]["total_seconds"] == 10.0
+    node, = result["nodes"]
+    assert (node["name"], node["count"], node["total_seconds"]) == ("prompt", 3, 3.0)
+
+
+def test_samples_follow_appends_and_rotation(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, ["Prompt executed in 5.00 seconds", "#3 [KSampler]: 2.00s"])
+    assert debugger.analyze_execution_times(path)["prompts"]["count"] == 1
+
+    write(path, ["Prompt executed in 7.00 seconds", "#3 [KSampler]: 4.00s"], 'a')
+    result = debugger.analyze_execution_times(path)
+    assert result["prompts"]["total_seconds"] == 12.0
+    assert result["nodes"] == [dict(name="KSampler", **summarize([2.0, 4.0]))]
+
+    os.rename(path, path + ".1")
+    write(path, ["Prompt executed in 1.00 seconds"])
+    result = debugger.analyze_execution_times(path)
+    assert result["prompts"]["total_seconds"] == 1.0 and result["nodes"] == []
+
+
+def test_synthetic_log_matches_a_direct_parse(debugger, synthetic_log):
+    prompts, nodes = [], {}
+    with open(synthetic_log, encoding='utf-8') as f:
+        for line in f:
+            timing = parse_timing(line)
+            if timing is not None and timing["kind"] == "prompt":
+                prompts.append(timing["seconds"])
+            elif timing is not None:
+                nodes.setdefault(timing["name"], []).append(timing["seconds"])
+    result = debugger.analyze_execution_times(synthetic_log, top_n=1000, max_bytes=0)
+    assert result["prompts"] == summarize(prompts) and prompts
+    assert {node["name"]: node["count"] for node in result["nodes"]} == {name: len(d) for name, d in nodes.items()}
@@ -0,0 +1,128 @@
+"""
+Tests for the shared log daemon: calls proxied to it, the authkey handshake both ways, and falling back when it's away
+"""
+import inspect
+import os
+import stat
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+import pytest
+
+import log_daemon
+from log_daemon import DaemonClient, LogDaemon, _authkey, daemon_address
+
+
+def connect(authkey, timeout=5.0):
+    """A connection to the daemon, once it is listening."""
+    address, family = daemon_address()
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Client(address, family, authkey=authkey)
+        except (OSError, EOFError):
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.02)
+
+
+@pytest.fixture
+def no_spawn(monkeypatch):
+    """Clients give up on the daemon quickly instead of starting a real one."""
+    spawned = []
+    monkeypatch.setattr(log_daemon, "_spawn_daemon", lambda: spawned.append(True))
+    monkeypatch.setattr(log_daemon, "START_TIMEOUT_SECONDS", 0.3)
+    return spawned
+
+
+@pytest.fixture
+def daemon(debugger):
+    server = LogDaemon(debugger, max_concurrent=2, idle_seconds=600)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    connect(server.authkey).close()
+    yield server
+    server.closing = True
+    connect(server.authkey).close()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+@pytest.fixture
+def impostor(cache_dir):
+    """A listener on the daemon's address that doesn't know the key, counting the clients it fails to authenticate."""
+    address, family = daemon_address()
+    os.makedirs(cache_dir, exist_ok=True)
+    key = b"not the daemon's key"
+    listener = Listener(address, family, authkey=key)
+    refused = []
+
+    def accept():
+        while True:
+            try:
+                conn = listener.accept()
+            except AuthenticationError:
+                refused.append(True)
+                continue
+            except OSError:
+                return
+            # Only the fixture itself knows this key, to stop the thread
+            conn.close()
+            return
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield refused
+    Client(address, family, authkey=key).close()
+    thread.join(5)
+    listener.close()
+
+
+def test_key_is_made_once_and_private(cache_dir):
+    key = _authkey()
+    assert len(key) == 64 and _authkey() == key
+    if sys.platform != 'win32':
+        assert stat.S_IMODE(os.stat(os.path.join(cache_dir, 'daemon.key')).st_mode) == 0o600
+
+
+def test_calls_run_in_the_daemon(debugger, daemon, synthetic_log, no_spawn):
+    client = DaemonClient()
+    # The proxies take the tools' own arguments
+    assert "self" not in inspect.signature(client.find_errors).parameters
+    assert client.get_logs() == debugger.get_logs()
+    expected = debugger.find_errors(synthetic_log, None, 2, cluster=False, max_bytes=0)
+    assert expected["errors"] and client.find_errors(synthetic_log, None, 2, cluster=False, max_bytes=0) == expected
+    assert no_spawn == []
+    with pytest.raises(AttributeError):
+        client.not_a_tool
+
+
+def test_daemon_only_answers_its_key(daemon):
+    with pytest.raises(AuthenticationError):
+        connect(b"some other key")
+    with connect(daemon.authkey) as conn:
+        conn.send(("_discover_logs", {}, None))
+        assert conn.recv() == ("error", "Unknown tool: _discover_logs")
+
+
+def test_second_daemon_leaves_the_first_serving(debugger, daemon):
+    started = time.monotonic()
+    LogDaemon(debugger, idle_seconds=600).serve()
+    assert time.monotonic() - started < 5
+    connect(daemon.authkey).close()
+
+
+def test_impostor_gets_no_calls(debugger, impostor, synthetic_log, no_spawn):
+    # A listener that can't prove it knows the key isn't the daemon, so the call runs here instead
+    result = DaemonClient(fallback=debugger).find_errors(synthetic_log, cluster=False, max_bytes=0)
+    assert result == debugger.find_errors(synthetic_log, cluster=False, max_bytes=0)
+    assert impostor and no_spawn == [True]
+
+
+def test_unreachable_daemon(debugger, synthetic_log, no_spawn):
+    assert DaemonClient(fallback=debugger).get_logs() == debugger.get_logs()
+    assert "could not be started" in DaemonClient().get_logs()["error"]
+    assert no_spawn == [True, True]
@@ -0,0 +1,163 @@
+"""
+Tests for the log scanner: the single-pass pattern prefilter, streaming, span merging and traceback chains
+"""
+import io
+import itertools
+import json
+import os
+import re
+
+import pytest
+
+from log_scanner import ErrorMatcher, ErrorScan, trie_regex
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+@pytest.fixture(scope="module")
+def error_patterns():
+    with open(os.path.join(SRC, 'error_patterns.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def naive_match(error_patterns, line):
+    """The error types a line matches, checking every pattern on its own."""
+    return [error_type for error_type, patterns in error_patterns.items()
+            if any(re.search(pattern, line, re.IGNORECASE) for pattern in patterns)]
+
+
+def test_trie_regex_matches_the_same_as_an_alternation():
+    words = ["out of memory", "out", "oom", "error", "error:", "err", "e", "a.b", "(x)", "zz"]
+    trie = re.compile(trie_regex(words))
+    alternation = re.compile("|".join(re.escape(word) for word in words))
+    alphabet = "eoutrm:.ab(x)z "
+    for length in range(4):
+        for chars in itertools.product(alphabet, repeat=length):
+            text = "".join(chars)
+            assert bool(trie.fullmatch(text)) == bool(alternation.fullmatch(text)), text
+            assert bool(trie.search(text)) == bool(alternation.search(text)), text
+    for word in words:
+        assert trie.fullmatch(word)
+
+
+def test_matcher_agrees_with_each_pattern(error_patterns, synthetic_log):
+    matcher = ErrorMatcher(error_patterns)
+    with open(synthetic_log, encoding='utf-8') as f:
+        lines = f.readlines()
+    lines += ["Room for improvement", "RuntimeError: CUDA OUT OF MEMORY", "nothing to see here"]
+    matched = 0
+    for line in lines:
+        error_types = matcher.match(line)
+        assert error_types == naive_match(error_patterns, line), line
+        matched += bool(error_types)
+    assert matched
+
+
+def test_matcher_with_regex_patterns():
+    error_patterns = {"Shape": [r"shape \[\d+\] mismatch", "size mismatch"], "Named": [r"(?P<code>E\d{3})"],
+                      "Invalid": ["(unclosed"]}
+    matcher = ErrorMatcher(error_patterns)
+    assert matcher.match("Tensor SHAPE [3] mismatch") == ["Shape"]
+    assert matcher.match("size mismatch for weight") == ["Shape"]
+    assert matcher.match("failed with E042") == ["Named"]
+    assert matcher.match("(unclosed") == []
+    assert matcher.match("all good") == []
+
+
+def scan(error_patterns, lines, context_lines=3):
+    data = "".join(line + "\n" for line in lines).encode('utf-8')
+    return list(ErrorScan(io.BytesIO(data), ErrorMatcher(error_patterns), context_lines))
+
+
+def filler(count):
+    return [f"step {i}: all fine" for i in range(count)]
+
+
+def test_scan_streams_in_bounded_memory(error_patterns):
+    read = 0
+
+    def endless_log():
+        nonlocal read
+        for i in itertools.count():
+            read += 1
+            yield b"Error: boom\n" if i % 1000 == 500 else b"step: all fine\n"
+
+    scan = ErrorScan(endless_log(), ErrorMatcher(error_patterns), context_lines=3)
+    spans = iter(scan)
+    for n in range(50):
+        span = next(spans)
+        assert span["line_number"] == n * 1000 + 501
+        # Each span is yielded once no later match could merge with it, holding only its lines
+        assert read <= span["end_line"] + 3 + 2
+        assert len(scan._history) <= span["end_line"] - span["start_line"] + 1 + 2 * 3 + 2
+
+
+def test_overlapping_context_is_merged(error_patterns):
+    lines = filler(40)
+    lines[9] = "Error: first"  # line 10
+    lines[14] = "CUDA out of memory"  # line 15, context overlaps line 10's
+    lines[30] = "Error: far away"  # line 31
+    first, second = scan(error_patterns, lines)
+    assert (first["start_line"], first["end_line"]) == (7, 18)
+    assert first["line_number"] == 10 and first["error_line"] == "Error: first"
+    assert first["error_types"] == ["GeneralError", "CUDA_OUT_OF_MEMORY"]
+    assert (second["start_line"], second["end_line"]) == (28, 34)
+
+
+def test_touching_context_is_merged(error_patterns):
+    lines = filler(40)
+    lines[9] = "Error: first"  # context 7-13
+    lines[16] = "Error: second"  # context 14-20
+    spans = scan(error_patterns, lines)
+    assert [(span["start_line"], span["end_line"]) for span in spans] == [(7, 20)]
+
+
+def test_context_is_cut_at_the_ends(error_patterns):
+    lines = filler(5)
+    lines[0] = "Error: at the start"
+    lines[4] = "Error: at the end"
+    spans = scan(error_patterns, lines, context_lines=10)
+    assert [(span["start_line"], span["end_line"]) for span in spans] == [(1, 5)]
+
+
+CHAINED = [
+    "Traceback (most recent call last):",
+    '  File "nodes.py", line 10, in load',
+    "    open(path)",
+    "FileNotFoundError: model.safetensors",
+    "",
+    "During handling of the above exception, another exception occurred:",
+    "",
+    "Traceback (most recent call last):",
+    '  File "execution.py", line 20, in execute',
+    "    load()",
+    "RuntimeError: Error occurred when executing LoadCheckpoint",
+    "    while loading model.safetensors",
+]
+
+
+def test_chained_traceback_is_one_span(error_patterns):
+    lines = filler(10) + CHAINED + filler(10)
+    span, = scan(error_patterns, lines)
+    assert span["start_line"] == 11 - 3
+    # Through the last exception line, with no context after it
+    assert span["end_line"] == 10 + len(CHAINED)
+    # Reported by the last exception in the chain
+    assert span["line_number"] == 21
+    assert span["error_line"].startswith("RuntimeError: Error occurred")
+    assert span["type"] == "NodeExecutionFailure"
+    assert "FileNotFoundError" in span["context"] and "while loading" in span["context"]
+
+
+def test_tracebacks_without_connector_are_separate(error_patterns):
+    first = ["Traceback (most recent call last):", '  File "a.py", line 1, in a', "ValueError: one"]
+    second = ["Traceback (most recent call last):", '  File "b.py", line 2, in b', "KeyError: two"]
+    spans = scan(error_patterns, filler(10) + first + filler(10) + second + filler(10), context_lines=2)
+    assert [span["error_line"] for span in spans] == ["ValueError: one", "KeyError: two"]
+    assert [(span["start_line"], span["end_line"]) for span in spans] == [(9, 13), (22, 26)]
+
+
+def test_timestamped_traceback_lines(error_patterns):
+    stamped = [f"[2024-06-15 12:00:{i:02d}.000] {line}" for i, line in enumerate(CHAINED)]
+    span, = scan(error_patterns, filler(10) + stamped + filler(10))
+    assert span["line_number"] == 21
@@ -0,0 +1,133 @@
+"""
+Tests for the log store behind query_log: records, counts and filters, extended as a log grows
+"""
+import json
+import os
+
+import pytest
+
+from log_scanner import ErrorMatcher
+from log_store import EVERY_LINE_RE, LogStore, notable_keywords, parse_prefix
+from log_tables import LogTables
+from test_log_tables import out_of_time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+LINES = [
+    "[2024-06-15 12:00:00.000] Starting server",
+    "[2024-06-15 12:00:01.000] WARNING: model.safetensors not found",
+    "[2024-06-15 12:00:02.000] [ComfyUI-Manager] ERROR: fetch failed",
+    "[2024-06-15 12:00:03.000] RuntimeError: CUDA out of memory. Tried to allocate 2.00 GiB",
+    "got prompt",
+    "Exception: node failed",
+    "[2024-06-15 12:00:05.000] Prompt executed in 1.00 seconds",
+]
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    with open(os.path.join(SRC, 'error_patterns.json'), encoding='utf-8') as f:
+        return ErrorMatcher(json.load(f))
+
+
+@pytest.fixture
+def store(cache_dir, matcher):
+    return LogStore(LogTables(), matcher)
+
+
+def write(path, lines, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+def query(store, path, **filters):
+    log_id, _ = store.update(path)
+    return [(record["line_number"], record["error_type"], record["level"], record["source"])
+            for record in store.records(path, log_id, **filters)]
+
+
+def test_records_and_filters(store, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    # A line of several error types is a record of each
+    assert sorted(query(store, path)) == [
+        (2, None, 'WARNING', None),
+        (3, 'GeneralError', 'ERROR', 'ComfyUI-Manager'),
+        (4, 'CUDA_OUT_OF_MEMORY', None, None),
+        (4, 'GeneralError', None, None),
+        (6, 'GeneralError', None, None),
+    ]
+    record = store.records(path, store.update(path)[0], error_type='CUDA_OUT_OF_MEMORY')[0]
+    assert record["text"] == LINES[3] and record["timestamp"] is not None
+
+    assert query(store, path, level='warn') == [(2, None, 'WARNING', None)]
+    assert [line for line, *_ in query(store, path, error_type='GeneralError', limit=2)] == [6, 4]
+    # Untimestamped lines take the last timestamp before them
+    since = store.records(path, store.update(path)[0], error_type='CUDA_OUT_OF_MEMORY')[0]["timestamp"]
+    assert sorted(line for line, *_ in query(store, path, since=since)) == [4, 4, 6]
+
+
+def test_counts(store, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    log_id, _ = store.update(path)
+    assert store.counts(log_id) == {"GeneralError": 3, "CUDA_OUT_OF_MEMORY": 1, "none": 1}
+    assert store.counts(log_id, 'level') == {"WARNING": 1, "ERROR": 1, "none": 3}
+    assert store.counts(log_id, 'source', level='ERROR') == {"ComfyUI-Manager": 1}
+    with pytest.raises(ValueError):
+        store.counts(log_id, 'text')
+
+
+def test_appended_lines_extend_the_records(store, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    log_id, state = store.update(path)
+    write(path, ["ERROR: after the append"], 'a')
+    new_id, new_state = store.update(path)
+    assert new_id == log_id and new_state["line_number"] == state["line_number"] + 1
+    assert query(store, path, limit=1) == [(8, 'GeneralError', 'ERROR', None)]
+    assert store.counts(new_id, 'level')["ERROR"] == 2
+
+
+def test_rotated_log_is_parsed_again(store, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    store.update(path)
+    os.rename(path, path + ".1")
+    write(path, ["WARNING: fresh start"])
+    assert query(store, path) == [(1, None, 'WARNING', None)]
+
+
+def test_changed_patterns_parse_again(cache_dir, matcher, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    tables = LogTables()
+    LogStore(tables, matcher).update(path)
+    other = LogStore(tables, ErrorMatcher({"ServerStart": ["Starting server"]}))
+    log_id, _ = other.update(path)
+    assert other.counts(log_id) == {"ServerStart": 1, "none": 2}
+
+
+def test_keyword_lines_are_every_notable_line(store, matcher, synthetic_log):
+    assert notable_keywords(matcher) is not EVERY_LINE_RE
+    expected = {}
+    with open(synthetic_log, encoding='utf-8') as f:
+        for line in f:
+            level, _ = parse_prefix(line)
+            for error_type in matcher.match(line) or ([None] if level in ('WARNING', 'ERROR', 'CRITICAL') else []):
+                key = error_type or "none"
+                expected[key] = expected.get(key, 0) + 1
+    log_id, _ = store.update(synthetic_log)
+    assert store.counts(log_id) == expected and expected
+
+
+def test_regex_patterns_read_every_line():
+    assert notable_keywords(ErrorMatcher({"Shape": [r"shape \[\d+\] mismatch"]})) is EVERY_LINE_RE
+    assert notable_keywords(ErrorMatcher({"Traceback": ["Traceback (most recent call last)"]})) is not EVERY_LINE_RE
+
+
+def test_query_log_reports_partial(debugger, synthetic_log):
+    result, _ = out_of_time(debugger.query_log, synthetic_log, None, None, None, 'level')
+    assert result["partial"] and "note" in result
+    full = debugger.query_log(synthetic_log, group_by='level')
+    assert "partial" not in full and sum(full["counts"].values()) > sum(result["counts"].values())
@@ -0,0 +1,82 @@
+"""
+Tests for incremental log indexes: saving as they go, carrying on after running out of time, and tools saying so
+"""
+import contextvars
+import gzip
+import shutil
+import time
+
+import pytest
+
+import log_tables
+from log_tables import LogTables
+from progress import CallProgress, cut_short, track
+from vram_events import VramEventExtractor
+
+BLOCK_BYTES = 64 * 1024
+
+
+def everything(extractor, log_id, state):
+    events, counts = extractor.events(log_id, state, limit=10 ** 6)
+    return events, counts, extractor.runs(log_id, state)
+
+
+def full_build(cache_dir, path):
+    extractor = VramEventExtractor(LogTables(cache_dir + "/full.sqlite3"))
+    return everything(extractor, *extractor.update(path))
+
+
+def out_of_time(func, *args):
+    """func(*args) in a call whose time is already up, and whether it was cut short."""
+    def run():
+        track(CallProgress(None, time.monotonic() - 1))
+        return func(*args), cut_short()
+    return contextvars.copy_context().run(run)
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_update_out_of_time_carries_on(cache_dir, synthetic_log, tmp_path, compressed):
+    path = synthetic_log
+    if compressed:
+        path = str(tmp_path / "comfyui.log.1.gz")
+        with open(synthetic_log, 'rb') as src, gzip.open(path, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+    extractor = VramEventExtractor(LogTables(), block_bytes=BLOCK_BYTES)
+
+    (log_id, state), was_cut_short = out_of_time(extractor.update, path)
+    assert was_cut_short
+    # Stopped after the first block, with that block's rows saved
+    assert 0 < state["offset"] <= BLOCK_BYTES
+    assert extractor.tables.load(extractor.KIND, path, extractor.VERSION)[1]["offset"] == state["offset"]
+
+    assert everything(extractor, *extractor.update(path)) == full_build(cache_dir, synthetic_log)
+
+
+def test_update_saves_as_it_goes(cache_dir, synthetic_log, monkeypatch):
+    monkeypatch.setattr(log_tables, "SAVE_BLOCKS", 2)
+
+    class Failing(VramEventExtractor):
+        def process_line(self, state, rows, line, start, end, number):
+            if start > 5 * BLOCK_BYTES:
+                raise RuntimeError("cancelled")
+            super().process_line(state, rows, line, start, end, number)
+
+    tables = LogTables()
+    with pytest.raises(RuntimeError):
+        Failing(tables, block_bytes=BLOCK_BYTES).update(synthetic_log)
+    saved = tables.load(VramEventExtractor.KIND, synthetic_log, VramEventExtractor.VERSION)
+    # Saved after the second and fourth blocks
+    assert saved is not None and saved[1]["offset"] > 3 * BLOCK_BYTES
+
+    extractor = VramEventExtractor(tables, block_bytes=BLOCK_BYTES)
+    assert everything(extractor, *extractor.update(synthetic_log)) == full_build(cache_dir, synthetic_log)
+
+
+@pytest.mark.parametrize("tool", ["monitor_gpu_memory_warnings", "find_workflow_by_id", "analyze_execution_times",
+                                  "analyze_model_loads", "query_log"])
+def test_tools_report_partial(debugger, synthetic_log, prompt_id, tool):
+    args = (prompt_id, synthetic_log) if tool == "find_workflow_by_id" else (synthetic_log,)
+    result, _ = out_of_time(getattr(debugger, tool), *args)
+    assert result["partial"] and result["note"]
+    # The next call carries on to the end
+    assert "partial" not in getattr(debugger, tool)(*args)
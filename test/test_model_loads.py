@@ -0,0 +1,108 @@
+"""
+Tests for model load churn: loads, reloads and the time they cost, kept up to date as a log grows
+"""
+import os
+
+import pytest
+
+from log_tables import LogTables
+from model_loads import ModelLoadTracker, model_kind, summarize_model
+
+LINES = [
+    "** ComfyUI startup time: 2024-06-15 10:00:00.000",
+    "[2024-06-15 10:00:01.000] Requested to load SDXLClipModel",
+    "[2024-06-15 10:00:03.500] loaded completely 9000.0 1500.0 True",
+    "Loading checkpoint models/checkpoints/sdxl_base.safetensors in 4.0 seconds",
+    "Requested to load SDXLClipModel",
+    "2 models unloaded.",
+    "loaded partially 4000.0 3800.0 0",
+    "Loading checkpoint models/checkpoints/sdxl_base.safetensors",
+    "** ComfyUI startup time: 2024-06-15 11:00:00.000",
+    "Requested to load SDXLClipModel",
+    "loaded completely 9000.0 1500.0 True",
+]
+
+
+def write(path, lines, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+def test_model_kind():
+    assert model_kind("models/loras/detail.safetensors") == "lora"
+    assert model_kind("SDXLClipModel") == "text_encoder"
+    assert model_kind("AutoencoderKL") == "vae"
+    assert model_kind("models/checkpoints/sdxl_base.safetensors") == "checkpoint"
+    assert model_kind("SomethingElse") == "model"
+
+
+def test_summarize_costs_untimed_reloads_at_the_median():
+    loads = [[1, None, 2.0, False], [5, None, 4.0, True], [9, None, None, True], [12, None, 6.0, False]]
+    summary = summarize_model("m", "checkpoint", loads)
+    assert (summary["loads"], summary["reloads"], summary["median_load_seconds"]) == (4, 2, 4.0)
+    assert summary["measured_reload_seconds"] == 4.0 and summary["estimated_lost_seconds"] == 8.0
+    assert summarize_model("m", "checkpoint", [[1, None, None, True]])["reloads_without_timing"] == 1
+
+
+def test_loads_and_reloads(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    result = debugger.analyze_model_loads(path)
+    checkpoint, clip = result["models"]
+    assert (checkpoint["model"], checkpoint["kind"], checkpoint["loads"], checkpoint["reloads"]) == (
+        "sdxl_base.safetensors", "checkpoint", 2, 1)
+    assert checkpoint["median_load_seconds"] == 4.0 and checkpoint["estimated_lost_seconds"] == 4.0
+    # Timed from the request and loaded lines' timestamps; the load after the restart isn't a reload
+    assert (clip["model"], clip["kind"], clip["loads"], clip["reloads"]) == ("SDXLClipModel", "text_encoder", 3, 1)
+    assert clip["median_load_seconds"] == 2.5 and clip["estimated_lost_seconds"] == 2.5
+    assert (result["total_loads"], result["total_reloads"], result["models_unloaded"]) == (5, 2, 2)
+    assert result["estimated_lost_seconds"] == 6.5
+
+
+def test_pending_request_is_counted(cache_dir, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES[:5])
+    loads = ModelLoadTracker(LogTables()).extract(path)["models"]["SDXLClipModel"]["loads"]
+    # Still waiting for its "loaded" line, so not timed yet
+    assert [load[0] for load in loads] == [2, 5] and loads[1][2:] == [None, True]
+
+
+@pytest.mark.parametrize("cut", range(1, len(LINES)))
+def test_appended_lines_extend_the_loads(cache_dir, tmp_path, cut):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    expected = ModelLoadTracker(LogTables(cache_dir + "/whole.sqlite3")).extract(path)
+    write(path, LINES[:cut])
+    tracker = ModelLoadTracker(LogTables())
+    tracker.extract(path)
+    write(path, LINES[cut:], 'a')
+    assert tracker.extract(path) == expected
+
+
+def test_synthetic_log_grown_in_pieces(cache_dir, synthetic_log, tmp_path):
+    with open(synthetic_log, 'rb') as f:
+        data = f.read()
+    path = str(tmp_path / "comfyui.log")
+    tracker = ModelLoadTracker(LogTables(), block_bytes=64 * 1024)
+    open(path, 'wb').close()
+    for piece in range(1, 6):
+        end = data.index(b'\n', len(data) * piece // 6) + 1
+        with open(path, 'ab') as f:
+            f.write(data[os.path.getsize(path):end])
+        tracker.extract(path)
+    with open(path, 'ab') as f:
+        f.write(data[os.path.getsize(path):])
+    loads = tracker.extract(path)
+    assert loads["models"] and loads == ModelLoadTracker(LogTables(cache_dir + "/whole.sqlite3")).extract(
+        synthetic_log)
+
+
+def test_rotated_log_is_read_again(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    debugger.analyze_model_loads(path)
+    os.rename(path, path + ".1")
+    write(path, LINES[8:])
+    result = debugger.analyze_model_loads(path)
+    assert [(model["model"], model["loads"], model["reloads"]) for model in result["models"]] == [
+        ("SDXLClipModel", 1, 0)]
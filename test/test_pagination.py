@@ -0,0 +1,93 @@
+"""
+Tests for response pagination: page sizes and cursor round-trips for every paged tool
+"""
+import asyncio
+import json
+from itertools import islice
+
+import pytest
+
+from pagination import CursorError, json_size, paginate, shrink
+
+# (tool, arguments, paged list); "LOG" and "PROMPT" stand for the synthetic log and a prompt ID in it
+PAGED_TOOLS = [
+    ("get_logs", {}, "log_files"),
+    ("find_errors", {"log_path": "LOG"}, "clusters"),
+    ("find_errors", {"log_path": "LOG", "cluster": False}, "errors"),
+    ("find_errors_all", {}, "clusters"),
+    ("find_errors_all", {"cluster": False}, "errors"),
+    ("monitor_gpu_memory_warnings", {"log_path": "LOG", "max_events": 1000}, "events"),
+    ("query_log", {"log_path": "LOG", "limit": 1000}, "records"),
+    ("analyze_execution_times", {"log_path": "LOG", "top_n": 100}, "nodes"),
+    ("analyze_model_loads", {"log_path": "LOG", "top_n": 100}, "models"),
+    ("find_workflow_by_id", {"workflow_id": "PROMPT"}, "executions"),
+]
+
+
+def call(debugger, tool, arguments, synthetic_log, prompt_id, **extra):
+    arguments = {name: {"LOG": synthetic_log, "PROMPT": prompt_id}.get(value, value)
+                 if isinstance(value, str) else value for name, value in arguments.items()}
+    result = getattr(debugger, tool)(**arguments, **extra)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    assert "error" not in result, result
+    return result
+
+
+def pages(debugger, tool, arguments, synthetic_log, prompt_id, max_bytes):
+    cursor = None
+    while True:
+        page = call(debugger, tool, arguments, synthetic_log, prompt_id, cursor=cursor, max_bytes=max_bytes)
+        yield page
+        if not page["has_more"]:
+            return
+        cursor = page["next_cursor"]
+
+
+@pytest.mark.parametrize("tool,arguments,key", PAGED_TOOLS)
+def test_pages_fit_max_bytes(debugger, synthetic_log, prompt_id, tool, arguments, key):
+    max_bytes = 2048
+    checked = list(islice(pages(debugger, tool, arguments, synthetic_log, prompt_id, max_bytes), 5))
+    assert checked
+    for page in checked:
+        assert json_size(page) <= max_bytes
+
+
+@pytest.mark.parametrize("tool,arguments,key", PAGED_TOOLS)
+def test_pages_concatenate_to_full_result(debugger, synthetic_log, prompt_id, tool, arguments, key):
+    full = call(debugger, tool, arguments, synthetic_log, prompt_id, max_bytes=0)
+    items = []
+    for page in pages(debugger, tool, arguments, synthetic_log, prompt_id, 16 * 1024):
+        assert key not in page.get("truncated", [])
+        items.extend(page[key])
+    assert items == full[key]
+
+
+def test_large_fields_are_shrunk():
+    result = {"items": list(range(100)), "notes": ["x" * 100] * 100, "count": 100}
+    page = paginate(result, "items", "q", max_bytes=2048)
+    assert json_size(page) <= 2048
+    assert page["truncated"] == ["notes"]
+    assert page["count"] == 100
+    assert page["items"] == list(range(len(page["items"])))
+
+
+def test_oversized_item_is_shrunk():
+    result = {"items": [{"line": 1, "context": ["y" * 500] * 20}, {"line": 2, "context": []}]}
+    page = paginate(result, "items", "q", max_bytes=2048)
+    assert json_size(page) <= 2048
+    assert page["truncated"] == ["items"]
+    assert page["items"][0]["line"] == 1
+    assert page["has_more"]
+
+
+def test_shrink_keeps_strings_within_budget():
+    value = "é" * 1000  # six bytes of JSON per character
+    assert json_size(shrink(value, 100)) <= 100
+    assert json.loads(json.dumps(shrink(value, 100))).endswith("...")
+
+
+def test_cursor_from_another_query_is_refused():
+    page = paginate({"items": list(range(1000))}, "items", "q1", max_bytes=1024)
+    with pytest.raises(CursorError):
+        paginate({"items": list(range(1000))}, "items", "q2", cursor=page["next_cursor"], max_bytes=1024)
@@ -0,0 +1,65 @@
+"""
+Tests for multi-core scanning: joined chunk scans find the same errors as one sequential scan
+"""
+import os
+
+import pytest
+
+import parallel_scan
+from log_scanner import ErrorScan
+from parallel_scan import parallel_cut, scan_errors_parallel
+
+CHUNK_BYTES = 128 * 1024
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Split even the 2 MB synthetic log into chunks across a few workers."""
+    monkeypatch.setattr(parallel_scan, "CHUNK_BYTES", CHUNK_BYTES)
+    monkeypatch.setenv("COMFYUI_PARALLEL_MIN_MB", "0")
+    monkeypatch.setenv("COMFYUI_SCAN_WORKERS", "4")
+
+
+def full_scan(debugger, path, context_lines):
+    with open(path, 'rb') as f:
+        return list(ErrorScan(f, debugger.error_matcher, context_lines))
+
+
+@pytest.mark.parametrize("context_lines", [0, 5, 20])
+def test_parallel_scan_matches_sequential(debugger, synthetic_log, small_chunks, context_lines):
+    size = os.path.getsize(synthetic_log)
+    cut = parallel_cut(synthetic_log, 0, size)
+    assert cut is not None and cut < size
+
+    result = scan_errors_parallel(synthetic_log, debugger.error_patterns, context_lines, 0, cut)
+    assert result is not None
+    errors, offset, line_number, before = result
+    with open(synthetic_log, 'rb') as f:
+        f.seek(offset)
+        errors += list(ErrorScan(f, debugger.error_matcher, context_lines, offset, line_number, before=before))
+    assert errors == full_scan(debugger, synthetic_log, context_lines)
+
+
+def test_parallel_scan_from_an_offset(debugger, synthetic_log, small_chunks):
+    # Start the way a resumed find_errors would: from a checkpoint's resume point
+    with open(synthetic_log, 'rb') as f:
+        scan = ErrorScan(f, debugger.error_matcher, 5)
+        expected = list(scan)
+    with open(synthetic_log, 'rb') as f:
+        data = f.read()
+    start = data.index(b'\n', len(data) // 4) + 1
+    start_line = data.count(b'\n', 0, start) + 1
+
+    cut = parallel_cut(synthetic_log, start, len(data))
+    result = scan_errors_parallel(synthetic_log, debugger.error_patterns, 5, start, cut, start_line)
+    assert result is not None
+    errors, offset, line_number, context = result
+    with open(synthetic_log, 'rb') as f:
+        f.seek(offset)
+        errors += list(ErrorScan(f, debugger.error_matcher, 5, offset, line_number, before=context))
+    assert errors == [error for error in expected if error["start_line"] >= start_line]
+
+
+def test_find_errors_uses_parallel_scan(debugger, synthetic_log, small_chunks):
+    assert debugger._file_errors(synthetic_log, None, 5) == [
+        dict(error, log_file=synthetic_log) for error in full_scan(debugger, synthetic_log, 5)]
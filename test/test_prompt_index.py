@@ -0,0 +1,115 @@
+"""
+Tests for the prompt ID index behind find_workflow_by_id: execution timelines, kept up to date as a log grows
+"""
+import os
+import re
+
+from log_tables import LogTables
+from prompt_index import UUID, PromptIndex, ids_in
+
+FIRST = "aaaaaaaa-1111-2222-3333-444444444444"
+SECOND = "bbbbbbbb-1111-2222-3333-444444444444"
+
+LINES = [
+    "got prompt",
+    f"prompt_id: {FIRST.upper()}",
+    "Requested to load SDXL",
+    " 50%|#####     | 10/20 [00:02<00:02,  4.51it/s]",
+    "100%|##########| 20/20 [00:04<00:00,  4.51it/s]",
+    "Prompt executed in 4.50 seconds",
+    "webhook sent for workflow_id=wf-1234",
+    "got prompt",
+    f"prompt_id: {SECOND}",
+    "RuntimeError: Error occurred when executing KSampler",
+    "Prompt executed in 1.00 seconds",
+]
+
+
+def write(path, lines, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+def executions(debugger, path, workflow_id, max_lines=200):
+    result = debugger.find_workflow_by_id(workflow_id, path, max_lines)
+    assert "error" not in result, result
+    return result["executions"]
+
+
+def test_ids_in():
+    assert ids_in(f"prompt_id: {FIRST.upper()} again {FIRST}") == [FIRST]
+    assert ids_in('{"workflow_id": "wf-1234"}') == ["wf-1234"]
+    assert ids_in("got prompt") == []
+
+
+def test_timelines(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    first, = executions(debugger, path, FIRST)
+    assert (first["start_line"], first["end_line"], first["status"]) == (1, 6, "finished")
+    assert first["execution_seconds"] == 4.5
+    # Progress bar lines collapse into one entry
+    assert [(item["kind"], item["line_number"]) for item in first["timeline"]] == [
+        ("queued", 1), ("log", 2), ("model", 3), ("progress", 4), ("finished", 6)]
+    assert first["timeline"][3]["count"] == 2
+
+    second, = executions(debugger, path, SECOND.upper())
+    assert second["status"] == "error" and second["start_line"] == 8
+    assert second["timeline"][2]["error_types"]
+
+    # Outside any execution, an ID is its own line
+    mention, = executions(debugger, path, "wf-1234")
+    assert (mention["status"], mention["start_line"], mention["end_line"]) == ("mentioned", 7, 7)
+    assert debugger.find_workflow_by_id("cccccccc-1111-2222-3333-444444444444", path)["executions"] == []
+
+
+def test_max_lines(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES + LINES)
+    found = executions(debugger, path, FIRST, max_lines=7)
+    assert len(found) == 2 and [len(execution["timeline"]) for execution in found] == [5, 2]
+
+
+def test_running_execution_is_followed(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    write(path, ["got prompt", f"prompt_id: {FIRST}", "Requested to load SDXL"], 'a')
+    finished, running = executions(debugger, path, FIRST)
+    assert running["status"] == "running" and running["start_line"] == 12 and running["end_line"] == 14
+
+    write(path, ["Prompt executed in 2.00 seconds"], 'a')
+    finished, done = executions(debugger, path, FIRST)
+    assert done["status"] == "finished" and done["end_line"] == 15 and done["execution_seconds"] == 2.0
+
+
+def test_rotated_log_is_indexed_again(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    executions(debugger, path, FIRST)
+    os.rename(path, path + ".1")
+    write(path, LINES[7:])
+    assert executions(debugger, path, FIRST) == []
+    assert executions(debugger, path, SECOND)[0]["start_line"] == 1
+
+
+def test_synthetic_log_grown_in_pieces(cache_dir, synthetic_log, tmp_path):
+    with open(synthetic_log, 'rb') as f:
+        data = f.read()
+    prompt_ids = sorted(set(re.findall(UUID, data.decode('utf-8'))))
+    assert prompt_ids
+
+    path = str(tmp_path / "comfyui.log")
+    index = PromptIndex(LogTables(), block_bytes=64 * 1024)
+    open(path, 'wb').close()
+    for piece in range(1, 6):
+        end = data.index(b'\n', len(data) * piece // 6) + 1
+        with open(path, 'ab') as f:
+            f.write(data[os.path.getsize(path):end])
+        index.update(path)
+    with open(path, 'ab') as f:
+        f.write(data[os.path.getsize(path):])
+
+    whole = PromptIndex(LogTables(cache_dir + "/whole.sqlite3"))
+    for prompt_id in prompt_ids:
+        ranges = index.ranges(path, prompt_id)
+        assert ranges and ranges == whole.ranges(synthetic_log, prompt_id)
@@ -0,0 +1,106 @@
+"""
+Tests for tail_log: resuming from a cursor, and following rotated and rewritten logs
+"""
+import asyncio
+import os
+
+import pytest
+
+import log_follower
+from log_follower import LogFollower
+
+
+def write(path, text, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.write(text)
+
+
+def numbered(first, last):
+    return "".join(f"line {i}\n" for i in range(first, last + 1))
+
+
+def tail(debugger, path, cursor=None, max_lines=100, wait_seconds=0):
+    result = asyncio.run(debugger.tail_log(path, cursor, max_lines, wait_seconds))
+    assert "error" not in result, result
+    return result
+
+
+@pytest.fixture
+def log(tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, numbered(1, 10))
+    return path
+
+
+def test_cursor_returns_only_new_lines(debugger, log):
+    first = tail(debugger, log, max_lines=3)
+    assert first["lines"] == ["line 8", "line 9", "line 10"]
+
+    assert tail(debugger, log, first["cursor"])["lines"] == []
+    write(log, numbered(11, 12) + "line 13 still being writ", 'a')
+    second = tail(debugger, log, first["cursor"])
+    assert second["lines"] == ["line 11", "line 12"] and second["status"] == "ok"
+
+    # The incomplete line is returned once it ends
+    write(log, "ten\n", 'a')
+    assert tail(debugger, log, second["cursor"])["lines"] == ["line 13 still being written"]
+
+
+def test_batches_follow_on(debugger, log):
+    cursor = tail(debugger, log, max_lines=1)["cursor"]
+    write(log, numbered(11, 15), 'a')
+    first = tail(debugger, log, cursor, max_lines=3)
+    assert first["lines"] == ["line 11", "line 12", "line 13"] and first["has_more"]
+    second = tail(debugger, log, first["cursor"], max_lines=3)
+    assert second["lines"] == ["line 14", "line 15"] and not second["has_more"]
+
+
+def test_rotated_log_is_followed_from_its_start(debugger, log):
+    cursor = tail(debugger, log)["cursor"]
+    write(log, numbered(11, 12), 'a')
+    os.rename(log, log + ".1")
+    write(log, numbered(1, 2))
+    result = tail(debugger, log, cursor)
+    assert result["status"] == "rotated"
+    assert result["lines"] == ["line 1", "line 2"]
+    assert tail(debugger, log, result["cursor"])["lines"] == []
+
+
+def test_truncated_log_is_followed_from_its_start(debugger, log):
+    cursor = tail(debugger, log)["cursor"]
+    write(log, numbered(1, 3))
+    result = tail(debugger, log, cursor)
+    assert result["status"] == "truncated"
+    assert result["lines"] == ["line 1", "line 2", "line 3"]
+
+
+def test_rewritten_log_is_followed_from_its_start(debugger, log):
+    cursor = tail(debugger, log)["cursor"]
+    # As long as before, but with different text: the cursor's head hash no longer matches
+    write(log, numbered(1, 10).replace("line", "LINE"))
+    result = tail(debugger, log, cursor)
+    assert result["status"] == "truncated"
+    assert result["lines"][0] == "LINE 1"
+
+
+@pytest.mark.parametrize("inotify", [True, False])
+def test_waits_for_new_lines(log, monkeypatch, inotify):
+    if inotify and not log_follower.inotify_available():
+        pytest.skip("inotify is not available here")
+    monkeypatch.setattr(log_follower, "inotify_available", lambda: inotify)
+    follower = LogFollower(poll_interval=0.05)
+
+    async def follow_while_appending():
+        cursor = (await follower.follow(log))["cursor"]
+        asyncio.get_running_loop().call_later(0.2, write, log, "line 11\n", 'a')
+        return await follower.follow(log, cursor, wait_seconds=5)
+
+    assert asyncio.run(follow_while_appending())["lines"] == ["line 11"]
+
+
+def test_wait_times_out(log):
+    async def follow_idle():
+        cursor = (await LogFollower(poll_interval=0.05).follow(log))["cursor"]
+        return await LogFollower(poll_interval=0.05).follow(log, cursor, wait_seconds=0.2)
+
+    assert asyncio.run(follow_idle())["lines"] == []
@@ -0,0 +1,116 @@
+"""
+Tests for the sparse timestamp index: line counting across blocks, seeking, extension and re-indexing
+"""
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from log_index import TimestampIndex, count_lines
+
+START = datetime(2024, 6, 15, 12)
+BLOCK_BYTES = 64
+
+
+def stamped_lines(count, first=0):
+    return [f"[{(START + timedelta(seconds=i)).strftime('%Y-%m-%d %H:%M:%S')}.000] line {i}"
+            for i in range(first, first + count)]
+
+
+def join(lines, endings):
+    """Lines joined with endings taken in turn, so \\r\\n, \\r and \\n all fall on block boundaries."""
+    return "".join(line + endings[i % len(endings)] for i, line in enumerate(lines)).encode('utf-8')
+
+
+def line_starts(data):
+    """{offset: line number} of every line start, splitting the way universal newlines do."""
+    starts = {0: 1}
+    for number, m in enumerate(re.finditer(rb'\r\n|\r|\n', data), 2):
+        starts[m.end()] = number
+    return starts
+
+
+def check(index, data):
+    """Every entry is a line start with its right line number, and the end line counts every line."""
+    starts = line_starts(data)
+    assert index["entries"]
+    for offset, line_number, _ in index["entries"]:
+        assert starts[offset] == line_number
+    assert index["end_offset"] == len(data)
+    assert index["end_line"] == max(starts.values())
+
+
+def test_count_lines():
+    assert count_lines(b"a\nb\r\nc\rd") == 3
+    assert count_lines(b"\r\r\n\n") == 3
+    # A \n right after a block that ended in \r completes that \r\n
+    assert count_lines(b"\nx\n", after_cr=True) == 1
+    assert count_lines(b"x\n", after_cr=True) == 1
+
+
+@pytest.mark.parametrize("endings", [["\n"], ["\r\n"], ["\r\n", "\n", "\r"], ["\r", "\r\n"]])
+def test_line_numbers_across_blocks(cache_dir, tmp_path, endings):
+    path = tmp_path / "comfyui.log"
+    data = join(stamped_lines(200), endings)
+    path.write_bytes(data)
+    index = TimestampIndex(BLOCK_BYTES).update(str(path))
+    check(index, data)
+    # Small blocks split some \r\n pairs between blocks
+    split = [offset for offset in range(BLOCK_BYTES, len(data), BLOCK_BYTES) if data[offset - 1:offset + 1] == b'\r\n']
+    assert split or "\r\n" not in endings
+
+
+def test_seek_starts_before_every_recent_line(cache_dir, tmp_path):
+    path = tmp_path / "comfyui.log"
+    lines = stamped_lines(300)
+    # Untimestamped lines (a traceback) take the time before them
+    lines[150:150] = ["Traceback (most recent call last):", "  File \"x.py\", line 1", "ValueError: x"]
+    data = join(lines, ["\r\n", "\n"])
+    path.write_bytes(data)
+    index = TimestampIndex(BLOCK_BYTES)
+    for second in list(range(0, 300, 17)) + [300]:
+        offset, line_number = index.seek(str(path), (START + timedelta(seconds=second)).timestamp())
+        assert line_starts(data)[offset] == line_number
+        # Every line from that second on is past the offset, and the first not much further
+        first = re.search(rb'line %d[\r\n]' % second, data)
+        assert first is None or 0 <= first.start() - offset <= 2 * BLOCK_BYTES
+    assert index.seek(str(path), START.timestamp() - 60) == (0, 1)
+
+
+def test_no_timestamps(cache_dir, tmp_path):
+    path = tmp_path / "comfyui.log"
+    path.write_bytes(b"no\ntimestamps\nhere\n" * 20)
+    assert TimestampIndex(BLOCK_BYTES).seek(str(path), START.timestamp()) is None
+
+
+def test_extension_after_an_append(cache_dir, tmp_path):
+    path = tmp_path / "comfyui.log"
+    data = join(stamped_lines(100), ["\r\n"])
+    # The first part ends between the \r and \n of a line ending
+    cut = data.index(b'\r\n', len(data) // 2) + 1
+    path.write_bytes(data[:cut])
+    index = TimestampIndex(BLOCK_BYTES)
+    assert index.update(str(path))["after_cr"]
+    with open(path, 'ab') as f:
+        f.write(data[cut:])
+    extended = index.update(str(path))
+    check(extended, data)
+    assert extended["last_time"] == TimestampIndex(BLOCK_BYTES).update(str(path))["last_time"]
+
+    # A fresh instance picks the saved index up and extends it from there
+    more = join(stamped_lines(50, first=100), ["\n"])
+    with open(path, 'ab') as f:
+        f.write(more)
+    check(TimestampIndex(BLOCK_BYTES).update(str(path)), data + more)
+
+
+def test_truncated_log_is_indexed_again(cache_dir, tmp_path):
+    path = tmp_path / "comfyui.log"
+    path.write_bytes(join(stamped_lines(200), ["\n"]))
+    index = TimestampIndex(BLOCK_BYTES)
+    index.update(str(path))
+    shorter = join(stamped_lines(30, first=500), ["\r\n"])
+    path.write_bytes(shorter)
+    rebuilt = index.update(str(path))
+    check(rebuilt, shorter)
+    assert rebuilt["entries"][0][2] == (START + timedelta(seconds=500)).timestamp()
@@ -0,0 +1,42 @@
+"""
+Tests for the tool stubs the standalone server lists before importing the debugger
+"""
+import asyncio
+import inspect
+import os
+import subprocess
+import sys
+
+from debugger_server import ComfyUILogDebugger
+from tool_names import TOOL_NAMES, tool_stubs
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+def test_stubs_match_the_debugger_methods():
+    stubs = tool_stubs(None)
+    assert [stub.__name__ for stub in stubs] == list(TOOL_NAMES)
+    for stub in stubs:
+        method = getattr(ComfyUILogDebugger, stub.__name__)
+        signature = inspect.signature(method)
+        assert inspect.signature(stub) == signature.replace(parameters=list(signature.parameters.values())[1:])
+        assert stub.__doc__ == method.__doc__
+
+
+def test_stubs_pass_calls_on():
+    calls = []
+
+    async def call(name, **arguments):
+        calls.append((name, arguments))
+        return {"ok": True}
+
+    stub = dict(zip(TOOL_NAMES, tool_stubs(call)))["find_errors"]
+    assert asyncio.run(stub(log_path="comfyui.log", context_lines=2)) == {"ok": True}
+    assert calls == [("find_errors", {"log_path": "comfyui.log", "context_lines": 2})]
+
+
+def test_stubs_do_not_import_the_debugger():
+    code = "import sys, tool_names; tool_names.tool_stubs(None); print('debugger_server' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=SRC),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,118 @@
+"""
+Tests for GPU memory events: classifying lines, runs and pressured prompts, kept up to date as a log grows
+"""
+import os
+
+import pytest
+
+from log_tables import LogTables
+from test_log_tables import everything, full_build
+from vram_events import (PRESSURE_LOWVRAM, PRESSURE_NONE, PRESSURE_OFFLOAD, PRESSURE_OOM, VramEventExtractor,
+                         classify_line, downsample)
+
+GIB = 1024 ** 3
+MIB = 1024 ** 2
+
+LINES = [
+    "** ComfyUI startup time: 2024-06-15 10:00:00.000",
+    "Total VRAM 8192 MB, total RAM 32000 MB",
+    "Set vram state to: NORMAL_VRAM",
+    "got prompt",
+    "loaded completely 6000.0 2000.0 True",
+    "loaded partially 5000.0 4800.0 0",
+    "Prompt executed in 12.50 seconds",
+    "got prompt",
+    "torch.OutOfMemoryError: CUDA out of memory. Tried to allocate 2.00 GiB. "
+    "GPU 0 has a total capacity of 8.00 GiB of which 100.00 MiB is free.",
+    "Got an OOM, unloading all loaded models.",
+    "Prompt executed in 3.00 seconds",
+    "** ComfyUI startup time: 2024-06-15 11:00:00.000",
+    "Set vram state to: LOW_VRAM",
+]
+
+
+def write(path, lines, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+def test_classify_line():
+    oom = classify_line(LINES[8])
+    assert oom == {"type": "oom", "pressure": PRESSURE_OOM, "requested_bytes": 2 * GIB, "total_bytes": 8 * GIB,
+                   "free_bytes": 100 * MIB}
+    assert classify_line("loaded partially 5000.0 4800.0 0")["pressure"] == PRESSURE_LOWVRAM
+    assert classify_line("loaded completely 6000.0 2000.0 True")["pressure"] == PRESSURE_NONE
+    assert classify_line("Set vram state to: NO_VRAM")["pressure"] == PRESSURE_LOWVRAM
+    assert classify_line("Requested to load SDXL, 2 models unloaded.") == {
+        "type": "offload", "pressure": PRESSURE_OFFLOAD, "models": 2}
+    assert classify_line("0 models unloaded.") is None
+    # Free VRAM is pressure only against the run's total
+    assert classify_line("free vram: 500 MB")["pressure"] == PRESSURE_NONE
+    assert classify_line("free vram: 500 MB", 8192 * MIB)["pressure"] == PRESSURE_LOWVRAM
+    assert classify_line("free vram: 1500 MB", 8192 * MIB)["pressure"] == PRESSURE_OFFLOAD
+    assert classify_line("got prompt") is None
+
+
+def test_downsample_keeps_peaks():
+    series = [[i, None, PRESSURE_OOM if i == 517 else PRESSURE_NONE] for i in range(1000)]
+    sampled = downsample(series, 10)
+    assert len(sampled) == 10 and [point[0] for point in sampled] == list(range(0, 1000, 100))
+    assert [point[2] for point in sampled].count(PRESSURE_OOM) == 1
+
+
+def test_events_runs_and_prompts(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    result = debugger.monitor_gpu_memory_warnings(path)
+    assert [(event["type"], event["run"], event["prompt"], event["line_number"]) for event in result["events"]] == [
+        ("vram_state", 1, None, 3), ("loaded_partially", 1, 1, 6), ("oom", 1, 2, 9), ("vram_state", 2, None, 13)]
+    # The OOM's follow-up line merged into it
+    assert result["events"][2]["lines"] == 2
+    assert result["event_counts"] == {"vram_state": 2, "loaded_partially": 1, "oom": 1}
+
+    first, second = result["runs"]
+    assert first["total_vram_bytes"] == 8 * GIB and first["peak_pressure"] == PRESSURE_OOM
+    assert first["event_counts"]["loaded_completely"] == 1
+    assert [(p["prompt"], p["peak_pressure"], p["execution_seconds"]) for p in first["pressured_prompts"]] == [
+        (1, PRESSURE_LOWVRAM, 12.5), (2, PRESSURE_OOM, 3.0)]
+    assert second["start_line"] == 12 and second["series"] == [[13, second["started_at"], PRESSURE_LOWVRAM]]
+
+
+@pytest.mark.parametrize("cut", range(1, len(LINES)))
+def test_appended_lines_extend_the_events(cache_dir, tmp_path, cut):
+    # Whatever line the first update stops at, including an OOM that may still merge with the next
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    expected = full_build(cache_dir, path)
+    write(path, LINES[:cut])
+    extractor = VramEventExtractor(LogTables())
+    extractor.update(path)
+    write(path, LINES[cut:], 'a')
+    assert everything(extractor, *extractor.update(path)) == expected
+
+
+def test_synthetic_log_grown_in_pieces(cache_dir, synthetic_log, tmp_path):
+    with open(synthetic_log, 'rb') as f:
+        data = f.read()
+    path = str(tmp_path / "comfyui.log")
+    extractor = VramEventExtractor(LogTables(), block_bytes=64 * 1024)
+    open(path, 'wb').close()
+    for piece in range(1, 6):
+        end = data.index(b'\n', len(data) * piece // 6) + 1
+        with open(path, 'ab') as f:
+            f.write(data[os.path.getsize(path):end])
+        extractor.update(path)
+    with open(path, 'ab') as f:
+        f.write(data[os.path.getsize(path):])
+    assert everything(extractor, *extractor.update(path)) == full_build(cache_dir, synthetic_log)
+
+
+def test_rotated_log_is_read_again(debugger, tmp_path):
+    path = str(tmp_path / "comfyui.log")
+    write(path, LINES)
+    debugger.monitor_gpu_memory_warnings(path)
+    os.rename(path, path + ".1")
+    write(path, LINES[11:])
+    result = debugger.monitor_gpu_memory_warnings(path)
+    assert [(event["type"], event["line_number"]) for event in result["events"]] == [("vram_state", 2)]
+    assert [run["run"] for run in result["runs"]] == [1]